@@ -15,7 +15,7 @@ try:
 except PackageNotFoundError:
     __version__ = "unknown"
 
-from interphyre.level import Level
+from interphyre.level import ContactGoal, Level
 from interphyre.config import SimulationConfig
 from interphyre.levels import build_level_from_scene, list_levels
 
@@ -23,9 +23,12 @@ from interphyre.levels import build_level_from_scene, list_levels
 # tooling does not require it.  Only import InterphyreEnv when available.
 try:
     from interphyre.environment import InterphyreEnv
+    from interphyre.vector import InterphyreVectorEnv
 
     __all__ = [
+        "ContactGoal",
         "InterphyreEnv",
+        "InterphyreVectorEnv",
         "Level",
         "SimulationConfig",
         "build_level_from_scene",
@@ -34,6 +37,7 @@ try:
     ]
 except ImportError:
     __all__ = [
+        "ContactGoal",
         "Level",
         "SimulationConfig",
         "build_level_from_scene",
@@ -37,18 +37,31 @@ class SimulationConfig:
         warm_starting (bool): Enable warm starting in Box2D solver (default: True)
         track_all_contacts (bool): Track all contact events for research (default: True)
         track_relevant_contacts_only (bool): Only track relevant contacts for performance (default: False)
+        lean_contact_tracking (bool): Use LeanContactListener — integer body IDs, numpy contact
+            tables and a bounded event ring buffer (default: False)
+        contact_event_capacity (int): Ring buffer size for the lean contact event log (default: 4096)
         enable_profiling (bool): Enable performance profiling (default: False)
         log_step_times (bool): Log timing for each simulation step (default: False)
         stationary_tolerance (float): Tolerance for detecting stationary world (default: 0.0001)
         stationary_check_frames (int): Number of frames for time-based stationary detection (default: 10)
         default_success_time (float): Default time for success detection (default: 3.0)
         max_steps (int): Maximum simulation steps before timeout (default: 1000)
+        early_termination (bool): End step() rollouts as soon as the world has settled
+            and the success condition can no longer be met (default: False)
+        success_hold_shortcut (bool): End step() rollouts as soon as the world has settled
+            and every contact hold the success condition needs is guaranteed to complete
+            (default: False)
+        verify_early_termination (bool): Keep simulating after either shortcut fires and
+            raise if the full rollout disagrees with it (default: False)
         verify_solutions (bool): Enable double-verification of solutions for data collection (default: False)
         enable_interventions (bool): Gate snapshot allocation for the intervention system (default: False).
             When False, no snapshots are allocated and restore() is unavailable, but trigger evaluation
             always runs regardless of this flag.
         intervention_max_snapshots (int): Maximum number of snapshots to keep (default: 100)
         intervention_auto_cleanup (bool): Automatically cleanup old snapshots (default: True)
+        intervention_spill_path (Optional[str]): Directory that the env's snapshot store spills
+            least recently used snapshots to instead of dropping them. Each store writes its
+            own file there (default: None)
     """
 
     # Time and physics settings
@@ -68,6 +81,8 @@ class SimulationConfig:
     # Contact tracking settings
     track_all_contacts: bool = True
     track_relevant_contacts_only: bool = False
+    lean_contact_tracking: bool = False
+    contact_event_capacity: int = 4096  # Events kept by the lean listener
 
     # Performance monitoring
     enable_profiling: bool = False
@@ -82,6 +97,15 @@ class SimulationConfig:
 
     # Simulation limits
     max_steps: int = 1000
+    early_termination: bool = (
+        False  # Stop failed rollouts once the world is provably settled
+    )
+    success_hold_shortcut: bool = (
+        False  # Stop successful rollouts once the hold is provably going to complete
+    )
+    verify_early_termination: bool = (
+        False  # Run shortcut rollouts to completion and check they agree
+    )
 
     # Data collection and verification settings
     verify_solutions: bool = (
@@ -92,6 +116,7 @@ class SimulationConfig:
     enable_interventions: bool = False
     intervention_max_snapshots: int = 100
     intervention_auto_cleanup: bool = True
+    intervention_spill_path: str | None = None
 
     def __post_init__(self):
         """Validate configuration parameters."""
@@ -103,6 +128,8 @@ class SimulationConfig:
             raise ValueError("position_iters must be at least 1")
         if self.fps <= 0:
             raise ValueError("fps must be positive")
+        if self.contact_event_capacity < 1:
+            raise ValueError("contact_event_capacity must be at least 1")
         if self.intervention_max_snapshots < 1:
             raise ValueError("intervention_max_snapshots must be at least 1")
         # Warn when physics step and render rate are decoupled.
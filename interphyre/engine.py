@@ -1,7 +1,10 @@
+import itertools
 import math
+import secrets
 from collections import deque
-from typing import Any
+from typing import Any, NamedTuple
 
+import numpy as np
 from Box2D import b2Contact, b2ContactListener, b2World, b2_dynamicBody
 
 from interphyre.config import (
@@ -24,6 +27,11 @@ from interphyre.objects import (
 # Static wall body names — used in reset_attempt to skip positional restoration.
 _WALL_NAMES = frozenset({"left_wall", "right_wall", "top_wall", "bottom_wall"})
 
+# Source of structural versions (see Box2DEngine.mark_structure_changed). Versions
+# start at a random offset so that versions in snapshots from another process
+# never match local ones.
+_STRUCTURE_VERSIONS = itertools.count(secrets.randbits(62))
+
 
 class GoalContactListener(b2ContactListener):
     """Contact listener for tracking object collisions and success conditions.
@@ -41,6 +49,13 @@ class GoalContactListener(b2ContactListener):
         contact_start_time (dict): Start time of each contact
         current_time (float): Current simulation time
         contact_events (list): Detailed list of contact events
+        goal_pair (frozenset | None): Contact pair of the level's ContactGoal, if any
+        goal_hold (float): Hold time the goal pair must stay in contact
+        goal_ready_time (float): Earliest simulation time at which the goal can be
+            satisfied — 0.0 without a goal, inf while the goal pair is apart
+        contact_matrix (np.ndarray | None): Symmetric bool matrix of active tracked
+            contacts over the names registered with TrackContactMatrix, updated in
+            place on every contact event; None until a matrix is requested
     """
 
     def __init__(
@@ -64,6 +79,11 @@ class GoalContactListener(b2ContactListener):
         self.profiler = profiler
         self.relevant_pairs = relevant_pairs or set()
 
+        # Optional dense view of self.contacts (see TrackContactMatrix). Set up
+        # before the contact state so subclass setters can rely on it.
+        self.contact_matrix: np.ndarray | None = None
+        self._matrix_index: dict[str, int] = {}
+
         # Contact pairs stored as frozensets for order-independent identity.
         self.contacts = set()
         self.contact_start_time = {}
@@ -72,12 +92,26 @@ class GoalContactListener(b2ContactListener):
         # Logging
         self.contact_events = []
 
+        # Declarative goal tracking (see SetGoal). Without a goal the ready time
+        # stays at 0 so callers always evaluate the success condition.
+        self.goal_pair = None
+        self.goal_hold = 0.0
+        self.goal_ready_time = 0.0
+
+        # Contact watch for event-driven triggers (see WatchContacts).
+        self._watch_pairs: frozenset = frozenset()
+        self._watch_names: frozenset = frozenset()
+        self._watching = False
+        self.watched_contact_began = False
+
     def BeginContact(self, contact: b2Contact):
         name_a = contact.fixtureA.body.userData
         name_b = contact.fixtureB.body.userData
         if name_a and name_b:
             # Use frozenset for consistent contact pair representation
             contact_pair = frozenset((name_a, name_b))
+            if self._watching:
+                self._check_watch(name_a, name_b)
 
             # Check if we should track this contact
             should_track = (
@@ -89,6 +123,10 @@ class GoalContactListener(b2ContactListener):
             if should_track:
                 self.contacts.add(contact_pair)
                 self.contact_start_time[contact_pair] = self.current_time
+                if self.contact_matrix is not None:
+                    self._mark_matrix(name_a, name_b, True)
+                if contact_pair == self.goal_pair:
+                    self.goal_ready_time = self.current_time + self.goal_hold
 
             # Log contact event whenever all-contact tracking is enabled
             if self.track_all_contacts:
@@ -119,6 +157,10 @@ class GoalContactListener(b2ContactListener):
                 # Reset the contact start time when contact ends
                 if contact_pair in self.contact_start_time:
                     del self.contact_start_time[contact_pair]
+                if self.contact_matrix is not None:
+                    self._mark_matrix(name_a, name_b, False)
+                if contact_pair == self.goal_pair:
+                    self.goal_ready_time = math.inf
 
             # Log contact event whenever all-contact tracking is enabled
             if self.track_all_contacts:
@@ -131,6 +173,152 @@ class GoalContactListener(b2ContactListener):
                     }
                 )
 
+    def SetGoal(self, a: str | None, b: str | None = None, hold: float = 0.0):
+        """Track a goal contact pair so its earliest success time is known.
+
+        Args:
+            a: Name of the first goal object, or None to clear the goal
+            b: Name of the second goal object
+            hold: Required contact duration in seconds
+        """
+        if a is None:
+            self.goal_pair = None
+            self.goal_hold = 0.0
+        else:
+            self.goal_pair = frozenset((a, b))
+            self.goal_hold = hold
+        self.SyncGoal()
+
+    def SyncGoal(self):
+        """Recompute goal_ready_time from the current contact state.
+
+        Call after contacts or start times are replaced wholesale (e.g. when a
+        snapshot is restored), since those bypass BeginContact/EndContact.
+        """
+        pair = self.goal_pair
+        if pair is None:
+            self.goal_ready_time = 0.0
+        elif pair in self.contacts and pair in self.contact_start_time:
+            self.goal_ready_time = self.contact_start_time[pair] + self.goal_hold
+        else:
+            self.goal_ready_time = math.inf
+
+    def TrackContactMatrix(self, names):
+        """Maintain contact_matrix over the given object names.
+
+        Row/column i of the matrix corresponds to names[i]. The matrix is
+        allocated once per call and then updated in place by BeginContact,
+        EndContact and invalidate_contact, so readers can hold a reference to
+        it across steps. Contacts with unlisted bodies are ignored.
+
+        Args:
+            names: Object names in matrix order, or None to stop tracking
+
+        Returns:
+            np.ndarray | None: The (n, n) bool contact matrix, or None.
+        """
+        if names is None:
+            self.contact_matrix = None
+            self._matrix_index = {}
+            return None
+        names = list(names)
+        self._matrix_index = {name: i for i, name in enumerate(names)}
+        self.contact_matrix = np.zeros((len(names), len(names)), dtype=np.bool_)
+        self.SyncContactMatrix()
+        return self.contact_matrix
+
+    def SyncContactMatrix(self):
+        """Rebuild contact_matrix from the current contact set.
+
+        Call after contacts are replaced wholesale (e.g. when a snapshot is
+        restored), since those bypass BeginContact/EndContact.
+        """
+        if self.contact_matrix is None:
+            return
+        self.contact_matrix[:] = False
+        for pair in self.contacts:
+            if len(pair) == 2:
+                a, b = tuple(pair)
+                self._mark_matrix(a, b, True)
+
+    def _mark_matrix(self, a, b, value: bool):
+        """Set the symmetric contact_matrix entries for a and b, if both are tracked."""
+        index = self._matrix_index
+        i = index.get(a)
+        j = index.get(b)
+        if i is not None and j is not None:
+            self.contact_matrix[i, j] = value
+            self.contact_matrix[j, i] = value
+
+    def WatchContacts(self, watched=()):
+        """Raise watched_contact_began when a watched contact begins.
+
+        Each entry is a tuple of one or two object names: a pair watches contacts
+        between those two objects, a single name watches any contact involving
+        that object. The flag is only ever set here and in BeginContact; callers
+        clear it themselves. Pass nothing to stop watching.
+
+        Args:
+            watched: Iterable of 1- or 2-tuples of object names
+        """
+        pairs = set()
+        names = set()
+        for entry in watched:
+            if len(entry) == 2:
+                pairs.add(frozenset(entry))
+            elif len(entry) == 1:
+                names.add(entry[0])
+            else:
+                raise ValueError(
+                    f"Watched contacts need 1 or 2 object names, got {entry!r}"
+                )
+        self._watch_pairs = frozenset(pairs)
+        self._watch_names = frozenset(names)
+        self._watching = bool(pairs or names)
+        self.watched_contact_began = False
+
+    def _check_watch(self, name_a, name_b):
+        """Set watched_contact_began if a contact between name_a and name_b is watched."""
+        if (
+            name_a in self._watch_names
+            or name_b in self._watch_names
+            or frozenset((name_a, name_b)) in self._watch_pairs
+        ):
+            self.watched_contact_began = True
+
+    def SetBodies(self, names):
+        """Register the body names of a freshly built world.
+
+        The full listener keys everything by name and needs no registration;
+        LeanContactListener uses this to assign integer body IDs.
+
+        Args:
+            names: Body names in creation order
+        """
+
+    def HasContact(self, a, b):
+        """Check whether two objects are currently in contact.
+
+        Args:
+            a: Name of the first object
+            b: Name of the second object
+
+        Returns:
+            bool: True if the pair is in the active contact set.
+        """
+        return frozenset((a, b)) in self.contacts
+
+    def HasContactWith(self, name):
+        """Check whether an object is currently in contact with anything.
+
+        Args:
+            name: Name of the object
+
+        Returns:
+            bool: True if any active contact pair involves the object.
+        """
+        return any(name in pair for pair in self.contacts)
+
     def Update(self, dt):
         """Update the internal simulation time counter.
 
@@ -229,6 +417,9 @@ class GoalContactListener(b2ContactListener):
         self.contact_start_time = {}
         self.contact_events = []
         self.current_time = 0.0
+        if self.contact_matrix is not None:
+            self.contact_matrix[:] = False
+        self.SyncGoal()
 
     def invalidate_contact(self, contact_pair):
         """Invalidate a tracked contact pair when external validation determines it is invalid.
@@ -240,6 +431,10 @@ class GoalContactListener(b2ContactListener):
         # Remove any recorded start time
         if contact_pair in self.contact_start_time:
             del self.contact_start_time[contact_pair]
+        if self.contact_matrix is not None and len(contact_pair) == 2:
+            self._mark_matrix(*tuple(contact_pair), False)
+        if contact_pair == self.goal_pair:
+            self.goal_ready_time = math.inf
         # Log contact invalidation event whenever all-contact tracking is enabled
         if self.track_all_contacts:
             self.contact_events.append(
@@ -252,6 +447,340 @@ class GoalContactListener(b2ContactListener):
             )
 
 
+# Event kinds stored in LeanContactListener's ring buffer, indexed by code.
+_EVENT_KINDS = ("begin", "end", "invalidate")
+_BEGIN, _END, _INVALIDATE = 0, 1, 2
+
+
+class LeanContactListener(GoalContactListener):
+    """GoalContactListener variant with integer body IDs and bounded event storage.
+
+    Bodies are assigned small integer IDs when the world is built (SetBodies),
+    and all per-pair state lives in preallocated numpy arrays indexed by the
+    sorted ID pair (i < j): an active-contact adjacency matrix, a contact start
+    time matrix (NaN when absent) and per-pair begin/end/invalidate counters
+    maintained incrementally. Contact events go to a fixed-capacity ring buffer,
+    so long simulations keep memory bounded and get_contact_statistics() is
+    independent of run length.
+
+    The name-keyed attributes of GoalContactListener (contacts,
+    contact_start_time, contact_events) remain available as properties that
+    build the equivalent views on demand, and assigning them rebuilds the
+    arrays, so snapshot restore and event-log consumers work unchanged. The
+    views are copies: mutating them in place does not update the listener.
+    get_contact_log() returns at most event_capacity of the most recent events;
+    statistics still count every event since the last reset.
+
+    Attributes:
+        event_capacity (int): Maximum number of events kept in the ring buffer
+    """
+
+    def __init__(
+        self,
+        track_all_contacts: bool = True,
+        track_relevant_only: bool = False,
+        profiler: PerformanceProfiler | None = None,
+        relevant_pairs: set | None = None,
+        event_capacity: int = 4096,
+    ):
+        """Initialize the lean contact listener.
+
+        Args:
+            track_all_contacts: Whether to track all contact events (default: True)
+            track_relevant_only: Whether to only track relevant pairs for performance (default: False)
+            profiler: Performance profiler for timing analysis (default: None)
+            relevant_pairs: Set of contact pairs to track for performance (default: None)
+            event_capacity: Ring buffer size for the contact event log (default: 4096)
+        """
+        if event_capacity < 1:
+            raise ValueError("event_capacity must be at least 1")
+        self.event_capacity = event_capacity
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._allocate(16)
+        self._event_time = np.zeros(event_capacity, dtype=np.float64)
+        self._event_kind = np.zeros(event_capacity, dtype=np.int8)
+        self._event_a = np.zeros(event_capacity, dtype=np.int32)
+        self._event_b = np.zeros(event_capacity, dtype=np.int32)
+        self._event_total = 0
+        self._goal_ids: tuple[int, int] | None = None
+        super().__init__(
+            track_all_contacts=track_all_contacts,
+            track_relevant_only=track_relevant_only,
+            profiler=profiler,
+            relevant_pairs=relevant_pairs,
+        )
+
+    def _allocate(self, capacity: int):
+        """(Re)allocate the per-pair arrays for up to capacity bodies, keeping state."""
+        active = np.zeros((capacity, capacity), dtype=bool)
+        start = np.full((capacity, capacity), np.nan, dtype=np.float64)
+        counts = np.zeros((capacity, capacity, 3), dtype=np.int64)
+        n = len(self._names)
+        if n:
+            active[:n, :n] = self._active[:n, :n]
+            start[:n, :n] = self._start[:n, :n]
+            counts[:n, :n] = self._counts[:n, :n]
+        self._active = active
+        self._start = start
+        self._counts = counts
+
+    def _intern(self, name: str) -> int:
+        """Return the ID for name, assigning a new one (and growing arrays) if needed."""
+        body_id = self._ids.get(name)
+        if body_id is None:
+            body_id = len(self._names)
+            if body_id >= self._active.shape[0]:
+                self._allocate(2 * self._active.shape[0])
+            self._ids[name] = body_id
+            self._names.append(name)
+        return body_id
+
+    def _log(self, kind: int, a: int, b: int):
+        """Append an event to the ring buffer and bump the pair's counter."""
+        slot = self._event_total % self.event_capacity
+        self._event_time[slot] = self.current_time
+        self._event_kind[slot] = kind
+        self._event_a[slot] = a
+        self._event_b[slot] = b
+        self._event_total += 1
+        if a < b:
+            self._counts[a, b, kind] += 1
+        else:
+            self._counts[b, a, kind] += 1
+
+    def SetBodies(self, names):
+        """Assign integer IDs to the bodies of a freshly built world.
+
+        IDs follow creation order, so the arrays only grow later if bodies are
+        added to the world after it is built (e.g. by interventions).
+
+        Args:
+            names: Body names in creation order
+        """
+        self._ids = {}
+        self._names = []
+        self._allocate(max(16, len(names)))
+        for name in names:
+            self._intern(name)
+        self._event_total = 0
+        # Goal IDs refer to the old mapping; Box2DEngine.reset() re-sets the goal.
+        self._goal_ids = None
+
+    def SetGoal(self, a: str | None, b: str | None = None, hold: float = 0.0):
+        if a is None:
+            self._goal_ids = None
+        else:
+            i, j = self._intern(a), self._intern(b)
+            self._goal_ids = (i, j) if i < j else (j, i)
+        super().SetGoal(a, b, hold)
+
+    SetGoal.__doc__ = GoalContactListener.SetGoal.__doc__
+
+    def _should_track(self, name_a, name_b) -> bool:
+        return (
+            self.track_all_contacts
+            or not self.track_relevant_only
+            or frozenset((name_a, name_b)) in self.relevant_pairs
+        )
+
+    def BeginContact(self, contact: b2Contact):
+        name_a = contact.fixtureA.body.userData
+        name_b = contact.fixtureB.body.userData
+        if name_a and name_b:
+            ids = self._ids
+            a = ids.get(name_a)
+            if a is None:
+                a = self._intern(name_a)
+            b = ids.get(name_b)
+            if b is None:
+                b = self._intern(name_b)
+            i, j = (a, b) if a < b else (b, a)
+            if self._watching:
+                self._check_watch(name_a, name_b)
+            if self._should_track(name_a, name_b):
+                self._active[i, j] = True
+                self._start[i, j] = self.current_time
+                if self.contact_matrix is not None:
+                    self._mark_matrix(name_a, name_b, True)
+                if (i, j) == self._goal_ids:
+                    self.goal_ready_time = self.current_time + self.goal_hold
+            if self.track_all_contacts:
+                self._log(_BEGIN, a, b)
+
+    def EndContact(self, contact: b2Contact):
+        name_a = contact.fixtureA.body.userData
+        name_b = contact.fixtureB.body.userData
+        if name_a and name_b:
+            ids = self._ids
+            a = ids.get(name_a)
+            if a is None:
+                a = self._intern(name_a)
+            b = ids.get(name_b)
+            if b is None:
+                b = self._intern(name_b)
+            i, j = (a, b) if a < b else (b, a)
+            if self._should_track(name_a, name_b):
+                self._active[i, j] = False
+                self._start[i, j] = np.nan
+                if self.contact_matrix is not None:
+                    self._mark_matrix(name_a, name_b, False)
+                if (i, j) == self._goal_ids:
+                    self.goal_ready_time = math.inf
+            if self.track_all_contacts:
+                self._log(_END, a, b)
+
+    @property
+    def contacts(self) -> set:
+        """Currently active contact pairs as frozensets of names (built on demand)."""
+        names = self._names
+        return {
+            frozenset((names[i], names[j])) for i, j in zip(*np.nonzero(self._active))
+        }
+
+    @contacts.setter
+    def contacts(self, pairs):
+        self._active[:] = False
+        for pair in pairs:
+            a, b = tuple(pair)
+            i, j = self._intern(a), self._intern(b)
+            self._active[min(i, j), max(i, j)] = True
+
+    @property
+    def contact_start_time(self) -> dict:
+        """Start time of each recorded contact, keyed by frozenset (built on demand)."""
+        names = self._names
+        start = self._start
+        return {
+            frozenset((names[i], names[j])): float(start[i, j])
+            for i, j in zip(*np.nonzero(~np.isnan(start)))
+        }
+
+    @contact_start_time.setter
+    def contact_start_time(self, start_times):
+        self._start[:] = np.nan
+        for pair, time in start_times.items():
+            a, b = tuple(pair)
+            i, j = self._intern(a), self._intern(b)
+            self._start[min(i, j), max(i, j)] = time
+
+    @property
+    def contact_events(self) -> list:
+        """Buffered contact events, oldest first, as GoalContactListener-style dicts."""
+        total = self._event_total
+        capacity = self.event_capacity
+        names = self._names
+        events = []
+        for n in range(max(0, total - capacity), total):
+            slot = n % capacity
+            a = names[self._event_a[slot]]
+            b = names[self._event_b[slot]]
+            events.append(
+                {
+                    "time": float(self._event_time[slot]),
+                    "event": _EVENT_KINDS[self._event_kind[slot]],
+                    "pair": frozenset((a, b)),
+                    "objects": (a, b),
+                }
+            )
+        return events
+
+    @contact_events.setter
+    def contact_events(self, events):
+        self._event_total = 0
+        self._counts[:] = 0
+        saved_time = self.current_time
+        try:
+            for event in events:
+                a, b = event["objects"]
+                self.current_time = event["time"]
+                self._log(
+                    _EVENT_KINDS.index(event["event"]),
+                    self._intern(a),
+                    self._intern(b),
+                )
+        finally:
+            self.current_time = saved_time
+
+    def HasContact(self, a, b):
+        i = self._ids.get(a)
+        j = self._ids.get(b)
+        if i is None or j is None:
+            return False
+        return bool(self._active[i, j] if i < j else self._active[j, i])
+
+    HasContact.__doc__ = GoalContactListener.HasContact.__doc__
+
+    def HasContactWith(self, name):
+        i = self._ids.get(name)
+        if i is None:
+            return False
+        return bool(self._active[i].any() or self._active[:, i].any())
+
+    HasContactWith.__doc__ = GoalContactListener.HasContactWith.__doc__
+
+    def _pair_start(self, a, b) -> float | None:
+        """Start time of an active tracked contact between a and b, else None."""
+        i = self._ids.get(a)
+        j = self._ids.get(b)
+        if i is None or j is None:
+            return None
+        if i > j:
+            i, j = j, i
+        start = self._start[i, j]
+        if not self._active[i, j] or math.isnan(start):
+            return None
+        return float(start)
+
+    def GetContactDuration(self, a, b):
+        start = self._pair_start(a, b)
+        return 0 if start is None else self.current_time - start
+
+    GetContactDuration.__doc__ = GoalContactListener.GetContactDuration.__doc__
+
+    def IsInContactForDuration(self, a, b, required_duration):
+        start = self._pair_start(a, b)
+        return start is not None and self.current_time - start >= required_duration
+
+    IsInContactForDuration.__doc__ = GoalContactListener.IsInContactForDuration.__doc__
+
+    def get_contact_statistics(self):
+        """Get statistics about all contacts, from the incremental per-pair counters."""
+        names = self._names
+        counts = self._counts
+        pair_counts = {}
+        for i, j in zip(*np.nonzero(counts.any(axis=2))):
+            begins, ends, invalidates = counts[i, j].tolist()
+            pair_counts[frozenset((names[i], names[j]))] = {
+                "begins": begins,
+                "ends": ends,
+                "invalidates": invalidates,
+            }
+        return {
+            "total_events": self._event_total,
+            "unique_pairs": len(pair_counts),
+            "pair_counts": pair_counts,
+            "current_contacts": int(np.count_nonzero(self._active)),
+        }
+
+    def invalidate_contact(self, contact_pair):
+        names = tuple(contact_pair)
+        if len(names) != 2:
+            return
+        a, b = self._intern(names[0]), self._intern(names[1])
+        i, j = (a, b) if a < b else (b, a)
+        self._active[i, j] = False
+        self._start[i, j] = np.nan
+        if self.contact_matrix is not None:
+            self._mark_matrix(names[0], names[1], False)
+        if (i, j) == self._goal_ids:
+            self.goal_ready_time = math.inf
+        if self.track_all_contacts:
+            self._log(_INVALIDATE, a, b)
+
+    invalidate_contact.__doc__ = GoalContactListener.invalidate_contact.__doc__
+
+
 class Box2DEngine:
     """Main physics engine for the Interphyre simulation.
 
@@ -285,17 +814,36 @@ class Box2DEngine:
         self.world.subStepping = self.config.substepping
         self.world.continuousPhysics = self.config.continuous_physics
 
-        self.contact_listener = GoalContactListener(
-            track_all_contacts=self.config.track_all_contacts,
-            track_relevant_only=self.config.track_relevant_contacts_only,
-            profiler=self.profiler,
-        )
+        if self.config.lean_contact_tracking:
+            self.contact_listener = LeanContactListener(
+                track_all_contacts=self.config.track_all_contacts,
+                track_relevant_only=self.config.track_relevant_contacts_only,
+                profiler=self.profiler,
+                event_capacity=self.config.contact_event_capacity,
+            )
+        else:
+            self.contact_listener = GoalContactListener(
+                track_all_contacts=self.config.track_all_contacts,
+                track_relevant_only=self.config.track_relevant_contacts_only,
+                profiler=self.profiler,
+            )
         self.world.contactListener = self.contact_listener
 
         # Velocity history for time-based stationary detection (bounded sliding window)
         self._velocity_history: deque[float] = deque(
             maxlen=self.config.stationary_check_frames
         )
+        # Early-termination bookkeeping for settled_outcome(): dynamic bodies
+        # (built lazily per rollout) and the current run of quiet frames.
+        self._settle_bodies: list | None = None
+        self._quiet_frames = 0
+        # Float tolerance for check_success()'s goal ready-time gate.
+        self._goal_slack = 0.5 * self.config.time_step
+        # Structural version of each object body; a new version is drawn whenever
+        # a body is created from the object's attributes.
+        self.structure_versions: dict[str, int] = {}
+        # StateSnapshot layout of the current bodies, reused until they change.
+        self._snapshot_layout = None
 
         self.reset(level)
 
@@ -314,11 +862,15 @@ class Box2DEngine:
         self.level = level
         self.contact_listener.ClearContacts()
         self.bodies = {}
+        self.structure_versions = {}
         self._velocity_history = deque(maxlen=self.config.stationary_check_frames)
+        self._settle_bodies = None
+        self._quiet_frames = 0
         if level is not None:
             self._create_world(level)
             # Update relevant contact pairs based on level
             self._update_relevant_contacts()
+        self._update_goal_tracking()
 
     def reset_attempt(self) -> None:
         """Reset engine state between oracle attempts without rebuilding the world.
@@ -336,6 +888,7 @@ class Box2DEngine:
         for name in self.level.action_objects:
             if name in self.bodies:
                 self.world.DestroyBody(self.bodies.pop(name))
+                self.structure_versions.pop(name, None)
 
         # Restore dynamic non-action level bodies to initial positions.
         # The level object stores the original geometry (x, y, angle in degrees).
@@ -355,6 +908,8 @@ class Box2DEngine:
 
         self.contact_listener.ClearContacts()
         self._velocity_history = deque(maxlen=self.config.stationary_check_frames)
+        self._settle_bodies = None
+        self._quiet_frames = 0
 
     def close(self) -> None:
         """Destroy the Box2D world and release native memory.
@@ -372,6 +927,13 @@ class Box2DEngine:
         self.world = None
 
     def _create_world(self, level):
+        # Body IDs for the lean listener follow creation order; action objects
+        # get theirs up front so placing them later does not grow the tables.
+        self.contact_listener.SetBodies(
+            ["left_wall", "right_wall", "top_wall", "bottom_wall"]
+            + sorted(level.objects.keys())
+        )
+
         # Create walls on the edges of the screen
         left_wall, right_wall, top_wall, bottom_wall = create_walls(
             self.world, 0.01, 10, 10
@@ -415,6 +977,20 @@ class Box2DEngine:
             else:
                 raise ValueError(f"Unknown object type for '{name}': {type(obj)}")
             self.bodies[name] = body
+            self.mark_structure_changed(name)
+
+    def mark_structure_changed(self, name: str) -> None:
+        """Record that the body of an object was (re)built from its attributes.
+
+        StateSnapshot.restore() only rebuilds bodies whose structural version
+        differs from the one captured in the snapshot, so every code path that
+        creates a body for a level object must call this.
+
+        Args:
+            name: Name of the object whose body was created
+        """
+        self.structure_versions[name] = next(_STRUCTURE_VERSIONS)
+        self._snapshot_layout = None
 
     def _update_relevant_contacts(self):
         """Update the list of relevant contact pairs based on the level's success condition."""
@@ -434,6 +1010,15 @@ class Box2DEngine:
 
         self.contact_listener.relevant_pairs = relevant_pairs
 
+    def _update_goal_tracking(self):
+        """Point the contact listener at the level's declarative goal, if any."""
+        goal = self.level.goal if self.level is not None else None
+        if goal is None:
+            self.contact_listener.SetGoal(None)
+            return
+        hold = goal.hold if goal.hold is not None else self.config.default_success_time
+        self.contact_listener.SetGoal(goal.a, goal.b, hold)
+
     def place_action_objects(
         self,
         positions: list[tuple[int | float, int | float, int | float]],
@@ -493,6 +1078,9 @@ class Box2DEngine:
             else:
                 raise ValueError(f"Unknown object type for '{name}': {type(obj)}")
             self.bodies[name] = body
+            self.mark_structure_changed(name)
+        self._settle_bodies = None
+        self._quiet_frames = 0
 
     def get_state(self) -> dict[str, Any]:
         """
@@ -561,8 +1149,7 @@ class Box2DEngine:
         """
         Check if the two object names have come into contact.
         """
-        contact_pair = frozenset((name1, name2))
-        return contact_pair in self.contact_listener.contacts
+        return self.contact_listener.HasContact(name1, name2)
 
     def world_is_stationary(self) -> bool:
         """Check if the world is stationary using time-based averaging.
@@ -607,6 +1194,89 @@ class Box2DEngine:
             vel <= self.config.stationary_tolerance for vel in self._velocity_history
         )
 
+    def settled_outcome(self, remaining_steps: int) -> bool | None:
+        """Resolve the rollout outcome early once the world has settled.
+
+        A settled world is one where every dynamic body is asleep or below
+        stationary_tolerance for stationary_check_frames consecutive frames — the
+        same criterion as world_is_stationary, tracked with an early-exit counter
+        so the per-step cost is usually a single body read. In that state no
+        contact begins or ends, so the only quantity still changing is the contact
+        clock. The success condition is therefore probed with the clock advanced
+        to the end of the remaining step budget: True means every contact hold it
+        needs will complete in time, False means none can.
+
+        Call once per physics step; the quiet-frame count is cleared by reset(),
+        reset_attempt() and place_action_objects().
+
+        Args:
+            remaining_steps: Physics steps left in the rollout budget.
+
+        Returns:
+            bool | None: None while the world is still moving (or the outcome
+                         falls within a step of the budget boundary), otherwise
+                         True if success is guaranteed within remaining_steps and
+                         False if it is out of reach.
+
+        Raises:
+            ValueError: If level is not set.
+        """
+        if self.level is None:
+            raise ValueError(
+                "Level is not set. Please call reset() before checking for stationary bodies."
+            )
+        if self._settle_bodies is None:
+            self._settle_bodies = [
+                body for body in self.bodies.values() if body.type == b2_dynamicBody
+            ]
+        bodies = self._settle_bodies
+        tolerance = self.config.stationary_tolerance
+        for i, body in enumerate(bodies):
+            if body.awake and (
+                body.linearVelocity.length > tolerance
+                or abs(body.angularVelocity) > tolerance
+            ):
+                # Move the offender to the front: it is the likeliest to still be
+                # moving next frame, which keeps the common case to one body read.
+                bodies[0], bodies[i] = body, bodies[0]
+                self._quiet_frames = 0
+                return None
+
+        self._quiet_frames += 1
+        if self._quiet_frames < self.config.stationary_check_frames:
+            return None
+
+        # Probe one step either side of the budget so float drift in the
+        # accumulated clock can never flip the verdict: a hold that only
+        # completes on the very last step is left to the real simulation.
+        listener = self.contact_listener
+        current_time = listener.current_time
+        time_step = self.config.time_step
+        try:
+            listener.current_time = current_time + (remaining_steps + 1) * time_step
+            if not self.level.success_condition(self):
+                return False
+            listener.current_time = current_time + (remaining_steps - 1) * time_step
+            if self.level.success_condition(self):
+                return True
+            return None
+        finally:
+            listener.current_time = current_time
+
+    def is_settled_failure(self, remaining_steps: int) -> bool:
+        """Check if the world has settled such that the level can no longer succeed.
+
+        Equivalent to settled_outcome(remaining_steps) is False.
+
+        Args:
+            remaining_steps: Physics steps left in the rollout budget.
+
+        Returns:
+            bool: True if the world is settled and the success condition cannot
+                  become True within remaining_steps, False otherwise.
+        """
+        return self.settled_outcome(remaining_steps) is False
+
     def _is_point_inside_polygon(
         self, x: float, y: float, polygon: list[tuple[float, float]]
     ) -> bool:
@@ -623,6 +1293,25 @@ class Box2DEngine:
             p1x, p1y = p2x, p2y
         return inside
 
+    def check_success(self) -> bool:
+        """Evaluate the level's success condition, skipping it while it cannot hold.
+
+        For levels whose success_condition is a ContactGoal, the contact listener
+        knows the earliest simulation time at which the goal pair can have been
+        in contact for the hold time. Before then the predicate is not called at
+        all; from then on it is evaluated as usual, so the result is identical to
+        calling level.success_condition(engine) directly. Half a time step of
+        slack keeps float rounding in the ready time from skipping a true result.
+        Levels with opaque callables are always evaluated.
+
+        Returns:
+            bool: True if the level's success condition is met.
+        """
+        listener = self.contact_listener
+        if listener.current_time + self._goal_slack < listener.goal_ready_time:
+            return False
+        return self.level.success_condition(self)
+
     def is_in_contact_for_duration(self, a, b, success_time: float | None = None):
         """Check if objects are currently in unbroken contact for the required duration.
 
@@ -685,3 +1374,254 @@ class Box2DEngine:
     def get_contact_statistics(self):
         """Get statistics about all contacts for research purposes."""
         return self.contact_listener.get_contact_statistics()
+
+
+class BatchRollout(NamedTuple):
+    """Per-world results of BatchedBox2DEngine.run().
+
+    All arrays have length N (the number of worlds); worlds excluded by the
+    run's active mask report success=False, steps=0 and termination_reason "".
+    """
+
+    success: np.ndarray  # bool[N]
+    truncated: np.ndarray  # bool[N]
+    steps: np.ndarray  # int64[N], physics steps simulated
+    termination_reason: np.ndarray  # str[N]: "success", "max_steps", ...
+    final_states: np.ndarray  # float64[N, n_bodies, 6]: x, y, angle, vx, vy, omega
+    body_names: tuple[str, ...]  # row order of final_states' second axis
+
+
+class BatchedBox2DEngine:
+    """N independent worlds of one level, placed and stepped in lockstep.
+
+    Each world is a full Box2DEngine built from its own clone of the level, so
+    world creation, action placement and contact tracking follow exactly the
+    same code as a single-world rollout. run() places one action per world and
+    advances every unfinished world one physics step at a time, dropping worlds
+    from the active set as they terminate, and applies the same termination
+    rules as InterphyreEnv.step() (including config.early_termination and
+    config.success_hold_shortcut). No observations, info dicts or rendering are
+    built along the way.
+
+    Every run() starts each active world with reset_attempt(), exactly as
+    InterphyreEnv.reset() does for an already-built world, so the n-th run()
+    of world i is bit-identical to the n-th reset() + step() on an environment
+    built for the same level and config.
+
+    Attributes:
+        level (Level): The level shared by every world
+        config (SimulationConfig): Simulation configuration for every world
+        engines (list[Box2DEngine]): One engine per world
+    """
+
+    def __init__(
+        self,
+        level: Level,
+        n_worlds: int,
+        config: SimulationConfig | None = None,
+    ):
+        """Build n_worlds independent worlds of level.
+
+        Args:
+            level: Level to simulate. Each world gets its own clone, because
+                placing action objects mutates the level's object descriptions.
+            n_worlds: Number of worlds to hold
+            config: Simulation configuration (default: SimulationConfig())
+
+        Raises:
+            ValueError: If n_worlds is less than 1.
+        """
+        if n_worlds < 1:
+            raise ValueError("n_worlds must be at least 1")
+        self.level = level
+        self.config = config or SimulationConfig()
+        self.engines = [
+            Box2DEngine(level=level.clone(new_name=level.name), config=self.config)
+            for _ in range(n_worlds)
+        ]
+        self._body_names = tuple(sorted(level.objects.keys()))
+
+    @property
+    def n_worlds(self) -> int:
+        """Number of worlds in the batch."""
+        return len(self.engines)
+
+    def run(
+        self,
+        positions: np.ndarray | list,
+        max_steps: int | None = None,
+        active: np.ndarray | None = None,
+    ) -> BatchRollout:
+        """Place one action per world and simulate all worlds to completion.
+
+        Positions are used as given (already converted and validated, as
+        InterphyreEnv.step() does before placing); see InterphyreEnv.step_batch
+        for the validating front end.
+
+        Args:
+            positions: Array-like of shape (N, k*3) or (N, k, 3) with (x, y, size)
+                per action object, N equal to n_worlds.
+            max_steps: Physics step budget per world (default: config.max_steps)
+            active: Optional bool[N] mask; worlds where it is False are neither
+                reset nor simulated.
+
+        Returns:
+            BatchRollout with per-world outcome arrays.
+
+        Raises:
+            ValueError: If positions or active do not match the batch shape.
+            RuntimeError: If config.verify_early_termination is set and a full
+                rollout disagrees with its shortcut verdict.
+        """
+        n = self.n_worlds
+        k = len(self.level.action_objects)
+        placements = np.asarray(positions, dtype=np.float64)
+        if placements.size == 0 and k == 0:
+            placements = placements.reshape(n, 0, 3)
+        if placements.shape[0] != n or placements.size != n * k * 3:
+            raise ValueError(
+                f"Expected positions of shape ({n}, {k * 3}) or ({n}, {k}, 3), "
+                f"got {placements.shape}"
+            )
+        placements = placements.reshape(n, k, 3)
+        if active is None:
+            active_mask = np.ones(n, dtype=bool)
+        else:
+            active_mask = np.asarray(active, dtype=bool)
+            if active_mask.shape != (n,):
+                raise ValueError(
+                    f"Expected active mask of shape ({n},), got {active_mask.shape}"
+                )
+        if max_steps is None:
+            max_steps = self.config.max_steps
+
+        success = np.zeros(n, dtype=bool)
+        truncated = np.zeros(n, dtype=bool)
+        steps = np.zeros(n, dtype=np.int64)
+        reasons = np.full(n, "", dtype="<U12")
+
+        running = []
+        for i in np.flatnonzero(active_mask):
+            engine = self.engines[i]
+            engine.reset_attempt()
+            engine.place_action_objects([tuple(p) for p in placements[i].tolist()])
+            running.append(int(i))
+
+        _lockstep_rollouts(
+            self.engines,
+            running,
+            max_steps,
+            self.config,
+            success,
+            truncated,
+            steps,
+            reasons,
+        )
+
+        return BatchRollout(
+            success=success,
+            truncated=truncated,
+            steps=steps,
+            termination_reason=reasons,
+            final_states=self._final_states(active_mask),
+            body_names=self._body_names,
+        )
+
+    def _final_states(self, active_mask: np.ndarray) -> np.ndarray:
+        """(x, y, angle, vx, vy, omega) per world and level object; NaN if absent."""
+        states = np.full((self.n_worlds, len(self._body_names), 6), np.nan)
+        for i in np.flatnonzero(active_mask):
+            bodies = self.engines[i].bodies
+            for j, name in enumerate(self._body_names):
+                body = bodies.get(name)
+                if body is None:
+                    continue
+                position = body.position
+                velocity = body.linearVelocity
+                states[i, j] = (
+                    position.x,
+                    position.y,
+                    body.angle,
+                    velocity.x,
+                    velocity.y,
+                    body.angularVelocity,
+                )
+        return states
+
+    def close(self) -> None:
+        """Destroy every world and release native memory."""
+        for engine in self.engines:
+            engine.close()
+
+
+def _lockstep_rollouts(
+    engines: list[Box2DEngine],
+    running: list[int],
+    max_steps: int,
+    config: SimulationConfig,
+    success: np.ndarray,
+    truncated: np.ndarray,
+    steps: np.ndarray,
+    reasons: np.ndarray,
+) -> None:
+    """Simulate engines[i] for i in running to the end of their rollouts.
+
+    Every listed engine must already have its action objects placed. Mirrors
+    InterphyreEnv._run_simulation_rollout step for step; a world leaves the
+    running list as soon as its rollout would have ended. Outcomes are written
+    into the output arrays at each world's index.
+
+    Raises:
+        RuntimeError: If config.verify_early_termination is set and a full
+            rollout disagrees with its shortcut verdict.
+    """
+    time_step = config.time_step
+    velocity_iters = config.velocity_iters
+    position_iters = config.position_iters
+    early_termination = config.early_termination
+    success_hold_shortcut = config.success_hold_shortcut
+    verify = config.verify_early_termination
+    check_settled = early_termination or success_hold_shortcut
+    predicted: dict[int, tuple[bool, int]] = {}
+
+    for i in running:
+        reasons[i] = "max_steps"
+    for step_index in range(max_steps):
+        if not running:
+            break
+        still_running = []
+        last_step = step_index >= max_steps - 1
+        for i in running:
+            engine = engines[i]
+            engine.world.Step(time_step, velocity_iters, position_iters)
+            engine.contact_listener.Update(time_step)
+            steps[i] = step_index + 1
+            if engine.check_success():
+                success[i] = True
+                reasons[i] = "success"
+                continue
+            if last_step:
+                truncated[i] = True
+                continue
+            if check_settled and i not in predicted:
+                outcome = engine.settled_outcome(max_steps - step_index - 1)
+                if outcome is not None and (
+                    success_hold_shortcut if outcome else early_termination
+                ):
+                    if verify:
+                        predicted[i] = (outcome, step_index + 1)
+                    else:
+                        success[i] = outcome
+                        truncated[i] = not outcome
+                        reasons[i] = "success_hold" if outcome else "stationary"
+                        continue
+            still_running.append(i)
+        running = still_running
+
+    for i, (outcome, at_step) in predicted.items():
+        if outcome != success[i]:
+            raise RuntimeError(
+                f"Early termination predicted success={outcome} at step "
+                f"{at_step} in world {i}, but the full rollout ended with "
+                f"success={bool(success[i])} at step {steps[i]}"
+            )
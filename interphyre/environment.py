@@ -2,18 +2,29 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import pickle
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import gymnasium as gym
 import numpy as np
 
 from interphyre.config import PRECISION, SimulationConfig
-from interphyre.engine import Box2DEngine
+from interphyre.engine import Box2DEngine, _lockstep_rollouts
+from interphyre.interventions.store import SnapshotStore
 from interphyre.level import Level
 from interphyre.render import Renderer
-from interphyre.validation.placement import is_valid_placement
+from interphyre.validation.placement import (
+    is_valid_placement,
+    placement_mask,
+    validate_placements,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from Box2D import b2Body
 
     from interphyre.interventions.state import StateSnapshot
@@ -23,13 +34,57 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Continuous sample_valid_action() draws candidates in batches of this size.
+_SAMPLE_BATCH_SIZE = 256
+_SAMPLE_BATCHES = 64
+
+
+class LazyObservation:
+    """Observation placeholder that is computed on first access.
+
+    Returned by InterphyreEnv when lazy_observations=True. Call get() (or use
+    indexing / np.asarray) to obtain the value. A proxy that is still alive when
+    the environment is about to change state is computed first, so it always
+    reflects the state it was returned for; proxies dropped unread cost nothing.
+    """
+
+    __slots__ = ("__weakref__", "_compute", "_value")
+
+    def __init__(self, compute: Callable[[], Any]) -> None:
+        self._compute: Callable[[], Any] | None = compute
+        self._value: Any = None
+
+    @property
+    def computed(self) -> bool:
+        """Whether the observation has been built."""
+        return self._compute is None
+
+    def get(self) -> Any:
+        """Return the observation, building it on the first call."""
+        if self._compute is not None:
+            self._value = self._compute()
+            self._compute = None
+        return self._value
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.get()[key]
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        return np.asarray(self.get(), dtype=dtype)
+
+    def __repr__(self) -> str:
+        if self._compute is not None:
+            return "LazyObservation(<pending>)"
+        return f"LazyObservation({self._value!r})"
+
 
 class _BranchContext:
     """Non-destructive counterfactual scope. Restores the world on enter and exit."""
 
     def __init__(self, env: "InterphyreEnv", snapshot: "StateSnapshot") -> None:
         self._env = env
-        self._snapshot = snapshot
+        # Resolved once so the store cannot evict it between enter and exit.
+        self._snapshot = env._resolve_snapshot(snapshot)
 
     def __enter__(self) -> "_BranchContext":
         self._env.restore(self._snapshot)
@@ -67,13 +122,16 @@ class InterphyreEnv(gym.Env):
         "name": "InterphyreEnv",
     }
 
+    # Column order of the "physics_array" observation's state array.
+    physics_array_fields = ("x", "y", "vx", "vy", "angle", "angular_velocity")
+
     def __init__(
         self,
         level_name: str | "Level",
         seed: int | None = None,
         config: SimulationConfig | None = None,
         render_mode: str | None = None,
-        observation_type: str = "physics_state",
+        observation_type: str | None = "physics_state",
         action_type: str = "continuous",
         image_size: tuple[int, int] = (600, 600),
         image_ppm: float = 60.0,
@@ -81,6 +139,9 @@ class InterphyreEnv(gym.Env):
         enable_interventions: bool = False,
         validate: bool = True,
         registry: "SeedRegistry | None" = None,
+        copy_observations: bool = False,
+        lazy_observations: bool = False,
+        evaluate_only: bool = False,
     ):
         """Initialize the Phyre environment.
 
@@ -92,7 +153,9 @@ class InterphyreEnv(gym.Env):
                 Defaults to seed 0 when None.
             config: Optional simulation configuration (uses defaults if None)
             render_mode: Rendering mode - "human" for pygame, "rgb_array" for images, None for no rendering
-            observation_type: Type of observation space ("physics_state", "image", "both")
+            observation_type: Type of observation space ("physics_state",
+                "physics_array", "image", "both"), or None to return None
+                instead of observations (observation_space is then None)
             action_type: Type of action space ("continuous", "discrete")
             image_size: Size of rendered images (width, height) for image observations
             image_ppm: Pixels per Box2D unit for image rendering
@@ -109,6 +172,16 @@ class InterphyreEnv(gym.Env):
                 Only use False when developing oracles or inspecting raw geometry.
             registry: Optional SeedRegistry for bundled/SQLite lookup. When None,
                 the module-level default registry is used.
+            copy_observations: If True, "physics_array" observations are fresh
+                copies. By default the same state and contact buffers are
+                returned (and overwritten) on every step.
+            lazy_observations: If True, reset()/step()/step_until() return
+                LazyObservation proxies that build the observation on first
+                access, so callers that ignore observations never pay for them.
+            evaluate_only: Headless scoring mode for callers that only read
+                info["success"] (oracles, data-collection workers). Implies
+                observation_type=None and leaves contact and performance
+                statistics out of the info dict; outcomes are unchanged.
 
         Raises:
             RuntimeError: When validate=True and no valid level can be found for the
@@ -118,6 +191,7 @@ class InterphyreEnv(gym.Env):
                 live oracle cost.
         """
         super().__init__()
+        self._validated = None
 
         # Dispatch on level type and validate flag.
         #
@@ -161,9 +235,9 @@ class InterphyreEnv(gym.Env):
             reg = registry if registry is not None else _get_registry()
             # Emit INFO if the oracle will need to run live (seed absent from
             # bundled data), so the user is not surprised by latency.
-            # Uses get_valid_entry (in-memory bundle only) to avoid opening
-            # the SQLite connection for this advisory check.
-            if reg.get_valid_entry(level_name, seed if seed is not None else 0) is None:
+            # Uses bundled_status (bundle index only) to avoid opening the
+            # SQLite connection for this advisory check.
+            if reg.bundled_status(level_name, seed if seed is not None else 0) is None:
                 logger.info(
                     "InterphyreEnv: running oracle live for '%s' seed=%s "
                     "(not in bundled data — result will be cached for future calls).",
@@ -177,7 +251,9 @@ class InterphyreEnv(gym.Env):
             self._level_name = level_name
             self._seed = validated.seed
             self._variant = validated.variant
-            self._scene_dict = validated.scene_dict
+            # Read on first access: bundled levels decode their scene lazily.
+            self._validated = validated
+            self._scene_dict = None
         else:
             # Path 3: validate=False, original load-by-name behavior.
             from interphyre.levels import load_level
@@ -202,11 +278,18 @@ class InterphyreEnv(gym.Env):
             width, height = image_size
             self.renderer = PygameRenderer(width=width, height=height, ppm=image_ppm)
 
-        self.observation_type = observation_type
+        self.evaluate_only = evaluate_only
+        self.observation_type = None if evaluate_only else observation_type
         self.action_type = action_type
         self.image_size = image_size
         self.image_ppm = image_ppm
         self.discrete_colors = discrete_colors
+        self.copy_observations = copy_observations
+        self.lazy_observations = lazy_observations
+        # Live LazyObservation proxies not yet computed (None unless lazy).
+        self._pending_observations: weakref.WeakSet[LazyObservation] | None = (
+            weakref.WeakSet() if lazy_observations else None
+        )
 
         # Initialize engine
         self.engine = Box2DEngine(config=self.config)
@@ -221,6 +304,20 @@ class InterphyreEnv(gym.Env):
         # Only instantiated when the observation type actually needs it.
         self._image_renderer = None
 
+        # "physics_array" buffers, bound to the object order they were built for.
+        self._array_names: tuple[str, ...] = ()
+        self._state_buffer: np.ndarray | None = None
+        self._contact_buffer: np.ndarray | None = None
+
+        # step_batch() process pool and the pickled (level, config, max_steps)
+        # its workers were built from; rebuilt when either changes.
+        self._batch_pool: ProcessPoolExecutor | None = None
+        self._batch_pool_key: tuple[int, bytes] | None = None
+
+        # Keyed snapshots for counterfactual analysis, bounded by the config's
+        # intervention_max_snapshots.
+        self.snapshots = SnapshotStore.from_config(self.config)
+
         # Set up action space
         self._setup_action_space()
 
@@ -266,6 +363,8 @@ class InterphyreEnv(gym.Env):
         extracted from the validated level — use as the long-form reproducibility
         artifact alongside (level_name, seed, variant).
         """
+        if self._scene_dict is None and self._validated is not None:
+            self._scene_dict = self._validated.scene_dict
         return self._scene_dict
 
     # === Intervention API ===
@@ -277,9 +376,15 @@ class InterphyreEnv(gym.Env):
         | list[tuple[float, float, float]]
         | None = None,
         max_steps: int = 240,
+        key: Hashable | None = None,
     ) -> tuple["StateSnapshot | None", int]:
         """Run simulation until trigger fires.
 
+        The trigger is not polled after every step: the world is stepped in a
+        tight loop up to the step returned by trigger.next_check(), or until
+        the contact listener reports that one of trigger.watched_contacts()
+        began, and only then is trigger.should_fire() evaluated.
+
         Args:
             trigger: Trigger condition to wait for
             action: Optional action to place before running. Can be:
@@ -287,6 +392,7 @@ class InterphyreEnv(gym.Env):
                 - List of tuples for multiple action objects
                 - None if action already placed or no action objects
             max_steps: Maximum steps to simulate
+            key: If given, also keep the snapshot in env.snapshots under this key
 
         Returns:
             (snapshot, step_index) if triggered, (None, final_step) if timeout
@@ -303,39 +409,104 @@ class InterphyreEnv(gym.Env):
         # Reset trigger state so once_only triggers can fire again across episodes
         trigger.reset()
 
-        # Place action if provided and not already placed
-        if action is not None and not self.action_placed:
-            if isinstance(action, tuple) and len(action) == 3:
-                action = [action]
+        self._place_intervention_action(action)
 
-            validation_result = self._validate_action_with_failure(action)
-            if validation_result["invalid"]:
-                raise ValueError(f"Invalid action: {validation_result['error']}")
+        start = self.step_count
+        end = start + max_steps
+        listener = self.engine.contact_listener
+        listener.WatchContacts(trigger.watched_contacts())
 
-            self._place_action_objects(validation_result["action"])
-            self.action_placed = True
+        try:
+            step_index = start
+            while step_index < end:
+                # Step without evaluating the trigger until its next scheduled
+                # check or until one of its watched contacts begins.
+                wake = trigger.next_check(step_index, self.engine)
+                stop = end if wake is None else min(wake, end)
+                listener.watched_contact_began = False
+                while True:
+                    self._step_physics()
+                    self.render()
+                    step_index += 1
+                    if step_index >= stop or listener.watched_contact_began:
+                        break
+
+                woken = step_index == wake or listener.watched_contact_began
+                if woken and trigger.should_fire(step_index, self.engine):
+                    snapshot = StateSnapshot.capture(
+                        self.engine,
+                        metadata={"step_index": step_index, "trigger": str(trigger)},
+                    )
+                    if key is not None:
+                        self.snapshots.put(key, snapshot)
+                    return snapshot, step_index
+        finally:
+            listener.WatchContacts()
 
-        start = self.step_count
+        return None, end
 
-        for step_index in range(start, start + max_steps):
-            self._step_physics()
-            self.render()
+    def _place_intervention_action(
+        self,
+        action: tuple[float, float, float] | list[tuple[float, float, float]] | None,
+    ) -> None:
+        """Place action objects for run_until() unless already placed.
 
-            if trigger.should_fire(step_index + 1, self.engine):
-                snapshot = StateSnapshot.capture(
-                    self.engine,
-                    metadata={"step_index": step_index + 1, "trigger": str(trigger)},
-                )
-                return snapshot, step_index + 1
+        Raises:
+            ValueError: If the action is invalid
+        """
+        if action is None or self.action_placed:
+            return
+        if isinstance(action, tuple) and len(action) == 3:
+            action = [action]
+
+        validation_result = self._validate_action_with_failure(action)
+        if validation_result["invalid"]:
+            raise ValueError(f"Invalid action: {validation_result['error']}")
 
-        return None, start + max_steps
+        self._place_action_objects(validation_result["action"])
+        self.action_placed = True
+
+    def checkpoint(self, key: Hashable | None = None) -> "StateSnapshot":
+        """Capture the current state into env.snapshots.
+
+        Args:
+            key: Key to store the snapshot under (default: the current step count)
+
+        Returns:
+            The captured snapshot
+        """
+        from interphyre.interventions.state import StateSnapshot
+
+        snapshot = StateSnapshot.capture(
+            self.engine, metadata={"step_index": self.step_count}
+        )
+        self.snapshots.put(self.step_count if key is None else key, snapshot)
+        return snapshot
+
+    def _resolve_snapshot(
+        self, snapshot: "StateSnapshot | Hashable"
+    ) -> "StateSnapshot":
+        """Return snapshot itself, or the snapshot stored under it as a key."""
+        from interphyre.interventions.state import StateSnapshot
 
-    def restore(self, snapshot: "StateSnapshot") -> None:
+        if isinstance(snapshot, StateSnapshot):
+            return snapshot
+        try:
+            return self.snapshots[snapshot]
+        except KeyError:
+            raise KeyError(f"No snapshot stored under key {snapshot!r}") from None
+
+    def restore(self, snapshot: "StateSnapshot | Hashable") -> None:
         """Restore simulation to a previous state.
 
         Args:
-            snapshot: StateSnapshot to restore
+            snapshot: StateSnapshot to restore, or the key of one in env.snapshots
+
+        Raises:
+            KeyError: If snapshot is a key with no stored snapshot
         """
+        snapshot = self._resolve_snapshot(snapshot)
+        self._settle_observations()
         snapshot.restore(self.engine)
         if snapshot.metadata and "step_index" in snapshot.metadata:
             self.step_count = snapshot.metadata["step_index"]
@@ -363,18 +534,19 @@ class InterphyreEnv(gym.Env):
         success = self._level.success_condition(self.engine)
         truncated = snapshot is None and not success
 
-        obs = self._get_observation()
+        obs = self._observe()
         reward = self._calculate_reward(success, truncated)
         info = self._get_info_dict(success, success, truncated)
         info["final_step"] = final_step
 
         return obs, reward, success, truncated, info
 
-    def branch(self, snapshot: "StateSnapshot") -> "_BranchContext":
+    def branch(self, snapshot: "StateSnapshot | Hashable") -> "_BranchContext":
         """Return a non-destructive counterfactual scope.
 
         Restores to *snapshot* on enter and again on exit (including on exception),
-        so each branch is fully self-contained.
+        so each branch is fully self-contained. *snapshot* may also be the key of a
+        snapshot in env.snapshots.
 
         Example:
             with env.branch(snapshot):
@@ -385,6 +557,104 @@ class InterphyreEnv(gym.Env):
         """
         return _BranchContext(self, snapshot)
 
+    def branch_many(
+        self,
+        snapshot: "StateSnapshot | Hashable",
+        interventions: list,
+        steps: int,
+        workers: int | None = None,
+        return_states: bool = False,
+    ) -> dict[str, np.ndarray]:
+        """Run many counterfactual branches from one snapshot.
+
+        Each intervention is applied right after restoring *snapshot*, then the
+        world is stepped *steps* times and the outcome recorded, as with::
+
+            with env.branch(snapshot):
+                apply(intervention)
+                env.step_physics(steps)
+                outcome = env.success
+
+        An intervention is one of:
+          - None: no change (the factual branch)
+          - a callable taking the env, e.g. ``lambda env: env.set("ball", radius=0.4)``
+          - an operation tuple naming an intervention method and its arguments:
+            ``("set", name, attrs)``, ``("impulse", name, impulse[, point])``,
+            ``("force", name, force[, point])``, ``("add", name, obj[, impulse])``
+            or ``("remove", name)``
+          - a list of operation tuples, applied in order
+
+        With workers > 1 the snapshot is serialized once and the branches are
+        split across the process pool also used by step_batch(), whose workers
+        keep a warm copy of the level. Callables must then be picklable
+        (module-level functions or functools.partial, not lambdas). The
+        environment is left at *snapshot* afterwards.
+
+        Args:
+            snapshot: StateSnapshot to branch from, or the key of one in env.snapshots
+            interventions: One intervention per branch
+            steps: Physics steps to simulate in each branch
+            workers: Number of worker processes (default: None, run in this process)
+            return_states: Also return every branch's final object states
+
+        Returns:
+            dict of length-N arrays:
+              - "success" (bool): Whether the success condition held after
+                *steps* steps.
+              - "states" (float32, shape (N, objects, 6)): Only with
+                return_states. Row j of branch i holds physics_array_fields for
+                the j-th of ``snapshot.layout.object_names``; objects without a
+                body at the end of the branch are NaN.
+
+        Raises:
+            ValueError: If workers or steps is invalid, or an operation tuple
+                names an unknown method.
+            KeyError: If snapshot is a key with no stored snapshot.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if steps < 0:
+            raise ValueError(f"steps must be >= 0, got {steps}")
+        for intervention in interventions:
+            _check_intervention(intervention)
+        snapshot = self._resolve_snapshot(snapshot)
+        self._settle_observations()
+
+        n = len(interventions)
+        names = snapshot.layout.object_names
+        success = np.zeros(n, dtype=bool)
+        states = np.full((n, len(names), 6), np.nan, dtype=np.float32)
+        if workers is not None and workers > 1 and n > 1:
+            pool = self._get_batch_pool(workers)
+            data = snapshot.to_bytes()
+            chunks = np.array_split(np.arange(n), workers * 4)
+            futures = [
+                (
+                    chunk,
+                    pool.submit(
+                        _branch_many_worker,
+                        data,
+                        [interventions[j] for j in chunk],
+                        steps,
+                        return_states,
+                    ),
+                )
+                for chunk in chunks
+                if len(chunk)
+            ]
+            for chunk, future in futures:
+                success[chunk], states[chunk] = future.result()
+        else:
+            success[:], states[:] = _run_branches(
+                self, snapshot, interventions, steps, return_states
+            )
+        self.restore(snapshot)
+
+        result = {"success": success}
+        if return_states:
+            result["states"] = states
+        return result
+
     # === Intervention API ===
 
     def set(self, name: str, **attrs: Any) -> None:
@@ -408,6 +678,7 @@ class InterphyreEnv(gym.Env):
                 an invalid value (e.g. negative radius).
             AttributeError: If an unknown attribute name is passed.
         """
+        self._settle_observations()
         from Box2D import b2Vec2
 
         from interphyre.objects import (
@@ -516,34 +787,46 @@ class InterphyreEnv(gym.Env):
 
             # Build the replacement body BEFORE destroying the old one so that a
             # creation failure (e.g. Box2D C-level error) leaves engine.bodies intact.
-            if isinstance(obj, Ball):
-                new_body = create_ball(
-                    self.engine.world,
-                    obj,
-                    name,
-                    use_ccd=self.config.continuous_collision_detection,
-                )
-            elif isinstance(obj, Bar):
-                new_body = create_bar(
-                    self.engine.world,
-                    obj,
-                    name,
-                    use_ccd=self.config.continuous_collision_detection,
-                )
-            elif isinstance(obj, Basket):
-                new_body = create_basket(
-                    self.engine.world,
-                    obj,
-                    name,
-                    use_ccd=self.config.continuous_collision_detection,
-                )
-            else:
-                raise TypeError(f"set: unrecognised object type '{type(obj).__name__}'")
+            # The old body is deactivated first so the replacement reuses its
+            # broad-phase proxy ids, which keeps contact ordering (and therefore
+            # restored branches) reproducible.
+            was_active = body.active
+            body.active = False
+            try:
+                if isinstance(obj, Ball):
+                    new_body = create_ball(
+                        self.engine.world,
+                        obj,
+                        name,
+                        use_ccd=self.config.continuous_collision_detection,
+                    )
+                elif isinstance(obj, Bar):
+                    new_body = create_bar(
+                        self.engine.world,
+                        obj,
+                        name,
+                        use_ccd=self.config.continuous_collision_detection,
+                    )
+                elif isinstance(obj, Basket):
+                    new_body = create_basket(
+                        self.engine.world,
+                        obj,
+                        name,
+                        use_ccd=self.config.continuous_collision_detection,
+                    )
+                else:
+                    raise TypeError(
+                        f"set: unrecognised object type '{type(obj).__name__}'"
+                    )
+            except Exception:
+                body.active = was_active
+                raise
 
             # Destroy old body only after the new one is successfully created.
             self.engine.world.DestroyBody(body)
             del self.engine.bodies[name]
             self.engine.bodies[name] = new_body
+            self.engine.mark_structure_changed(name)
 
             # Restore live kinematics unless the caller overrode them.
             if obj.dynamic:
@@ -584,6 +867,7 @@ class InterphyreEnv(gym.Env):
         """
         if name in self.engine.bodies:
             raise ValueError(f"Object '{name}' already exists")
+        self._settle_observations()
 
         from interphyre.objects import (
             Ball,
@@ -621,6 +905,7 @@ class InterphyreEnv(gym.Env):
             raise TypeError(f"Unknown object type: {type(obj)}")
 
         self.engine.bodies[name] = body
+        self.engine.mark_structure_changed(name)
 
         if impulse is not None:
             self.impulse(name, impulse)
@@ -636,9 +921,11 @@ class InterphyreEnv(gym.Env):
         """
         if name not in self.engine.bodies:
             raise ValueError(f"Object '{name}' not found")
+        self._settle_observations()
 
         self.engine.world.DestroyBody(self.engine.bodies[name])
         del self.engine.bodies[name]
+        self.engine.structure_versions.pop(name, None)
 
         if name in self._level.objects:
             del self._level.objects[name]
@@ -657,6 +944,7 @@ class InterphyreEnv(gym.Env):
             point: World-space application point (default: center of mass).
         """
         body = self._get_body(name)
+        self._settle_observations()
         from Box2D import b2Vec2
 
         ix, iy = impulse
@@ -812,6 +1100,26 @@ class InterphyreEnv(gym.Env):
             }
         )
 
+    def _build_physics_array_space(self) -> gym.spaces.Dict:
+        """Build the flat physics-array observation space from the level's objects."""
+        n_objects = len(self._level.objects)
+        # Same per-field bounds as the physics_state space, one row per object.
+        high = np.tile(
+            np.array([10, 10, 50, 50, np.pi, 10], dtype=np.float32), (n_objects, 1)
+        )
+        return gym.spaces.Dict(
+            {
+                "state": gym.spaces.Box(low=-high, high=high, dtype=np.float32),
+                "contacts": gym.spaces.Box(
+                    low=0,
+                    high=1,
+                    shape=(n_objects, n_objects),
+                    dtype=np.bool_,
+                ),
+                "step_count": gym.spaces.Discrete(self.max_steps + 1),
+            }
+        )
+
     def _build_image_space(self) -> gym.spaces.Box:
         """Build the image observation space from current image settings."""
         width, height = self.image_size
@@ -821,8 +1129,12 @@ class InterphyreEnv(gym.Env):
 
     def _setup_observation_space(self) -> None:
         """Set up the observation space based on observation_type."""
-        if self.observation_type == "physics_state":
+        if self.observation_type is None:
+            self.observation_space = None
+        elif self.observation_type == "physics_state":
             self.observation_space = self._build_physics_state_space()
+        elif self.observation_type == "physics_array":
+            self.observation_space = self._build_physics_array_space()
         elif self.observation_type == "image":
             self.observation_space = self._build_image_space()
         elif self.observation_type == "both":
@@ -851,6 +1163,7 @@ class InterphyreEnv(gym.Env):
         # It seeds a PCG64 generator when seed is provided, or carries forward the
         # existing generator when seed is None — consistent behavior across all calls.
         super().reset(seed=seed)
+        self._settle_observations()
 
         # Reset engine state.
         # First call (level not yet loaded): full world build via reset(level).
@@ -866,7 +1179,7 @@ class InterphyreEnv(gym.Env):
         self.step_count = 0
         self._rollout_complete = False
 
-        observation = self._get_observation()
+        observation = self._observe()
 
         info = {
             "level_name": self._level.name,
@@ -878,6 +1191,8 @@ class InterphyreEnv(gym.Env):
             "truncated": False,
             "terminated": False,
         }
+        if self.action_type == "discrete":
+            info["action_mask"] = self.action_mask()
 
         return observation, info
 
@@ -904,7 +1219,7 @@ class InterphyreEnv(gym.Env):
 
         validation_result = self._validate_action_with_failure(action)
         if validation_result["invalid"]:
-            obs = self._get_observation()
+            obs = self._observe()
             info = {
                 "level_name": self._level.name,
                 "step_count": 0,
@@ -916,6 +1231,8 @@ class InterphyreEnv(gym.Env):
                 "validation_error": validation_result["error"],
                 "invalid_action": True,
             }
+            if self.action_type == "discrete":
+                info["action_mask"] = self.action_mask()
             # Invalid actions don't consume the episode — caller can retry without reset()
             return obs, -1.0, False, True, info
 
@@ -924,8 +1241,212 @@ class InterphyreEnv(gym.Env):
 
         obs, reward, terminated, truncated, info = self._run_simulation_rollout()
         self._rollout_complete = True
+        if self.action_type == "discrete":
+            info["action_mask"] = self.action_mask()
         return obs, reward, terminated, truncated, info
 
+    def action_mask(self) -> np.ndarray | None:
+        """Valid-placement mask over the discrete action grid.
+
+        mask[xi, yi, si] is True iff placing an action ball at the cell with
+        those bin indices passes the same check as step(). Every action object
+        shares the mask, since placements are checked against the level's other
+        objects only. Masks are cached by scene geometry, so repeated calls and
+        seeds with identical static geometry cost one lookup.
+
+        Returns:
+            Read-only bool[x_bins, y_bins, size_bins], or None when action_type
+            is not "discrete" or the level has no action objects.
+        """
+        if self.action_type != "discrete" or not self._level.action_objects:
+            return None
+        return placement_mask(self._level, *self._discrete_values())
+
+    def _discrete_values(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Coordinates of every discrete bin, converted exactly as _validate_action does."""
+        step = self._discrete_step
+        return tuple(  # type: ignore[return-value]
+            np.array(
+                [float(round(low + step * i, PRECISION)) for i in range(bins)],
+                dtype=np.float64,
+            )
+            for low, bins in zip(self._discrete_lows, self._discrete_bins)
+        )
+
+    def sample_valid_action(self, rng: np.random.Generator | None = None) -> np.ndarray:
+        """Sample an action whose every placement passes validation.
+
+        Discrete actions are drawn uniformly from the valid cells of
+        action_mask(). Continuous actions are drawn uniformly from the action
+        space and filtered in batches with validate_placements().
+
+        Args:
+            rng: Random generator to draw from (default: self.np_random)
+
+        Returns:
+            Flat action array of shape (k*3,) in the action space's dtype.
+
+        Raises:
+            RuntimeError: If the level admits no valid placement.
+        """
+        rng = rng if rng is not None else self.np_random
+        k = len(self._level.action_objects)
+        if k == 0:
+            return np.zeros(0, dtype=self.action_space.dtype)
+
+        if self.action_type == "discrete":
+            mask = self.action_mask()
+            cells = np.flatnonzero(mask)
+            if cells.size == 0:
+                raise RuntimeError(
+                    f"No valid placement on the discrete grid of level "
+                    f"'{self._level.name}'"
+                )
+            picks = rng.choice(cells, size=k)
+            indices = np.column_stack(np.unravel_index(picks, mask.shape))
+            return indices.reshape(-1).astype(np.int64)
+
+        low = self.action_space.low[:3]
+        high = self.action_space.high[:3]
+        chosen: list[np.ndarray] = []
+        for _ in range(_SAMPLE_BATCHES):
+            candidates = rng.uniform(low, high, size=(_SAMPLE_BATCH_SIZE, 3)).astype(
+                self.action_space.dtype
+            )
+            ok = validate_placements(self._level, candidates.astype(np.float64))
+            chosen.extend(candidates[ok][: k - len(chosen)])
+            if len(chosen) == k:
+                return np.concatenate(chosen)
+        raise RuntimeError(
+            f"No valid placement found for level '{self._level.name}' after "
+            f"{_SAMPLE_BATCHES * _SAMPLE_BATCH_SIZE} samples"
+        )
+
+    def step_batch(
+        self,
+        actions: np.ndarray | list,
+        workers: int | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Score many actions against the current level in one call.
+
+        Each action is validated like step() and evaluated as one reset() +
+        step() attempt: the engine's reset_attempt() runs between attempts and no
+        observations, info dicts or renders are built. The environment is left
+        as if reset() had just been called.
+
+        With workers > 1 the valid actions are split across a process pool whose
+        workers each hold a warm copy of the level; the pool is kept for later
+        calls until the level or config changes, or close() is called. Box2D
+        results depend on a world's attempt history at float precision, so a
+        knife-edge placement may resolve differently than on the serial path.
+
+        Args:
+            actions: N actions, each in a format accepted by step(): an array
+                of shape (N, k*3) or (N, k, 3), or a list of N per-attempt
+                actions.
+            workers: Number of worker processes (default: None, evaluate in
+                this process).
+
+        Returns:
+            dict of length-N arrays:
+              - "reward" (float64): step() reward; -1.0 for invalid actions.
+              - "success" (bool): Whether the attempt met the success condition.
+              - "steps" (int64): Physics steps simulated; 0 for invalid actions.
+              - "valid" (bool): Whether the action passed validation.
+              - "termination_reason" (str): As info["termination_reason"] from
+                step(), or "invalid".
+
+        Raises:
+            ValueError: If workers is less than 1.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._settle_observations()
+        if isinstance(actions, np.ndarray) and actions.ndim == 3:
+            actions = actions.reshape(len(actions), -1)
+        n = len(actions)
+
+        # Format checks run per action; placement checks run once over every
+        # candidate ball with the vectorized validate_placements().
+        converted: list[list[tuple[float, float, float]]] = []
+        well_formed = np.zeros(n, dtype=bool)
+        for i, action in enumerate(actions):
+            try:
+                converted.append(self._validate_action(action))
+            except ValueError:
+                continue
+            well_formed[i] = True
+        k = len(self._level.action_objects)
+        placeable = validate_placements(
+            self._level, np.array(converted, dtype=np.float64).reshape(-1, 3)
+        ).reshape(len(converted), k)
+        valid = np.zeros(n, dtype=bool)
+        valid[well_formed] = placeable.all(axis=1)
+        placements = [p for p, ok in zip(converted, valid[well_formed]) if ok]
+
+        success = np.zeros(n, dtype=bool)
+        truncated = np.zeros(n, dtype=bool)
+        steps = np.zeros(n, dtype=np.int64)
+        reasons = np.full(n, "invalid", dtype="<U12")
+        index = np.flatnonzero(valid)
+        if workers is not None and workers > 1 and len(placements) > 1:
+            pool = self._get_batch_pool(workers)
+            chunks = np.array_split(np.arange(len(placements)), workers * 4)
+            futures = [
+                (chunk, pool.submit(_step_batch_worker, [placements[j] for j in chunk]))
+                for chunk in chunks
+                if len(chunk)
+            ]
+            for chunk, future in futures:
+                rows = index[chunk]
+                success[rows], truncated[rows], steps[rows], reasons[rows] = (
+                    future.result()
+                )
+        else:
+            success[index], truncated[index], steps[index], reasons[index] = (
+                _run_attempts(self.engine, placements, self.max_steps, self.config)
+            )
+            self.engine.reset_attempt()
+
+        self.action_placed = False
+        self.step_count = 0
+        self._rollout_complete = False
+
+        reward = np.array(
+            [
+                self._calculate_reward(bool(s), bool(t)) if v else -1.0
+                for s, t, v in zip(success, truncated, valid)
+            ],
+            dtype=np.float64,
+        )
+        return {
+            "reward": reward,
+            "success": success,
+            "steps": steps,
+            "valid": valid,
+            "termination_reason": reasons,
+        }
+
+    def _get_batch_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return a pool of warm step_batch() workers for the current level."""
+        payload = pickle.dumps((self._level, self.config, self.max_steps))
+        key = (workers, payload)
+        if self._batch_pool is None or self._batch_pool_key != key:
+            self._close_batch_pool()
+            self._batch_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_step_batch_worker,
+                initargs=(payload,),
+            )
+            self._batch_pool_key = key
+        return self._batch_pool
+
+    def _close_batch_pool(self) -> None:
+        if self._batch_pool is not None:
+            self._batch_pool.shutdown()
+            self._batch_pool = None
+            self._batch_pool_key = None
+
     def step_physics(self, n: int = 1) -> None:
         """Advance simulation by n physics frames without serialization cost."""
         for _ in range(n):
@@ -933,6 +1454,8 @@ class InterphyreEnv(gym.Env):
 
     def _step_physics(self) -> None:
         """Execute a single physics step (internal method)."""
+        if self._pending_observations:
+            self._settle_observations()
         self.engine.world.Step(
             self.config.time_step,
             self.config.velocity_iters,
@@ -943,30 +1466,81 @@ class InterphyreEnv(gym.Env):
         self.step_count += 1
 
     def _run_simulation_rollout(self) -> tuple[Any, float, bool, bool, dict[str, Any]]:
-        """Run physics simulation to completion."""
+        """Run physics simulation to completion.
+
+        Once the world has settled, engine.settled_outcome() can decide the
+        rollout without simulating the rest of the budget. With
+        config.early_termination a failed rollout stops as soon as success is
+        provably out of reach ("stationary"); with config.success_hold_shortcut a
+        successful one stops as soon as the goal contact hold is guaranteed to
+        complete ("success_hold"). The outcome is unchanged; only
+        info["step_count"] and info["termination_reason"] reflect the early stop.
+
+        With config.verify_early_termination the shortcut verdict is recorded but
+        the rollout runs to completion as usual, and a disagreement raises.
+
+        Raises:
+            RuntimeError: If verify_early_termination is set and the full rollout
+                disagrees with the shortcut verdict.
+        """
+        early_termination = self.config.early_termination
+        success_hold_shortcut = self.config.success_hold_shortcut
+        verify = self.config.verify_early_termination
+        check_settled = early_termination or success_hold_shortcut
+        termination_reason = "max_steps"
+        # (predicted success, step it was predicted at) in verification mode.
+        predicted: tuple[bool, int] | None = None
         for step_index in range(self.max_steps):
             self._step_physics()
             self.render()
 
-            success = self._level.success_condition(self.engine)
+            success = self.engine.check_success()
             terminated = success
             truncated = (step_index >= self.max_steps - 1) and not success
 
-            if success or truncated:
+            if success:
+                termination_reason = "success"
+                break
+            if truncated:
                 break
+            if not check_settled or predicted is not None:
+                continue
+            outcome = self.engine.settled_outcome(self.max_steps - step_index - 1)
+            if outcome is None:
+                continue
+            if not (success_hold_shortcut if outcome else early_termination):
+                continue
+            if verify:
+                predicted = (outcome, step_index + 1)
+                continue
+            success = terminated = outcome
+            truncated = not outcome
+            termination_reason = "success_hold" if outcome else "stationary"
+            break
+
+        if predicted is not None and predicted[0] != success:
+            raise RuntimeError(
+                f"Early termination predicted success={predicted[0]} at step "
+                f"{predicted[1]}, but the full rollout ended with success={success} "
+                f"at step {self.step_count}"
+            )
 
         # Capture stationary status here — calling world_is_stationary() inside
         # _get_info_dict would append a spurious extra frame to _velocity_history
         # post-loop, which persists into the next episode in simulate() calls.
-        world_stationary = (
-            self.engine.world_is_stationary() if self.engine.world else False
-        )
+        if termination_reason in ("stationary", "success_hold"):
+            world_stationary = True
+        else:
+            world_stationary = (
+                self.engine.world_is_stationary() if self.engine.world else False
+            )
 
-        obs = self._get_observation()
+        obs = self._observe()
         reward = self._calculate_reward(success, truncated)
         info = self._get_info_dict(
             success, terminated, truncated, world_stationary=world_stationary
         )
+        info["termination_reason"] = termination_reason
 
         return obs, reward, terminated, truncated, info
 
@@ -1131,12 +1705,32 @@ class InterphyreEnv(gym.Env):
             raise ValueError(
                 f"Expected {len(self._level.action_objects)} positions, got {len(action)}"
             )
+        self._settle_observations()
         self.engine.place_action_objects(action)
 
+    def _observe(self) -> Any:
+        """Return the observation for the caller: None, a lazy proxy, or the value."""
+        if self.observation_type is None:
+            return None
+        if self._pending_observations is None:
+            return self._get_observation()
+        observation = LazyObservation(self._get_observation)
+        self._pending_observations.add(observation)
+        return observation
+
+    def _settle_observations(self) -> None:
+        """Build any live lazy observations before the simulation state changes."""
+        if self._pending_observations:
+            for observation in list(self._pending_observations):
+                observation.get()
+            self._pending_observations.clear()
+
     def _get_observation(self) -> Any:
         """Get the current observation based on observation_type."""
         if self.observation_type == "physics_state":
             return self._get_physics_state()
+        elif self.observation_type == "physics_array":
+            return self._get_physics_array()
         elif self.observation_type == "image":
             return self._get_image_observation()
         elif self.observation_type == "both":
@@ -1193,6 +1787,49 @@ class InterphyreEnv(gym.Env):
             "step_count": self.step_count,
         }
 
+    def _get_physics_array(self) -> dict[str, Any]:
+        """Get the flat physics-array observation.
+
+        Row i of "state" holds physics_array_fields for the i-th object of the
+        level, and "contacts" is the matching symmetric contact matrix, which the
+        contact listener keeps up to date as contacts begin and end. Unless
+        copy_observations is set, both arrays are reused across calls.
+        """
+        names = tuple(self._level.objects.keys())
+        listener = self.engine.contact_listener
+        if (
+            names != self._array_names
+            or listener.contact_matrix is not self._contact_buffer
+        ):
+            self._array_names = names
+            self._state_buffer = np.zeros((len(names), 6), dtype=np.float32)
+            self._contact_buffer = listener.TrackContactMatrix(names)
+
+        state = self._state_buffer
+        bodies = self.engine.bodies
+        for i, name in enumerate(names):
+            body = bodies.get(name)
+            if body is not None:
+                position = body.position
+                velocity = body.linearVelocity
+                state[i] = (
+                    position.x,
+                    position.y,
+                    velocity.x,
+                    velocity.y,
+                    body.angle,
+                    body.angularVelocity,
+                )
+            else:
+                obj = self._level.objects[name]
+                state[i] = (obj.x, obj.y, 0.0, 0.0, obj.angle, 0.0)
+
+        contacts = self._contact_buffer
+        if self.copy_observations:
+            state = state.copy()
+            contacts = contacts.copy()
+        return {"state": state, "contacts": contacts, "step_count": self.step_count}
+
     def _get_image_observation(self) -> np.ndarray:
         """Get image observation by rendering current simulation state."""
         if self._image_renderer is None:
@@ -1249,6 +1886,9 @@ class InterphyreEnv(gym.Env):
             "world_stationary": world_stationary,
         }
 
+        if self.evaluate_only:
+            return info
+
         if hasattr(self.engine, "get_contact_statistics"):
             contact_stats = self.engine.get_contact_statistics()
             info["contact_statistics"] = contact_stats
@@ -1289,7 +1929,7 @@ class InterphyreEnv(gym.Env):
         for i in range(steps):
             self._step_physics()
 
-            done = self._level.success_condition(self.engine)
+            done = self.engine.check_success()
             if done:
                 status = "success"
             elif self.engine.world_is_stationary():
@@ -1299,7 +1939,7 @@ class InterphyreEnv(gym.Env):
                 terminated = True
 
             if return_trace:
-                observation = self._get_observation()
+                observation = self._observe()
                 reward = self._calculate_reward(done, terminated)
                 info = self._get_info_dict(done, done, terminated)
                 trace.append((observation, reward, done, terminated, info))
@@ -1328,6 +1968,8 @@ class InterphyreEnv(gym.Env):
         if self._image_renderer is not None:
             self._image_renderer.close()
             self._image_renderer = None
+        self._close_batch_pool()
+        self.snapshots.close()
         self.engine.close()
 
     def get_performance_stats(self) -> dict[str, Any]:
@@ -1491,3 +2133,167 @@ class InterphyreEnv(gym.Env):
             "angular_velocity": 0.0,
             "dynamic": obj.dynamic,
         }
+
+
+def _run_attempts(
+    engine: Box2DEngine,
+    placements: list[list[tuple[float, float, float]]],
+    max_steps: int,
+    config: SimulationConfig,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Run one reset() + step() attempt per placement, in order, on engine.
+
+    Returns:
+        (success, truncated, steps, termination_reason) arrays, one entry per
+        placement.
+    """
+    n = len(placements)
+    success = np.zeros(n, dtype=bool)
+    truncated = np.zeros(n, dtype=bool)
+    steps = np.zeros(n, dtype=np.int64)
+    reasons = np.full(n, "", dtype="<U12")
+    for j, placement in enumerate(placements):
+        engine.reset_attempt()
+        engine.place_action_objects(placement)
+        _lockstep_rollouts(
+            [engine],
+            [0],
+            max_steps,
+            config,
+            success[j : j + 1],
+            truncated[j : j + 1],
+            steps[j : j + 1],
+            reasons[j : j + 1],
+        )
+    return success, truncated, steps, reasons
+
+
+# Per-process state for step_batch() workers: (engine, max_steps, config).
+_batch_worker: tuple[Box2DEngine, int, SimulationConfig] | None = None
+# The pool's (level, config, max_steps) payload, and the environment
+# branch_many() jobs run on, built from it on first use.
+_batch_payload: bytes | None = None
+_branch_env: InterphyreEnv | None = None
+
+# Intervention methods an operation tuple may name in branch_many().
+_INTERVENTION_METHODS = frozenset({"set", "impulse", "force", "add", "remove"})
+
+
+def _init_step_batch_worker(payload: bytes) -> None:
+    """Build the worker's engine the same way a fresh InterphyreEnv does.
+
+    Top-level function required for ProcessPoolExecutor pickling on macOS (spawn).
+    """
+    global _batch_worker, _batch_payload
+    level, config, max_steps = pickle.loads(payload)
+    engine = Box2DEngine(config=config)
+    engine.reset(level)
+    _batch_worker = (engine, max_steps, config)
+    _batch_payload = payload
+
+
+def _step_batch_worker(
+    placements: list[list[tuple[float, float, float]]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Evaluate placements in order on this worker's engine."""
+    assert _batch_worker is not None
+    engine, max_steps, config = _batch_worker
+    return _run_attempts(engine, placements, max_steps, config)
+
+
+def _check_intervention(intervention: Any) -> None:
+    """Raise ValueError if intervention is not a valid branch_many() entry."""
+    if intervention is None or callable(intervention):
+        return
+    operations = [intervention] if isinstance(intervention, tuple) else intervention
+    for operation in operations:
+        if (
+            not isinstance(operation, tuple)
+            or not operation
+            or operation[0] not in _INTERVENTION_METHODS
+        ):
+            raise ValueError(
+                f"Invalid intervention {operation!r}: expected None, a callable or "
+                f"a tuple starting with one of {sorted(_INTERVENTION_METHODS)}"
+            )
+
+
+def _apply_intervention(env: InterphyreEnv, intervention: Any) -> None:
+    """Apply one branch_many() intervention to env."""
+    if intervention is None:
+        return
+    if callable(intervention):
+        intervention(env)
+        return
+    operations = [intervention] if isinstance(intervention, tuple) else intervention
+    for method, *args in operations:
+        if method == "set":
+            name, attrs = args
+            env.set(name, **attrs)
+        else:
+            getattr(env, method)(*args)
+
+
+def _run_branches(
+    env: InterphyreEnv,
+    snapshot: StateSnapshot,
+    interventions: list,
+    steps: int,
+    return_states: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run one branch per intervention from snapshot, in order, on env.
+
+    Returns:
+        (success, states) arrays as described in InterphyreEnv.branch_many();
+        states is left NaN unless return_states is set.
+    """
+    names = snapshot.layout.object_names
+    n = len(interventions)
+    success = np.zeros(n, dtype=bool)
+    states = np.full((n, len(names), 6), np.nan, dtype=np.float32)
+    for i, intervention in enumerate(interventions):
+        env.restore(snapshot)
+        _apply_intervention(env, intervention)
+        env.step_physics(steps)
+        success[i] = env.success
+        if return_states:
+            bodies = env.engine.bodies
+            for j, name in enumerate(names):
+                body = bodies.get(name)
+                if body is not None:
+                    position = body.position
+                    velocity = body.linearVelocity
+                    states[i, j] = (
+                        position.x,
+                        position.y,
+                        velocity.x,
+                        velocity.y,
+                        body.angle,
+                        body.angularVelocity,
+                    )
+    return success, states
+
+
+def _worker_branch_env() -> InterphyreEnv:
+    """Return this pool worker's branching environment, building it on first use."""
+    global _branch_env
+    if _branch_env is None:
+        assert _batch_payload is not None
+        level, config, max_steps = pickle.loads(_batch_payload)
+        _branch_env = InterphyreEnv(
+            level, config=config, validate=False, evaluate_only=True
+        )
+        _branch_env.max_steps = max_steps
+    return _branch_env
+
+
+def _branch_many_worker(
+    data: bytes, interventions: list, steps: int, return_states: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run branches on this worker's environment."""
+    from interphyre.interventions.state import StateSnapshot
+
+    snapshot = StateSnapshot.from_buffer(data)
+    return _run_branches(
+        _worker_branch_env(), snapshot, interventions, steps, return_states
+    )
@@ -40,9 +40,20 @@ Use triggers with InterphyreEnv:
 ## State Management
 
 - `StateSnapshot` - Captured simulation state (returned by run_until)
+- `SnapshotLayout` - Per-level structure shared by snapshots
+- `SnapshotStore` - Keyed LRU snapshot store with optional disk spill (env.snapshots)
+- `CounterfactualSweep` - Outcome of interventions at every step of one rollout
+- `SnapshotTrajectoryWriter` / `SnapshotTrajectory` - Keyframe + delta trajectory
+  files with random-access decoding
 """
 
-from interphyre.interventions.state import StateSnapshot
+from interphyre.interventions.state import SnapshotLayout, StateSnapshot
+from interphyre.interventions.store import SnapshotStore
+from interphyre.interventions.sweep import CounterfactualSweep
+from interphyre.interventions.trajectory import (
+    SnapshotTrajectory,
+    SnapshotTrajectoryWriter,
+)
 from interphyre.interventions.triggers import (
     Trigger,
     TimeBasedTrigger,
@@ -63,6 +74,11 @@ from interphyre.interventions.triggers import (
 )
 
 __all__ = [
+    "CounterfactualSweep",
+    "SnapshotLayout",
+    "SnapshotStore",
+    "SnapshotTrajectory",
+    "SnapshotTrajectoryWriter",
     "StateSnapshot",
     "Trigger",
     "TimeBasedTrigger",
@@ -7,10 +7,13 @@ complete simulation state, enabling deterministic replay and branching.
 
 import hashlib
 import pickle
+import struct
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, TYPE_CHECKING
 
-from Box2D import b2World, b2Body, b2Vec2
+import numpy as np
+from Box2D import b2World, b2Body, b2Vec2, b2_staticBody
 
 if TYPE_CHECKING:
     from interphyre.engine import Box2DEngine
@@ -191,22 +194,342 @@ def _load_world(world: b2World, body_names: dict[str, b2Body], data: bytes) -> N
     world.ClearForces()
 
 
+# Snapshot layout
+#
+# A snapshot is split into per-level structure (SnapshotLayout: body order,
+# object attributes, fixture materials, world settings) and per-step state
+# (StateSnapshot: float32 arrays of body transforms and velocities plus contact
+# bookkeeping). Structure only changes when bodies are created or destroyed,
+# so it is built once, shared by every snapshot of that structure and
+# referenced by its digest.
+
+# Bits of StateSnapshot.body_flags.
+_FLAG_AWAKE = 1
+_FLAG_ACTIVE = 2
+
+# Offset (world units) that moves a body's proxies out of their fattened bounds.
+_FAR_AWAY = 1000.0
+
+# Structural attributes are everything in obj_attrs except the live pose.
+_POSE_ATTRS = ("x", "y", "angle")
+
+# Live layouts by digest, so snapshots serialized without their layout can be
+# decoded while any snapshot (or engine) still holds the layout.
+_LAYOUTS: "weakref.WeakValueDictionary[str, SnapshotLayout]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+@dataclass(frozen=True, eq=False)
+class SnapshotLayout:
+    """
+    Per-level structure shared by every snapshot taken with the same bodies.
+
+    Attributes:
+        digest: SHA-256 hex digest of everything below; snapshots refer to
+            their layout by it
+        level_name: Name of the level the bodies belong to
+        names: Body names (including walls), sorted; row order of the
+            snapshot arrays
+        creation_order: Body names in the order the bodies were created, which
+            is the order Box2D iterates (and solves) them in
+        object_names: Level object names in level order
+        object_types: Object class name for every level object
+        dynamic: Whether each level object is dynamic
+        unplaced: (x, y, angle) of level objects without a body, e.g. action
+            objects before placement
+        obj_attrs: Structural attributes (everything but x, y and angle) of
+            level objects with a body, in level order
+        body_params: float32 (bodies, 3) linear damping, angular damping and
+            gravity scale
+        body_options: uint8 (bodies, 2) bullet and fixed rotation
+        fixture_counts: Number of fixtures of each body
+        fixture_materials: float32 (fixtures, 3) density, friction, restitution
+        fixture_filters: int32 (fixtures, 4) category bits, mask bits, group
+            index and sensor flag
+        world: Gravity (x, y), warm starting, substepping, continuous physics
+    """
+
+    digest: str
+    level_name: str
+    names: tuple[str, ...]
+    creation_order: tuple[str, ...]
+    object_names: tuple[str, ...]
+    object_types: dict[str, str]
+    dynamic: dict[str, bool]
+    unplaced: dict[str, tuple[float, float, float]]
+    obj_attrs: dict[str, dict[str, Any]]
+    body_params: np.ndarray
+    body_options: np.ndarray
+    fixture_counts: tuple[int, ...]
+    fixture_materials: np.ndarray
+    fixture_filters: np.ndarray
+    world: tuple[float, float, bool, bool, bool]
+
+    @classmethod
+    def from_engine(cls, engine: "Box2DEngine") -> "SnapshotLayout":
+        """
+        Build the layout of an engine's current bodies.
+
+        Returns the already registered layout if an identical one exists.
+
+        Args:
+            engine: Engine with a level loaded
+
+        Returns:
+            Interned SnapshotLayout
+        """
+        level = engine.level
+        if level is None:
+            raise ValueError(
+                "Level is not set. Please call reset() with a valid level before capturing state."
+            )
+        names = tuple(sorted(engine.bodies))
+        bodies = [engine.bodies[name] for name in names]
+
+        params, options, counts, materials, filters = [], [], [], [], []
+        for body in bodies:
+            params.append((body.linearDamping, body.angularDamping, body.gravityScale))
+            options.append((body.bullet, body.fixedRotation))
+            counts.append(len(body.fixtures))
+            for fixture in body.fixtures:
+                data = fixture.filterData
+                materials.append(
+                    (fixture.density, fixture.friction, fixture.restitution)
+                )
+                filters.append(
+                    (
+                        data.categoryBits,
+                        data.maskBits,
+                        data.groupIndex,
+                        fixture.sensor,
+                    )
+                )
+
+        object_types, dynamic, unplaced = {}, {}, {}
+        for name, obj in level.objects.items():
+            object_types[name] = type(obj).__name__
+            if name in engine.bodies:
+                dynamic[name] = engine.bodies[name].type == 2  # b2_dynamicBody
+            else:
+                dynamic[name] = obj.dynamic
+                unplaced[name] = (obj.x, obj.y, obj.angle)
+        obj_attrs = {
+            name: {k: v for k, v in attrs.items() if k not in _POSE_ATTRS}
+            for name, attrs in StateSnapshot._capture_obj_attrs(
+                level, bodies=engine.bodies
+            ).items()
+        }
+        world = engine.world
+        gravity = world.gravity
+
+        fields = {
+            "level_name": level.name,
+            "names": names,
+            "creation_order": _creation_order(engine),
+            "object_names": tuple(level.objects),
+            "object_types": object_types,
+            "dynamic": dynamic,
+            "unplaced": unplaced,
+            "obj_attrs": obj_attrs,
+            "body_params": _frozen(np.array(params, np.float32).reshape(-1, 3)),
+            "body_options": _frozen(np.array(options, np.uint8).reshape(-1, 2)),
+            "fixture_counts": tuple(counts),
+            "fixture_materials": _frozen(
+                np.array(materials, np.float32).reshape(-1, 3)
+            ),
+            "fixture_filters": _frozen(np.array(filters, np.int32).reshape(-1, 4)),
+            "world": (
+                float(gravity.x),
+                float(gravity.y),
+                bool(world.warmStarting),
+                bool(world.subStepping),
+                bool(world.continuousPhysics),
+            ),
+        }
+        hasher = hashlib.sha256()
+        for key, value in fields.items():
+            hasher.update(key.encode())
+            if isinstance(value, np.ndarray):
+                hasher.update(value.tobytes())
+            else:
+                hasher.update(repr(value).encode())
+        layout = cls(digest=hasher.hexdigest(), **fields)
+        return _LAYOUTS.setdefault(layout.digest, layout)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the layout to bytes."""
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SnapshotLayout":
+        """Deserialize a layout and register it so snapshots can refer to it."""
+        layout = pickle.loads(data)
+        return _LAYOUTS.setdefault(layout.digest, layout)
+
+    @staticmethod
+    def lookup(digest: str) -> "SnapshotLayout | None":
+        """Return the live layout with this digest, or None."""
+        return _LAYOUTS.get(digest)
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _creation_order(engine: "Box2DEngine") -> tuple[str, ...]:
+    """Names of the engine's bodies, oldest first."""
+    cached = _cached_layout(engine)
+    if cached is not None:
+        return cached[3].creation_order
+    # world.bodies lists bodies oldest first.
+    names = [body.userData for body in engine.world.bodies]
+    return tuple(name for name in names if name in engine.bodies)
+
+
+def _cached_layout(engine: "Box2DEngine") -> tuple | None:
+    """Return the engine's cached layout entry if it still matches its bodies.
+
+    The entry is (level, world settings, (name, body) pairs, layout, level
+    hash, structural versions). Every structural edit (set, add, remove,
+    restore, placing actions) creates new bodies or draws new versions, which
+    invalidates it.
+    """
+    cached = engine._snapshot_layout
+    if cached is None:
+        return None
+    level, world_key, pairs, layout = cached[:4]
+    world = engine.world
+    bodies = engine.bodies
+    if (
+        level is engine.level
+        and world_key
+        == (
+            tuple(world.gravity),
+            world.warmStarting,
+            world.subStepping,
+            world.continuousPhysics,
+        )
+        and len(pairs) == len(bodies)
+        and all(bodies.get(name) is body for name, body in pairs)
+        and layout.object_names == tuple(level.objects)
+    ):
+        return cached
+    return None
+
+
+def _engine_layout(
+    engine: "Box2DEngine",
+) -> tuple[SnapshotLayout, str, list, np.ndarray]:
+    """Return (layout, level hash, bodies in layout order, versions) for an engine.
+
+    The layout is cached on the engine and reused as long as the level, its
+    objects, the body objects and the world settings are unchanged.
+    """
+    cached = _cached_layout(engine)
+    if cached is None:
+        level = engine.level
+        versions = engine.structure_versions
+        for name in engine.bodies:
+            if name not in versions and name in level.objects:
+                # Bodies created outside the engine's own bookkeeping.
+                engine.mark_structure_changed(name)
+        layout = SnapshotLayout.from_engine(engine)
+        cached = _cache_layout(engine, layout, StateSnapshot._hash_level(level))
+    _, _, pairs, layout, level_hash, versions = cached
+    if level_hash is None:
+        # Left unset by restore(): the level objects' poses have just changed.
+        level_hash = StateSnapshot._hash_level(engine.level)
+        engine._snapshot_layout = (*cached[:4], level_hash, versions)
+    return layout, level_hash, [body for _, body in pairs], versions
+
+
+def _cache_layout(
+    engine: "Box2DEngine", layout: SnapshotLayout, level_hash: str | None
+) -> tuple:
+    world = engine.world
+    pairs = tuple((name, engine.bodies[name]) for name in layout.names)
+    versions = engine.structure_versions
+    engine._snapshot_layout = (
+        engine.level,
+        (
+            tuple(world.gravity),
+            world.warmStarting,
+            world.subStepping,
+            world.continuousPhysics,
+        ),
+        pairs,
+        layout,
+        level_hash,
+        _frozen(np.array([versions.get(name, 0) for name in layout.names], np.int64)),
+    )
+    return engine._snapshot_layout
+
+
+# Fixed binary layout of StateSnapshot.to_bytes(): this header, then 8-byte
+# aligned sections for transforms (bodies x 3 float32), velocities (bodies x 3
+# float32), body flags (bodies uint8), structural versions (bodies int64),
+# contact pairs (contacts x 2 uint32),
+# start-time pairs (start times x 2 uint32), start times (float64), pickled
+# metadata and, optionally, the pickled layout.
+_MAGIC = b"ISNP"
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<4sHHIIIIIqd64s16s")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _sections(
+    bodies: int, contacts: int, start_times: int, metadata: int, layout: int
+) -> tuple[list[tuple[int, int]], int]:
+    """Return [(offset, size)] of each section and the total size."""
+    sizes = [
+        bodies * 12,
+        bodies * 12,
+        bodies,
+        bodies * 8,
+        contacts * 8,
+        start_times * 8,
+        start_times * 8,
+        metadata,
+        layout,
+    ]
+    offset = _align(_HEADER.size)
+    sections = []
+    for size in sizes:
+        sections.append((offset, size))
+        offset = _align(offset + size)
+    return sections, offset
+
+
 # StateSnapshot
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class StateSnapshot:
     """
     Immutable snapshot of complete simulation state.
 
     This captures everything needed to restore the simulation to an exact
     state, including Box2D physics state, contact tracking, and metadata.
+    Per-step body state is stored as float32 arrays in the body order of the
+    shared SnapshotLayout; everything that only changes when bodies are
+    rebuilt lives in the layout.
 
     Attributes:
         step_index: Simulation step index when snapshot was taken
         current_time: Simulation time in seconds
-        objects: InterphyreObject state (position, velocity, etc.)
-        box2d_state: Serialized Box2D world state
+        layout: Shared per-level structure (body order, object attributes,
+            fixture materials, world settings)
+        transforms: float32 (bodies, 3) x, y and angle of each body
+        velocities: float32 (bodies, 3) linear (x, y) and angular velocity
+        body_flags: uint8 (bodies,) awake and active bits
+        structure_versions: int64 (bodies,) structural version of each body
+            (see Box2DEngine.mark_structure_changed); restore() keeps bodies
+            whose version is unchanged instead of rebuilding them
         contacts: Set of active contact pairs
         contact_start_times: Start time of each contact
         level_hash: Hash of level configuration for validation
@@ -215,20 +538,15 @@ class StateSnapshot:
 
     step_index: int
     current_time: float
-    objects: dict[str, dict[str, Any]]
-    box2d_state: bytes
+    layout: SnapshotLayout
+    transforms: np.ndarray
+    velocities: np.ndarray
+    body_flags: np.ndarray
+    structure_versions: np.ndarray
     contacts: frozenset[frozenset[str]]
     contact_start_times: dict[str, float]
     level_hash: str
     metadata: dict[str, Any] = field(default_factory=dict)
-    # Python-level object attributes captured at snapshot time.  When populated,
-    # restore() uses these to rebuild bodies from scratch so that structural
-    # changes (radius, length, add/remove) are fully reverted.  Empty dict means
-    # "legacy snapshot": use the old body-update path with hash validation.
-    obj_attrs: dict[str, dict[str, Any]] = field(default_factory=dict)
-    # Level name stored at capture time; used in restore() to guard against
-    # cross-level misuse when obj_attrs is populated.
-    level_name: str = ""
 
     @classmethod
     def capture(
@@ -244,74 +562,118 @@ class StateSnapshot:
         Returns:
             Immutable StateSnapshot containing complete state
         """
-        # Capture object states from Box2D bodies
-        objects = {}
         if engine.level is None:
             raise ValueError(
                 "Level is not set. Please call reset() with a valid level before capturing state."
             )
-        for name in engine.level.objects.keys():
-            if name in engine.bodies:
-                body = engine.bodies[name]
-                objects[name] = {
-                    "position": (body.position.x, body.position.y),
-                    "velocity": (body.linearVelocity.x, body.linearVelocity.y),
-                    "angle": body.angle,
-                    "angular_velocity": body.angularVelocity,
-                    "type": type(engine.level.objects[name]).__name__,
-                    "dynamic": body.type == 2,  # b2_dynamicBody
-                }
-            else:
-                # Object not yet placed (e.g., action objects before placement)
-                obj = engine.level.objects[name]
-                objects[name] = {
-                    "position": (obj.x, obj.y),
-                    "velocity": (0.0, 0.0),
-                    "angle": obj.angle,
-                    "angular_velocity": 0.0,
-                    "type": type(obj).__name__,
-                    "dynamic": obj.dynamic,
-                }
-
-        # Serialize Box2D world state
-        box2d_state = _save_world(engine.world, engine.bodies)
-
-        # Capture contact tracking state
-        contacts = frozenset(engine.contact_listener.contacts)
-
+        layout, level_hash, bodies, versions = _engine_layout(engine)
+
+        rows = []
+        flags = []
+        for body in bodies:
+            position = body.position
+            velocity = body.linearVelocity
+            rows.append(
+                (
+                    position.x,
+                    position.y,
+                    body.angle,
+                    velocity.x,
+                    velocity.y,
+                    body.angularVelocity,
+                )
+            )
+            flags.append(body.awake | body.active << 1)
+        state = np.array(rows, dtype=np.float32).reshape(-1, 6)
+        transforms = _frozen(np.ascontiguousarray(state[:, :3]))
+        velocities = _frozen(np.ascontiguousarray(state[:, 3:]))
+        body_flags = _frozen(np.array(flags, dtype=np.uint8))
+
+        listener = engine.contact_listener
+        contacts = frozenset(listener.contacts)
         # Serialize frozenset keys as "obj1|obj2" strings
-        contact_start_times = {
-            f"{sorted(pair)[0]}|{sorted(pair)[1]}": time
-            for pair, time in engine.contact_listener.contact_start_time.items()
-        }
-
-        # Compute level hash for validation
-        level_hash = cls._hash_level(engine.level)
-
-        # Capture Python-level object attributes for full structural restore.
-        # This allows restore() to rebuild bodies from scratch when set() has
-        # changed structural properties (radius, length, dynamic, etc.) or
-        # when objects have been added/removed since this snapshot was taken.
-        obj_attrs = cls._capture_obj_attrs(engine.level, bodies=engine.bodies)
+        contact_start_times = {}
+        for pair, time in listener.contact_start_time.items():
+            first, second = sorted(pair)
+            contact_start_times[f"{first}|{second}"] = time
 
         # Derive step index from contact_listener.current_time rather than maintaining
         # a separate counter, so snapshot step index is always consistent with the
         # time that contact durations are measured against.
-        step_index = int(
-            round(engine.contact_listener.current_time / engine.config.time_step)
-        )
+        step_index = int(round(listener.current_time / engine.config.time_step))
 
         return cls(
             step_index=step_index,
-            current_time=engine.contact_listener.current_time,
-            objects=objects,
-            box2d_state=box2d_state,
+            current_time=listener.current_time,
+            layout=layout,
+            transforms=transforms,
+            velocities=velocities,
+            body_flags=body_flags,
+            structure_versions=versions,
             contacts=contacts,
             contact_start_times=contact_start_times,
             level_hash=level_hash,
             metadata=metadata or {},
-            obj_attrs=obj_attrs,
-            level_name=engine.level.name,
+        )
+
+    @property
+    def level_name(self) -> str:
+        """Name of the level the snapshot was taken from."""
+        return self.layout.level_name
+
+    @property
+    def objects(self) -> dict[str, dict[str, Any]]:
+        """InterphyreObject state (position, velocity, etc.) by object name."""
+        layout = self.layout
+        index = {name: i for i, name in enumerate(layout.names)}
+        transforms = self.transforms.tolist()
+        velocities = self.velocities.tolist()
+        objects = {}
+        for name in layout.object_names:
+            if name in index:
+                x, y, angle = transforms[index[name]]
+                vx, vy, omega = velocities[index[name]]
+            else:
+                # Object not yet placed (e.g., action objects before placement)
+                x, y, angle = layout.unplaced[name]
+                vx, vy, omega = 0.0, 0.0, 0.0
+            objects[name] = {
+                "position": (x, y),
+                "velocity": (vx, vy),
+                "angle": angle,
+                "angular_velocity": omega,
+                "type": layout.object_types[name],
+                "dynamic": layout.dynamic[name],
+            }
+        return objects
+
+    @property
+    def obj_attrs(self) -> dict[str, dict[str, Any]]:
+        """Python-level attributes of every object with a body.
+
+        Structural attributes come from the layout; x, y and angle are the
+        body pose at capture time.
+        """
+        index = {name: i for i, name in enumerate(self.layout.names)}
+        transforms = self.transforms.tolist()
+        result = {}
+        for name, structural in self.layout.obj_attrs.items():
+            x, y, angle = transforms[index[name]]
+            attrs = {"_type": structural["_type"], "x": x, "y": y, "angle": angle}
+            attrs.update(structural)
+            result[name] = attrs
+        return result
+
+    @property
+    def box2d_state(self) -> bytes:
+        """Box2D body state as bytes (layout digest followed by the arrays)."""
+        return b"".join(
+            (
+                self.layout.digest.encode(),
+                self.transforms.tobytes(),
+                self.velocities.tobytes(),
+                self.body_flags.tobytes(),
+            )
         )
 
     def restore(self, engine: "Box2DEngine") -> None:
@@ -327,10 +689,11 @@ class StateSnapshot:
         Raises:
             ValueError: If snapshot level doesn't match engine level
         """
-        if self.obj_attrs:
-            # Full structural restore: rebuild bodies from stored Python attributes.
-            # This handles structural changes (radius, length, add/remove) made via
-            # env.set(), env.add(), or env.remove() since the snapshot was taken.
+        layout = self.layout
+        if layout.obj_attrs:
+            # Structural restore from stored Python attributes. This reverts
+            # structural changes (radius, length, add/remove) made via env.set(),
+            # env.add(), or env.remove() since the snapshot was taken.
             if engine.level is None:
                 raise ValueError(
                     "Cannot restore snapshot: engine has no level loaded. "
@@ -340,83 +703,44 @@ class StateSnapshot:
             # Guard against cross-level misuse: the target engine must run the same
             # level (by name).  We compare names, not geometry hashes, so env.set()
             # mutations on the same level still pass correctly.
-            if self.level_name and engine.level.name != self.level_name:
+            if engine.level.name != layout.level_name:
                 raise ValueError(
                     "Cannot restore snapshot to different level. "
-                    f"Snapshot was taken from '{self.level_name}' but current level "
+                    f"Snapshot was taken from '{layout.level_name}' but current level "
                     f"is '{engine.level.name}'."
                 )
 
-            from interphyre.objects import (
-                Ball,
-                Bar,
-                Basket,
-                create_ball,
-                create_bar,
-                create_basket,
-            )
-
-            current_names = set(engine.level.objects.keys())
-            snapshot_names = set(self.obj_attrs.keys())
-
-            # Remove objects that were added after the snapshot.
-            for name in current_names - snapshot_names:
-                if name in engine.bodies:
-                    engine.world.DestroyBody(engine.bodies[name])
-                    del engine.bodies[name]
-                del engine.level.objects[name]
-
-            # Restore or add each object from the snapshot.
-            for name, attrs in self.obj_attrs.items():
-                obj_type = attrs["_type"]
-                field_attrs = {k: v for k, v in attrs.items() if k != "_type"}
-
-                if name in engine.level.objects:
-                    obj = engine.level.objects[name]
-                else:
-                    # Object was removed after snapshot — reconstruct Python object.
-                    if obj_type == "Ball":
-                        obj = Ball(**field_attrs)
-                    elif obj_type == "Bar":
-                        obj = Bar(**field_attrs)
-                    elif obj_type == "Basket":
-                        obj = Basket(**field_attrs)
-                    else:
-                        raise ValueError(f"restore: unknown object type '{obj_type}'")
-                    engine.level.objects[name] = obj
-
-                # Apply stored attributes back to Python object.
-                for k, v in field_attrs.items():
-                    setattr(obj, k, v)
-
-                # Destroy existing body and recreate with correct shape from Python obj.
-                if name in engine.bodies:
-                    engine.world.DestroyBody(engine.bodies[name])
-                    del engine.bodies[name]
-
-                use_ccd = engine.config.continuous_collision_detection
-                if obj_type == "Ball":
-                    body = create_ball(engine.world, obj, name, use_ccd=use_ccd)
-                elif obj_type == "Bar":
-                    body = create_bar(engine.world, obj, name, use_ccd=use_ccd)
-                elif obj_type == "Basket":
-                    body = create_basket(engine.world, obj, name, use_ccd=use_ccd)
-                else:
-                    raise ValueError(f"restore: unknown object type '{obj_type}'")
-                engine.bodies[name] = body
+            self._restore_bodies(engine)
 
         else:
-            # Legacy path (snapshots without obj_attrs): validate level hash.
+            # Nothing to rebuild (no placed objects): validate level hash instead.
             if self.level_hash != self._hash_level(engine.level):
                 raise ValueError(
                     "Cannot restore snapshot to different level. "
                     "Snapshot level hash does not match current engine level."
                 )
 
-        # Restore Box2D world state (_load_world calls ClearForces internally).
-        # After body recreation above, _load_world restores kinematics (position,
-        # velocity, angle) for all bodies from the serialized snapshot state.
-        _load_world(engine.world, engine.bodies, self.box2d_state)
+        # Damping, fixture materials and filters are part of the layout and were
+        # set when the bodies were built; only kinematics are applied.
+        self._apply_body_state(engine)
+        # Create contacts for the re-inserted proxies now, as the next step would
+        # for freshly created fixtures, and update them with every body awake so
+        # resting contacts count too. Otherwise the next step (or the step a
+        # sleeping body wakes at) reports contacts that were touching at capture
+        # time as beginning again, which restarts their hold timers. The begin
+        # events raised here are overwritten by the listener state below.
+        manager = engine.world.contactManager
+        manager.FindNewContacts()
+        asleep = [
+            body
+            for body in engine.world.bodies
+            if not body.awake and body.type != b2_staticBody
+        ]
+        for body in asleep:
+            body.awake = True
+        manager.Collide()
+        for body in asleep:
+            body.awake = False
 
         # Restore contact listener state
         engine.contact_listener.contacts = set(self.contacts)
@@ -430,10 +754,161 @@ class StateSnapshot:
         }
 
         engine.contact_listener.current_time = self.current_time
+        engine.contact_listener.SyncGoal()
+        engine.contact_listener.SyncContactMatrix()
         # Clear the append-only event log: events after the snapshot belong to the
         # discarded timeline and would corrupt contact statistics after restore.
         engine.contact_listener.contact_events = []
 
+    def _restore_bodies(self, engine: "Box2DEngine") -> None:
+        """Bring the engine's bodies back to the snapshot's structure.
+
+        Bodies are restored in the order they were created at capture time,
+        which is the order Box2D solves them in. The longest prefix of the
+        current bodies that matches that order with unchanged structural
+        versions is kept, with only its broad-phase proxies refreshed; everything
+        after it is destroyed and rebuilt from the stored attributes. Restoring after a branch that edited one object
+        therefore rebuilds that object (and any created after it), not the world.
+        """
+        from interphyre.objects import (
+            Ball,
+            Bar,
+            Basket,
+            create_ball,
+            create_bar,
+            create_basket,
+        )
+
+        layout = self.layout
+        obj_attrs = self.obj_attrs
+        world = engine.world
+        bodies = engine.bodies
+        level_objects = engine.level.objects
+        versions = engine.structure_versions
+        snapshot_versions = dict(zip(layout.names, self.structure_versions.tolist()))
+
+        target = [name for name in layout.creation_order if name in obj_attrs]
+        current = [name for name in _creation_order(engine) if name in level_objects]
+        kept = 0
+        for have, want in zip(current, target):
+            if have != want or versions.get(want) != snapshot_versions[want]:
+                break
+            kept += 1
+
+        # Drop every contact so that contacts (and their warm-starting impulses)
+        # are found afresh instead of carrying over from the discarded timeline,
+        # then destroy the bodies of objects the snapshot does not have.
+        contact_manager = world.contactManager
+        for contact in world.contacts:
+            contact_manager.Destroy(contact)
+        rebuilt = set(target[kept:])
+        for name in reversed(current[kept:]):
+            if name not in rebuilt:
+                world.DestroyBody(bodies.pop(name))
+                versions.pop(name, None)
+
+        # Remove objects that were added after the snapshot. Objects that were
+        # not yet placed at capture time (e.g. action objects) stay in the level.
+        for name in list(level_objects):
+            if name not in obj_attrs and name not in layout.unplaced:
+                del level_objects[name]
+        for name, (x, y, angle) in layout.unplaced.items():
+            if name in level_objects:
+                obj = level_objects[name]
+                obj.x, obj.y, obj.angle = x, y, angle
+
+        use_ccd = engine.config.continuous_collision_detection
+        for index, name in enumerate(target):
+            attrs = obj_attrs[name]
+            obj_type = attrs["_type"]
+            field_attrs = {k: v for k, v in attrs.items() if k != "_type"}
+
+            if name in level_objects:
+                obj = level_objects[name]
+            else:
+                # Object was removed after snapshot — reconstruct Python object.
+                if obj_type == "Ball":
+                    obj = Ball(**field_attrs)
+                elif obj_type == "Bar":
+                    obj = Bar(**field_attrs)
+                elif obj_type == "Basket":
+                    obj = Basket(**field_attrs)
+                else:
+                    raise ValueError(f"restore: unknown object type '{obj_type}'")
+                level_objects[name] = obj
+
+            # Apply stored attributes back to Python object.
+            for k, v in field_attrs.items():
+                setattr(obj, k, v)
+
+            if index < kept:
+                body = bodies[name]
+                # Resets the sleep timer (and velocities, set again afterwards).
+                body.awake = False
+                # Re-create the proxies as a rebuild would. Reactivation inserts
+                # fixtures newest first, the reverse of creation, so bodies
+                # with several fixtures are cycled twice to keep their ids.
+                for _ in range(1 if len(body.fixtures) == 1 else 2):
+                    body.active = False
+                    body.active = True
+            else:
+                # Destroy the old body right before building its replacement so
+                # the replacement reuses its broad-phase proxy ids, which decide
+                # the order new contacts are created in.
+                if name in bodies:
+                    world.DestroyBody(bodies.pop(name))
+                if obj_type == "Ball":
+                    body = create_ball(world, obj, name, use_ccd=use_ccd)
+                elif obj_type == "Bar":
+                    body = create_bar(world, obj, name, use_ccd=use_ccd)
+                elif obj_type == "Basket":
+                    body = create_basket(world, obj, name, use_ccd=use_ccd)
+                else:
+                    raise ValueError(f"restore: unknown object type '{obj_type}'")
+                bodies[name] = body
+                versions[name] = snapshot_versions[name]
+
+            # Moving the body away and back re-inserts its proxies around the
+            # stored pose, so their fattened bounds (and with them the contacts
+            # found) do not depend on how the body moved before.
+            body.transform = ((obj.x + _FAR_AWAY, obj.y), obj.angle)
+            body.transform = ((obj.x, obj.y), obj.angle)
+
+        # The bodies now match the layout, so the next capture can reuse it.
+        if layout.object_names == tuple(level_objects):
+            _cache_layout(engine, layout, None)
+
+    def _apply_body_state(self, engine: "Box2DEngine") -> None:
+        """Set world properties and body kinematics, in layout body order."""
+        layout = self.layout
+        world = engine.world
+        gravity_x, gravity_y, warm, substep, continuous = layout.world
+        world.gravity = (gravity_x, gravity_y)
+        world.warmStarting = warm
+        world.subStepping = substep
+        world.continuousPhysics = continuous
+
+        bodies = engine.bodies
+        transforms = self.transforms.tolist()
+        velocities = self.velocities.tolist()
+        flags = self.body_flags.tolist()
+        for i, name in enumerate(layout.names):
+            body = bodies.get(name)
+            if body is None:
+                continue
+            awake = bool(flags[i] & _FLAG_AWAKE)
+            # Wake the body first to ensure it can be modified
+            if not awake:
+                body.awake = True
+            x, y, angle = transforms[i]
+            body.transform = ((x, y), angle)
+            vx, vy, omega = velocities[i]
+            body.linearVelocity = (vx, vy)
+            body.angularVelocity = omega
+            body.active = bool(flags[i] & _FLAG_ACTIVE)
+            body.awake = awake
+        world.ClearForces()
+
     @staticmethod
     def _capture_obj_attrs(
         level, bodies: "dict[str, Any] | None" = None
@@ -548,14 +1023,181 @@ class StateSnapshot:
 
         return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
 
-    def to_bytes(self) -> bytes:
+    def to_bytes(self, include_layout: bool = True) -> bytes:
+        """
+        Serialize snapshot to a fixed binary layout.
+
+        A header is followed by 8-byte aligned array sections, so
+        from_buffer() can read the arrays without copying.
+
+        Args:
+            include_layout: Embed the SnapshotLayout. Without it the bytes only
+                reference the layout by digest and can be decoded while a
+                snapshot of the same structure is alive in the process.
+
+        Returns:
+            Bytes containing the snapshot
         """
-        Serialize snapshot to bytes for storage.
+        layout = self.layout
+        index = {name: i for i, name in enumerate(layout.names)}
+        extra_names: list[str] = []
+
+        def name_index(name: str) -> int:
+            # Contacts can refer to names outside the layout (e.g. bodies
+            # removed since the contact began); those go into the trailer.
+            if name not in index:
+                index[name] = len(layout.names) + len(extra_names)
+                extra_names.append(name)
+            return index[name]
+
+        contact_pairs = np.array(
+            [
+                [name_index(name) for name in sorted(pair)]
+                for pair in sorted(self.contacts, key=sorted)
+            ],
+            dtype=np.uint32,
+        ).reshape(-1, 2)
+        time_items = sorted(self.contact_start_times.items())
+        time_pairs = np.array(
+            [[name_index(name) for name in key.split("|", 1)] for key, _ in time_items],
+            dtype=np.uint32,
+        ).reshape(-1, 2)
+        times = np.array([time for _, time in time_items], dtype=np.float64)
+
+        trailer = pickle.dumps(
+            (self.metadata, extra_names), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        layout_bytes = layout.to_bytes() if include_layout else b""
+        bodies = len(layout.names)
+        sections, total = _sections(
+            bodies, len(contact_pairs), len(times), len(trailer), len(layout_bytes)
+        )
+        out = bytearray(total)
+        _HEADER.pack_into(
+            out,
+            0,
+            _MAGIC,
+            _FORMAT_VERSION,
+            include_layout,
+            bodies,
+            len(contact_pairs),
+            len(times),
+            len(trailer),
+            len(layout_bytes),
+            self.step_index,
+            self.current_time,
+            layout.digest.encode(),
+            self.level_hash.encode(),
+        )
+        payloads = (
+            np.ascontiguousarray(self.transforms, dtype=np.float32),
+            np.ascontiguousarray(self.velocities, dtype=np.float32),
+            np.ascontiguousarray(self.body_flags, dtype=np.uint8),
+            np.ascontiguousarray(self.structure_versions, dtype=np.int64),
+            contact_pairs,
+            time_pairs,
+            times,
+            trailer,
+            layout_bytes,
+        )
+        for (offset, size), payload in zip(sections, payloads):
+            if size:
+                out[offset : offset + size] = memoryview(payload).cast("B")
+        return bytes(out)
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> "StateSnapshot":
+        """
+        Decode a snapshot from bytes or any buffer without copying arrays.
+
+        The transform, velocity and flag arrays are read-only views into
+        *buffer*, which must stay unmodified while the snapshot is in use.
+
+        Args:
+            buffer: bytes, bytearray, memoryview or mmap from to_bytes()
 
         Returns:
-            Pickled bytes containing complete snapshot
+            StateSnapshot instance
+
+        Raises:
+            ValueError: If the buffer is not a snapshot, or was written without
+                its layout and no snapshot with that layout is alive
         """
-        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        view = memoryview(buffer).cast("B")
+        if len(view) < _HEADER.size:
+            raise ValueError("Buffer is too short to hold a StateSnapshot")
+        (
+            magic,
+            version,
+            has_layout,
+            bodies,
+            n_contacts,
+            n_times,
+            trailer_len,
+            layout_len,
+            step_index,
+            current_time,
+            digest,
+            level_hash,
+        ) = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Buffer does not contain a StateSnapshot")
+        if version != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported StateSnapshot format version {version} "
+                f"(expected {_FORMAT_VERSION})"
+            )
+        sections, total = _sections(
+            bodies, n_contacts, n_times, trailer_len, layout_len
+        )
+        if len(view) < total:
+            raise ValueError(
+                f"Truncated StateSnapshot buffer: {len(view)} of {total} bytes"
+            )
+
+        def array(section: int, dtype: Any, shape: tuple[int, ...]) -> np.ndarray:
+            offset, _ = sections[section]
+            count = int(np.prod(shape))
+            values = np.frombuffer(view, dtype=dtype, count=count, offset=offset)
+            return _frozen(values.reshape(shape))
+
+        digest = digest.decode()
+        if has_layout:
+            offset, size = sections[8]
+            layout = SnapshotLayout.from_bytes(view[offset : offset + size])
+        else:
+            layout = SnapshotLayout.lookup(digest)
+            if layout is None:
+                raise ValueError(
+                    f"Snapshot layout {digest[:12]} is not loaded; serialize with "
+                    "include_layout=True to decode it in another process"
+                )
+
+        offset, size = sections[7]
+        metadata, extra_names = pickle.loads(view[offset : offset + size])
+        names = layout.names + tuple(extra_names)
+        contacts = frozenset(
+            frozenset((names[a], names[b]))
+            for a, b in array(4, np.uint32, (n_contacts, 2)).tolist()
+        )
+        times = array(6, np.float64, (n_times,)).tolist()
+        contact_start_times = {
+            f"{names[a]}|{names[b]}": time
+            for (a, b), time in zip(array(5, np.uint32, (n_times, 2)).tolist(), times)
+        }
+        return cls(
+            step_index=step_index,
+            current_time=current_time,
+            layout=layout,
+            transforms=array(0, np.float32, (bodies, 3)),
+            velocities=array(1, np.float32, (bodies, 3)),
+            body_flags=array(2, np.uint8, (bodies,)),
+            structure_versions=array(3, np.int64, (bodies,)),
+            contacts=contacts,
+            contact_start_times=contact_start_times,
+            level_hash=level_hash.rstrip(b"\0").decode(),
+            metadata=metadata,
+        )
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "StateSnapshot":
@@ -563,12 +1205,15 @@ class StateSnapshot:
         Deserialize snapshot from bytes.
 
         Args:
-            data: Pickled bytes containing snapshot
+            data: Bytes from to_bytes()
 
         Returns:
             StateSnapshot instance
         """
-        return pickle.loads(data)
+        return cls.from_buffer(data)
+
+    def __reduce__(self):
+        return (StateSnapshot.from_buffer, (self.to_bytes(),))
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -589,8 +1234,10 @@ class StateSnapshot:
         return (
             self.step_index == other.step_index
             and abs(self.current_time - other.current_time) < 1e-9
-            and self.objects == other.objects
-            and self.box2d_state == other.box2d_state
+            and self.layout.digest == other.layout.digest
+            and np.array_equal(self.transforms, other.transforms)
+            and np.array_equal(self.velocities, other.velocities)
+            and np.array_equal(self.body_flags, other.body_flags)
             and self.contacts == other.contacts
             and self.contact_start_times == other.contact_start_times
             and self.level_hash == other.level_hash
@@ -600,6 +1247,6 @@ class StateSnapshot:
         return (
             f"StateSnapshot(step={self.step_index}, "
             f"time={self.current_time:.3f}s, "
-            f"objects={len(self.objects)}, "
+            f"objects={len(self.layout.object_names)}, "
             f"contacts={len(self.contacts)})"
         )
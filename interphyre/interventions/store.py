@@ -0,0 +1,273 @@
+"""
+Bounded, keyed storage for StateSnapshots.
+
+A SnapshotStore keeps at most ``max_snapshots`` snapshots in memory and drops
+(or spills to disk) the least recently used one when a new snapshot would
+exceed that budget. InterphyreEnv owns one, sized from
+``SimulationConfig.intervention_max_snapshots``, so long counterfactual jobs
+that checkpoint every few steps run in bounded memory.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from typing import TYPE_CHECKING
+
+from interphyre.interventions.state import SnapshotLayout, StateSnapshot
+
+if TYPE_CHECKING:
+    from interphyre.config import SimulationConfig
+
+
+class SnapshotStore:
+    """LRU store of snapshots with optional spill to a memory-mapped file.
+
+    Snapshots are looked up by any hashable key. Reads and writes mark a
+    snapshot as most recently used. When storing a snapshot would put more than
+    ``max_snapshots`` in memory, the least recently used one leaves memory:
+
+    - with a ``spill_path`` directory, it is appended to this store's spill
+      file there and read back through a memory map the next time its key is
+      requested;
+    - otherwise, with ``auto_cleanup``, it is dropped;
+    - otherwise a RuntimeError is raised and the store is left unchanged.
+
+    Spilled snapshots are written without their layout; the store keeps each
+    spilled layout alive, so consecutive snapshots of a rollout share one copy.
+    Each store creates its own uniquely named spill file on the first spill,
+    so several stores (e.g. the envs of a vector env sharing one config) can
+    spill to the same directory. The file is append-only, is truncated when
+    the store is cleared and is deleted when it is closed.
+
+    Example:
+        store = SnapshotStore(max_snapshots=10, spill_path="/tmp/snapshots")
+        store.put(step, StateSnapshot.capture(engine))
+        snapshot = store.get(step)
+        print(store.get_stats())
+    """
+
+    def __init__(
+        self,
+        max_snapshots: int = 100,
+        auto_cleanup: bool = True,
+        spill_path: str | os.PathLike | None = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            max_snapshots: Number of snapshots kept in memory
+            auto_cleanup: Drop the least recently used snapshot when memory is
+                full and there is no spill file. If False, put() raises instead.
+            spill_path: Directory to spill evicted snapshots to, created if
+                missing (default: no spill)
+        """
+        if max_snapshots < 1:
+            raise ValueError(f"max_snapshots must be >= 1, got {max_snapshots}")
+        self.max_snapshots = max_snapshots
+        self.auto_cleanup = auto_cleanup
+        self.spill_path = os.fspath(spill_path) if spill_path is not None else None
+
+        self._memory: OrderedDict[Hashable, StateSnapshot] = OrderedDict()
+        # Spilled snapshots: key -> (offset, length) in the spill file.
+        self._disk: dict[Hashable, tuple[int, int]] = {}
+        self._layouts: dict[str, SnapshotLayout] = {}
+        self._file = None
+        self._spill_file: str | None = None
+        self._map: mmap.mmap | None = None
+        self._size = 0
+        self.reset_stats()
+
+    @classmethod
+    def from_config(cls, config: SimulationConfig) -> SnapshotStore:
+        """Create a store from the intervention settings of a config.
+
+        Args:
+            config: Config providing intervention_max_snapshots,
+                intervention_auto_cleanup and intervention_spill_path
+        """
+        return cls(
+            max_snapshots=config.intervention_max_snapshots,
+            auto_cleanup=config.intervention_auto_cleanup,
+            spill_path=config.intervention_spill_path,
+        )
+
+    # === Mapping interface ===
+
+    def put(self, key: Hashable, snapshot: StateSnapshot) -> None:
+        """Store a snapshot under key, replacing any previous one.
+
+        Raises:
+            RuntimeError: If memory is full, there is no spill file and
+                auto_cleanup is disabled
+        """
+        if key not in self._memory and len(self._memory) >= self.max_snapshots:
+            if self.spill_path is None and not self.auto_cleanup:
+                raise RuntimeError(
+                    f"Snapshot store is full ({self.max_snapshots} snapshots) and "
+                    "intervention_auto_cleanup is disabled; discard snapshots or "
+                    "raise intervention_max_snapshots"
+                )
+            self._evict()
+        self._disk.pop(key, None)
+        self._memory[key] = snapshot
+        self._memory.move_to_end(key)
+
+    def get(
+        self, key: Hashable, default: StateSnapshot | None = None
+    ) -> StateSnapshot | None:
+        """Return the snapshot stored under key, or default.
+
+        A spilled snapshot is read back into memory, which may spill another.
+        """
+        snapshot = self._memory.get(key)
+        if snapshot is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return snapshot
+        location = self._disk.get(key)
+        if location is None:
+            self.misses += 1
+            return default
+        snapshot = self._read(*location)
+        self.disk_hits += 1
+        self.put(key, snapshot)
+        return snapshot
+
+    def __getitem__(self, key: Hashable) -> StateSnapshot:
+        snapshot = self.get(key)
+        if snapshot is None:
+            raise KeyError(key)
+        return snapshot
+
+    def __setitem__(self, key: Hashable, snapshot: StateSnapshot) -> None:
+        self.put(key, snapshot)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if self._memory.pop(key, None) is None and self._disk.pop(key, None) is None:
+            raise KeyError(key)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove the snapshot stored under key, if any."""
+        self._memory.pop(key, None)
+        self._disk.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._memory or key in self._disk
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._disk)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        yield from list(self._disk)
+        yield from list(self._memory)
+
+    def keys(self) -> list[Hashable]:
+        """Keys of all stored snapshots: spilled ones, then in-memory ones from
+        least to most recently used."""
+        return list(self)
+
+    def clear(self) -> None:
+        """Remove all snapshots and truncate the spill file."""
+        self._memory.clear()
+        self._disk.clear()
+        self._layouts.clear()
+        self._unmap()
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+        self._size = 0
+
+    def close(self) -> None:
+        """Remove all snapshots and delete the spill file."""
+        self.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            try:
+                os.remove(self._spill_file)
+            except FileNotFoundError:
+                pass  # already removed, e.g. by cleaning up the directory
+            self._spill_file = None
+
+    @property
+    def spill_file(self) -> str | None:
+        """Path of this store's spill file, or None until the first spill."""
+        return self._spill_file
+
+    # === Statistics ===
+
+    def get_stats(self) -> dict[str, int]:
+        """Get lookup and eviction counters.
+
+        Returns:
+            Dict with hits (served from memory), disk_hits (read back from the
+            spill file), misses, spills and evictions (snapshots dropped), plus
+            the current in_memory and on_disk counts and spill file size in
+            disk_bytes.
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "spills": self.spills,
+            "evictions": self.evictions,
+            "in_memory": len(self._memory),
+            "on_disk": len(self._disk),
+            "disk_bytes": self._size,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the lookup and eviction counters."""
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.spills = 0
+        self.evictions = 0
+
+    # === Spilling ===
+
+    def _evict(self) -> None:
+        """Move the least recently used in-memory snapshot out of memory."""
+        key, snapshot = self._memory.popitem(last=False)
+        if self.spill_path is None:
+            self.evictions += 1
+            return
+        self._layouts.setdefault(snapshot.layout.digest, snapshot.layout)
+        data = snapshot.to_bytes(include_layout=False)
+        if self._file is None:
+            os.makedirs(self.spill_path, exist_ok=True)
+            fd, self._spill_file = tempfile.mkstemp(
+                dir=self.spill_path, prefix="snapshots-", suffix=".bin"
+            )
+            self._file = os.fdopen(fd, "w+b")
+        self._file.seek(self._size)
+        self._file.write(data)
+        self._file.flush()
+        self._disk[key] = (self._size, len(data))
+        self._size += len(data)
+        self.spills += 1
+
+    def _read(self, offset: int, length: int) -> StateSnapshot:
+        """Decode a spilled snapshot through the memory map."""
+        assert self._file is not None
+        if self._map is None or len(self._map) < offset + length:
+            self._unmap()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        # Copy the record so the snapshot does not pin the map, which is
+        # replaced as the file grows.
+        return StateSnapshot.from_buffer(self._map[offset : offset + length])
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __repr__(self) -> str:
+        return (
+            f"SnapshotStore(in_memory={len(self._memory)}, on_disk={len(self._disk)}, "
+            f"max_snapshots={self.max_snapshots})"
+        )
@@ -0,0 +1,233 @@
+"""
+Counterfactual time sweeps over a single factual rollout.
+
+A sweep answers "what happens if we intervene at step t?" for every step t of
+a trajectory. Replaying the rollout from step 0 for each t costs O(T²) physics
+steps; CounterfactualSweep instead records a StateSnapshot every
+``checkpoint_every`` steps of one factual rollout, and each branch restores the
+nearest checkpoint at or before t and replays at most ``checkpoint_every - 1``
+steps before applying its intervention.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from interphyre.interventions.state import StateSnapshot
+
+if TYPE_CHECKING:
+    from interphyre.environment import InterphyreEnv
+
+
+class CounterfactualSweep:
+    """Outcome of each intervention applied at each step of one rollout.
+
+    Interventions use the same forms as InterphyreEnv.branch_many(): None (the
+    factual branch), a callable taking the env, an operation tuple such as
+    ``("impulse", name, (fx, fy))`` or ``("set", name, attrs)``, or a list of
+    operation tuples. The factual rollout starts from the environment's
+    current state, as with run_until(). Every branch intervenes t steps into
+    the rollout and then runs on to its end, where the outcome is recorded.
+
+    ``checkpoint_every`` trades memory for time: the sweep keeps
+    ``ceil(steps / checkpoint_every)`` snapshots and each branch replays on
+    average ``(checkpoint_every - 1) / 2`` extra steps.
+
+    Example:
+        sweep = CounterfactualSweep(
+            env,
+            [("impulse", "red_ball", (2.0, 0.0)), ("remove", "blue_ball")],
+            checkpoint_every=10,
+        )
+        env.reset()
+        outcomes = sweep.run(action=(0.0, 3.0, 0.5), steps=300)
+        # outcomes[t, i]: success when intervention i is applied at step t
+        flips = outcomes != sweep.factual_outcome
+
+    Attributes:
+        checkpoints: Snapshots of the last factual rollout, keyed by the number
+            of steps into the rollout
+        factual_outcome: Outcome of the last factual rollout
+    """
+
+    def __init__(
+        self,
+        env: InterphyreEnv,
+        interventions: Sequence[Any],
+        checkpoint_every: int = 10,
+        workers: int | None = None,
+        outcome: Callable[[InterphyreEnv], float] | None = None,
+    ):
+        """Initialize the sweep.
+
+        Args:
+            env: Environment to run the factual rollout and branches on
+            interventions: Interventions to apply, one matrix column each
+            checkpoint_every: Steps between factual checkpoints (default: 10)
+            workers: Number of worker processes (default: None, run in this
+                process). Callables must then be picklable.
+            outcome: Callable mapping the env at the end of a branch to a float
+                (default: None, record env.success as a bool)
+
+        Raises:
+            ValueError: If checkpoint_every or workers is invalid, or an
+                intervention is malformed
+        """
+        from interphyre.environment import _check_intervention
+
+        if checkpoint_every < 1:
+            raise ValueError(f"checkpoint_every must be >= 1, got {checkpoint_every}")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        for intervention in interventions:
+            _check_intervention(intervention)
+        self.env = env
+        self.interventions = list(interventions)
+        self.checkpoint_every = checkpoint_every
+        self.workers = workers
+        self.outcome = outcome
+        self.checkpoints: dict[int, StateSnapshot] = {}
+        self.factual_outcome: Any = None
+
+    def run(
+        self,
+        action: tuple[float, float, float]
+        | list[tuple[float, float, float]]
+        | None = None,
+        steps: int | None = None,
+        times: Sequence[int] | None = None,
+    ) -> np.ndarray:
+        """Run the factual rollout, then every (step, intervention) branch.
+
+        The action is placed unless one already is, and the rollout is stepped
+        *steps* times from the current state. Afterwards the environment is
+        back at the start of the rollout, so run() can be repeated.
+
+        Args:
+            action: Action to place first, as for run_until()
+            steps: Length of the rollout (default: env.max_steps)
+            times: Intervention steps into the rollout, each in [0, steps)
+                (default: every step)
+
+        Returns:
+            Array of shape (len(times), len(interventions)): bool success, or
+            float64 values of the outcome callable. Row r holds the branches
+            that intervene at step times[r].
+
+        Raises:
+            ValueError: If steps or times is invalid, or the action is invalid
+        """
+        env = self.env
+        steps = env.max_steps if steps is None else steps
+        if steps < 1:
+            raise ValueError(f"steps must be >= 1, got {steps}")
+        times = np.arange(steps) if times is None else np.asarray(times, dtype=int)
+        if times.size and (times.min() < 0 or times.max() >= steps):
+            raise ValueError(f"times must lie in [0, {steps}), got {times}")
+
+        env._place_intervention_action(action)
+        k = self.checkpoint_every
+        self.checkpoints = {}
+        for t in range(steps):
+            if t % k == 0:
+                self.checkpoints[t] = StateSnapshot.capture(
+                    env.engine, metadata={"step_index": env.step_count}
+                )
+            env.step_physics()
+        self.factual_outcome = _measure(env, self.outcome)
+
+        dtype = bool if self.outcome is None else np.float64
+        outcomes = np.zeros((len(times), len(self.interventions)), dtype=dtype)
+        # One job per checkpoint: all the rows that branch from it.
+        groups: dict[int, list[int]] = {}
+        for row, t in enumerate(times.tolist()):
+            groups.setdefault(t - t % k, []).append(row)
+
+        if self.workers is not None and self.workers > 1 and len(groups) > 1:
+            pool = env._get_batch_pool(self.workers)
+            futures = [
+                (
+                    rows,
+                    pool.submit(
+                        _sweep_worker,
+                        self.checkpoints[start].to_bytes(),
+                        times[rows] - start,
+                        self.interventions,
+                        steps - start,
+                        self.outcome,
+                    ),
+                )
+                for start, rows in groups.items()
+            ]
+            for rows, future in futures:
+                outcomes[rows] = future.result()
+        else:
+            for start, rows in groups.items():
+                outcomes[rows] = _sweep_branches(
+                    env,
+                    self.checkpoints[start],
+                    times[rows] - start,
+                    self.interventions,
+                    steps - start,
+                    self.outcome,
+                )
+        env.restore(self.checkpoints[0])
+        return outcomes
+
+    def __repr__(self) -> str:
+        return (
+            f"CounterfactualSweep({len(self.interventions)} interventions, "
+            f"checkpoint_every={self.checkpoint_every})"
+        )
+
+
+def _measure(env: InterphyreEnv, outcome: Callable | None) -> Any:
+    """Outcome of the current state: env.success, or the outcome callable."""
+    return env.success if outcome is None else outcome(env)
+
+
+def _sweep_branches(
+    env: InterphyreEnv,
+    checkpoint: StateSnapshot,
+    offsets: np.ndarray,
+    interventions: list,
+    remaining: int,
+    outcome: Callable | None,
+) -> np.ndarray:
+    """Run every intervention offset steps after checkpoint, for each offset.
+
+    Returns:
+        Array of shape (len(offsets), len(interventions)) of outcomes measured
+        remaining steps after checkpoint.
+    """
+    from interphyre.environment import _apply_intervention
+
+    dtype = bool if outcome is None else np.float64
+    result = np.zeros((len(offsets), len(interventions)), dtype=dtype)
+    for row, offset in enumerate(offsets.tolist()):
+        for column, intervention in enumerate(interventions):
+            env.restore(checkpoint)
+            env.step_physics(offset)
+            _apply_intervention(env, intervention)
+            env.step_physics(remaining - offset)
+            result[row, column] = _measure(env, outcome)
+    return result
+
+
+def _sweep_worker(
+    data: bytes,
+    offsets: np.ndarray,
+    interventions: list,
+    remaining: int,
+    outcome: Callable | None,
+) -> np.ndarray:
+    """Run one checkpoint's branches on a step_batch() pool worker."""
+    from interphyre.environment import _worker_branch_env
+
+    checkpoint = StateSnapshot.from_buffer(data)
+    return _sweep_branches(
+        _worker_branch_env(), checkpoint, offsets, interventions, remaining, outcome
+    )
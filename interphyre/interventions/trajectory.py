@@ -0,0 +1,479 @@
+"""
+Keyframe + delta storage for whole-trajectory snapshots.
+
+Storing a StateSnapshot per step repeats everything that does not change
+between steps. A snapshot trajectory file instead holds a full keyframe every
+``keyframe_every`` records and, in between, deltas with only the kinematics of
+the dynamic bodies plus the contact state when it changed. Any record can be
+decoded from its nearest keyframe, so restoring to an arbitrary step never
+replays physics.
+
+File format: a sequence of 8-byte aligned records, each a fixed header (kind,
+payload length, step index, simulation time) followed by its payload:
+
+- layout: a pickled SnapshotLayout, written once per distinct layout before
+  the first keyframe that uses it;
+- keyframe: StateSnapshot.to_bytes(include_layout=False);
+- delta: float32 (dynamic bodies, 6) x, y, angle, vx, vy, angular velocity,
+  uint8 body flags, then the contact pairs and start times if they changed
+  since the previous record, then pickled metadata if there is any.
+
+Records are self-describing, so a reader indexes a file by scanning record
+headers and can open a file that is still being written.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import struct
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from interphyre.interventions.state import SnapshotLayout, StateSnapshot, _frozen
+
+if TYPE_CHECKING:
+    from interphyre.engine import Box2DEngine
+
+_MAGIC = b"ITRJ"
+_FORMAT_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sHH")
+# kind, payload length, step index, simulation time
+_RECORD = struct.Struct("<BxxxIqd")
+# contact pair count, start time count (_UNCHANGED: same as previous record),
+# metadata length
+_DELTA = struct.Struct("<HHI")
+_UNCHANGED = 0xFFFF
+_LAYOUT, _KEYFRAME, _DELTA_KIND = 0, 1, 2
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _dynamic_rows(layout: SnapshotLayout) -> np.ndarray:
+    """Row indices of the layout's dynamic bodies."""
+    return np.array(
+        [i for i, name in enumerate(layout.names) if layout.dynamic.get(name)],
+        dtype=np.intp,
+    )
+
+
+def _contact_arrays(
+    snapshot: StateSnapshot, index: dict[str, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Contact pairs, start-time pairs and start times as layout row indices.
+
+    Returns None if a contact refers to a body outside the layout.
+    """
+    try:
+        pairs = np.array(
+            sorted(sorted(index[name] for name in pair) for pair in snapshot.contacts),
+            dtype=np.uint16,
+        ).reshape(-1, 2)
+        items = sorted(snapshot.contact_start_times.items())
+        time_pairs = np.array(
+            [[index[name] for name in key.split("|", 1)] for key, _ in items],
+            dtype=np.uint16,
+        ).reshape(-1, 2)
+    except KeyError:
+        return None
+    times = np.array([time for _, time in items], dtype=np.float64)
+    return pairs, time_pairs, times
+
+
+class SnapshotTrajectoryWriter:
+    """Streaming writer for snapshot trajectory files.
+
+    Snapshots are appended in order. A keyframe is written every
+    ``keyframe_every`` records and whenever a delta could not reproduce the
+    snapshot exactly: the layout or structural versions changed, a
+    non-dynamic body moved, or a contact refers to a removed body.
+
+    Example:
+        with SnapshotTrajectoryWriter("rollout.traj", keyframe_every=60) as writer:
+            for _ in range(600):
+                env.step_physics()
+                writer.capture(env.engine)
+
+        trajectory = SnapshotTrajectory("rollout.traj")
+        env.restore(trajectory.at_step(250))
+    """
+
+    def __init__(self, path: str | os.PathLike, keyframe_every: int = 60):
+        """Create (or truncate) a trajectory file.
+
+        Args:
+            path: File to write
+            keyframe_every: Maximum number of records between keyframes
+
+        Raises:
+            ValueError: If keyframe_every is less than 1
+        """
+        if keyframe_every < 1:
+            raise ValueError(f"keyframe_every must be >= 1, got {keyframe_every}")
+        self.path = os.fspath(path)
+        self.keyframe_every = keyframe_every
+        self._file = open(self.path, "wb")  # noqa: SIM115 - closed in close()
+        self._file.write(_FILE_HEADER.pack(_MAGIC, _FORMAT_VERSION, 0))
+        self._size = _align(_FILE_HEADER.size)
+        self._file.write(bytes(self._size - _FILE_HEADER.size))
+        self._layouts: set[str] = set()
+        self._keyframe: StateSnapshot | None = None
+        self._static_rows = np.zeros(0, dtype=np.intp)
+        self._dynamic_rows = np.zeros(0, dtype=np.intp)
+        self._index: dict[str, int] = {}
+        self._since_keyframe = 0
+        self._contacts: tuple | None = None
+        self.records = 0
+        self.keyframes = 0
+
+    def capture(
+        self, engine: Box2DEngine, metadata: dict[str, Any] | None = None
+    ) -> StateSnapshot:
+        """Capture the engine's state and append it.
+
+        Returns:
+            The captured snapshot
+        """
+        snapshot = StateSnapshot.capture(engine, metadata=metadata)
+        self.append(snapshot)
+        return snapshot
+
+    def append(self, snapshot: StateSnapshot) -> None:
+        """Append a snapshot as a keyframe or a delta."""
+        if self._file is None:
+            raise RuntimeError("Cannot append to a closed SnapshotTrajectoryWriter")
+        keyframe = self._keyframe
+        contacts = None
+        if (
+            keyframe is not None
+            and self._since_keyframe < self.keyframe_every
+            and snapshot.layout.digest == keyframe.layout.digest
+            and np.array_equal(snapshot.structure_versions, keyframe.structure_versions)
+        ):
+            contacts = _contact_arrays(snapshot, self._index)
+        if contacts is None or not self._static_unchanged(snapshot):
+            self._write_keyframe(snapshot)
+        else:
+            self._write_delta(snapshot, contacts)
+        self.records += 1
+
+    def _static_unchanged(self, snapshot: StateSnapshot) -> bool:
+        """Whether every non-dynamic body matches the current keyframe."""
+        keyframe = self._keyframe
+        rows = self._static_rows
+        return (
+            np.array_equal(snapshot.transforms[rows], keyframe.transforms[rows])
+            and np.array_equal(snapshot.velocities[rows], keyframe.velocities[rows])
+            and np.array_equal(snapshot.body_flags[rows], keyframe.body_flags[rows])
+        )
+
+    def _write_keyframe(self, snapshot: StateSnapshot) -> None:
+        layout = snapshot.layout
+        if layout.digest not in self._layouts:
+            self._write(_LAYOUT, layout.to_bytes(), snapshot)
+            self._layouts.add(layout.digest)
+        self._write(_KEYFRAME, snapshot.to_bytes(include_layout=False), snapshot)
+        if self._keyframe is None or layout.digest != self._keyframe.layout.digest:
+            self._dynamic_rows = _dynamic_rows(layout)
+            self._static_rows = np.setdiff1d(
+                np.arange(len(layout.names)), self._dynamic_rows
+            )
+            self._index = {name: i for i, name in enumerate(layout.names)}
+        self._keyframe = snapshot
+        self._since_keyframe = 1
+        self._contacts = _contact_arrays(snapshot, self._index)
+        self.keyframes += 1
+
+    def _write_delta(self, snapshot: StateSnapshot, contacts: tuple) -> None:
+        rows = self._dynamic_rows
+        state = np.concatenate(
+            (snapshot.transforms[rows], snapshot.velocities[rows]), axis=1
+        ).astype(np.float32, copy=False)
+        metadata = (
+            pickle.dumps(snapshot.metadata, protocol=pickle.HIGHEST_PROTOCOL)
+            if snapshot.metadata
+            else b""
+        )
+        previous = self._contacts
+        changed = previous is None or not all(
+            np.array_equal(a, b) for a, b in zip(contacts, previous)
+        )
+        pairs, time_pairs, times = contacts
+        parts = [
+            _DELTA.pack(
+                len(pairs) if changed else _UNCHANGED,
+                len(times) if changed else _UNCHANGED,
+                len(metadata),
+            ),
+            state.tobytes(),
+            np.ascontiguousarray(snapshot.body_flags[rows]).tobytes(),
+        ]
+        if changed:
+            parts += [pairs.tobytes(), time_pairs.tobytes(), times.tobytes()]
+        parts.append(metadata)
+        self._write(_DELTA_KIND, b"".join(parts), snapshot)
+        self._contacts = contacts
+        self._since_keyframe += 1
+
+    def _write(self, kind: int, payload: bytes, snapshot: StateSnapshot) -> None:
+        header = _RECORD.pack(
+            kind, len(payload), snapshot.step_index, snapshot.current_time
+        )
+        size = _align(_RECORD.size + len(payload))
+        self._file.write(header)
+        self._file.write(payload)
+        self._file.write(bytes(size - _RECORD.size - len(payload)))
+        self._size += size
+
+    @property
+    def bytes_written(self) -> int:
+        """Size of the file so far."""
+        return self._size
+
+    def flush(self) -> None:
+        """Flush buffered records so readers opening the file see them."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> SnapshotTrajectoryWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        return (
+            f"SnapshotTrajectoryWriter(path={self.path!r}, records={self.records}, "
+            f"keyframes={self.keyframes})"
+        )
+
+
+class SnapshotTrajectory:
+    """Random-access reader for snapshot trajectory files.
+
+    The file is memory-mapped; opening it scans the record headers to build
+    the index and loads the layouts. Decoding a record reads its keyframe,
+    its own delta and, if its contact state was carried over, the delta that
+    last changed it.
+
+    Attributes:
+        steps: int64 step index of every record
+        times: float64 simulation time of every record
+        keyframes: Record indices of the keyframes
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open and index a trajectory file.
+
+        Raises:
+            ValueError: If the file is not a snapshot trajectory
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _FILE_HEADER.size:
+                raise ValueError(f"{self.path} is not a snapshot trajectory file")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _ = _FILE_HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not a snapshot trajectory file")
+        if version != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot trajectory format version {version} "
+                f"(expected {_FORMAT_VERSION})"
+            )
+        self._index()
+
+    def _index(self) -> None:
+        view = self._map
+        size = len(view)
+        offsets, lengths, steps, times = [], [], [], []
+        keyframe_of, contacts_of = [], []
+        self._layouts: dict[str, SnapshotLayout] = {}
+        keyframe = contacts = -1
+        offset = _align(_FILE_HEADER.size)
+        while offset + _RECORD.size <= size:
+            kind, length, step, time = _RECORD.unpack_from(view, offset)
+            start = offset + _RECORD.size
+            if start + length > size:
+                break  # record still being written
+            if kind == _LAYOUT:
+                layout = SnapshotLayout.from_bytes(view[start : start + length])
+                self._layouts[layout.digest] = layout
+            else:
+                record = len(offsets)
+                if kind == _KEYFRAME:
+                    keyframe = contacts = record
+                elif _DELTA.unpack_from(view, start)[0] != _UNCHANGED:
+                    contacts = record
+                offsets.append(start)
+                lengths.append(length)
+                steps.append(step)
+                times.append(time)
+                keyframe_of.append(keyframe)
+                contacts_of.append(contacts)
+            offset = _align(start + length)
+        self._offsets = np.array(offsets, dtype=np.int64)
+        self._lengths = np.array(lengths, dtype=np.int64)
+        self.steps = _frozen(np.array(steps, dtype=np.int64))
+        self.times = _frozen(np.array(times, dtype=np.float64))
+        self._keyframe_of = np.array(keyframe_of, dtype=np.int64)
+        self._contacts_of = np.array(contacts_of, dtype=np.int64)
+        self.keyframes = _frozen(
+            np.flatnonzero(self._keyframe_of == np.arange(len(offsets)))
+        )
+        self._cache: tuple[int, StateSnapshot] | None = None
+        self._dynamic: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, record: int) -> StateSnapshot:
+        """Decode record *record* (negative indices count from the end).
+
+        Raises:
+            IndexError: If record is out of range
+            ValueError: If the trajectory is closed
+        """
+        n = len(self)
+        if not -n <= record < n:
+            raise IndexError(f"record {record} out of range for {n} records")
+        return self._decode(record % n)
+
+    def at_step(self, step_index: int) -> StateSnapshot:
+        """Decode the last record with the given step index.
+
+        Raises:
+            KeyError: If no record has that step index
+            ValueError: If the trajectory is closed
+        """
+        position = int(np.searchsorted(self.steps, step_index, side="right")) - 1
+        if position < 0 or self.steps[position] != step_index:
+            raise KeyError(f"No snapshot recorded at step {step_index}")
+        return self._decode(position)
+
+    def _keyframe(self, record: int) -> StateSnapshot:
+        """Decode a keyframe, caching the last one used."""
+        if self._cache is not None and self._cache[0] == record:
+            return self._cache[1]
+        # Copy the record out so decoded snapshots do not pin the mmap; the
+        # layouts in self._layouts keep from_buffer able to resolve digests.
+        offset = int(self._offsets[record])
+        length = int(self._lengths[record])
+        snapshot = StateSnapshot.from_buffer(self._map[offset : offset + length])
+        self._cache = (record, snapshot)
+        return snapshot
+
+    def _rows(self, layout: SnapshotLayout) -> np.ndarray:
+        rows = self._dynamic.get(layout.digest)
+        if rows is None:
+            rows = self._dynamic[layout.digest] = _dynamic_rows(layout)
+        return rows
+
+    def _decode(self, record: int) -> StateSnapshot:
+        if self._map is None:
+            raise ValueError("trajectory is closed")
+        keyframe_record = int(self._keyframe_of[record])
+        keyframe = self._keyframe(keyframe_record)
+        if record == keyframe_record:
+            return keyframe
+        layout = keyframe.layout
+        rows = self._rows(layout)
+        view = self._map
+        offset = int(self._offsets[record])
+        _, _, metadata_length = _DELTA.unpack_from(view, offset)
+        offset += _DELTA.size
+        count = len(rows)
+        state = np.frombuffer(view, np.float32, count * 6, offset).reshape(count, 6)
+        offset += state.nbytes
+        flags = np.frombuffer(view, np.uint8, count, offset)
+        offset += count
+        transforms = keyframe.transforms.copy()
+        velocities = keyframe.velocities.copy()
+        body_flags = keyframe.body_flags.copy()
+        transforms[rows] = state[:, :3]
+        velocities[rows] = state[:, 3:]
+        body_flags[rows] = flags
+
+        contacts_record = int(self._contacts_of[record])
+        if contacts_record == keyframe_record:
+            contacts = keyframe.contacts
+            start_times = keyframe.contact_start_times
+        else:
+            contacts, start_times = self._read_contacts(contacts_record, layout)
+            if contacts_record == record:
+                n_pairs, n_times, _ = _DELTA.unpack_from(
+                    view, int(self._offsets[record])
+                )
+                offset += n_pairs * 4 + n_times * 12
+        metadata = (
+            pickle.loads(view[offset : offset + metadata_length])
+            if metadata_length
+            else {}
+        )
+        return StateSnapshot(
+            step_index=int(self.steps[record]),
+            current_time=float(self.times[record]),
+            layout=layout,
+            transforms=_frozen(transforms),
+            velocities=_frozen(velocities),
+            body_flags=_frozen(body_flags),
+            structure_versions=keyframe.structure_versions,
+            contacts=contacts,
+            contact_start_times=start_times,
+            level_hash=keyframe.level_hash,
+            metadata=metadata,
+        )
+
+    def _read_contacts(
+        self, record: int, layout: SnapshotLayout
+    ) -> tuple[frozenset, dict[str, float]]:
+        """Contact pairs and start times stored in a delta record."""
+        view = self._map
+        offset = int(self._offsets[record])
+        n_pairs, n_times, _ = _DELTA.unpack_from(view, offset)
+        count = len(self._rows(layout))
+        offset += _DELTA.size + count * 25
+        names = layout.names
+        pairs = np.frombuffer(view, np.uint16, n_pairs * 2, offset).reshape(-1, 2)
+        offset += pairs.nbytes
+        time_pairs = np.frombuffer(view, np.uint16, n_times * 2, offset).reshape(-1, 2)
+        offset += time_pairs.nbytes
+        times = np.frombuffer(view, np.float64, n_times, offset).tolist()
+        contacts = frozenset(frozenset((names[a], names[b])) for a, b in pairs.tolist())
+        start_times = {
+            f"{names[a]}|{names[b]}": time
+            for (a, b), time in zip(time_pairs.tolist(), times)
+        }
+        return contacts, start_times
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._cache = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> SnapshotTrajectory:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        return (
+            f"SnapshotTrajectory(path={self.path!r}, records={len(self)}, "
+            f"keyframes={len(self.keyframes)})"
+        )
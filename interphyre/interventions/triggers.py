@@ -22,7 +22,10 @@ class Trigger(ABC):
     Abstract base class for all intervention triggers.
 
     A trigger determines when an intervention should fire during simulation.
-    Triggers are evaluated each simulation step.
+    Triggers are evaluated by run_until(), which only calls should_fire() at
+    the steps a trigger asks for through next_check(), or when one of its
+    watched_contacts() begins. The defaults poll every step, so a subclass
+    only needs should_fire().
 
     Attributes:
         reset_callback: Callable invoked by reset() after subclass state
@@ -46,6 +49,34 @@ class Trigger(ABC):
         """
         pass
 
+    def next_check(self, step_index: int, engine: "Box2DEngine") -> int | None:
+        """
+        Get the next step at which should_fire() could return True.
+
+        Called after should_fire() was (or would have been) evaluated at
+        step_index. Until the returned step, should_fire() must return False
+        and have no side effects unless a watched contact begins first.
+
+        Args:
+            step_index: Step index the trigger was last evaluated at
+            engine: The Box2DEngine being simulated
+
+        Returns:
+            Step index greater than step_index, or None if only a watched
+            contact can make the trigger fire
+        """
+        return step_index + 1
+
+    def watched_contacts(self) -> tuple[tuple[str, ...], ...]:
+        """
+        Get the contacts whose beginning can make this trigger fire.
+
+        Returns:
+            Tuple of (obj_a, obj_b) pairs and (obj,) single names, in the form
+            accepted by GoalContactListener.WatchContacts()
+        """
+        return ()
+
     def reset(self) -> None:
         """
         Reset trigger state for reuse.
@@ -75,6 +106,10 @@ class TimeBasedTrigger(Trigger):
         """Fire when current step matches target step."""
         return step_index == self.step_index
 
+    def next_check(self, step_index: int, engine: "Box2DEngine") -> int | None:
+        """Wake exactly at the target step."""
+        return self.step_index if self.step_index > step_index else None
+
     def __repr__(self) -> str:
         return f"TimeBasedTrigger(step={self.step_index})"
 
@@ -114,27 +149,36 @@ class EventBasedTrigger(Trigger):
         if self.event_type == "contact":
             if len(self.object_names) == 2:
                 # Specific contact pair
-                contact_pair = frozenset(self.object_names)
-                return contact_pair in engine.contact_listener.contacts
+                return engine.contact_listener.HasContact(*self.object_names)
             elif len(self.object_names) == 1:
                 # Any contact involving this object
-                obj_name = self.object_names[0]
-                for contact in engine.contact_listener.contacts:
-                    if obj_name in contact:
-                        return True
-                return False
+                return engine.contact_listener.HasContactWith(self.object_names[0])
             else:
                 raise ValueError("EventBasedTrigger requires 1 or 2 object names")
 
         elif self.event_type == "success":
             # Success condition met
             if engine.level and engine.level.success_condition:
-                return engine.level.success_condition(engine)
+                return engine.check_success()
             return False
 
         else:
             raise ValueError(f"Unknown event type: {self.event_type}")
 
+    def next_check(self, step_index: int, engine: "Box2DEngine") -> int | None:
+        """Wait for a contact to begin; poll the success condition every step."""
+        if self.once_only and self._fired:
+            return None
+        if self.event_type == "contact" and not self._check_event(engine):
+            return None
+        return step_index + 1
+
+    def watched_contacts(self) -> tuple[tuple[str, ...], ...]:
+        """Watch the trigger's contact pair or object."""
+        if self.event_type == "contact":
+            return (self.object_names,)
+        return ()
+
     def reset(self) -> None:
         """Reset fired state for reuse."""
         self._fired = False
@@ -159,16 +203,25 @@ class ConditionBasedTrigger(Trigger):
     Attributes:
         condition: Callable that takes engine and returns bool
         once_only: If True, fire only once (default: True)
+        check_every: Only evaluate the condition at step indices that are a
+            multiple of this (default: 1, every step)
     """
 
     condition: Callable[["Box2DEngine"], bool] = field(default=lambda e: False)
     once_only: bool = True
+    check_every: int = 1
     _fired: bool = field(default=False, init=False, repr=False)
 
+    def __post_init__(self) -> None:
+        if self.check_every < 1:
+            raise ValueError(f"check_every must be >= 1, got {self.check_every}")
+
     def should_fire(self, step_index: int, engine: "Box2DEngine") -> bool:
         """Fire when custom condition returns True."""
         if self.once_only and self._fired:
             return False
+        if step_index % self.check_every:
+            return False
 
         result = self.condition(engine)
 
@@ -177,6 +230,12 @@ class ConditionBasedTrigger(Trigger):
 
         return result
 
+    def next_check(self, step_index: int, engine: "Box2DEngine") -> int | None:
+        """Poll at the next multiple of check_every."""
+        if self.once_only and self._fired:
+            return None
+        return step_index + self.check_every - step_index % self.check_every
+
     def reset(self) -> None:
         """Reset fired state for reuse."""
         self._fired = False
@@ -261,6 +320,7 @@ def on_success(once_only: bool = True) -> EventBasedTrigger:
 def when(
     condition: Callable[["Box2DEngine"], bool],
     once_only: bool = True,
+    every: int = 1,
 ) -> ConditionBasedTrigger:
     """
     Create a condition-based trigger that fires when a custom condition is met.
@@ -268,16 +328,20 @@ def when(
     Args:
         condition: Callable that takes Box2DEngine and returns bool
         once_only: If True, fire only once (default: True)
+        every: Evaluate the condition only every this many steps (default: 1)
 
     Returns:
         ConditionBasedTrigger configured with the custom condition
 
     Example:
         >>> trigger = when(lambda e: e.bodies["ball"].position.y < -2.0)
+        >>> # Expensive checks can be thinned out
+        >>> trigger = when(expensive_check, every=10)
     """
     return ConditionBasedTrigger(
         condition=condition,
         once_only=once_only,
+        check_every=every,
     )
 
 
@@ -481,6 +545,22 @@ class SequenceTrigger(Trigger):
 
         return False
 
+    def next_check(self, step_index: int, engine: "Box2DEngine") -> int | None:
+        """Wake for the current trigger, and earlier ones if they can reset."""
+        if self.once_only and self._fired:
+            return None
+        if self._current_index >= len(self.triggers):
+            return None
+        first = 0 if self.reset_on_failure else self._current_index
+        return _earliest(
+            trigger.next_check(step_index, engine)
+            for trigger in self.triggers[first : self._current_index + 1]
+        )
+
+    def watched_contacts(self) -> tuple[tuple[str, ...], ...]:
+        """Watch the contacts of every trigger in the sequence."""
+        return _watched(self.triggers)
+
     def reset(self) -> None:
         """Reset sequence state for reuse."""
         self._current_index = 0
@@ -532,6 +612,18 @@ class AnyTrigger(Trigger):
 
         return fired
 
+    def next_check(self, step_index: int, engine: "Box2DEngine") -> int | None:
+        """Wake at the earliest step any trigger asks for."""
+        if self.once_only and self._fired:
+            return None
+        return _earliest(
+            trigger.next_check(step_index, engine) for trigger in self.triggers
+        )
+
+    def watched_contacts(self) -> tuple[tuple[str, ...], ...]:
+        """Watch the contacts of every trigger."""
+        return _watched(self.triggers)
+
     def reset(self) -> None:
         """Reset fired state for reuse."""
         self._fired = False
@@ -544,6 +636,20 @@ class AnyTrigger(Trigger):
         return f"AnyTrigger({len(self.triggers)} triggers, {once_str})"
 
 
+def _earliest(steps) -> int | None:
+    """Smallest of the given wake-up steps, ignoring None."""
+    return min((step for step in steps if step is not None), default=None)
+
+
+def _watched(triggers) -> tuple[tuple[str, ...], ...]:
+    """Union of the watched contacts of triggers, in first-seen order."""
+    return tuple(
+        dict.fromkeys(
+            contact for trigger in triggers for contact in trigger.watched_contacts()
+        )
+    )
+
+
 def on_sequence(
     triggers: list[Trigger],
     reset_on_failure: bool = True,
@@ -10,6 +10,33 @@ if TYPE_CHECKING:
     from interphyre.engine import Box2DEngine
 
 
+@dataclass(frozen=True)
+class ContactGoal:
+    """Declarative success condition: two objects in unbroken contact for a hold time.
+
+    A ContactGoal is itself a success_condition callable, so it can be passed
+    anywhere a Level expects one. Declaring the goal as data lets Box2DEngine
+    track the pair directly in the contact listener and skip evaluating the
+    predicate until the hold can have completed (see Box2DEngine.check_success).
+
+    Attributes:
+        a (str): Name of the first object
+        b (str): Name of the second object
+        hold (float | None): Required contact duration in seconds. If None, uses
+            config.default_success_time.
+
+    Example:
+        success_condition = ContactGoal("green_ball", "blue_ball")
+    """
+
+    a: str
+    b: str
+    hold: float | None = None
+
+    def __call__(self, engine: Box2DEngine) -> bool:
+        return engine.is_in_contact_for_duration(self.a, self.b, self.hold)
+
+
 @dataclass
 class Level:
     """Represents a physics puzzle level with objects and success conditions.
@@ -22,7 +49,8 @@ class Level:
         name (str): Unique identifier for the level
         objects (dict[str, InterphyreObject]): Dictionary mapping object names to physics objects
         action_objects (list[str]): List of object names that can be controlled by the agent
-        success_condition (Callable[[Box2DEngine], bool]): Function that determines if the level is solved
+        success_condition (Callable[[Box2DEngine], bool]): Function that determines if the level is solved.
+            Pass a ContactGoal to declare the goal as data.
         metadata (dict | None): Additional level information (default: empty dict)
     """
 
@@ -43,6 +71,13 @@ class Level:
                 f"Level '{self.name}' must define a success_condition function."
             )
 
+    @property
+    def goal(self) -> ContactGoal | None:
+        """The level's declarative goal, or None if success_condition is opaque."""
+        if isinstance(self.success_condition, ContactGoal):
+            return self.success_condition
+        return None
+
     def move_object(self, obj_name: str, x: float, y: float):
         """Move an object to a new position.
 
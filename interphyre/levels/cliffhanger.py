@@ -1,17 +1,11 @@
 import numpy as np
 from interphyre.objects import Ball, Bar
-from interphyre.level import Level
+from interphyre.level import ContactGoal, Level
 from interphyre.levels import register_level
 from interphyre.config import MIN_X, MAX_X, MIN_Y
 
 
-def success_condition(engine):
-    success_time = engine.config.default_success_time
-    return engine.is_in_contact_for_duration(
-        "green_bar",
-        "purple_ground",
-        success_time,
-    )
+success_condition = ContactGoal("green_bar", "purple_ground")
 
 
 @register_level
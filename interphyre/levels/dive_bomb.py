@@ -2,14 +2,12 @@ from __future__ import annotations
 
 import numpy as np
 from interphyre.objects import Ball, Bar
-from interphyre.level import Level
+from interphyre.level import ContactGoal, Level
 from interphyre.levels import register_level
 from interphyre.config import MAX_X, MAX_Y, MIN_X, MIN_Y
 
 
-def success_condition(engine):
-    success_time = engine.config.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "purple_pad", success_time)
+success_condition = ContactGoal("green_ball", "purple_pad")
 
 
 @register_level
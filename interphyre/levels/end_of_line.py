@@ -1,12 +1,10 @@
 import numpy as np
 from interphyre.objects import Ball, Bar
-from interphyre.level import Level
+from interphyre.level import ContactGoal, Level
 from interphyre.levels import register_level
 
 
-def success_condition(engine):
-    success_time = engine.config.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "purple_wall", success_time)
+success_condition = ContactGoal("green_ball", "purple_wall")
 
 
 @register_level
@@ -1,13 +1,11 @@
 import numpy as np
 from interphyre.objects import Ball, Bar
-from interphyre.level import Level
+from interphyre.level import ContactGoal, Level
 from interphyre.levels import register_level
 from interphyre.config import MAX_X, MAX_Y, MIN_X, MIN_Y, WORLD_WIDTH, WORLD_HEIGHT
 
 
-def success_condition(engine):
-    success_time = engine.config.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "purple_floor", success_time)
+success_condition = ContactGoal("green_ball", "purple_floor")
 
 
 @register_level
@@ -1,14 +1,11 @@
 import numpy as np
 from interphyre.objects import Ball, Bar, Basket
-from interphyre.level import Level
+from interphyre.level import ContactGoal, Level
 from interphyre.levels import register_level
 from interphyre.config import MIN_X, MAX_X, MIN_Y, MAX_Y, WORLD_WIDTH, WORLD_HEIGHT
 
 
-def success_condition(engine):
-    return engine.is_in_contact_for_duration(
-        "basket", "green_ball", engine.config.default_success_time
-    )
+success_condition = ContactGoal("basket", "green_ball")
 
 
 @register_level
@@ -212,38 +212,25 @@ class Basket(InterphyreObject):
             raise ValueError(f"Unknown anchor: {self.anchor}")
 
 
-def circle_intersects_basket(
-    cx: float, cy: float, radius: float, basket: "Basket"
-) -> bool:
-    """Return True if a circle overlaps any wall segment of a basket.
+def basket_wall_slabs(
+    basket: "Basket",
+) -> list[tuple[float, float, float, float]]:
+    """Return the basket's four placement-blocking wall slabs in world coordinates.
 
-    Four axis-aligned wall slabs are checked: floor, left wall, right wall, and a
-    virtual top cap.  The test uses nearest-point clamping to find the closest
-    point on each slab to the circle center, then compares the squared distance
-    against radius².
-
-    The top cap has no corresponding physics fixture (baskets are open at the top),
-    but it blocks action-ball placements inside the basket interior — which would
-    be an exploit in levels where the goal is to land a ball in the basket.
+    Slabs are axis-aligned (left, bottom, right, top) boxes: floor, left wall,
+    right wall, and the virtual top cap used by circle_intersects_basket.
 
     Anchor awareness: basket.x/y is the anchor point, not the geometric center.
     get_anchor_offset() returns the vector from bottom-center to the anchor in
     local space, which must be subtracted from the anchor position to recover the
     actual floor-bottom world coordinate.
 
-    This is the authoritative implementation shared by InterphyreEnv (placement
-    validation) and the oracle registry (solvability checking).  It intentionally
-    uses only the Python standard library so that basket.py remains numpy-free.
-
     Args:
-        cx: Circle center x-coordinate.
-        cy: Circle center y-coordinate.
-        radius: Circle radius.
         basket: Basket instance providing x, y, total_width, total_height,
             wall_thickness, and get_anchor_offset() attributes.
 
     Returns:
-        True if the circle intersects at least one wall slab; False otherwise.
+        List of four (left, bottom, right, top) tuples.
     """
     half_width = basket.total_width / 2
     wall_thickness = basket.wall_thickness
@@ -259,15 +246,46 @@ def circle_intersects_basket(
     basket_top = basket.y + anchor_offset_y + basket.total_height
 
     # Four axis-aligned wall slabs: floor, left, right, virtual top cap.
-    walls = [
+    return [
         (basket_left, basket_bottom, basket_right, basket_bottom + wall_thickness),
         (basket_left, basket_bottom, basket_left + wall_thickness, basket_top),
         (basket_right - wall_thickness, basket_bottom, basket_right, basket_top),
         (basket_left, basket_top - wall_thickness, basket_right, basket_top),
     ]
 
+
+def circle_intersects_basket(
+    cx: float, cy: float, radius: float, basket: "Basket"
+) -> bool:
+    """Return True if a circle overlaps any wall segment of a basket.
+
+    Four axis-aligned wall slabs are checked: floor, left wall, right wall, and a
+    virtual top cap.  The test uses nearest-point clamping to find the closest
+    point on each slab to the circle center, then compares the squared distance
+    against radius².
+
+    The top cap has no corresponding physics fixture (baskets are open at the top),
+    but it blocks action-ball placements inside the basket interior — which would
+    be an exploit in levels where the goal is to land a ball in the basket.
+
+    The slabs come from basket_wall_slabs(), which resolves the anchor point.
+
+    This is the authoritative implementation shared by InterphyreEnv (placement
+    validation) and the oracle registry (solvability checking).  It intentionally
+    uses only the Python standard library so that basket.py remains numpy-free.
+
+    Args:
+        cx: Circle center x-coordinate.
+        cy: Circle center y-coordinate.
+        radius: Circle radius.
+        basket: Basket instance providing x, y, total_width, total_height,
+            wall_thickness, and get_anchor_offset() attributes.
+
+    Returns:
+        True if the circle intersects at least one wall slab; False otherwise.
+    """
     radius_sq = radius**2
-    for left, bottom, right, top in walls:
+    for left, bottom, right, top in basket_wall_slabs(basket):
         nearest_x = max(left, min(cx, right))
         nearest_y = max(bottom, min(cy, top))
         if (cx - nearest_x) ** 2 + (cy - nearest_y) ** 2 <= radius_sq:
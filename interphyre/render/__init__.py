@@ -6,6 +6,12 @@ from interphyre.render.base import (
 )
 from interphyre.render.opencv import OpenCVRenderer as OpenCVRenderer
 from interphyre.render.pygame import PygameRenderer as PygameRenderer
+from interphyre.render.trajectory import (
+    Trajectory as Trajectory,
+    TrajectoryRecorder as TrajectoryRecorder,
+    iter_trajectory_frames as iter_trajectory_frames,
+    render_trajectory as render_trajectory,
+)
 from interphyre.render.video import VideoRecorder as VideoRecorder
 
 
@@ -1,17 +1,135 @@
 import cv2
 import numpy as np
 from interphyre.render.base import Renderer, DISCRETE_COLORS, RGB_TO_DISCRETE
-from Box2D import b2PolygonShape, b2CircleShape
+from Box2D import b2PolygonShape, b2CircleShape, b2_staticBody
+
+
+# Bound on cached _Batch entries (one per distinct set of bodies transformed).
+_MAX_BATCHES = 64
+
+
+def _overlaps(a: tuple, b: tuple) -> bool:
+    """Whether two (x0, y0, x1, y1) boxes with exclusive upper bounds intersect."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class _BodyGeometry:
+    """Local-frame geometry of one body's visible fixtures, cached per body.
+
+    Circle centers and polygon vertices are stacked into one float32 array so a
+    body is transformed to screen space with a handful of numpy operations.
+
+    Attributes:
+        body: The Box2D body (kept so a recycled id() is never mistaken for it)
+        points (np.ndarray): Local points, float32 (m, 2)
+        pad (np.ndarray): Pixel radius per point (0 for polygon vertices)
+        parts (list): (is_circle, start, stop, radius) per fixture, in fixture order
+    """
+
+    __slots__ = ("body", "pad", "parts", "points")
+
+    def __init__(self, body, ppm: float):
+        points = []
+        pad = []
+        parts = []
+        for fixture in body.fixtures:
+            if fixture.sensor:
+                continue
+            shape = fixture.shape
+            start = len(points)
+            if isinstance(shape, b2CircleShape):
+                radius = max(1, round(shape.radius * ppm))
+                points.append(tuple(shape.pos))
+                pad.append(radius)
+                parts.append((True, start, start + 1, radius))
+            elif isinstance(shape, b2PolygonShape):
+                vertices = [tuple(v) for v in shape.vertices]
+                points.extend(vertices)
+                pad.extend([0] * len(vertices))
+                parts.append((False, start, start + len(vertices), 0))
+            else:
+                raise ValueError(f"Unsupported shape type: {type(shape)}")
+        self.body = body
+        self.points = np.array(points, dtype=np.float32).reshape(-1, 2)
+        self.pad = np.array(pad, dtype=np.int32)
+        self.parts = parts
+
+
+class _Batch:
+    """Concatenated geometry of a list of bodies that are transformed together.
+
+    Attributes:
+        geometries (list): _BodyGeometry per body, in call order
+        offsets (list): Start row of each body's points in the stacked arrays
+        local_x (np.ndarray): Local x of every point, float32
+        local_y (np.ndarray): Local y of every point, float32
+        pad (list): Pixel radius per point
+        owner (np.ndarray | None): Row into the per-body transform array for
+            each point, or None when no body has visible fixtures
+    """
+
+    __slots__ = ("geometries", "local_x", "local_y", "offsets", "owner", "pad")
+
+    def __init__(self, geometries: list):
+        self.geometries = geometries
+        self.offsets = []
+        owner = []
+        visible = []
+        for geometry in geometries:
+            self.offsets.append(len(owner))
+            if geometry.parts:
+                owner.extend([len(visible)] * len(geometry.points))
+                visible.append(geometry)
+        if not visible:
+            self.owner = None
+            return
+        points = np.concatenate([geometry.points for geometry in visible])
+        self.local_x = np.ascontiguousarray(points[:, 0])
+        self.local_y = np.ascontiguousarray(points[:, 1])
+        self.pad = np.concatenate([geometry.pad for geometry in visible]).tolist()
+        self.owner = np.array(owner, dtype=np.intp)
+
+
+class _Layer:
+    """Cached static background and last composited frame for one output format.
+
+    Attributes:
+        canvas (np.ndarray): Last rendered frame
+        background (np.ndarray | None): Static bodies only, on a cleared canvas
+        fill (int): Clear value of the canvas
+        statics (list): (body, pose, screen shapes, bbox) per static body drawn
+            into background, in engine.bodies order
+        drawn (dict): id(body) -> (body, pose, screen shapes, bbox) for the
+            dynamic bodies composited into canvas
+    """
+
+    __slots__ = ("background", "canvas", "drawn", "fill", "statics")
+
+    def __init__(self, canvas: np.ndarray, fill: int):
+        self.canvas = canvas
+        self.background: np.ndarray | None = None
+        self.fill = fill
+        self.statics: list = []
+        self.drawn: dict = {}
 
 
 class OpenCVRenderer(Renderer):
     """OpenCV-based renderer for generating images of physics simulations without real-time display.
 
+    Static bodies are rasterized once into a cached background layer, which is
+    rebuilt only when a static body is added, removed, moved or recolored.
+    Each frame then restores the background inside the bounding box of the
+    bodies that moved since the previous frame and redraws only what overlaps
+    it, so frames where nothing moved (e.g. once every body is asleep) cost no
+    drawing at all. Body geometry is cached per body and transformed with numpy.
+    Output is pixel-identical to drawing every body bottom-to-top on a cleared
+    canvas.
+
     Attributes:
         width (int): Width of the rendered image in pixels
         height (int): Height of the rendered image in pixels
         ppm (float): Pixels per Box2D unit (scaling factor)
-        image (np.ndarray): Current rendered image buffer
+        image (np.ndarray): Current rendered RGB image buffer
     """
 
     def __init__(self, width: int = 600, height: int = 600, ppm: float = 60):
@@ -26,12 +144,20 @@ class OpenCVRenderer(Renderer):
         self.height = height
         self.ppm = ppm
         self.image = np.zeros((height, width, 3), dtype=np.uint8)
+        self._rgb = _Layer(self.image, 255)
+        self._discrete = _Layer(np.zeros((height, width), dtype=np.uint8), 0)
+        self._geometry: dict[int, _BodyGeometry] = {}
+        self._batches: dict[tuple[int, ...], _Batch] = {}
+        # world_to_screen as a vectorized affine map.
+        self._scale = np.array([ppm, -ppm], dtype=np.float64)
+        self._offset = np.array([width / 2, height / 2], dtype=np.float64)
 
     def render(self, engine) -> np.ndarray:
         """
         Render the current state of the simulation to an image.
 
-        Each fixture is rendered after applying the body transform to its local coordinates.
+        Bodies are drawn bottom to top (by y position) so objects above are drawn
+        last; only regions that changed since the previous call are redrawn.
 
         Args:
             engine: The Box2DEngine containing the physics world to render
@@ -39,42 +165,8 @@ class OpenCVRenderer(Renderer):
         Returns:
             np.ndarray: RGB image as numpy array (height, width, 3)
         """
-        self.image.fill(255)
-
-        # Sort bodies by y-position (bottom to top) so objects above are drawn last
-        sorted_bodies = sorted(
-            engine.bodies.items(), key=lambda item: item[1].position.y
-        )
-
-        for name, body in sorted_bodies:
-            color = self._get_object_color(body, engine)
-            if color is None:
-                continue
-            bgr_color = (color[2], color[1], color[0])
-
-            for fixture in body.fixtures:
-                if fixture.sensor:
-                    continue
-
-                shape = fixture.shape
-                if isinstance(shape, b2CircleShape):
-                    position = body.transform * shape.pos
-                    radius = max(1, round(shape.radius * self.ppm))
-                    screen_pos = self.world_to_screen((position[0], position[1]))
-                    cv2.circle(self.image, screen_pos, radius, bgr_color, -1)
-
-                elif isinstance(shape, b2PolygonShape):
-                    vertices = [body.transform * v for v in shape.vertices]
-                    pts = np.array(
-                        [self.world_to_screen((v[0], v[1])) for v in vertices],
-                        dtype=np.int32,
-                    )
-                    cv2.fillPoly(self.image, [pts], bgr_color)
-                else:
-                    raise ValueError(f"Unsupported shape type: {type(shape)}")
-
-        rgb_image = cv2.cvtColor(self.image, cv2.COLOR_BGR2RGB)
-        return rgb_image
+        self._composite(engine, self._rgb, lambda color: color)
+        return self.image.copy()
 
     def render_discrete(self, engine) -> np.ndarray:
         """Render simulation state to discrete color image.
@@ -89,40 +181,230 @@ class OpenCVRenderer(Renderer):
         Returns:
             Single-channel discrete color image (height, width)
         """
-        discrete_image = np.zeros((self.height, self.width), dtype=np.uint8)
+        self._composite(
+            engine, self._discrete, lambda color: RGB_TO_DISCRETE.get(color, 0)
+        )
+        return self._discrete.canvas.copy()
+
+    def invalidate(self) -> None:
+        """Drop all cached layers and geometry, forcing a full redraw next frame."""
+        for layer in (self._rgb, self._discrete):
+            layer.background = None
+            layer.statics = []
+            layer.drawn = {}
+        self._geometry = {}
+        self._batches = {}
+
+    def _screen_shapes(self, bodies: list) -> list[tuple[list, tuple]]:
+        """Transform the cached geometry of several bodies to screen space at once.
 
-        sorted_bodies = sorted(
-            engine.bodies.items(), key=lambda item: item[1].position.y
+        Applies the same float32 body transform as Box2D's b2Mul and the same
+        truncation as world_to_screen, so pixels match per-vertex conversion.
+
+        Returns:
+            One (shapes, bbox) pair per body: shapes is a list of
+            (is_circle, data, radius) where data is a screen center (circle) or
+            int32 vertex array (polygon); bbox is (x0, y0, x1, y1) with exclusive
+            upper bounds, padded by a pixel.
+        """
+        batch = self._batches.get(tuple(map(id, bodies)))
+        if batch is None or any(
+            geometry.body is not body
+            for geometry, body in zip(batch.geometries, bodies)
+        ):
+            batch = _Batch([self._body_geometry(body) for body in bodies])
+            if len(self._batches) >= _MAX_BATCHES:
+                self._batches.clear()
+            self._batches[tuple(map(id, bodies))] = batch
+        if batch.owner is None:
+            return [([], (0, 0, 0, 0)) for _ in bodies]
+
+        params = []
+        for body, geometry in zip(bodies, batch.geometries):
+            if geometry.parts:
+                transform = body.transform
+                rotation = transform.q
+                position = transform.position
+                params.append((rotation.c, rotation.s, position.x, position.y))
+        c, s, px, py = np.array(params, dtype=np.float32)[batch.owner].T
+        local_x = batch.local_x
+        local_y = batch.local_y
+        world = np.empty((len(local_x), 2), dtype=np.float32)
+        world[:, 0] = (c * local_x - s * local_y) + px
+        world[:, 1] = (s * local_x + c * local_y) + py
+        screen = (world.astype(np.float64) * self._scale + self._offset).astype(
+            np.int32
         )
+        points = screen.tolist()
 
-        for name, body in sorted_bodies:
+        results = []
+        pad = batch.pad
+        for geometry, offset in zip(batch.geometries, batch.offsets):
+            if not geometry.parts:
+                results.append(([], (0, 0, 0, 0)))
+                continue
+            shapes = []
+            for is_circle, start, stop, radius in geometry.parts:
+                if is_circle:
+                    shapes.append((True, points[offset + start], radius))
+                else:
+                    shapes.append((False, screen[offset + start : offset + stop], 0))
+            span = range(offset, offset + len(geometry.pad))
+            bbox = (
+                min(points[i][0] - pad[i] for i in span) - 1,
+                min(points[i][1] - pad[i] for i in span) - 1,
+                max(points[i][0] + pad[i] for i in span) + 2,
+                max(points[i][1] + pad[i] for i in span) + 2,
+            )
+            results.append((shapes, bbox))
+        return results
+
+    def _body_geometry(self, body) -> _BodyGeometry:
+        """Cached local geometry of body, rebuilt if the body was replaced."""
+        geometry = self._geometry.get(id(body))
+        if geometry is None or geometry.body is not body:
+            geometry = _BodyGeometry(body, self.ppm)
+            self._geometry[id(body)] = geometry
+        return geometry
+
+    def _draw(self, canvas: np.ndarray, shapes: list, color, x0: int, y0: int):
+        """Draw screen shapes into a canvas view whose origin is pixel (x0, y0)."""
+        for is_circle, data, radius in shapes:
+            if is_circle:
+                cv2.circle(canvas, (data[0] - x0, data[1] - y0), radius, color, -1)
+            else:
+                cv2.fillPoly(canvas, [data], color, offset=(-x0, -y0))
+
+    def _composite(self, engine, layer: _Layer, color_of) -> None:
+        """Bring layer.canvas up to date with the engine's current state.
+
+        Paint order is (y position, engine.bodies order), exactly as a full
+        bottom-to-top redraw. The background already holds the static bodies in
+        that order; repainting the dynamic bodies plus every static body that
+        comes after an already repainted body and overlaps it reproduces the full
+        redraw pixel for pixel. Only the union bounding box of the bodies that
+        changed since the last frame is restored and repainted.
+        """
+        statics = []
+        dynamics = []
+        for index, body in enumerate(engine.bodies.values()):
             color = self._get_object_color(body, engine)
             if color is None:
                 continue
-            discrete_idx = RGB_TO_DISCRETE.get(color, 0)
-
-            for fixture in body.fixtures:
-                if fixture.sensor:
-                    continue
-
-                shape = fixture.shape
-                if isinstance(shape, b2CircleShape):
-                    position = body.transform * shape.pos
-                    radius = max(1, round(shape.radius * self.ppm))
-                    screen_pos = self.world_to_screen((position[0], position[1]))
-                    cv2.circle(discrete_image, screen_pos, radius, discrete_idx, -1)  # type: ignore
-
-                elif isinstance(shape, b2PolygonShape):
-                    vertices = [body.transform * v for v in shape.vertices]
-                    pts = np.array(
-                        [self.world_to_screen((v[0], v[1])) for v in vertices],
-                        dtype=np.int32,
-                    )
-                    cv2.fillPoly(discrete_image, [pts], discrete_idx)  # type: ignore
-                else:
-                    raise ValueError(f"Unsupported shape type: {type(shape)}")
-
-        return discrete_image
+            position = body.position
+            pose = (position.x, position.y, body.angle, color)
+            if body.type == b2_staticBody:
+                statics.append((body, pose, index))
+            else:
+                dynamics.append((body, pose, index))
+
+        full = layer.background is None or len(statics) != len(layer.statics)
+        if not full:
+            for (body, pose, _), cached in zip(statics, layer.statics):
+                if body is not cached[0] or pose != cached[1]:
+                    full = True
+                    break
+        if full:
+            self._geometry = {
+                id(body): self._geometry[id(body)]
+                for body, _, _ in statics + dynamics
+                if id(body) in self._geometry
+            }
+            self._batches = {}
+            screen = self._screen_shapes([body for body, _, _ in statics])
+            layer.statics = [
+                (body, pose, shapes, bbox)
+                for (body, pose, _), (shapes, bbox) in zip(statics, screen)
+            ]
+            layer.background = np.full_like(layer.canvas, layer.fill)
+            for _, pose, shapes, _ in sorted(
+                layer.statics, key=lambda item: item[1][1]
+            ):
+                self._draw(layer.background, shapes, color_of(pose[3]), 0, 0)
+            layer.drawn = {}
+
+        previous = layer.drawn
+        drawn = {}
+        dirty = []
+        moved = []
+        for body, pose, _ in dynamics:
+            entry = previous.pop(id(body), None)
+            if entry is not None and entry[0] is body and entry[1] == pose:
+                drawn[id(body)] = entry
+                continue
+            moved.append((body, pose))
+            if entry is not None:
+                dirty.append(entry[3])
+        if moved:
+            screen = self._screen_shapes([body for body, _ in moved])
+            for (body, pose), (shapes, bbox) in zip(moved, screen):
+                drawn[id(body)] = (body, pose, shapes, bbox)
+                dirty.append(bbox)
+        for entry in previous.values():
+            # Bodies gone since the last frame.
+            dirty.append(entry[3])
+            self._geometry.pop(id(entry[0]), None)
+        layer.drawn = drawn
+
+        if not full and not dirty:
+            return
+
+        # Paint order over every body, then the subset that must be repainted.
+        order = [
+            ((pose[1], index), False, drawn[id(body)]) for body, pose, index in dynamics
+        ]
+        order.extend(
+            ((pose[1], index), True, cached)
+            for (_, pose, index), cached in zip(statics, layer.statics)
+        )
+        order.sort(key=lambda item: item[0])
+        repaint = []
+        for _, is_static, (_, pose, shapes, bbox) in order:
+            if is_static and not any(_overlaps(bbox, other[0]) for other in repaint):
+                continue
+            repaint.append((bbox, shapes, pose[3]))
+
+        if full:
+            x0, y0, x1, y1 = 0, 0, self.width, self.height
+        else:
+            # Grow the region until it contains every shape it touches: OpenCV
+            # rasterizes edges differently when a polygon is clipped, so shapes
+            # are never cut at the region boundary.
+            region = (
+                min(box[0] for box in dirty),
+                min(box[1] for box in dirty),
+                max(box[2] for box in dirty),
+                max(box[3] for box in dirty),
+            )
+            grown = True
+            while grown:
+                grown = False
+                for bbox, _, _ in repaint:
+                    if _overlaps(bbox, region) and not (
+                        region[0] <= bbox[0]
+                        and region[1] <= bbox[1]
+                        and bbox[2] <= region[2]
+                        and bbox[3] <= region[3]
+                    ):
+                        region = (
+                            min(region[0], bbox[0]),
+                            min(region[1], bbox[1]),
+                            max(region[2], bbox[2]),
+                            max(region[3], bbox[3]),
+                        )
+                        grown = True
+            x0 = max(0, region[0])
+            y0 = max(0, region[1])
+            x1 = min(self.width, region[2])
+            y1 = min(self.height, region[3])
+            if x0 >= x1 or y0 >= y1:
+                return
+        view = layer.canvas[y0:y1, x0:x1]
+        view[...] = layer.background[y0:y1, x0:x1]
+        region = (x0, y0, x1, y1)
+        for bbox, shapes, color in repaint:
+            if _overlaps(bbox, region):
+                self._draw(view, shapes, color_of(color), x0, y0)
 
     def discrete_to_rgb(self, discrete_image: np.ndarray) -> np.ndarray:
         """Convert discrete color image to RGB.
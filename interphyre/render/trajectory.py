@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from interphyre.config import WORLD_HEIGHT, WORLD_WIDTH
+from interphyre.level import Level
+from interphyre.objects import Ball
+from interphyre.render.base import Renderer
+
+
+@dataclass
+class Trajectory:
+    """Compact record of a rollout: one (x, y, angle) row per body per frame.
+
+    Attributes:
+        names: Body names, in the column order of poses
+        poses: float32 array of shape (frames, bodies, 3) holding x, y and angle
+            (radians). Bodies missing from a frame are NaN.
+        action: Action placements (x, y, size) the rollout was run with, or None
+            if the level had no action objects placed
+    """
+
+    names: tuple[str, ...]
+    poses: np.ndarray
+    action: list[tuple[float, float, float]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.poses)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the pose array in bytes."""
+        return self.poses.nbytes
+
+
+class TrajectoryRecorder(Renderer):
+    """Renderer that records body poses instead of drawing them.
+
+    Assign it to ``env.renderer`` and every ``render()`` call during a rollout
+    stores one float32 (x, y, angle) row per body into a preallocated buffer.
+    Frames are rasterized afterwards with render_trajectory(), so stride and
+    resolution can be chosen after the fact and the physics loop never pays for
+    drawing.
+
+    The body set is fixed by the first recorded frame. Bodies that disappear
+    later are recorded as NaN; bodies added later are not recorded.
+
+    Example:
+        recorder = TrajectoryRecorder()
+        env.renderer = recorder
+        env.step(action)
+        frames = render_trajectory(env.level, recorder.get_trajectory(), stride=2)
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """Initialize the recorder.
+
+        Args:
+            capacity: Number of frames to preallocate. The buffer doubles when full.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self.names: tuple[str, ...] | None = None
+        self.action: list[tuple[float, float, float]] | None = None
+        self._poses: np.ndarray | None = None
+        self._count = 0
+        self._closed = False
+
+    def render(self, engine) -> None:
+        """Record the pose of every body in the engine.
+
+        Args:
+            engine: The Box2DEngine whose bodies to record
+        """
+        if self.names is None:
+            self._start(engine)
+        assert self._poses is not None and self.names is not None
+        if self._count == len(self._poses):
+            grown = np.empty(
+                (2 * len(self._poses), *self._poses.shape[1:]), dtype=np.float32
+            )
+            grown[: self._count] = self._poses
+            self._poses = grown
+        bodies = engine.bodies
+        row = self._poses[self._count]
+        for i, name in enumerate(self.names):
+            body = bodies.get(name)
+            if body is None:
+                row[i] = np.nan
+            else:
+                position = body.position
+                row[i] = (position.x, position.y, body.angle)
+        self._count += 1
+
+    def _start(self, engine) -> None:
+        """Fix the body set and remember the action placements."""
+        self.names = tuple(engine.bodies)
+        self._poses = np.empty((self.capacity, len(self.names), 3), dtype=np.float32)
+        level = engine.level
+        if level is None or not level.action_objects:
+            return
+        if all(name in engine.bodies for name in level.action_objects):
+            self.action = []
+            for name in level.action_objects:
+                obj = level.objects[name]
+                size = obj.radius if isinstance(obj, Ball) else 0.0
+                self.action.append((float(obj.x), float(obj.y), float(size)))
+
+    def get_trajectory(self) -> Trajectory:
+        """Return the frames recorded so far.
+
+        The pose array is a view of the recorder's buffer. Copy it before
+        calling reset() if the recorder will be reused.
+
+        Raises:
+            RuntimeError: If no frame has been recorded
+        """
+        if self.names is None or self._poses is None:
+            raise RuntimeError("No frames recorded; call render() first")
+        return Trajectory(self.names, self._poses[: self._count], self.action)
+
+    def reset(self) -> None:
+        """Forget recorded frames so the recorder can be reused for another rollout."""
+        self.names = None
+        self.action = None
+        self._count = 0
+
+    def get_frame_count(self) -> int:
+        """Get the number of frames recorded so far."""
+        return self._count
+
+    def close(self) -> None:
+        self._closed = True
+
+
+def render_trajectory(
+    level: Level,
+    trajectory: Trajectory,
+    stride: int = 1,
+    size: tuple[int, int] = (600, 600),
+    workers: int = 1,
+    discrete: bool = False,
+    ppm: float | None = None,
+    use_threads: bool = False,
+) -> np.ndarray:
+    """Rasterize a recorded trajectory into frames.
+
+    The level is rebuilt in a fresh engine, the trajectory's action is placed and
+    each selected frame's poses are applied before drawing with OpenCVRenderer.
+    The frames match what an OpenCVRenderer would have drawn during the rollout.
+
+    Args:
+        level: The level the trajectory was recorded on. It is not modified.
+        trajectory: Trajectory from TrajectoryRecorder.get_trajectory()
+        stride: Render every stride-th recorded frame
+        size: Output (width, height) in pixels
+        workers: Number of workers; frames are split into contiguous chunks
+        discrete: Render single-channel discrete color indices instead of RGB
+        ppm: Pixels per Box2D unit (default: fit the world to the image)
+        use_threads: Use a thread pool instead of a process pool
+
+    Returns:
+        uint8 array of shape (frames, height, width, 3), or (frames, height,
+        width) when discrete is set.
+    """
+    if stride < 1:
+        raise ValueError(f"stride must be >= 1, got {stride}")
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    width, height = size
+    if ppm is None:
+        ppm = min(width / WORLD_WIDTH, height / WORLD_HEIGHT)
+
+    poses = trajectory.poses[::stride]
+    shape = (len(poses), height, width) if discrete else (len(poses), height, width, 3)
+    frames = np.empty(shape, dtype=np.uint8)
+    if len(poses) == 0:
+        return frames
+
+    chunks = np.array_split(np.arange(len(poses)), min(workers, len(poses)))
+    names, action = trajectory.names, trajectory.action
+    args = [
+        (level, names, poses[c[0] : c[-1] + 1], action, width, height, ppm, discrete)
+        for c in chunks
+    ]
+    if len(args) == 1:
+        frames[:] = _render_poses(*args[0])
+        return frames
+
+    pool_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with pool_class(max_workers=len(args)) as pool:
+        results = pool.map(_render_poses, *zip(*args))
+        for chunk, result in zip(chunks, results):
+            frames[chunk[0] : chunk[-1] + 1] = result
+    return frames
+
+
+def iter_trajectory_frames(
+    level: Level,
+    trajectory: Trajectory,
+    stride: int = 1,
+    size: tuple[int, int] = (600, 600),
+    discrete: bool = False,
+    ppm: float | None = None,
+) -> Iterator[np.ndarray]:
+    """Yield rasterized frames of a trajectory one at a time.
+
+    Same output as render_trajectory(), but frames are produced lazily on a
+    single engine, so memory stays bounded when streaming into a video.
+
+    Args:
+        level: The level the trajectory was recorded on. It is not modified.
+        trajectory: Trajectory from TrajectoryRecorder.get_trajectory()
+        stride: Render every stride-th recorded frame
+        size: Output (width, height) in pixels
+        discrete: Render single-channel discrete color indices instead of RGB
+        ppm: Pixels per Box2D unit (default: fit the world to the image)
+
+    Yields:
+        One uint8 frame per selected pose.
+    """
+    if stride < 1:
+        raise ValueError(f"stride must be >= 1, got {stride}")
+    width, height = size
+    if ppm is None:
+        ppm = min(width / WORLD_WIDTH, height / WORLD_HEIGHT)
+    yield from _iter_poses(
+        level,
+        trajectory.names,
+        trajectory.poses[::stride],
+        trajectory.action,
+        width,
+        height,
+        ppm,
+        discrete,
+    )
+
+
+def _render_poses(
+    level: Level,
+    names: tuple[str, ...],
+    poses: np.ndarray,
+    action: list[tuple[float, float, float]] | None,
+    width: int,
+    height: int,
+    ppm: float,
+    discrete: bool,
+) -> np.ndarray:
+    """Draw consecutive pose frames on a private engine and renderer.
+
+    Top-level function required for ProcessPoolExecutor pickling on macOS (spawn).
+    """
+    return np.stack(
+        list(_iter_poses(level, names, poses, action, width, height, ppm, discrete))
+    )
+
+
+def _iter_poses(
+    level: Level,
+    names: tuple[str, ...],
+    poses: np.ndarray,
+    action: list[tuple[float, float, float]] | None,
+    width: int,
+    height: int,
+    ppm: float,
+    discrete: bool,
+) -> Iterator[np.ndarray]:
+    """Apply each row of poses to a private engine and yield the drawn frame."""
+    from interphyre.engine import Box2DEngine
+    from interphyre.render.opencv import OpenCVRenderer
+
+    engine = Box2DEngine(level=level.clone(level.name))
+    if action is not None:
+        engine.place_action_objects(action)
+    renderer = OpenCVRenderer(width=width, height=height, ppm=ppm)
+    all_bodies = engine.bodies
+    bodies = [all_bodies.get(name) for name in names]
+    render = renderer.render_discrete if discrete else renderer.render
+    try:
+        for frame in poses.tolist():
+            hidden = set()
+            for name, body, (x, y, angle) in zip(names, bodies, frame):
+                if math.isnan(x):
+                    hidden.add(name)
+                elif body is not None:
+                    body.transform = ((x, y), angle)
+            # Bodies that were gone when the frame was recorded are not drawn.
+            engine.bodies = (
+                {n: b for n, b in all_bodies.items() if n not in hidden}
+                if hidden
+                else all_bodies
+            )
+            yield render(engine)
+        engine.bodies = all_bodies
+    finally:
+        renderer.close()
+        engine.close()
@@ -1,31 +1,113 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import argparse
 import json
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+
 import cv2
 import numpy as np
 from interphyre.render.opencv import OpenCVRenderer
-from interphyre.render.base import Renderer
+from interphyre.render.base import COLORS, DISCRETE_COLORS, Renderer
+from interphyre.render.trajectory import (
+    Trajectory,
+    TrajectoryRecorder,
+    iter_trajectory_frames,
+)
 
 logger = logging.getLogger(__name__)
 
 
+_VIDEO_FORMATS = ("mp4", "gif")
+
+
+class _Mp4Writer:
+    """Encode RGB frames to MP4 as they arrive."""
+
+    def __init__(self, path: str, fps: float, width: int, height: int):
+        fourcc = cv2.VideoWriter.fourcc(*"mp4v")
+        self.writer = cv2.VideoWriter(path, fourcc, float(fps), (width, height))
+        if not self.writer.isOpened():
+            raise RuntimeError(f"Failed to open video writer for {path}")
+
+    def write(self, frame: np.ndarray) -> None:
+        self.writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+
+    def close(self) -> None:
+        self.writer.release()
+
+
+class _GifWriter:
+    """Append frames to an open GIF file one at a time.
+
+    Frames are mapped onto a fixed global palette built from the renderer's
+    colors, so each frame is encoded and written immediately instead of being
+    held until the end.
+    """
+
+    def __init__(self, path: str, fps: float):
+        from PIL import Image
+
+        colors = sorted(set(COLORS.values()) | set(DISCRETE_COLORS.values()))
+        self._palette = Image.new("P", (1, 1))
+        self._palette.putpalette([c for rgb in colors for c in rgb])
+        # GIF stores frame delays in centiseconds, so high frame rates are
+        # approximated.
+        self._duration = int(1000 / max(fps, 1))
+        self._file = open(path, "wb")  # noqa: SIM115 - closed in close()
+        self._started = False
+
+    def write(self, frame: np.ndarray) -> None:
+        from PIL import GifImagePlugin, Image
+
+        if frame.dtype != np.uint8:
+            frame = np.clip(frame, 0, 255).astype(np.uint8)
+        image = Image.fromarray(frame).quantize(
+            palette=self._palette, dither=Image.Dither.NONE
+        )
+        if not self._started:
+            header, _ = GifImagePlugin.getheader(
+                image, info={"loop": 0, "duration": self._duration}
+            )
+            self._file.write(b"".join(header))
+            self._started = True
+        for chunk in GifImagePlugin.getdata(image, duration=self._duration):
+            self._file.write(chunk)
+
+    def close(self) -> None:
+        if self._started:
+            self._file.write(b";")
+        self._file.close()
+
+
 class VideoRecorder(Renderer):
     """Renderer that captures frames during simulation and saves them as video.
 
     This renderer wraps OpenCVRenderer and captures frames during render() calls,
     then saves them as MP4 or GIF files. Designed for headless operation on servers.
 
+    By default frames are kept in memory and encoded in close(). With
+    ``streaming=True`` each frame is encoded as soon as it is rendered, so memory
+    stays bounded regardless of rollout length. Several formats can be written
+    from a single rollout by passing a list of formats.
+
     Attributes:
         width (int): Width of the video in pixels
         height (int): Height of the video in pixels
         ppm (float): Pixels per Box2D unit (scaling factor)
-        video_format (str): Output format ('mp4' or 'gif')
+        video_format (str): First output format ('mp4' or 'gif')
+        video_formats (tuple[str, ...]): All output formats
         fps (int): Target frames per second for the video
-        output_path (str): Path where the video will be saved
-        frames (list): List of captured frames
+        output_path (str | dict[str, str] | None): Path where the video will be
+            saved, or a mapping from format to path
+        streaming (bool): Whether frames are encoded as they arrive
+        physics_fps (float | None): Rate of render() calls; frames are decimated
+            to fps when set
+        frames (list): List of captured frames (empty in streaming mode)
         opencv_renderer (OpenCVRenderer): Internal OpenCV renderer
     """
 
@@ -34,9 +116,11 @@ class VideoRecorder(Renderer):
         width: int = 600,
         height: int = 600,
         ppm: float = 60,
-        video_format: str = "mp4",
+        video_format: str | Sequence[str] = "mp4",
         fps: int = 30,
-        output_path: str | None = None,
+        output_path: str | dict[str, str] | None = None,
+        streaming: bool = False,
+        physics_fps: float | None = None,
     ):
         """Initialize the video recorder.
 
@@ -44,42 +128,121 @@ class VideoRecorder(Renderer):
             width: Width of the video in pixels (default: 600)
             height: Height of the video in pixels (default: 600)
             ppm: Pixels per Box2D unit (scaling factor) (default: 60)
-            video_format: Output format, 'mp4' or 'gif' (default: 'mp4')
+            video_format: Output format, 'mp4' or 'gif', or a list of formats to
+                write from the same frames (default: 'mp4')
             fps: Target frames per second for the video (default: 30)
-            output_path: Path where the video will be saved. If None, must be set via set_output_path()
+            output_path: Path where the video will be saved. With several
+                formats, either a mapping from format to path or a single path
+                whose extension is replaced per format. If None, must be set via
+                set_output_path()
+            streaming: Encode frames as they are rendered instead of in close()
+                (default: False). The output path must be set before the first
+                frame.
+            physics_fps: Rate at which render() is called, e.g. 60 for the
+                default physics step. When set, frames are dropped so the video
+                plays back at fps in real time (default: None, keep every frame)
         """
+        formats = [video_format] if isinstance(video_format, str) else video_format
+        self.video_formats = tuple(fmt.lower() for fmt in formats)
+        if not self.video_formats:
+            raise ValueError("At least one video format is required")
+        for fmt in self.video_formats:
+            if fmt not in _VIDEO_FORMATS:
+                raise ValueError(f"Unsupported video format: {fmt}. Use 'mp4' or 'gif'")
+        if physics_fps is not None and physics_fps <= 0:
+            raise ValueError(f"physics_fps must be positive, got {physics_fps}")
+
         self.width = width
         self.height = height
         self.ppm = ppm
-        self.video_format = video_format.lower()
+        self.video_format = self.video_formats[0]
         self.fps = fps
         self.output_path = output_path
+        self.streaming = streaming
+        self.physics_fps = physics_fps
         self.frames: list[np.ndarray] = []
         self._closed = False
+        self._seen = 0
+        self._written = 0
+        self._writers: dict[str, _Mp4Writer | _GifWriter] | None = None
         self.opencv_renderer = OpenCVRenderer(width=width, height=height, ppm=ppm)
 
-        if self.video_format not in ["mp4", "gif"]:
-            raise ValueError(
-                f"Unsupported video format: {video_format}. Use 'mp4' or 'gif'"
-            )
-
-    def set_output_path(self, path: str) -> None:
+    def set_output_path(self, path: str | dict[str, str]) -> None:
         """Set the output path for the video file.
 
         Args:
-            path: Path where the video will be saved
+            path: Path where the video will be saved, or a mapping from format
+                to path
         """
         self.output_path = path
 
+    def _output_paths(self) -> dict[str, str]:
+        """Resolve output_path to one path per format."""
+        path = self.output_path
+        if isinstance(path, dict):
+            missing = [fmt for fmt in self.video_formats if fmt not in path]
+            if missing:
+                raise ValueError(f"output_path has no entry for format(s) {missing}")
+            return {fmt: path[fmt] for fmt in self.video_formats}
+        assert path is not None
+        if len(self.video_formats) == 1:
+            return {self.video_format: path}
+        stem = os.path.splitext(path)[0]
+        return {fmt: f"{stem}.{fmt}" for fmt in self.video_formats}
+
+    def _missing_output_path_error(self, frames: int) -> ValueError:
+        return ValueError(
+            f"VideoRecorder has {frames} captured frames but output_path "
+            "is None. Call set_output_path() before close(), or pass output_path to "
+            "the constructor."
+        )
+
     def render(self, engine) -> None:
         """Render the current state and capture the frame.
 
         Args:
             engine: The Box2DEngine containing the physics world to render
         """
-        frame = self.opencv_renderer.render(engine)
-        # Frame is RGB (height × width × 3); copy to avoid aliasing with the renderer buffer.
-        self.frames.append(frame.copy())
+        seen = self._seen
+        self._seen += 1
+        if (
+            self.physics_fps is not None
+            and seen * self.fps < self.get_frame_count() * self.physics_fps
+        ):
+            return
+        # render() returns a fresh RGB array (height × width × 3).
+        self.add_frame(self.opencv_renderer.render(engine))
+
+    def add_frame(self, frame: np.ndarray) -> None:
+        """Capture an already rendered RGB frame.
+
+        Args:
+            frame: RGB image of shape (height, width, 3)
+        """
+        if not self.streaming:
+            self.frames.append(frame)
+            return
+        if self._writers is None:
+            if not self.output_path:
+                raise self._missing_output_path_error(1)
+            writers: dict[str, _Mp4Writer | _GifWriter] = {}
+            try:
+                for fmt, path in self._output_paths().items():
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    if fmt == "mp4":
+                        writers[fmt] = _Mp4Writer(
+                            path, self.fps, self.width, self.height
+                        )
+                    else:
+                        writers[fmt] = _GifWriter(path, self.fps)
+            except Exception:
+                for writer in writers.values():
+                    writer.close()
+                raise
+            self._writers = writers
+        for writer in self._writers.values():
+            writer.write(frame)
+        self._written += 1
 
     def close(self) -> None:
         """Close the recorder and save the video file.
@@ -90,6 +253,17 @@ class VideoRecorder(Renderer):
         if self._closed:
             return
 
+        if self._writers is not None:
+            for writer in self._writers.values():
+                writer.close()
+            for fmt, path in self._output_paths().items():
+                print(f"Saved {fmt.upper()} to: {path} ({self._written} frames)")
+            self._writers = None
+            self.output_path = None
+            self.opencv_renderer.close()
+            self._closed = True
+            return
+
         if not self.frames:
             if self.output_path:
                 logger.warning("No frames captured, skipping video save")
@@ -97,53 +271,31 @@ class VideoRecorder(Renderer):
             return
 
         if not self.output_path:
-            raise ValueError(
-                f"VideoRecorder has {len(self.frames)} captured frames but output_path "
-                "is None. Call set_output_path() before close(), or pass output_path to "
-                "the constructor."
-            )
+            raise self._missing_output_path_error(len(self.frames))
 
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
-
-        if self.video_format == "mp4":
-            self._save_mp4()
-        elif self.video_format == "gif":
-            self._save_gif()
+        for fmt, path in self._output_paths().items():
+            # Ensure output directory exists
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if fmt == "mp4":
+                self._save_mp4(path)
+            elif fmt == "gif":
+                self._save_gif(path)
 
         self.output_path = None
         self.opencv_renderer.close()
         self.frames.clear()
         self._closed = True
 
-    def _save_mp4(self) -> None:
+    def _save_mp4(self, path: str) -> None:
         """Save frames as MP4 video using OpenCV VideoWriter."""
-        # output_path is guaranteed to be non-None by close() method
-        assert self.output_path is not None, (
-            "output_path must be set before calling _save_mp4"
-        )
-        fourcc = cv2.VideoWriter.fourcc(*"mp4v")
-        video_writer = cv2.VideoWriter(
-            self.output_path, fourcc, float(self.fps), (self.width, self.height)
-        )
-
-        if not video_writer.isOpened():
-            raise RuntimeError(f"Failed to open video writer for {self.output_path}")
-
+        writer = _Mp4Writer(path, self.fps, self.width, self.height)
         for frame in self.frames:
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            video_writer.write(frame_bgr)
-
-        video_writer.release()
-        print(f"Saved MP4 video to: {self.output_path} ({len(self.frames)} frames)")
+            writer.write(frame)
+        writer.close()
+        print(f"Saved MP4 video to: {path} ({len(self.frames)} frames)")
 
-    def _save_gif(self) -> None:
+    def _save_gif(self, path: str) -> None:
         """Save frames as GIF using imageio (with Pillow fallback)."""
-        # output_path is guaranteed to be non-None by close() method
-        assert self.output_path is not None, (
-            "output_path must be set before calling _save_gif"
-        )
-
         # Convert frames to uint8 if needed and ensure they're in the right format
         frames_uint8 = []
         for frame in self.frames:
@@ -159,7 +311,7 @@ class VideoRecorder(Renderer):
             # so exact frame rates like 60 FPS may be slightly approximated.
             # This is acceptable as long as playback speed is reasonable.
             imageio.mimsave(  # type: ignore[arg-type]
-                self.output_path,
+                path,
                 frames_uint8,
                 fps=self.fps,
                 loop=0,  # Loop forever
@@ -170,7 +322,7 @@ class VideoRecorder(Renderer):
             frames = [Image.fromarray(frame) for frame in frames_uint8]
             duration_ms = int(1000 / max(self.fps, 1))
             frames[0].save(
-                self.output_path,
+                path,
                 save_all=True,
                 append_images=frames[1:],
                 duration=duration_ms,
@@ -178,7 +330,7 @@ class VideoRecorder(Renderer):
                 optimize=False,
             )
 
-        print(f"Saved GIF to: {self.output_path} ({len(self.frames)} frames)")
+        print(f"Saved GIF to: {path} ({len(self.frames)} frames)")
 
     def wait(self, duration: int) -> None:
         """Wait for specified duration (compatibility method).
@@ -196,7 +348,7 @@ class VideoRecorder(Renderer):
         Returns:
             Number of frames captured
         """
-        return len(self.frames)
+        return self._written if self.streaming else len(self.frames)
 
 
 def generate_video_filename(
@@ -287,34 +439,329 @@ def get_first_seed_from_file(solutions_file: str, level_name: str) -> int | None
     return int(first_seed_str)
 
 
-def export_videos_for_level(
+def get_solution_from_file(
+    solutions_file: str, level_name: str, seed: int
+) -> list[tuple[float, float, float]] | None:
+    """Get the stored action for a seed from a solutions file.
+
+    Args:
+        solutions_file: Path to the solutions JSON file
+        level_name: Name of the level
+        seed: Seed whose solution to load
+
+    Returns:
+        The first stored action as a list of (x, y, size) tuples, or None if
+        not found.
+    """
+    if not os.path.exists(solutions_file):
+        return None
+
+    with open(solutions_file, "r") as f:
+        solutions_data = json.load(f)
+
+    entries = solutions_data.get(level_name, {}).get("solutions", {}).get(str(seed))
+    if not entries:
+        return None
+    flat = np.asarray(entries[0], dtype=float).ravel()
+    return [tuple(float(v) for v in flat[i : i + 3]) for i in range(0, len(flat), 3)]
+
+
+def record_solution_video(
     level_name: str,
-    data_dir: str,
-    output_dir: str,
+    seed: int,
+    action: list[tuple[float, float, float]],
+    output_paths: dict[str, str],
     video_fps: int = 30,
-    formats: list[str] | None = None,
-):
-    """Export videos for both success and failure solutions for a level.
+) -> bool:
+    """Replay an action once and stream it to every requested format.
+
+    Physics runs at 60 Hz; frames are decimated to video_fps so the videos play
+    back in real time.
 
     Args:
-        level_name: Name of the level to export
-        data_dir: Directory containing level data
-        output_dir: Base output directory for videos
+        level_name: Name of the level
+        seed: Level seed
+        action: List of (x, y, size) placements
+        output_paths: Mapping from video format to output path
         video_fps: Video frame rate (default: 30)
-        formats: List of video formats to export (default: ["mp4", "gif"])
+
+    Returns:
+        True if the action solved the level.
     """
-    if formats is None:
-        formats = ["mp4", "gif"]
+    from interphyre import InterphyreEnv, SimulationConfig
+
+    config = SimulationConfig(fps=60, time_step=1 / 60)
+    recorder = VideoRecorder(
+        video_format=list(output_paths),
+        fps=video_fps,
+        output_path=output_paths,
+        streaming=True,
+        physics_fps=config.fps,
+    )
+    env = InterphyreEnv(level_name, seed=seed, config=config)
+    env.renderer = recorder
+    try:
+        env.reset()
+        _, _, _, _, info = env.step(action)
+    finally:
+        env.close()
+    return bool(info.get("success", False))
+
 
-    from interphyre.viewer._viewer import visualize_solution_from_file
+@dataclass(frozen=True)
+class VideoJob:
+    """One stored solution to export.
 
+    Attributes:
+        level_name: Name of the level
+        seed: Level seed
+        action: Placements as (x, y, size) tuples
+        label: Optional filename label (e.g. 'success' or 'failure')
+    """
+
+    level_name: str
+    seed: int
+    action: tuple[tuple[float, float, float], ...]
+    label: str | None = None
+
+
+# Name of the file in output_dir that maps each video to the hash it was made from.
+_MANIFEST_NAME = ".video_manifest.json"
+# Bump when rendering or encoding changes so existing videos are regenerated.
+_RENDER_VERSION = 1
+_PHYSICS_FPS = 60
+
+
+def video_digest(
+    level,
+    action: Sequence[tuple[float, float, float]],
+    video_format: str,
+    video_fps: int,
+    size: tuple[int, int],
+) -> str:
+    """Hash everything a video's content depends on.
+
+    Covers the level scene, the action, and the render settings, so a video
+    whose digest is unchanged does not need to be regenerated.
+
+    Args:
+        level: The Level being recorded
+        action: Placements as (x, y, size) tuples
+        video_format: 'mp4' or 'gif'
+        video_fps: Video frame rate
+        size: Output (width, height) in pixels
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    from interphyre.validation.checks import extract_scene_dict
+
+    payload = {
+        "level": level.name,
+        "scene": extract_scene_dict(level),
+        "action_objects": list(level.action_objects),
+        "action": [[float(v) for v in placement] for placement in action],
+        "format": video_format,
+        "fps": video_fps,
+        "physics_fps": _PHYSICS_FPS,
+        "size": list(size),
+        "version": _RENDER_VERSION,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _load_manifest(output_dir: str) -> dict[str, str]:
+    path = os.path.join(output_dir, _MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Ignoring unreadable video manifest %s", path)
+        return {}
+
+
+def _save_manifest(output_dir: str, manifest: dict[str, str]) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, _MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _simulate_trajectory(job: VideoJob):
+    """Run a job's rollout once, recording poses instead of frames."""
+    from interphyre import InterphyreEnv, SimulationConfig
+
+    config = SimulationConfig(fps=_PHYSICS_FPS, time_step=1 / _PHYSICS_FPS)
+    recorder = TrajectoryRecorder()
+    env = InterphyreEnv(job.level_name, seed=job.seed, config=config)
+    env.renderer = recorder
+    try:
+        env.reset()
+        env.step(list(job.action))
+        return env.level, recorder.get_trajectory()
+    finally:
+        env.close()
+
+
+def _encode_trajectory(
+    level,
+    trajectory: Trajectory,
+    output_paths: dict[str, str],
+    video_fps: int,
+    size: tuple[int, int],
+) -> int:
+    """Rasterize a trajectory and stream it to every requested format.
+
+    Top-level function required for ProcessPoolExecutor pickling on macOS (spawn).
+
+    Returns:
+        Number of frames written
+    """
+    width, height = size
+    # Keep the frames VideoRecorder(physics_fps=...) would: frame i is kept
+    # once i * video_fps catches up with frames_kept * physics fps, so rates
+    # that do not divide the physics rate still play back in real time.
+    candidates = np.arange(len(trajectory))
+    keep = np.unique(-(-candidates * _PHYSICS_FPS // video_fps))
+    trajectory = replace(
+        trajectory, poses=trajectory.poses[keep[keep < len(trajectory)]]
+    )
+    recorder = VideoRecorder(
+        width=width,
+        height=height,
+        video_format=list(output_paths),
+        fps=video_fps,
+        output_path=output_paths,
+        streaming=True,
+    )
+    for frame in iter_trajectory_frames(level, trajectory, size=size):
+        recorder.add_frame(frame)
+    frames = recorder.get_frame_count()
+    recorder.close()
+    return frames
+
+
+def export_videos(
+    jobs: Sequence[VideoJob],
+    output_dir: str = "outputs",
+    formats: Sequence[str] = ("mp4", "gif"),
+    video_fps: int = 30,
+    size: tuple[int, int] = (600, 600),
+    workers: int | None = None,
+    force: bool = False,
+) -> dict[str, str]:
+    """Export videos for many solutions, simulating each one only once.
+
+    Each job's physics runs once in this process with a TrajectoryRecorder.
+    Rasterizing and encoding every requested format from that trajectory is
+    handed to a process pool, so the next job simulates while earlier ones
+    encode. A manifest in output_dir stores the video_digest() of each output.
+    Outputs whose digest is unchanged and whose file still exists are skipped.
+
+    Args:
+        jobs: Solutions to export
+        output_dir: Base output directory; videos go to output_dir/<format>/
+        formats: Video formats to write (default: mp4 and gif)
+        video_fps: Video frame rate (default: 30). Physics frames are
+            decimated to this rate.
+        size: Output (width, height) in pixels (default: 600x600)
+        workers: Number of encoding processes (default: CPU count). 1 encodes
+            in this process.
+        force: Regenerate outputs even if they are up to date
+
+    Returns:
+        Mapping from output path to 'written', 'skipped' or 'failed'
+    """
+    from interphyre.validation import load_valid_level
+
+    for fmt in formats:
+        if fmt not in _VIDEO_FORMATS:
+            raise ValueError(f"Unsupported video format: {fmt}. Use 'mp4' or 'gif'")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
+    manifest = _load_manifest(output_dir)
+    results: dict[str, str] = {}
+    pending: list[tuple[VideoJob, dict[str, tuple[str, str]]]] = []
+    for job in jobs:
+        # Hash the variant _simulate_trajectory renders, not variant 0.
+        level = load_valid_level(job.level_name, job.seed).level
+        stale: dict[str, tuple[str, str]] = {}
+        for fmt in formats:
+            path = generate_video_filename(
+                job.level_name, job.seed, output_dir, fmt, job.label
+            )
+            digest = video_digest(level, job.action, fmt, video_fps, size)
+            key = os.path.relpath(path, output_dir)
+            if not force and manifest.get(key) == digest and os.path.exists(path):
+                results[path] = "skipped"
+            else:
+                stale[fmt] = (path, digest)
+        if stale:
+            pending.append((job, stale))
+
+    def finish(job: VideoJob, stale: dict[str, tuple[str, str]], error) -> None:
+        name = f"{job.level_name} seed {job.seed}" + (
+            f" ({job.label})" if job.label else ""
+        )
+        for path, digest in stale.values():
+            key = os.path.relpath(path, output_dir)
+            if error is None:
+                results[path] = "written"
+                manifest[key] = digest
+            else:
+                results[path] = "failed"
+                manifest.pop(key, None)
+        if error is not None:
+            print(f"Error exporting {name}: {error}")
+        _save_manifest(output_dir, manifest)
+
+    if not pending:
+        return results
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    futures = {}
+    try:
+        for job, stale in pending:
+            paths = {fmt: path for fmt, (path, _) in stale.items()}
+            try:
+                level, trajectory = _simulate_trajectory(job)
+                if pool is not None:
+                    future = pool.submit(
+                        _encode_trajectory, level, trajectory, paths, video_fps, size
+                    )
+                    futures[future] = (job, stale)
+                    continue
+                _encode_trajectory(level, trajectory, paths, video_fps, size)
+            except Exception as e:
+                finish(job, stale, e)
+            else:
+                finish(job, stale, None)
+        for future in as_completed(futures):
+            job, stale = futures[future]
+            finish(job, stale, future.exception())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results
+
+
+def _jobs_for_level(level_name: str, data_dir: str) -> list[VideoJob]:
+    """Build success and failure jobs from a level's stored solutions."""
     level_dir = os.path.join(data_dir, level_name)
     successes_file = os.path.join(level_dir, "successes.json")
     failures_file = os.path.join(level_dir, "failures.json")
 
     if not os.path.exists(successes_file) or not os.path.exists(failures_file):
         print(f"Skipping {level_name}: missing solutions files")
-        return
+        return []
 
     # Get first seed from each file
     success_seed = get_first_seed_from_file(successes_file, level_name)
@@ -322,47 +769,55 @@ def export_videos_for_level(
 
     if success_seed is None or failure_seed is None:
         print(f"Skipping {level_name}: no seeds found")
-        return
+        return []
 
-    print(f"\n{'=' * 60}")
-    print(f"Processing level: {level_name}")
-    print(f"{'=' * 60}")
+    jobs = []
+    for label, solutions_file, seed in (
+        ("success", successes_file, success_seed),
+        ("failure", failures_file, failure_seed),
+    ):
+        action = get_solution_from_file(solutions_file, level_name, seed)
+        if action is None:
+            print(f"Skipping {level_name} {label}: no action stored for seed {seed}")
+            continue
+        jobs.append(VideoJob(level_name, seed, tuple(action), label))
+    return jobs
 
-    # Export success videos
-    print(f"\nExporting SUCCESS videos (seed {success_seed})...")
-    for fmt in formats:
-        print(f"  - {fmt.upper()}...")
-        try:
-            visualize_solution_from_file(
-                solutions_file=successes_file,
-                level_name=level_name,
-                seed=success_seed,
-                pause_time=0.0,
-                record_video=True,
-                video_format=fmt,
-                video_fps=video_fps,
-                output_dir=output_dir,
-            )
-        except Exception as e:
-            print(f"    Error exporting {fmt}: {e}")
 
-    # Export failure videos
-    print(f"\nExporting FAILURE videos (seed {failure_seed})...")
-    for fmt in formats:
-        print(f"  - {fmt.upper()}...")
-        try:
-            visualize_solution_from_file(
-                solutions_file=failures_file,
-                level_name=level_name,
-                seed=failure_seed,
-                pause_time=0.0,
-                record_video=True,
-                video_format=fmt,
-                video_fps=video_fps,
-                output_dir=output_dir,
-            )
-        except Exception as e:
-            print(f"    Error exporting {fmt}: {e}")
+def export_videos_for_level(
+    level_name: str,
+    data_dir: str,
+    output_dir: str,
+    video_fps: int = 30,
+    formats: list[str] | None = None,
+    workers: int = 1,
+    force: bool = False,
+) -> dict[str, str]:
+    """Export videos for both success and failure solutions for a level.
+
+    Each solution is simulated once and written to all requested formats; see
+    export_videos().
+
+    Args:
+        level_name: Name of the level to export
+        data_dir: Directory containing level data
+        output_dir: Base output directory for videos
+        video_fps: Video frame rate (default: 30)
+        formats: List of video formats to export (default: ["mp4", "gif"])
+        workers: Number of encoding processes (default: 1)
+        force: Regenerate outputs even if they are up to date
+
+    Returns:
+        Mapping from output path to 'written', 'skipped' or 'failed'
+    """
+    if formats is None:
+        formats = ["mp4", "gif"]
+    jobs = _jobs_for_level(level_name, data_dir)
+    if not jobs:
+        return {}
+    return export_videos(
+        jobs, output_dir, formats, video_fps, workers=workers, force=force
+    )
 
 
 def main():
@@ -401,6 +856,17 @@ def main():
         type=str,
         help="Specific levels to export (default: all levels)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of encoding processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate videos even if they are up to date",
+    )
 
     args = parser.parse_args()
 
@@ -418,32 +884,26 @@ def main():
     print(f"Formats: {', '.join(args.formats)}")
     print(f"Output directory: {args.output_dir}")
 
-    # Process each level
-    successful = 0
-    failed = 0
-
-    for i, level_name in enumerate(levels, 1):
-        print(f"\n[{i}/{len(levels)}] Processing {level_name}...")
-        try:
-            export_videos_for_level(
-                level_name,
-                args.data_dir,
-                args.output_dir,
-                args.video_fps,
-                args.formats,
-            )
-            successful += 1
-        except Exception as e:
-            print(f"Error processing {level_name}: {e}")
-            failed += 1
+    jobs = [job for level in levels for job in _jobs_for_level(level, args.data_dir)]
+    results = export_videos(
+        jobs,
+        args.output_dir,
+        args.formats,
+        args.video_fps,
+        workers=args.workers,
+        force=args.force,
+    )
+    statuses = list(results.values())
 
     # Summary
     print(f"\n{'=' * 60}")
     print("EXPORT SUMMARY")
     print(f"{'=' * 60}")
     print(f"Total levels: {len(levels)}")
-    print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
+    print(f"Solutions: {len(jobs)}")
+    print(f"Written: {statuses.count('written')}")
+    print(f"Up to date: {statuses.count('skipped')}")
+    print(f"Failed: {statuses.count('failed')}")
     print(f"Videos saved to: {args.output_dir}")
 
 
@@ -29,6 +29,7 @@ import sys
 import warnings
 from collections.abc import Iterator
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
 from typing import NamedTuple
 
 import numpy as np
@@ -70,6 +71,19 @@ def _get_registry() -> SeedRegistry:
     return _default_registry
 
 
+def _bundled_scene_dict(level_name: str, seed: int, variant: int) -> dict:
+    """Return the bundled scene of (level_name, seed, variant).
+
+    Loader for ValidatedLevel.lazy(). Falls back to the scene of a freshly
+    built level, so the result never reflects later changes to the caller's
+    Level object.
+    """
+    scene = _get_registry().get_scene_dict(level_name, seed, variant)
+    if scene is None:
+        scene = extract_scene_dict(load_level(level_name, seed=seed, variant=variant))
+    return scene
+
+
 def validate_level(
     level_name: str,
     seed: int,
@@ -188,20 +202,20 @@ def load_valid_level(
             )
 
     # Fast path: direct bundle lookup — O(1), no oracle call needed.
-    # get_valid_entry returns the pre-computed entry for this seed (valid or
-    # impossible) without scanning variants.
-    bundle_entry = reg.get_valid_entry(level_name, seed)
-    if bundle_entry is not None:
-        if bundle_entry["status"] == "valid":
-            variant = bundle_entry["variant"]
+    # bundled_status returns the pre-computed status for this seed (valid or
+    # impossible) without scanning variants or decoding the stored scene,
+    # which is only decoded if the caller reads scene_dict.
+    bundled = reg.bundled_status(level_name, seed)
+    if bundled is not None:
+        status, variant = bundled
+        if status == "valid":
             level = load_level(level_name, seed=seed, variant=variant)
-            scene = bundle_entry.get("scene") or extract_scene_dict(level)
-            return ValidatedLevel(
-                level=level,
-                level_name=level_name,
-                seed=seed,
-                variant=variant,
-                scene_dict=scene,
+            return ValidatedLevel.lazy(
+                level,
+                level_name,
+                seed,
+                variant,
+                partial(_bundled_scene_dict, level_name, seed, variant),
             )
         # status == "impossible": confirmed by the bundle oracle.  Fall through
         # to the scan loop so out-of-date bundles do not permanently block seeds
@@ -395,35 +409,47 @@ def _prewarm_worker(args: _PrewarmArgs) -> tuple[str, int, str, int]:
         return level_name, seed, "exhausted", -1
 
 
-def _seed_outcome_from_registry(
-    reg: SeedRegistry, level_name: str, seed: int, max_variants: int
-) -> tuple[str, int] | None:
-    """Return the prewarm outcome for seed if all max_variants are in the registry.
+def _seed_outcomes_from_registry(
+    reg: SeedRegistry, level_name: str, seeds: list[int], max_variants: int
+) -> list[tuple[str, int] | None]:
+    """Return the prewarm outcome of each seed whose variants are all in the registry.
 
-    Returns None if any variant is not yet validated — the seed must be sent
-    to the worker pool.
+    All (seed, variant) pairs are resolved with one lookup_many() call. An
+    entry is None if a variant before the first valid one is not yet
+    validated — the seed must be sent to the worker pool.
 
-    Returns (outcome, winning_variant) where:
+    Otherwise the entry is (outcome, winning_variant) where:
       - outcome is "valid", "trivial", "impossible", or "exhausted"
       - winning_variant is the variant index when outcome is "valid", else -1
     """
-    statuses: list[str] = []
-    for variant in range(max_variants):
-        status = reg.lookup(level_name, seed, variant)
-        if status is None:
-            return None  # Still has unchecked variants — needs worker
-        if status == "valid":
-            return "valid", variant  # capture the first valid variant index
-        statuses.append(status)
+    statuses = reg.lookup_many(
+        level_name,
+        np.repeat(seeds, max_variants),
+        np.tile(np.arange(max_variants), len(seeds)),
+    )
 
-    # All max_variants checked, none valid.
-    unique = set(statuses)
-    if unique == {"trivial"}:
-        return "trivial", -1
-    elif unique == {"impossible"}:
-        return "impossible", -1
-    else:
-        return "exhausted", -1
+    outcomes: list[tuple[str, int] | None] = []
+    for i in range(len(seeds)):
+        seen: set[str] = set()
+        outcome: tuple[str, int] | None = None
+        chunk = statuses[i * max_variants : (i + 1) * max_variants]
+        for variant, status in enumerate(chunk):
+            if status is None:
+                break  # Still has unchecked variants — needs worker
+            if status == "valid":
+                outcome = ("valid", variant)  # the first valid variant index
+                break
+            seen.add(status)
+        else:
+            # All max_variants checked, none valid.
+            if seen == {"trivial"}:
+                outcome = ("trivial", -1)
+            elif seen == {"impossible"}:
+                outcome = ("impossible", -1)
+            else:
+                outcome = ("exhausted", -1)
+        outcomes.append(outcome)
+    return outcomes
 
 
 def prewarm(
@@ -480,8 +506,10 @@ def prewarm(
     # Partition seeds: fully resolved in registry vs. needs worker processing.
     pending: list[_PrewarmArgs] = []
     for level_name in level_names:
-        for seed in seeds_list:
-            result = _seed_outcome_from_registry(reg, level_name, seed, max_variants)
+        outcomes = _seed_outcomes_from_registry(
+            reg, level_name, seeds_list, max_variants
+        )
+        for seed, result in zip(seeds_list, outcomes):
             if result is not None:
                 outcome, winning_variant = result
                 _record_outcome(level_name, outcome, winning_variant)
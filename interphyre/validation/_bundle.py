@@ -148,7 +148,7 @@ def _validate_seed(args: _ValidateSeedArgs) -> dict:
                     ]
                     for pos in sol
                 ]
-                env_check = InterphyreEnv(level, config=config)
+                env_check = InterphyreEnv(level, config=config, evaluate_only=True)
                 try:
                     env_check.reset()
                     _, _, _, _, info = env_check.step(solution_json)
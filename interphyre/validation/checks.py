@@ -40,7 +40,8 @@ def is_trivial(
 
     physics_steps=1000 corresponds to ~5 seconds at the default 60Hz time step,
     which is sufficient for unstable dynamics (swaying poles, rolling balls,
-    tipping objects) to play out.
+    tipping objects) to play out. With config.early_termination, each rollout
+    stops as soon as Box2DEngine.is_settled_failure() proves it cannot succeed.
 
     Design note: action objects are absent from the engine by construction
     (Box2DEngine._create_world skips them), so the simulation represents purely
@@ -55,11 +56,15 @@ def is_trivial(
             return True
 
         # Post-physics check: simulate without agent action
-        for _ in range(physics_steps):
+        for step in range(physics_steps):
             engine.world.Step(cfg.time_step, cfg.velocity_iters, cfg.position_iters)
             engine.time_update(cfg.time_step)
-            if level.success_condition(engine):
+            if engine.check_success():
                 return True
+            if cfg.early_termination and engine.is_settled_failure(
+                physics_steps - step - 1
+            ):
+                break
     finally:
         engine.close()
 
@@ -93,14 +98,18 @@ def is_trivial(
                 if level.success_condition(engine2):
                     triggered = True
                 else:
-                    for _ in range(physics_steps):
+                    for step in range(physics_steps):
                         engine2.world.Step(
                             cfg.time_step, cfg.velocity_iters, cfg.position_iters
                         )
                         engine2.time_update(cfg.time_step)
-                        if level.success_condition(engine2):
+                        if engine2.check_success():
                             triggered = True
                             break
+                        if cfg.early_termination and engine2.is_settled_failure(
+                            physics_steps - step - 1
+                        ):
+                            break
             finally:
                 engine2.close()
             corner_results.append(triggered)
@@ -1,12 +1,31 @@
-"""One-time migration: compact bundles to one entry per seed.
+"""Bundle format conversions.
+
+One-time migration: compact bundles to one entry per seed.
 
 Bundles generated before the compact-format change store one entry per
 variant tried (including intermediate impossible variants).  This script
 collapses each bundle to a single entry per seed — the valid entry if one
 exists, otherwise a single impossible marker at variant=0.
 
+Columnar bundles: the lzma JSON bundles must be decompressed and parsed in
+full before any seed can be looked up. A columnar bundle holds the same
+entries in a flat binary file that is opened with mmap:
+
+  - a fixed-width index sorted by seed: (seed, variant, status, schema id);
+  - solutions as a float64 (rows, objects, 3) array;
+  - scene dicts as one array per (object, attribute) column. Every seed of a
+    level shares one of a handful of object/attribute schemas, so a scene is
+    rebuilt from its schema id and one value per column. Columns that hold
+    the same value for every seed are stored once in the header.
+
+A lookup decodes one row and touches only the pages it needs, and worker
+processes opening the same file share the page cache. SeedRegistry converts
+each lzma bundle on first use into <cache dir>/bundles/{level}.columnar and
+reopens that file from then on.
+
 Usage:
     python -m interphyre.validation.compact_bundles
+    python -m interphyre.validation.compact_bundles --columnar [OUT_DIR]
 
 Safe to run multiple times (idempotent — already-compact bundles are left
 unchanged and reported as "already compact").
@@ -14,9 +33,18 @@ unchanged and reported as "already compact").
 
 from __future__ import annotations
 
+import argparse
+import copy
 import json
 import lzma
+import mmap
+import os
+import struct
+import tempfile
 from pathlib import Path
+from typing import Any
+
+import numpy as np
 
 _BUNDLE_DIR = Path(__file__).parent.parent / "data" / "levels"
 
@@ -55,12 +83,478 @@ def compact_bundle(bundle_path: Path) -> None:
     )
 
 
+# ---------------------------------------------------------------------------
+# Columnar bundles
+# ---------------------------------------------------------------------------
+
+_MAGIC = b"IPHBNDL\0"
+_FORMAT_VERSION = 1
+# magic, format version, header length
+_PREAMBLE = struct.Struct("<8sII")
+
+STATUSES = ("valid", "impossible", "trivial")
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+INDEX_DTYPE = np.dtype(
+    [("seed", "<i8"), ("variant", "<i4"), ("status", "u1"), ("schema", "<u2")],
+    align=True,
+)
+# Schema id of entries without a scene dict.
+_NO_SCENE = 0xFFFF
+_ENTRY_KEYS = {"seed", "variant", "status", "scene", "solution"}
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def bundle_source(bundle_path: Path) -> dict[str, int]:
+    """Identify an lzma bundle file by size and modification time."""
+    stat = bundle_path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+# Scene columns of the same kind are stored side by side in one
+# (rows, columns) array, so decoding a scene reads one contiguous row per kind.
+_KIND_DTYPES = {
+    "float": np.float64,
+    "int": np.int64,
+    "bool": np.uint8,
+    "str": np.uint16,
+    "int_flags": np.uint8,
+}
+
+
+def _encode_column(
+    values: list[Any], present: np.ndarray, groups: dict[str, list]
+) -> dict[str, Any]:
+    """Pick the narrowest storage for one scene column.
+
+    values has one item per row; rows where present is False hold None and
+    are never decoded. Array columns are appended to groups[kind] and the
+    returned spec records their slot.
+    """
+    used = [v for v, p in zip(values, present) if p]
+    first = used[0]
+
+    def add(kind: str, column: np.ndarray) -> int:
+        groups[kind].append(column)
+        return len(groups[kind]) - 1
+
+    if all(isinstance(v, bool) for v in used):
+        if len(set(used)) == 1:
+            return {"kind": "const", "value": first}
+        column = np.array([bool(v) for v in values], dtype=np.uint8)
+        return {"kind": "bool", "slot": add("bool", column)}
+    if all(_is_number(v) for v in used):
+        ints = np.array([isinstance(v, int) for v in values], dtype=np.uint8)
+        if ints[present].all() and all(-(2**63) <= v < 2**63 for v in used):
+            column = np.array([0 if v is None else v for v in values], np.int64)
+            if (column[present] == first).all():
+                return {"kind": "const", "value": first}
+            return {"kind": "int", "slot": add("int", column)}
+        column = np.array([0.0 if v is None else v for v in values], np.float64)
+        bits = column[present].view(np.int64)
+        flags = ints[present]
+        if (bits == bits[0]).all() and (flags == flags[0]).all():
+            return {"kind": "const", "value": first}
+        spec = {"kind": "float", "slot": add("float", column)}
+        if flags.any():
+            # JSON distinguishes -5 from -5.0; keep which values were ints.
+            spec["flag"] = add("int_flags", ints)
+        return spec
+    if all(isinstance(v, str) for v in used):
+        strings = sorted(set(used))
+        if len(strings) == 1:
+            return {"kind": "const", "value": first}
+        if len(strings) <= 0xFFFF:
+            codes = {string: i for i, string in enumerate(strings)}
+            column = np.array([codes.get(v, 0) for v in values], dtype=np.uint16)
+            return {"kind": "str", "slot": add("str", column), "strings": strings}
+    # Anything else (lists, None, mixed types) is stored as JSON text.
+    blobs = [json.dumps(v).encode() if p else b"" for v, p in zip(values, present)]
+    if len({b for b in blobs if b}) == 1:
+        return {"kind": "const", "value": first}
+    groups["json"].append(blobs)
+    return {"kind": "json", "slot": len(groups["json"]) - 1}
+
+
+def _add_json(sections: dict, name: str, blobs: list[bytes]) -> None:
+    """Store one JSON document per row as offsets into a byte heap."""
+    sections[name] = np.cumsum([0] + [len(b) for b in blobs], dtype=np.int64)
+    sections[f"{name}_json"] = np.frombuffer(b"".join(blobs), dtype=np.uint8)
+
+
+def _read_json(arrays: dict, name: str, row: int) -> Any:
+    offsets = arrays[name]
+    return json.loads(arrays[f"{name}_json"][offsets[row] : offsets[row + 1]].tobytes())
+
+
+def _encode_solutions(solutions: list[Any], sections: dict) -> dict[str, Any]:
+    """Store solutions as a (rows, objects, 3) float64 array when they fit."""
+    triples = all(
+        s is None
+        or (
+            isinstance(s, list)
+            and all(
+                isinstance(p, list) and len(p) == 3 and all(_is_number(v) for v in p)
+                for p in s
+            )
+        )
+        for s in solutions
+    )
+    if not triples:
+        _add_json(sections, "solution", [json.dumps(s).encode() for s in solutions])
+        return {"layout": "json"}
+    width = max((len(s) for s in solutions if s is not None), default=0)
+    counts = np.array([-1 if s is None else len(s) for s in solutions], np.int16)
+    array = np.zeros((len(solutions), width, 3), dtype=np.float64)
+    for row, solution in enumerate(solutions):
+        if solution:
+            array[row, : len(solution)] = solution
+    sections["solution_counts"] = counts
+    sections["solutions"] = array
+    return {"layout": "array"}
+
+
+def encode_columnar_bundle(
+    data: dict[str, Any], source: dict[str, int] | None = None
+) -> bytes:
+    """Encode a bundle (the parsed lzma JSON) as a columnar bundle.
+
+    Entries are deduplicated by seed the same way SeedRegistry does: the
+    valid entry wins over impossible markers.
+
+    Args:
+        data: Bundle dict with "entries" and optional metadata fields
+        source: bundle_source() of the lzma file, stored so a cached
+            conversion can be checked against its source
+
+    Raises:
+        ValueError: If an entry has fields or a status the format does not store
+    """
+    seed_map: dict[int, dict] = {}
+    for entry in data.get("entries", []):
+        extra = set(entry) - _ENTRY_KEYS
+        if extra:
+            raise ValueError(f"Unsupported bundle entry fields: {sorted(extra)}")
+        if entry["status"] not in _STATUS_CODES:
+            raise ValueError(f"Unsupported bundle entry status: {entry['status']!r}")
+        s = entry["seed"]
+        if s not in seed_map or entry["status"] == "valid":
+            seed_map[s] = entry
+    entries = [seed_map[s] for s in sorted(seed_map)]
+    n = len(entries)
+
+    # Distinct ordered (object, attributes) structures and the union of
+    # their (object, attribute) columns.
+    schema_ids: dict[tuple, int] = {}
+    columns: dict[tuple[str, str], int] = {}
+    index = np.zeros(n, dtype=INDEX_DTYPE)
+    for row, entry in enumerate(entries):
+        scene = entry.get("scene")
+        schema = _NO_SCENE
+        if scene is not None:
+            key = tuple((obj, tuple(attrs)) for obj, attrs in scene.items())
+            schema = schema_ids.setdefault(key, len(schema_ids))
+            for obj, attrs in key:
+                for attr in attrs:
+                    columns.setdefault((obj, attr), len(columns))
+        index[row] = (
+            entry["seed"],
+            entry["variant"],
+            _STATUS_CODES[entry["status"]],
+            schema,
+        )
+    if len(schema_ids) >= _NO_SCENE:
+        raise ValueError("Too many distinct scene schemas for a columnar bundle")
+
+    values: list[list[Any]] = [[None] * n for _ in columns]
+    present = np.zeros((len(columns), n), dtype=bool)
+    for row, entry in enumerate(entries):
+        for obj, attrs in (entry.get("scene") or {}).items():
+            for attr, value in attrs.items():
+                column = columns[(obj, attr)]
+                values[column][row] = value
+                present[column, row] = True
+
+    groups: dict[str, list] = {kind: [] for kind in (*_KIND_DTYPES, "json")}
+    column_specs = [
+        {"object": obj, "attr": attr} | _encode_column(values[i], present[i], groups)
+        for (obj, attr), i in columns.items()
+    ]
+    sections: dict[str, np.ndarray] = {"index": index}
+    for kind, dtype in _KIND_DTYPES.items():
+        if groups[kind]:
+            sections[kind] = np.stack(groups[kind], axis=1).astype(dtype)
+    for slot, blobs in enumerate(groups["json"]):
+        _add_json(sections, f"json{slot}", blobs)
+    solutions = _encode_solutions([e.get("solution") for e in entries], sections)
+    schemas = [
+        [[obj, [columns[(obj, attr)] for attr in attrs]] for obj, attrs in key]
+        for key in schema_ids
+    ]
+
+    offset = 0
+    layout = {}
+    for name, array in sections.items():
+        array = np.ascontiguousarray(array)
+        sections[name] = array
+        layout[name] = [
+            offset,
+            array.dtype.str if array.dtype.names is None else "index",
+            list(array.shape),
+        ]
+        offset = _align(offset + array.nbytes)
+    seeds = index["seed"]
+    header = {
+        "schema_hash": data.get("schema_hash", ""),
+        "oracle_commit": data.get("oracle_commit", "unknown"),
+        "source": source,
+        "rows": n,
+        "dense": bool(n and np.array_equal(seeds, np.arange(seeds[0], seeds[0] + n))),
+        "statuses": list(STATUSES),
+        "schemas": schemas,
+        "columns": column_specs,
+        "solutions": solutions,
+        "sections": layout,
+    }
+    header_bytes = json.dumps(header).encode()
+    start = _align(_PREAMBLE.size + len(header_bytes))
+    out = bytearray(start + offset)
+    _PREAMBLE.pack_into(out, 0, _MAGIC, _FORMAT_VERSION, len(header_bytes))
+    out[_PREAMBLE.size : _PREAMBLE.size + len(header_bytes)] = header_bytes
+    for name, array in sections.items():
+        position = start + layout[name][0]
+        out[position : position + array.nbytes] = array.tobytes()
+    return bytes(out)
+
+
+def write_columnar_bundle(path: Path, encoded: bytes) -> None:
+    """Write an encoded columnar bundle to path atomically.
+
+    Concurrent writers are safe: each writes a temporary file in the target
+    directory and renames it into place.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(encoded)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def convert_bundle(bundle_path: Path, out_dir: Path) -> Path:
+    """Convert one lzma bundle to out_dir/{level}.columnar and return its path."""
+    level_name = bundle_path.name.removesuffix(".json.lzma")
+    with lzma.open(bundle_path, "rt", encoding="utf-8") as fh:
+        data = json.load(fh)
+    out_path = out_dir / f"{level_name}.columnar"
+    write_columnar_bundle(
+        out_path, encode_columnar_bundle(data, source=bundle_source(bundle_path))
+    )
+    return out_path
+
+
+class ColumnarBundle:
+    """Read-only view of a columnar bundle file or buffer.
+
+    Attributes:
+        index: Structured array (seed, variant, status, schema) sorted by
+            seed; status indexes STATUSES
+        schema_hash: Schema hash of the source bundle
+        oracle_commit: Oracle commit of the source bundle
+        source: bundle_source() of the lzma file it was converted from
+    """
+
+    def __init__(self, buffer: Any):
+        """Decode the header of a columnar bundle; arrays are views into buffer.
+
+        Raises:
+            ValueError: If buffer is not a columnar bundle
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) < _PREAMBLE.size:
+            raise ValueError("Buffer is too short to hold a columnar bundle")
+        magic, version, header_len = _PREAMBLE.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Buffer does not contain a columnar bundle")
+        if version != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported columnar bundle format version {version} "
+                f"(expected {_FORMAT_VERSION})"
+            )
+        header = json.loads(bytes(view[_PREAMBLE.size : _PREAMBLE.size + header_len]))
+        start = _align(_PREAMBLE.size + header_len)
+        arrays = {}
+        for name, (offset, dtype, shape) in header["sections"].items():
+            dtype = INDEX_DTYPE if dtype == "index" else np.dtype(dtype)
+            count = int(np.prod(shape))
+            if start + offset + count * dtype.itemsize > len(view):
+                raise ValueError("Truncated columnar bundle")
+            array = np.frombuffer(view, dtype=dtype, count=count, offset=start + offset)
+            arrays[name] = array.reshape(shape)
+        self._buffer = buffer
+        self._arrays = arrays
+        self._groups = {k: arrays[k] for k in _KIND_DTYPES if k in arrays}
+        self._columns = header["columns"]
+        self._schemas = header["schemas"]
+        self._solutions = header["solutions"]
+        self._dense = header["dense"]
+        self.index = arrays["index"]
+        self.schema_hash: str = header["schema_hash"]
+        self.oracle_commit: str = header["oracle_commit"]
+        self.source: dict[str, int] | None = header["source"]
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> ColumnarBundle:
+        """Memory-map a columnar bundle file.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a columnar bundle
+        """
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                raise ValueError(f"{path} is empty")
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def find(self, seed: int) -> int | None:
+        """Return the row of seed, or None if the bundle does not cover it."""
+        seeds = self.index["seed"]
+        if not len(seeds):
+            return None
+        if self._dense:
+            row = seed - int(seeds[0])
+            return row if 0 <= row < len(seeds) else None
+        row = int(np.searchsorted(seeds, seed))
+        return row if row < len(seeds) and seeds[row] == seed else None
+
+    def find_many(self, seeds: np.ndarray) -> np.ndarray:
+        """Return the row of each seed, or -1 where the bundle does not cover it."""
+        seeds = np.asarray(seeds, dtype=np.int64)
+        index_seeds = self.index["seed"]
+        if not len(index_seeds):
+            return np.full(seeds.shape, -1, dtype=np.intp)
+        rows = np.minimum(np.searchsorted(index_seeds, seeds), len(index_seeds) - 1)
+        return np.where(index_seeds[rows] == seeds, rows, -1)
+
+    def status(self, row: int) -> str:
+        return STATUSES[self.index["status"][row]]
+
+    def variant(self, row: int) -> int:
+        return int(self.index["variant"][row])
+
+    def scene(self, row: int) -> dict | None:
+        """Decode the scene dict of row, or None if the entry has none."""
+        schema = int(self.index["schema"][row])
+        if schema == _NO_SCENE:
+            return None
+        rows = {kind: array[row].tolist() for kind, array in self._groups.items()}
+        scene = {}
+        for obj, columns in self._schemas[schema]:
+            attrs = scene[obj] = {}
+            for column in columns:
+                spec = self._columns[column]
+                kind = spec["kind"]
+                if kind == "const":
+                    value = spec["value"]
+                    if isinstance(value, (list, dict)):
+                        value = copy.deepcopy(value)
+                elif kind == "json":
+                    value = _read_json(self._arrays, f"json{spec['slot']}", row)
+                else:
+                    value = rows[kind][spec["slot"]]
+                    if kind == "str":
+                        value = spec["strings"][value]
+                    elif kind == "bool":
+                        value = bool(value)
+                    elif "flag" in spec and rows["int_flags"][spec["flag"]]:
+                        value = int(value)
+                attrs[spec["attr"]] = value
+        return scene
+
+    def solution(self, row: int) -> list | None:
+        """Decode the solution of row as a list of [x, y, radius] lists."""
+        if self._solutions["layout"] == "json":
+            return _read_json(self._arrays, "solution", row)
+        count = int(self._arrays["solution_counts"][row])
+        if count < 0:
+            return None
+        return self._arrays["solutions"][row, :count].tolist()
+
+    def entry(self, row: int) -> dict:
+        """Decode row as a bundle entry {seed, variant, status, scene, solution}."""
+        return {
+            "seed": int(self.index["seed"][row]),
+            "variant": self.variant(row),
+            "status": self.status(row),
+            "scene": self.scene(row),
+            "solution": self.solution(row),
+        }
+
+    def get(self, seed: int) -> dict | None:
+        """Return the decoded entry for seed, or None if not in the bundle."""
+        row = self.find(seed)
+        return None if row is None else self.entry(row)
+
+    def close(self) -> None:
+        """Release the buffer (closes the mmap for bundles from open())."""
+        self._arrays = {}
+        self._groups = {}
+        self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __repr__(self) -> str:
+        return f"ColumnarBundle(rows={len(self)}, schemas={len(self._schemas)})"
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert bundled level data.")
+    parser.add_argument(
+        "--columnar",
+        nargs="?",
+        const="",
+        metavar="OUT_DIR",
+        help="Write columnar bundles (default: the registry's cache directory)",
+    )
+    args = parser.parse_args()
+
     bundles = sorted(_BUNDLE_DIR.glob("*.json.lzma"))
     if not bundles:
         print("No bundles found in", _BUNDLE_DIR)
         return
 
+    if args.columnar is not None:
+        from interphyre.validation.registry import _default_cache_path
+
+        out_dir = (
+            Path(args.columnar)
+            if args.columnar
+            else _default_cache_path().parent / "bundles"
+        )
+        print(f"Converting {len(bundles)} bundles to {out_dir}...\n")
+        for bundle_path in bundles:
+            out_path = convert_bundle(bundle_path, out_dir)
+            print(
+                f"  {bundle_path.name}: {bundle_path.stat().st_size} → "
+                f"{out_path.stat().st_size} bytes"
+            )
+        print("\nDone.")
+        return
+
     print(f"Compacting {len(bundles)} bundles in {_BUNDLE_DIR}...\n")
     for bundle_path in bundles:
         compact_bundle(bundle_path)
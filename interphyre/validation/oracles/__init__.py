@@ -154,9 +154,9 @@ def _run_attempt(
     simulation. Returns True if info["success"] is set.
 
     Invalid placements are handled internally by env.step() and return False
-    via info["success"]. The caller creates one InterphyreEnv before the attempt
-    loop; env.reset() handles world reset between attempts without rebuilding
-    static bodies.
+    via info["success"]. The caller creates one InterphyreEnv (evaluate_only=True,
+    so no observations are built) before the attempt loop; env.reset() handles
+    world reset between attempts without rebuilding static bodies.
     """
     env.reset()
     _, _, _, _, info = env.step(positions)
@@ -187,7 +187,7 @@ def _default_oracle(
     ]
     n_objects = len(level.action_objects)
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for _ in range(n_attempts):
             xs = rng.uniform(_PLACEMENT_MIN, _PLACEMENT_MAX, size=n_objects)
@@ -125,7 +125,7 @@ def solver(
     rim_y = basket.y + basket.total_height
     outer_half = basket.top_width / 2
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             band = i % 10
@@ -98,7 +98,7 @@ def solver(
     # x covers the full board; y ∈ [arm_top, 4.5].
     y_min_d = float(np.clip(arm_top, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             zone = i % 100
@@ -68,7 +68,7 @@ def solver(
     y_min_c = float(np.clip(gray_ball.y - 0.5, -4.5, 4.5))
     y_max_c = float(np.clip(gray_ball.y + 2.5, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             zone = i % 10
@@ -46,7 +46,7 @@ def solver(
     y_min = np.clip(platform.y - 1.0, -4.5, 4.5)
     y_max = np.clip(green_ball.y + 0.5, -4.5, 4.5)
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for _ in range(n_attempts):
             x = rng.uniform(x_min, x_max)
@@ -68,7 +68,7 @@ def solver(
     y_min_b = y_max_a  # starts where Band A ends
     y_max_b = 4.4  # near world top boundary
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             x = rng.uniform(x_min, x_max)
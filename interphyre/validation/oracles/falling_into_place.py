@@ -78,7 +78,7 @@ def solver(
     wall_clearance = 4.5 + push_direction * green_ball.x  # distance to push-side wall
     max_push = float(max(0.05, min(sum_of_radii - 0.05, wall_clearance)))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             region = i % 3
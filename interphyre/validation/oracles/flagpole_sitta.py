@@ -150,7 +150,7 @@ def solver(
         else 0.99
     )
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             # Phase 2 is tried for 30% of attempts (i%10 >= 7) even when Phase 1 is
@@ -67,7 +67,7 @@ def solver(
     # Zone A: full near-platform region fallback (covers the 3.7% outside Zone C).
     x_min_a = float(np.clip(green_ball.x - 3.5, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 10 < 4:
@@ -90,7 +90,7 @@ def solver(
     max_x_offset = min(0.6, abs(green_ball.x) - 0.2)
     max_x_offset = max(0.05, max_x_offset)  # at least 0.05 offset
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             # Small horizontal offset keeps the collision glancing (diagonal contact
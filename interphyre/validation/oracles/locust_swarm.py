@@ -66,7 +66,7 @@ def solver(
     # Solution y mean = green_ball.y - 1.71 (4.0 - 1.71 = 2.29 across all seeds).
     y_center_a = green_ball_y - 1.71
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 5 < 4:
@@ -81,7 +81,7 @@ def solver(
     if y_max <= y_min:
         return None
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for _ in range(n_attempts):
             x = rng.uniform(x_min, x_max)
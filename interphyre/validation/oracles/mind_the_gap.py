@@ -59,7 +59,7 @@ def solver(
     x_b_max = float(np.clip(hole_cx + 1.5, -4.5, 4.5))
     y_b_max = float(np.clip(green_ball.y - 0.5, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 2 == 0:
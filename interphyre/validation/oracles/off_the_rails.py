@@ -91,7 +91,7 @@ def solver(
     band_a_height = y_max_a - y_min_a
     use_band_a = band_a_height >= 1.0
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             x = rng.uniform(x_min, x_max)
@@ -44,7 +44,7 @@ def solver(
     y_min = np.clip(top_basket.y + 0.1, -4.5, 4.5)
     y_max = np.clip(top_basket.y + 1.5, -4.5, 4.5)
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for _ in range(n_attempts):
             x = rng.uniform(x_min, x_max)
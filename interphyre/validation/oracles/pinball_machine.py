@@ -56,7 +56,7 @@ def solver(
     x_min = float(np.clip(green_ball.x - 3.5, -4.5, 4.5))
     x_max = float(np.clip(green_ball.x + 3.5, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 10 < 7:
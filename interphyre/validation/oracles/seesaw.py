@@ -87,7 +87,7 @@ def solver(
         x_min_a = float(np.clip(cx - 1.5, -4.5, 4.5))
         x_max_a = float(np.clip(cx + 1.5, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 5 < 3:
@@ -67,7 +67,7 @@ def solver(
     y_min = float(np.clip(min(stair_ys) - 0.5, -4.5, 4.5)) if stair_ys else -4.5
     y_max = float(np.clip(green_ball.y + 0.5, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for _ in range(n_attempts):
             # Full-board uniform x: solution x is nearly uniform (std=2.22, mean=0.49)
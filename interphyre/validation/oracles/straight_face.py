@@ -56,7 +56,7 @@ def solver(
     corridor_lo = float(np.clip(min(green_ball.x, purple_pad.x) - radius, -4.5, 4.5))
     corridor_hi = float(np.clip(max(green_ball.x, purple_pad.x) + radius, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for _ in range(n_attempts):
             # 70% corridor sampling, 30% full-board fallback. The fallback handles
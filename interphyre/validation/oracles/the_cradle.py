@@ -64,7 +64,7 @@ def solver(
     x_min_b = float(np.clip(green_ball.x - 3.0, -4.5, 4.5))
     x_max_b = float(np.clip(green_ball.x + 3.0, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 4 < 3:
@@ -61,7 +61,7 @@ def solver(
     # Zone A: y near top of board — standard mechanism (green_ball near y=4.7).
     y_min_a = float(np.clip(green_ball.y - 0.5, -4.5, 4.5))
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 5 < 3:
@@ -82,7 +82,7 @@ def solver(
         4.5,
     )
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             region = i % 5
@@ -65,7 +65,7 @@ def solver(
     if x_min_a >= x_max_a or y_min_a >= y_max:
         return None
 
-    env = InterphyreEnv(level, config=config)
+    env = InterphyreEnv(level, config=config, evaluate_only=True)
     try:
         for i in range(n_attempts):
             if i % 10 < 7:
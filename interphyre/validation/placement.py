@@ -5,17 +5,25 @@ Both InterphyreEnv (step/action validation) and the oracle registry
 legal. Keeping a single implementation here prevents the two from
 diverging silently — which previously caused oracles to accept
 placements that the environment would reject, or vice versa.
+
+validate_placements() is the vectorized counterpart for many candidate
+placements at once. It evaluates the same arithmetic over a per-level
+PlacementGeometry table and must return exactly what is_valid_placement()
+returns for every row.
 """
 
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from interphyre.config import MAX_X, MAX_Y, MIN_X, MIN_Y
 from interphyre.objects import Basket
 from interphyre.objects.bar import circle_intersects_bar
-from interphyre.objects.basket import circle_intersects_basket
+from interphyre.objects.basket import basket_wall_slabs, circle_intersects_basket
 
 if TYPE_CHECKING:
     from interphyre.level import Level
@@ -58,3 +66,189 @@ def is_valid_placement(level: "Level", x: float, y: float, radius: float) -> boo
             if circle_intersects_basket(x, y, radius, obj):
                 return False
     return True
+
+
+@dataclass(frozen=True)
+class PlacementGeometry:
+    """Obstacle table for vectorized placement checks, one row per primitive.
+
+    Attributes:
+        balls: float64[B, 3] rows of (x, y, radius)
+        bars: float64[R, 6] rows of (x, y, cos, sin, half_length, half_thickness),
+            where cos/sin are of -angle, the rotation into the bar's local frame
+        slabs: float64[S, 4] rows of (left, bottom, right, top), four per basket
+    """
+
+    balls: np.ndarray
+    bars: np.ndarray
+    slabs: np.ndarray
+
+
+# Built tables keyed by the obstacle signature they were built from, so levels
+# with identical static geometry (and repeated calls on one level) share one.
+_GEOMETRY_CACHE: dict[tuple, PlacementGeometry] = {}
+_GEOMETRY_CACHE_SIZE = 256
+
+
+def _obstacle_signature(level: "Level") -> tuple:
+    """Geometry of every object is_valid_placement checks, in the same dispatch order."""
+    signature = []
+    for name, obj in level.objects.items():
+        if name in level.action_objects:
+            continue
+        if hasattr(obj, "radius"):
+            signature.append(("ball", obj.x, obj.y, obj.radius))
+        elif hasattr(obj, "length"):
+            signature.append(
+                ("bar", obj.x, obj.y, obj.angle, obj.length, obj.thickness)
+            )
+        elif isinstance(obj, Basket):
+            signature.append(("basket", *basket_wall_slabs(obj)))
+    return tuple(signature)
+
+
+def placement_geometry(level: "Level") -> PlacementGeometry:
+    """Return the obstacle table of level's non-action objects.
+
+    Tables are cached by the objects' current geometry, so repeated calls cost
+    one pass over level.objects and moving an object is picked up on the next
+    call.
+
+    Args:
+        level: Level instance providing objects and action_objects.
+
+    Returns:
+        PlacementGeometry for the level's current static description.
+    """
+    signature = _obstacle_signature(level)
+    geometry = _GEOMETRY_CACHE.get(signature)
+    if geometry is not None:
+        return geometry
+
+    balls, bars, slabs = [], [], []
+    for kind, *values in signature:
+        if kind == "ball":
+            balls.append(values)
+        elif kind == "bar":
+            x, y, angle, length, thickness = values
+            # Same trigonometry as circle_intersects_bar, evaluated once in math.
+            angle_rad = math.radians(-angle)
+            bars.append(
+                (
+                    x,
+                    y,
+                    math.cos(angle_rad),
+                    math.sin(angle_rad),
+                    length / 2,
+                    thickness / 2,
+                )
+            )
+        else:
+            slabs.extend(values)
+    geometry = PlacementGeometry(
+        balls=np.array(balls, dtype=np.float64).reshape(-1, 3),
+        bars=np.array(bars, dtype=np.float64).reshape(-1, 6),
+        slabs=np.array(slabs, dtype=np.float64).reshape(-1, 4),
+    )
+    if len(_GEOMETRY_CACHE) >= _GEOMETRY_CACHE_SIZE:
+        _GEOMETRY_CACHE.clear()
+    _GEOMETRY_CACHE[signature] = geometry
+    return geometry
+
+
+def validate_placements(level: "Level", xyr: np.ndarray) -> np.ndarray:
+    """Vectorized is_valid_placement over many candidate balls.
+
+    Args:
+        level: Level instance providing objects and action_objects.
+        xyr: Array-like of shape (N, 3) with one (x, y, radius) row per ball.
+
+    Returns:
+        bool[N], True where placing that ball is a valid action.
+
+    Raises:
+        ValueError: If xyr does not have shape (N, 3).
+    """
+    xyr = np.asarray(xyr, dtype=np.float64)
+    if xyr.ndim != 2 or xyr.shape[1] != 3:
+        raise ValueError(f"Expected placements of shape (N, 3), got {xyr.shape}")
+    geometry = placement_geometry(level)
+    x, y, radius = xyr[:, 0:1], xyr[:, 1:2], xyr[:, 2:3]
+
+    valid = (
+        (MIN_X + radius <= x)
+        & (x <= MAX_X - radius)
+        & (MIN_Y + radius <= y)
+        & (y <= MAX_Y - radius)
+    )[:, 0]
+
+    if len(geometry.balls):
+        bx, by, br = geometry.balls.T
+        distance = np.sqrt((x - bx) ** 2 + (y - by) ** 2)
+        valid &= ~(distance <= radius + br).any(axis=1)
+
+    if len(geometry.bars):
+        bx, by, cos, sin, half_length, half_thickness = geometry.bars.T
+        dx, dy = x - bx, y - by
+        local_x = dx * cos - dy * sin
+        local_y = dx * sin + dy * cos
+        closest_x = np.maximum(-half_length, np.minimum(local_x, half_length))
+        closest_y = np.maximum(-half_thickness, np.minimum(local_y, half_thickness))
+        hits = (local_x - closest_x) ** 2 + (local_y - closest_y) ** 2 <= radius**2
+        valid &= ~hits.any(axis=1)
+
+    if len(geometry.slabs):
+        left, bottom, right, top = geometry.slabs.T
+        nearest_x = np.maximum(left, np.minimum(x, right))
+        nearest_y = np.maximum(bottom, np.minimum(y, top))
+        hits = (x - nearest_x) ** 2 + (y - nearest_y) ** 2 <= radius**2
+        valid &= ~hits.any(axis=1)
+
+    return valid
+
+
+# Placement masks keyed by (obstacle signature, grid), so every seed or variant
+# sharing static geometry and action bins reuses one mask.
+_MASK_CACHE: dict[tuple, np.ndarray] = {}
+_MASK_CACHE_SIZE = 64
+
+
+def placement_mask(
+    level: "Level",
+    xs: np.ndarray,
+    ys: np.ndarray,
+    radii: np.ndarray,
+) -> np.ndarray:
+    """Validity of every (x, y, radius) grid cell, as is_valid_placement reports it.
+
+    Args:
+        level: Level instance providing objects and action_objects.
+        xs: Candidate x-coordinates, one per x bin.
+        ys: Candidate y-coordinates, one per y bin.
+        radii: Candidate radii, one per radius bin.
+
+    Returns:
+        Read-only bool[len(xs), len(ys), len(radii)] with mask[i, j, k] True iff
+        a ball at (xs[i], ys[j], radii[k]) is a valid placement. Masks are cached
+        by the level's obstacle geometry and the grid.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    radii = np.asarray(radii, dtype=np.float64)
+    key = (
+        _obstacle_signature(level),
+        xs.tobytes(),
+        ys.tobytes(),
+        radii.tobytes(),
+    )
+    mask = _MASK_CACHE.get(key)
+    if mask is not None:
+        return mask
+
+    grid = np.stack(np.meshgrid(xs, ys, radii, indexing="ij"), axis=-1)
+    mask = validate_placements(level, grid.reshape(-1, 3)).reshape(grid.shape[:3])
+    mask.flags.writeable = False
+    if len(_MASK_CACHE) >= _MASK_CACHE_SIZE:
+        _MASK_CACHE.clear()
+    _MASK_CACHE[key] = mask
+    return mask
@@ -2,9 +2,16 @@
 
 Two-tier lookup:
   Tier 1 — bundled lzma-compressed JSON shipped with the package
-            (interphyre/data/levels/{level_name}.json.lzma). Loaded lazily
-            per level, cached in-memory as {(seed, variant): entry}. O(1)
-            after first access per level.
+            (interphyre/data/levels/{level_name}.json.lzma). On first access
+            per level the bundle is converted to a memory-mapped columnar
+            file next to the SQLite cache (bundles/{level_name}.columnar, see
+            compact_bundles.py) and reopened from there by later processes,
+            so only the first process on a machine pays the decompression.
+            If the file cannot be written, the same arrays are built in
+            memory. Either way a level is a handful of numpy arrays (a
+            structured seed index plus scene and solution columns); entries
+            and scene dicts are decoded only when requested. O(1) after
+            first access per level.
   Tier 2 — user SQLite cache at ~/.cache/interphyre/seed_registry.db,
             following the XDG convention used by PHYRE (~/.cache/phyre/).
             Configurable via INTERPHYRE_CACHE_DIR env var. WAL mode,
@@ -28,12 +35,23 @@ import logging
 import lzma
 import os
 import sqlite3
+from collections.abc import Callable, Iterable, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 from interphyre.level import Level
+from interphyre.validation.compact_bundles import (
+    INDEX_DTYPE,
+    STATUSES,
+    ColumnarBundle,
+    bundle_source,
+    encode_columnar_bundle,
+    write_columnar_bundle,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +66,10 @@ class ValidatedLevel:
     Bundles the level with its provenance so experiments can cite it exactly.
     The (level_name, seed, variant) triple is the short-form reference;
     scene_dict is the long-form reproducibility artifact.
+
+    Levels served from the bundled tier are created with lazy(), which
+    decodes scene_dict from the bundle on first access. Pickling decodes it
+    first, so a pickled ValidatedLevel does not depend on the bundle.
     """
 
     level: Level
@@ -56,6 +78,38 @@ class ValidatedLevel:
     variant: int
     scene_dict: dict  # full geometry, JSON-serializable
 
+    @classmethod
+    def lazy(
+        cls,
+        level: Level,
+        level_name: str,
+        seed: int,
+        variant: int,
+        load_scene: Callable[[], dict],
+    ) -> ValidatedLevel:
+        """Create a ValidatedLevel whose scene_dict is load_scene() on first access."""
+        validated = cls.__new__(cls)
+        validated.level = level
+        validated.level_name = level_name
+        validated.seed = seed
+        validated.variant = variant
+        validated._load_scene = load_scene
+        return validated
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes missing from the instance, i.e. the
+        # scene_dict of a lazy() level that has not been read yet.
+        if name == "scene_dict" and "_load_scene" in self.__dict__:
+            self.scene_dict = self.__dict__.pop("_load_scene")()
+            return self.scene_dict
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __getstate__(self) -> dict:
+        self.scene_dict  # noqa: B018 - decode a lazy scene before pickling
+        return self.__dict__.copy()
+
 
 def _default_cache_path() -> Path:
     """Return the default SQLite cache path, respecting INTERPHYRE_CACHE_DIR."""
@@ -86,6 +140,18 @@ def _compute_schema_hash(level_name: str) -> str:
     return hashlib.sha256(schema_str.encode()).hexdigest()
 
 
+def _open_columnar(path: Path, source: dict[str, int]) -> ColumnarBundle | None:
+    """Open a cached columnar bundle if it was converted from source."""
+    try:
+        bundle = ColumnarBundle.open(path)
+    except (OSError, ValueError):
+        return None
+    if bundle.source != source:
+        bundle.close()
+        return None
+    return bundle
+
+
 class SeedRegistry:
     """Two-tier registry for validated (level_name, seed, variant) entries."""
 
@@ -99,12 +165,12 @@ class SeedRegistry:
         resolved.parent.mkdir(parents=True, exist_ok=True)
         self._db_path = resolved
 
-        # Per-level in-memory bundled cache: missing key = not yet loaded;
-        # empty dict = no bundled data (file absent or schema stale).
-        # Indexed by seed (one entry per seed — the valid variant or a single
-        # impossible marker).
-        self._bundled: dict[str, dict[int, dict]] = {}
+        # Per-level bundled data: missing key = not yet loaded; None = no
+        # bundled data (file absent or schema stale). One index row per seed —
+        # the valid variant or a single impossible marker.
+        self._bundled: dict[str, ColumnarBundle | None] = {}
         self._schema_checked: set[str] = set()
+        self._columnar_dir = resolved.parent / "bundles"
 
         # Per-level schema hash cache: computed once per session per level.
         # Used to validate SQLite entries so stale cached results (written by
@@ -182,6 +248,18 @@ class SeedRegistry:
                     conn.execute(col_def)
                 except sqlite3.OperationalError:
                     pass
+            # Covers lookup()/lookup_many() so they never read the JSON columns.
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS seed_validity_status
+                ON seed_validity (level_name, seed, variant, status, schema_hash)
+            """)
+            conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS lookup_keys (
+                    position INTEGER PRIMARY KEY,
+                    seed     INTEGER NOT NULL,
+                    variant  INTEGER NOT NULL
+                )
+            """)
             conn.commit()
             self._conn = conn
         return self._conn
@@ -193,63 +271,108 @@ class SeedRegistry:
         return self._current_schema_hashes[level_name]
 
     def _load_bundled(self, level_name: str) -> None:
-        """Load and validate bundled lzma data for level_name into memory.
+        """Load and validate bundled data for level_name.
+
+        If the bundle file is absent, _bundled[level_name] is set to None (no
+        bundled data available; falls through to SQLite).
 
-        If the bundle file is absent, _bundled[level_name] is set to an empty
-        dict (no bundled data available; falls through to SQLite).
+        A columnar copy in the cache directory is used when it was converted
+        from the current bundle file; otherwise the bundle is decompressed and
+        converted. If the conversion cannot be written, the columnar arrays
+        are built in memory instead.
 
         If the schema hash mismatches, a WARNING is logged, _bundled[level_name]
-        is set to an empty dict, and the bundled tier is skipped for this level
-        for the remainder of the process. Experiment continues via SQLite.
+        is set to None, and the bundled tier is skipped for this level for the
+        remainder of the process. Experiment continues via SQLite.
         """
         self._schema_checked.add(level_name)
+        self._bundled[level_name] = None
         bundle_path = _BUNDLE_DIR / f"{level_name}.json.lzma"
 
         if not bundle_path.exists():
-            self._bundled[level_name] = {}
             return
 
-        with lzma.open(bundle_path, "rt", encoding="utf-8") as fh:
-            data = json.load(fh)
+        source = bundle_source(bundle_path)
+        columnar_path = self._columnar_dir / f"{level_name}.columnar"
+        bundle = _open_columnar(columnar_path, source)
+        if bundle is None:
+            with lzma.open(bundle_path, "rt", encoding="utf-8") as fh:
+                data = json.load(fh)
+            try:
+                encoded = encode_columnar_bundle(data, source=source)
+            except ValueError as exc:
+                logger.warning(
+                    "SeedRegistry: cannot index bundled data for '%s' (%s). "
+                    "Bundled tier will be skipped for this level.",
+                    level_name,
+                    exc,
+                )
+                return
+            try:
+                write_columnar_bundle(columnar_path, encoded)
+                bundle = ColumnarBundle.open(columnar_path)
+            except (OSError, ValueError) as exc:
+                logger.debug(
+                    "SeedRegistry: keeping bundle for '%s' in memory (%s)",
+                    level_name,
+                    exc,
+                )
+                bundle = ColumnarBundle(encoded)
 
-        stored_hash = data.get("schema_hash", "")
         current_hash = self._get_current_schema_hash(level_name)
-
-        if stored_hash != current_hash:
+        if bundle.schema_hash != current_hash:
             logger.warning(
                 "SeedRegistry: bundled data for '%s' has a stale schema hash "
                 "(stored=%.8s, current=%.8s). Bundled tier will be skipped "
                 "for this level. Run `python -m interphyre.validation._bundle` "
                 "to regenerate.",
                 level_name,
-                stored_hash,
+                bundle.schema_hash,
                 current_hash,
             )
-            self._bundled[level_name] = {}
+            bundle.close()
             return
 
-        entries = data.get("entries", [])
-        # Index by seed: one entry per seed.  Bundles generated before the
-        # compact-format change may contain multiple entries per seed (one per
-        # variant tried); in that case, prefer the valid entry over any
-        # impossible entries so the correct scene and solution are served.
-        seed_map: dict[int, dict] = {}
-        for entry in entries:
-            s = entry["seed"]
-            if s not in seed_map or entry["status"] == "valid":
-                seed_map[s] = entry
-        self._bundled[level_name] = seed_map
+        self._bundled[level_name] = bundle
         logger.debug(
             "SeedRegistry: loaded bundle for '%s' (%d entries, oracle_commit=%s)",
             level_name,
-            len(entries),
-            data.get("oracle_commit", "unknown"),
+            len(bundle),
+            bundle.oracle_commit,
         )
 
-    def _ensure_bundled(self, level_name: str) -> None:
-        """Load bundled data for level_name on first access."""
+    def _ensure_bundled(self, level_name: str) -> ColumnarBundle | None:
+        """Load bundled data for level_name on first access and return it."""
         if level_name not in self._schema_checked:
             self._load_bundled(level_name)
+        return self._bundled.get(level_name)
+
+    def _bundled_index(self, level_name: str) -> np.ndarray:
+        """Return the bundled seed index for level_name (empty if no bundle)."""
+        bundle = self._ensure_bundled(level_name)
+        return bundle.index if bundle is not None else np.zeros(0, INDEX_DTYPE)
+
+    def _bundled_row(self, level_name: str, seed: int, variant: int) -> int | None:
+        """Return the bundle row storing (seed, variant), or None."""
+        bundle = self._ensure_bundled(level_name)
+        if bundle is None:
+            return None
+        row = bundle.find(seed)
+        if row is None or bundle.variant(row) != variant:
+            return None
+        return row
+
+    def bundled_status(self, level_name: str, seed: int) -> tuple[str, int] | None:
+        """Return (status, variant) of seed's bundled entry, or None.
+
+        Unlike get_valid_entry(), this reads only the seed index: the scene
+        and solution are not decoded.
+        """
+        bundle = self._ensure_bundled(level_name)
+        row = bundle.find(seed) if bundle is not None else None
+        if row is None:
+            return None
+        return bundle.status(row), bundle.variant(row)
 
     def get_valid_entry(self, level_name: str, seed: int) -> dict | None:
         """Return the stored bundle entry for seed, or None if not in the bundle.
@@ -260,28 +383,27 @@ class SeedRegistry:
 
         Only covers the bundled tier; live-validated seeds go through lookup().
         """
-        self._ensure_bundled(level_name)
-        return self._bundled.get(level_name, {}).get(seed)
+        bundle = self._ensure_bundled(level_name)
+        return bundle.get(seed) if bundle is not None else None
 
     def lookup(self, level_name: str, seed: int, variant: int = 0) -> str | None:
         """Return the status string for (level_name, seed, variant), or None.
 
-        Checks bundled data first (O(1) in-memory after first access per level),
-        then falls back to user SQLite cache.
+        Checks bundled data first (O(1) after first access per level), then
+        falls back to user SQLite cache.
 
         For the bundled tier, a seed's entry stores the first valid variant
         (or variant=0 for impossible seeds).  A query for a different variant
         of a valid seed returns "impossible" so the caller's scan loop keeps
         advancing until it reaches the stored valid variant.
         """
-        self._ensure_bundled(level_name)
-
-        entry = self._bundled.get(level_name, {}).get(seed)
-        if entry is not None:
-            if entry["status"] == "valid":
+        bundled = self.bundled_status(level_name, seed)
+        if bundled is not None:
+            status, stored_variant = bundled
+            if status == "valid":
                 # Only the stored variant is confirmed valid.
-                return "valid" if entry["variant"] == variant else "impossible"
-            return entry["status"]  # "impossible"
+                return "valid" if stored_variant == variant else "impossible"
+            return status  # "impossible"
 
         row = (
             self._get_conn()
@@ -300,6 +422,89 @@ class SeedRegistry:
             return None
         return row[0]
 
+    def lookup_many(
+        self, level_name: str, seeds: Sequence[int], variants: Sequence[int] | int = 0
+    ) -> list[str | None]:
+        """Return lookup() for each (seed, variant) pair, in order.
+
+        Bundled seeds are resolved from the seed index in one vectorized pass.
+        The rest are written to a temporary table and joined against the
+        SQLite cache in a single query, instead of one SELECT per pair.
+
+        Args:
+            level_name: Level to look up.
+            seeds: Seeds to look up.
+            variants: Variant of each seed, or one variant for all of them.
+
+        Raises:
+            ValueError: If seeds and variants have different lengths.
+        """
+        seeds_arr = np.asarray(seeds, dtype=np.int64).reshape(-1)
+        variants_arr = np.asarray(variants, dtype=np.int64).reshape(-1)
+        if variants_arr.size == 1:
+            variants_arr = np.full_like(seeds_arr, variants_arr[0])
+        if variants_arr.shape != seeds_arr.shape:
+            raise ValueError(
+                f"lookup_many: got {len(seeds_arr)} seeds but "
+                f"{len(variants_arr)} variants"
+            )
+        statuses: list[str | None] = [None] * len(seeds_arr)
+
+        bundle = self._ensure_bundled(level_name)
+        if bundle is not None:
+            rows = bundle.find_many(seeds_arr)
+            bundled = np.flatnonzero(rows >= 0)
+            index = bundle.index[rows[bundled]]
+            codes = index["status"].astype(np.intp)
+            # Same rule as lookup(): only the stored variant of a valid seed
+            # is valid, the others read as impossible.
+            valid = STATUSES.index("valid")
+            codes[(codes == valid) & (index["variant"] != variants_arr[bundled])] = (
+                STATUSES.index("impossible")
+            )
+            for position, code in zip(bundled.tolist(), codes.tolist()):
+                statuses[position] = STATUSES[code]
+            missing = np.flatnonzero(rows < 0)
+        else:
+            missing = np.arange(len(seeds_arr))
+
+        if not len(missing):
+            return statuses
+
+        conn = self._get_conn()
+        # Filling the key table opens a transaction; end it afterwards unless
+        # the caller already had one open (e.g. inside batched()).
+        own_transaction = not conn.in_transaction
+        try:
+            conn.executemany(
+                "INSERT INTO temp.lookup_keys (position, seed, variant) VALUES (?, ?, ?)",
+                zip(
+                    missing.tolist(),
+                    seeds_arr[missing].tolist(),
+                    variants_arr[missing].tolist(),
+                ),
+            )
+            hits = conn.execute(
+                """
+                SELECT k.position, s.status, s.schema_hash
+                FROM temp.lookup_keys AS k
+                JOIN seed_validity AS s
+                    ON s.level_name = ? AND s.seed = k.seed AND s.variant = k.variant
+                """,
+                (level_name,),
+            ).fetchall()
+        finally:
+            conn.execute("DELETE FROM temp.lookup_keys")
+            if own_transaction:
+                conn.commit()
+
+        current_hash = self._get_current_schema_hash(level_name)
+        for position, status, stored_hash in hits:
+            # Stale rows are cache misses, as in lookup().
+            if stored_hash == current_hash:
+                statuses[position] = status
+        return statuses
+
     def record(
         self,
         level_name: str,
@@ -339,13 +544,45 @@ class SeedRegistry:
         if self._auto_flush:
             self._get_conn().commit()
 
+    def record_many(self, rows: Iterable[tuple]) -> None:
+        """Write or overwrite many entries in the user SQLite cache at once.
+
+        Each row holds record()'s positional arguments: (level_name, seed,
+        variant, status), optionally followed by scene_dict and solution.
+        All rows are inserted with a single executemany() and one commit.
+        """
+        checked_at = datetime.now(tz=timezone.utc).isoformat()
+        params = []
+        for level_name, seed, variant, status, *extra in rows:
+            scene_dict, solution = (*extra, None, None)[:2]
+            params.append(
+                (
+                    level_name,
+                    seed,
+                    variant,
+                    status,
+                    json.dumps(scene_dict) if scene_dict is not None else None,
+                    checked_at,
+                    json.dumps(solution) if solution is not None else None,
+                    self._get_current_schema_hash(level_name),
+                )
+            )
+        self._get_conn().executemany(
+            """
+            INSERT OR REPLACE INTO seed_validity
+                (level_name, seed, variant, status, scene_json, checked_at, solution_json, schema_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            params,
+        )
+        if self._auto_flush:
+            self._get_conn().commit()
+
     def get_scene_dict(self, level_name: str, seed: int, variant: int) -> dict | None:
         """Return the stored scene dict from bundled data or SQLite, or None."""
-        self._ensure_bundled(level_name)
-
-        entry = self._bundled.get(level_name, {}).get(seed)
-        if entry is not None and entry.get("variant") == variant:
-            return entry.get("scene")
+        row = self._bundled_row(level_name, seed, variant)
+        if row is not None:
+            return self._bundled[level_name].scene(row)
 
         row = (
             self._get_conn()
@@ -367,11 +604,9 @@ class SeedRegistry:
         no solution was recorded (levels without a registered solver, impossible
         seeds, or bundles generated before the solver-registry refactor).
         """
-        self._ensure_bundled(level_name)
-
-        entry = self._bundled.get(level_name, {}).get(seed)
-        if entry is not None and entry.get("variant") == variant:
-            return entry.get("solution")
+        row = self._bundled_row(level_name, seed, variant)
+        if row is not None:
+            return self._bundled[level_name].solution(row)
 
         row = (
             self._get_conn()
@@ -391,21 +626,23 @@ class SeedRegistry:
         Deduplicates by seed: SQLite entries whose seed is already covered by
         the bundled tier are not double-counted.
         """
-        self._ensure_bundled(level_name)
-
-        bundled = self._bundled.get(level_name, {})
-        bundled_count = sum(1 for e in bundled.values() if e["status"] == status)
-        bundled_seeds = set(bundled.keys())
+        index = self._bundled_index(level_name)
+        bundled_count = (
+            int(np.count_nonzero(index["status"] == STATUSES.index(status)))
+            if status in STATUSES
+            else 0
+        )
 
-        sql_rows = (
+        sql_seeds = np.array(
             self._get_conn()
             .execute(
-                "SELECT seed, variant FROM seed_validity WHERE level_name=? AND status=?",
+                "SELECT seed FROM seed_validity WHERE level_name=? AND status=?",
                 (level_name, status),
             )
-            .fetchall()
-        )
-        sql_count = sum(1 for row in sql_rows if row[0] not in bundled_seeds)
+            .fetchall(),
+            dtype=np.int64,
+        ).reshape(-1)
+        sql_count = int(np.count_nonzero(~np.isin(sql_seeds, index["seed"])))
 
         return bundled_count + sql_count
 
@@ -414,28 +651,27 @@ class SeedRegistry:
 
         Merges bundled and SQLite tiers; deduplicates by seed.
         """
-        self._ensure_bundled(level_name)
+        index = self._bundled_index(level_name)
+        valid = index[index["status"] == STATUSES.index("valid")]
 
-        bundled = self._bundled.get(level_name, {})
-        valid: dict[int, int] = {
-            seed: entry["variant"]
-            for seed, entry in bundled.items()
-            if entry["status"] == "valid"
-        }
-
-        sql_rows = (
+        sql_rows = np.array(
             self._get_conn()
             .execute(
                 "SELECT seed, variant FROM seed_validity WHERE level_name=? AND status='valid'",
                 (level_name,),
             )
-            .fetchall()
-        )
-        for row in sql_rows:
-            if row[0] not in valid:
-                valid[row[0]] = row[1]
-
-        return sorted(valid.items(), key=lambda pair: pair[0])
+            .fetchall(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        sql_rows = sql_rows[~np.isin(sql_rows[:, 0], valid["seed"])]
+        # Several valid variants of one seed: keep the first row, as before.
+        _, first = np.unique(sql_rows[:, 0], return_index=True)
+        sql_rows = sql_rows[np.sort(first)]
+
+        seeds = np.concatenate([valid["seed"], sql_rows[:, 0]])
+        variants = np.concatenate([valid["variant"], sql_rows[:, 1]])
+        order = np.argsort(seeds, kind="stable")
+        return list(zip(seeds[order].tolist(), variants[order].tolist()))
 
     def bundle_valid_rate(self, level_name: str) -> float | None:
         """Return the fraction of bundled seeds with status 'valid', or None if no bundle.
@@ -445,16 +681,23 @@ class SeedRegistry:
         Used to warn before entering the oracle search loop on known-impossible
         or near-impossible levels.
         """
-        self._ensure_bundled(level_name)
-        bundled = self._bundled.get(level_name, {})
-        if not bundled:
+        statuses = self._bundled_index(level_name)["status"]
+        if not len(statuses):
             return None
-        total = len(bundled)
-        valid = sum(1 for entry in bundled.values() if entry["status"] == "valid")
-        return valid / total
+        return float(np.count_nonzero(statuses == STATUSES.index("valid"))) / len(
+            statuses
+        )
 
     def close(self) -> None:
-        """Close the underlying SQLite connection if it was opened."""
+        """Close the SQLite connection and unmap bundled data.
+
+        Bundled data is reopened on the next access.
+        """
+        for bundle in self._bundled.values():
+            if bundle is not None:
+                bundle.close()
+        self._bundled.clear()
+        self._schema_checked.clear()
         if self._conn is not None:
             self._conn.close()
             self._conn = None
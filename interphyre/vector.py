@@ -0,0 +1,416 @@
+"""Vectorized Interphyre environments with shared-memory image observations.
+
+InterphyreVectorEnv runs N InterphyreEnv instances, each with its own level
+and seed, and stacks their image observations into one preallocated
+(N, H, W[, 3]) array. In asynchronous mode every sub-environment lives in its
+own process and renders straight into shared memory, so only rewards, flags
+and a few scalar info fields travel through the pipes.
+
+Every Interphyre episode is one step long, so each step() ends every episode
+whose action was valid. Those environments are reset in the same call using
+InterphyreEnv.reset(), which rewinds the already-built world with
+reset_attempt(); the returned observation is the new episode's first frame and
+the frame the episode ended on is reported in infos["final_obs"].
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import traceback
+from collections.abc import Sequence
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import gymnasium as gym
+import numpy as np
+
+from interphyre.config import SimulationConfig
+from interphyre.environment import InterphyreEnv
+from interphyre.level import Level
+
+try:
+    from gymnasium.vector import AutoresetMode
+
+    _METADATA: dict[str, Any] = {"autoreset_mode": AutoresetMode.SAME_STEP}
+except ImportError:
+    _METADATA = {}
+
+# Scalar info fields gathered from every sub-environment after step().
+_STEP_INFO_KEYS = (
+    "level_name",
+    "success",
+    "step_count",
+    "termination_reason",
+    "invalid_action",
+)
+
+
+class InterphyreVectorEnv(gym.vector.VectorEnv):
+    """N Interphyre environments stepped together, with stacked image observations.
+
+    Each sub-environment may use a different level and seed, as long as all of
+    them take actions of the same shape. The batched action space stacks each
+    level's own bounds; single_action_space covers all of them.
+
+    Example:
+        from interphyre import list_levels
+        from interphyre.vector import InterphyreVectorEnv
+
+        envs = InterphyreVectorEnv(list_levels(), asynchronous=True,
+                                   image_size=(224, 224))
+        obs, infos = envs.reset(seed=0)          # (25, 224, 224, 3) uint8
+        obs, rewards, terminated, truncated, infos = envs.step(
+            envs.action_space.sample()
+        )
+        envs.close()
+
+    Attributes:
+        num_envs (int): Number of sub-environments
+        level_names (tuple[str, ...]): Level name of each sub-environment
+        asynchronous (bool): True when sub-environments run in worker processes
+    """
+
+    metadata = {"name": "InterphyreVectorEnv", **_METADATA}
+
+    def __init__(
+        self,
+        levels: Sequence[str | Level],
+        seeds: Sequence[int | None] | int | None = None,
+        *,
+        asynchronous: bool = False,
+        config: SimulationConfig | None = None,
+        action_type: str = "continuous",
+        image_size: tuple[int, int] = (600, 600),
+        image_ppm: float = 60.0,
+        discrete_colors: bool = False,
+        validate: bool = True,
+        copy: bool = True,
+        context: str | None = None,
+    ):
+        """Create one InterphyreEnv per entry of levels.
+
+        Args:
+            levels: Level name or pre-built Level for each sub-environment.
+                Pre-built levels must be picklable in asynchronous mode.
+            seeds: Level seed for each sub-environment, or one seed shared by
+                all of them (default: None, seed 0 as in InterphyreEnv)
+            asynchronous: If True, run each sub-environment in its own process.
+            config: Simulation configuration shared by all sub-environments
+            action_type: "continuous" or "discrete", as in InterphyreEnv
+            image_size: Observation size (width, height)
+            image_ppm: Pixels per Box2D unit for rendering
+            discrete_colors: If True, observations are single-channel class maps
+            validate: Passed through to each InterphyreEnv
+            copy: If True, reset() and step() return a copy of the observation
+                buffer; if False, they return the buffer itself, which the next
+                call overwrites.
+            context: multiprocessing start method for asynchronous mode
+                (default: the platform default)
+
+        Raises:
+            ValueError: If levels is empty, seeds has the wrong length, or the
+                levels' action shapes differ.
+        """
+        n = len(levels)
+        if n == 0:
+            raise ValueError("levels must contain at least one level")
+        if seeds is None or isinstance(seeds, int):
+            seeds = [seeds] * n
+        if len(seeds) != n:
+            raise ValueError(f"Expected {n} seeds, got {len(seeds)}")
+
+        env_kwargs = {
+            "config": config,
+            "observation_type": "image",
+            "action_type": action_type,
+            "image_size": image_size,
+            "image_ppm": image_ppm,
+            "discrete_colors": discrete_colors,
+            "validate": validate,
+        }
+        self.num_envs = n
+        self.asynchronous = asynchronous
+        self.copy = copy
+        self.level_names = tuple(
+            level.name if isinstance(level, Level) else level for level in levels
+        )
+
+        width, height = image_size
+        frame_shape = (height, width) if discrete_colors else (height, width, 3)
+        buffer_shape = (n, *frame_shape)
+        nbytes = int(np.prod(buffer_shape))
+        self._closed = False
+        self._shared: list[SharedMemory] = []
+        if asynchronous:
+            self._shared = [SharedMemory(create=True, size=nbytes) for _ in range(2)]
+            self._obs = np.ndarray(buffer_shape, np.uint8, self._shared[0].buf)
+            self._final_obs = np.ndarray(buffer_shape, np.uint8, self._shared[1].buf)
+            ctx = mp.get_context(context)
+            self._pipes = []
+            self._processes = []
+            for i, (level, seed) in enumerate(zip(levels, seeds)):
+                parent, child = ctx.Pipe()
+                process = ctx.Process(
+                    target=_worker,
+                    name=f"InterphyreVectorEnv-{i}",
+                    args=(
+                        i,
+                        level,
+                        seed,
+                        env_kwargs,
+                        [shm.name for shm in self._shared],
+                        buffer_shape,
+                        child,
+                        parent,
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                self._pipes.append(parent)
+                self._processes.append(process)
+            spaces = self._gather([("spaces", None)] * n)
+        else:
+            self._obs = np.zeros(buffer_shape, np.uint8)
+            self._final_obs = np.zeros(buffer_shape, np.uint8)
+            self.envs = [
+                InterphyreEnv(level, seed=seed, **env_kwargs)
+                for level, seed in zip(levels, seeds)
+            ]
+            spaces = [(env.observation_space, env.action_space) for env in self.envs]
+
+        self.single_observation_space = spaces[0][0]
+        self.observation_space = gym.spaces.Box(
+            low=0, high=255, shape=buffer_shape, dtype=np.uint8
+        )
+        action_spaces = [action_space for _, action_space in spaces]
+        self.single_action_space, self.action_space = _stack_action_spaces(
+            action_spaces
+        )
+        if self.single_action_space is None:
+            self.close()
+            raise ValueError(
+                "All levels in an InterphyreVectorEnv must share one action shape"
+            )
+
+    def reset(
+        self,
+        *,
+        seed: int | Sequence[int | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        """Reset every sub-environment.
+
+        Args:
+            seed: RNG seed for each sub-environment's np_random, or one int from
+                which seeds seed, seed+1, ... are derived. Level geometry is
+                fixed at construction and is not affected.
+            options: Passed to each InterphyreEnv.reset()
+
+        Returns:
+            (observations, infos) with observations of shape (N, H, W[, 3]).
+        """
+        if seed is None or isinstance(seed, int):
+            seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        else:
+            seeds = list(seed)
+            if len(seeds) != self.num_envs:
+                raise ValueError(f"Expected {self.num_envs} seeds, got {len(seeds)}")
+
+        if self.asynchronous:
+            results = self._gather([("reset", (s, options)) for s in seeds])
+        else:
+            results = []
+            for i, env in enumerate(self.envs):
+                obs, info = env.reset(seed=seeds[i], options=options)
+                self._obs[i] = obs
+                results.append(info["level_name"])
+        infos = {"level_name": np.array(results)}
+        return self._observations(), infos
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """Run one episode in every sub-environment and reset the finished ones.
+
+        Args:
+            actions: Batched actions of shape (N, k*3), one row per
+                sub-environment.
+
+        Returns:
+            (observations, rewards, terminated, truncated, infos). infos holds
+            one array per field in level_name, success, step_count,
+            termination_reason and invalid_action, plus final_obs (the frame
+            each episode ended on) with its _final_obs mask; sub-environments
+            whose action was invalid keep their episode and are not reset.
+        """
+        actions = np.asarray(actions)
+        if len(actions) != self.num_envs:
+            raise ValueError(
+                f"Expected actions for {self.num_envs} environments, got {len(actions)}"
+            )
+        if self.asynchronous:
+            results = self._gather([("step", action) for action in actions])
+        else:
+            results = [
+                _step_and_reset(env, action, self._obs, self._final_obs, i)
+                for i, (env, action) in enumerate(zip(self.envs, actions))
+            ]
+
+        rewards = np.array([r[0] for r in results], dtype=np.float64)
+        terminated = np.array([r[1] for r in results], dtype=bool)
+        truncated = np.array([r[2] for r in results], dtype=bool)
+        infos: dict[str, Any] = {
+            key: np.array([r[3][key] for r in results]) for key in _STEP_INFO_KEYS
+        }
+        infos["_final_obs"] = ~infos["invalid_action"]
+        infos["final_obs"] = self._final_obs.copy() if self.copy else self._final_obs
+        return self._observations(), rewards, terminated, truncated, infos
+
+    def close_extras(self, **kwargs: Any) -> None:
+        """Stop worker processes and release the observation buffers."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.asynchronous:
+            for pipe in self._pipes:
+                try:
+                    pipe.send(("close", None))
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in self._processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for pipe in self._pipes:
+                pipe.close()
+            del self._obs, self._final_obs
+            for shm in self._shared:
+                shm.close()
+                shm.unlink()
+        else:
+            for env in self.envs:
+                env.close()
+
+    def close(self, **kwargs: Any) -> None:
+        """Close all sub-environments."""
+        self.close_extras(**kwargs)
+
+    def __del__(self):
+        if not getattr(self, "_closed", True):
+            self.close_extras()
+
+    def _observations(self) -> np.ndarray:
+        return self._obs.copy() if self.copy else self._obs
+
+    def _gather(self, commands: list[tuple[str, Any]]) -> list[Any]:
+        """Send one command to every worker, then collect all replies."""
+        for pipe, command in zip(self._pipes, commands):
+            pipe.send(command)
+        replies = [pipe.recv() for pipe in self._pipes]
+        for i, (ok, payload) in enumerate(replies):
+            if not ok:
+                raise RuntimeError(
+                    f"InterphyreVectorEnv worker {i} ({self.level_names[i]}) "
+                    f"failed:\n{payload}"
+                )
+        return [payload for _, payload in replies]
+
+
+def _stack_action_spaces(
+    spaces: list[gym.Space],
+) -> tuple[gym.Space | None, gym.Space | None]:
+    """(single, batched) action spaces, or (None, None) if shapes differ."""
+    first = spaces[0]
+    if isinstance(first, gym.spaces.MultiDiscrete):
+        if any(
+            not isinstance(s, gym.spaces.MultiDiscrete) or s.shape != first.shape
+            for s in spaces
+        ):
+            return None, None
+        nvec = np.stack([s.nvec for s in spaces])
+        single = gym.spaces.MultiDiscrete(nvec.max(axis=0))
+        return single, gym.spaces.MultiDiscrete(nvec)
+    if any(not isinstance(s, gym.spaces.Box) or s.shape != first.shape for s in spaces):
+        return None, None
+    low = np.stack([s.low for s in spaces])
+    high = np.stack([s.high for s in spaces])
+    single = gym.spaces.Box(low.min(axis=0), high.max(axis=0), dtype=first.dtype)
+    return single, gym.spaces.Box(low, high, dtype=first.dtype)
+
+
+def _step_and_reset(
+    env: InterphyreEnv,
+    action: np.ndarray,
+    obs_buffer: np.ndarray,
+    final_buffer: np.ndarray,
+    index: int,
+) -> tuple[float, bool, bool, dict[str, Any]]:
+    """Step one sub-environment, writing its frames into the shared buffers."""
+    obs, reward, terminated, truncated, info = env.step(action)
+    invalid = bool(info.get("invalid_action", False))
+    summary = {
+        "level_name": info["level_name"],
+        "success": bool(info["success"]),
+        "step_count": int(info["step_count"]),
+        "termination_reason": info.get("termination_reason", ""),
+        "invalid_action": invalid,
+    }
+    if invalid:
+        obs_buffer[index] = obs
+    else:
+        final_buffer[index] = obs
+        obs_buffer[index] = env.reset()[0]
+    return float(reward), bool(terminated), bool(truncated), summary
+
+
+def _worker(
+    index: int,
+    level: str | Level,
+    seed: int | None,
+    env_kwargs: dict[str, Any],
+    shm_names: list[str],
+    buffer_shape: tuple[int, ...],
+    pipe: Any,
+    parent_pipe: Any,
+) -> None:
+    """Serve one sub-environment over pipe until told to close.
+
+    Top-level function required for multiprocessing pickling on macOS (spawn).
+    Replies are (ok, payload); failures send the formatted traceback.
+    """
+    parent_pipe.close()
+    shared = [SharedMemory(name=name) for name in shm_names]
+    obs_buffer = np.ndarray(buffer_shape, np.uint8, shared[0].buf)
+    final_buffer = np.ndarray(buffer_shape, np.uint8, shared[1].buf)
+    env = None
+    try:
+        while True:
+            command, data = pipe.recv()
+            try:
+                if command == "close":
+                    break
+                if env is None:
+                    env = InterphyreEnv(level, seed=seed, **env_kwargs)
+                if command == "spaces":
+                    reply: Any = (env.observation_space, env.action_space)
+                elif command == "reset":
+                    obs, info = env.reset(seed=data[0], options=data[1])
+                    obs_buffer[index] = obs
+                    reply = info["level_name"]
+                elif command == "step":
+                    reply = _step_and_reset(env, data, obs_buffer, final_buffer, index)
+                else:
+                    raise ValueError(f"Unknown command: {command}")
+                pipe.send((True, reply))
+            except Exception:
+                pipe.send((False, traceback.format_exc()))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if env is not None:
+            env.close()
+        del obs_buffer, final_buffer
+        for shm in shared:
+            shm.close()
+        pipe.close()
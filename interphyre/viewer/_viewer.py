@@ -37,6 +37,7 @@ def _make_renderer(
             video_format=video_format,
             fps=60,
             output_path=video_path,
+            streaming=True,
         )
     return PygameRenderer(width=600, height=600, ppm=60)
 
@@ -5,6 +5,7 @@ Shared pytest fixtures for interphyre tests.
 import pytest
 
 from interphyre import InterphyreEnv, SimulationConfig
+from interphyre.validation import _get_registry
 
 
 @pytest.fixture
@@ -42,3 +43,14 @@ def intervention_env(intervention_config):
     env = InterphyreEnv("two_body_problem", seed=42, config=intervention_config)
     yield env
     env.close()
+
+
+@pytest.fixture
+def bundled_solution():
+    """Return a function giving a seed's bundled solution as a step() action."""
+
+    def solution(level_name: str, seed: int = 0):
+        entry = _get_registry().get_valid_entry(level_name, seed)
+        return [tuple(p) for p in entry["solution"]]
+
+    return solution
@@ -0,0 +1,196 @@
+"""
+Tests for BatchedBox2DEngine: lockstep rollouts must reproduce env.step().
+"""
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv, SimulationConfig
+from interphyre.engine import BatchedBox2DEngine
+
+
+def _sample_actions(env, rng, n):
+    actions = []
+    k = len(env.level.action_objects)
+    while len(actions) < n:
+        action = [
+            (
+                float(rng.uniform(-4, 4)),
+                float(rng.uniform(-4, 4)),
+                float(rng.uniform(0.2, 1.0)),
+            )
+            for _ in range(k)
+        ]
+        result = env.validate_action(action)
+        if not result["invalid"]:
+            actions.append(result["action"])
+    return actions
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "config",
+    [
+        SimulationConfig(),
+        SimulationConfig(early_termination=True, success_hold_shortcut=True),
+    ],
+)
+@pytest.mark.parametrize("level_name", ["two_body_problem", "catapult"])
+def test_batch_matches_sequential_env_step(level_name, config):
+    """Every world reproduces env.reset() + env.step() bit for bit, run after run."""
+    rng = np.random.default_rng(0)
+    probe = InterphyreEnv(level_name, seed=0, config=config)
+    n = 3
+    batch = BatchedBox2DEngine(probe.level, n, config=config)
+    envs = [InterphyreEnv(level_name, seed=0, config=config) for _ in range(n)]
+    for _ in range(2):
+        actions = _sample_actions(probe, rng, n)
+        result = batch.run(np.array(actions))
+        for i, env in enumerate(envs):
+            env.reset()
+            _, _, _, truncated, info = env.step(actions[i])
+            assert result.success[i] == info["success"]
+            assert result.truncated[i] == truncated
+            assert result.steps[i] == info["step_count"]
+            assert result.termination_reason[i] == info["termination_reason"]
+            for j, name in enumerate(result.body_names):
+                body = env.engine.bodies[name]
+                expected = (
+                    body.position.x,
+                    body.position.y,
+                    body.angle,
+                    body.linearVelocity.x,
+                    body.linearVelocity.y,
+                    body.angularVelocity,
+                )
+                assert tuple(result.final_states[i, j]) == expected
+    for env in envs:
+        env.close()
+    probe.close()
+    batch.close()
+
+
+@pytest.mark.fast
+def test_batch_active_mask_skips_worlds():
+    env = InterphyreEnv("two_body_problem", seed=0)
+    actions = _sample_actions(env, np.random.default_rng(1), 2)
+    batch = BatchedBox2DEngine(env.level, 2, config=env.config)
+    result = batch.run(np.array(actions), max_steps=20, active=[True, False])
+    assert result.steps.tolist() == [20, 0]
+    assert result.termination_reason[1] == ""
+    assert np.isnan(result.final_states[1]).all()
+    assert not np.isnan(result.final_states[0]).any()
+    batch.close()
+    env.close()
+
+
+@pytest.mark.fast
+def test_batch_rejects_bad_shapes():
+    env = InterphyreEnv("two_body_problem", seed=0)
+    with pytest.raises(ValueError, match="n_worlds must be at least 1"):
+        BatchedBox2DEngine(env.level, 0)
+    batch = BatchedBox2DEngine(env.level, 2)
+    with pytest.raises(ValueError, match="Expected positions of shape"):
+        batch.run(np.zeros((3, 3)))
+    with pytest.raises(ValueError, match="Expected active mask"):
+        batch.run(np.zeros((2, 3)), active=[True])
+    batch.close()
+    env.close()
+
+
+@pytest.mark.fast
+def test_step_batch_matches_reset_and_step():
+    """step_batch reports what a reset() + step() per action would."""
+    env = InterphyreEnv("two_body_problem", seed=0)
+    reference = InterphyreEnv("two_body_problem", seed=0)
+    rng = np.random.default_rng(0)
+    actions = _sample_actions(env, rng, 4)
+    actions.append([(100.0, 100.0, 0.5)])
+    result = env.step_batch(np.array(actions))
+    assert result["valid"].tolist() == [True] * 4 + [False]
+    assert result["reward"][-1] == -1.0
+    assert result["termination_reason"][-1] == "invalid"
+    for i, action in enumerate(actions[:4]):
+        reference.reset()
+        _, reward, _, _, info = reference.step(action)
+        assert result["reward"][i] == reward
+        assert result["success"][i] == info["success"]
+        assert result["steps"][i] == info["step_count"]
+    # The env is left ready for a regular attempt.
+    env.step(actions[0])
+    env.close()
+    reference.close()
+
+
+@pytest.mark.fast
+def test_step_batch_workers_match_serial():
+    """A process pool scores the same actions with the same outcomes."""
+    env = InterphyreEnv("two_body_problem", seed=0)
+    actions = _sample_actions(env, np.random.default_rng(2), 6)
+    serial = env.step_batch(actions)
+    pooled = env.step_batch(actions, workers=2)
+    assert pooled["valid"].tolist() == serial["valid"].tolist()
+    assert pooled["steps"].shape == (6,)
+    assert pooled["success"].tolist() == serial["success"].tolist()
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        env.step_batch(actions, workers=0)
+    env.close()
+
+
+@pytest.mark.fast
+def test_branch_many_workers_match_serial():
+    """Pooled counterfactual branches reproduce the serial ones."""
+    from interphyre.interventions import at_step
+    from interphyre.validation import _get_registry
+
+    entry = _get_registry().get_valid_entry("two_body_problem", 0)
+    env = InterphyreEnv("two_body_problem", enable_interventions=True)
+    snapshot, _ = env.run_until(
+        at_step(10), action=[tuple(p) for p in entry["solution"]]
+    )
+    interventions = [
+        None,
+        ("impulse", "red_ball", (0.0, 5.0)),
+        [("set", "red_ball", {"density": 2.0}), ("impulse", "red_ball", (-5.0, 0.0))],
+        ("remove", "green_ball"),
+    ]
+    serial = env.branch_many(snapshot, interventions, 600, return_states=True)
+    pooled = env.branch_many(
+        snapshot, interventions, 600, workers=2, return_states=True
+    )
+    assert serial["success"].tolist() == [True, True, False, False]
+    assert pooled["success"].tolist() == serial["success"].tolist()
+    np.testing.assert_array_equal(pooled["states"], serial["states"])
+    # The removed object has no final state.
+    green = snapshot.layout.object_names.index("green_ball")
+    assert np.isnan(serial["states"][3, green]).all()
+    with pytest.raises(ValueError, match="Invalid intervention"):
+        env.branch_many(snapshot, [("teleport", "red_ball")], 10)
+    env.close()
+
+
+@pytest.mark.fast
+def test_counterfactual_sweep_workers_match_serial():
+    """Pooled sweep jobs reproduce the serial outcome matrix."""
+    from interphyre.interventions import CounterfactualSweep
+    from interphyre.validation import _get_registry
+
+    entry = _get_registry().get_valid_entry("two_body_problem", 0)
+    action = [tuple(p) for p in entry["solution"]]
+    interventions = [
+        None,
+        ("impulse", "red_ball", (0.0, 5.0)),
+        ("remove", "green_ball"),
+    ]
+    outcomes = {}
+    for workers in (None, 2):
+        env = InterphyreEnv("two_body_problem", enable_interventions=True)
+        sweep = CounterfactualSweep(
+            env, interventions, checkpoint_every=25, workers=workers
+        )
+        outcomes[workers] = sweep.run(action=action, steps=600, times=range(0, 600, 60))
+        assert sweep.factual_outcome
+        env.close()
+    np.testing.assert_array_equal(outcomes[2], outcomes[None])
+    assert outcomes[None][:, 0].all()
+    assert not outcomes[None][:, 2].any()
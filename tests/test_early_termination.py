@@ -0,0 +1,189 @@
+"""
+Tests for opt-in rollout shortcuts once the world has settled: early
+termination of failed rollouts and the success-hold shortcut.
+"""
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv, SimulationConfig
+from interphyre.engine import Box2DEngine
+from interphyre.level import Level
+from interphyre.objects import Ball, Bar
+from interphyre.validation import _get_registry
+
+
+def _resting_pair_level(hold_time: float) -> Level:
+    """A ball dropped onto a floor bar; success once they touch for hold_time."""
+
+    def success_condition(engine):
+        return engine.is_in_contact_for_duration("ball", "floor", hold_time)
+
+    return Level(
+        name="early_termination_level",
+        objects={
+            "floor": Bar(x1=-4.0, y1=-4.0, x2=4.0, y2=-4.0, thickness=0.2),
+            "ball": Ball(x=0.0, y=-3.0, radius=0.5, color="green", dynamic=True),
+            "red_ball": Ball(x=3.0, y=3.0, radius=0.3, color="red", dynamic=True),
+        },
+        action_objects=["red_ball"],
+        success_condition=success_condition,
+        metadata={},
+    )
+
+
+@pytest.mark.fast
+def test_early_termination_disabled_by_default():
+    """Default config runs failed rollouts to max_steps."""
+    assert SimulationConfig().early_termination is False
+    level = _resting_pair_level(hold_time=1000.0)
+    env = InterphyreEnv(level, config=SimulationConfig(max_steps=200))
+    _, _, _, truncated, info = env.step([(3.0, 3.0, 0.3)])
+    assert truncated is True
+    assert info["termination_reason"] == "max_steps"
+    assert info["step_count"] == 200
+    env.close()
+
+
+@pytest.mark.fast
+def test_early_termination_stops_settled_failure():
+    """A hold that cannot complete within the budget ends once the world settles."""
+    level = _resting_pair_level(hold_time=1000.0)
+    config = SimulationConfig(max_steps=600, early_termination=True)
+    env = InterphyreEnv(level, config=config)
+    _, _, _, truncated, info = env.step([(3.0, 3.0, 0.3)])
+    assert truncated is True
+    assert info["success"] is False
+    assert info["termination_reason"] == "stationary"
+    assert info["world_stationary"] is True
+    assert info["step_count"] < 600
+    env.close()
+
+
+@pytest.mark.fast
+def test_early_termination_keeps_reachable_hold():
+    """A settled world with the goal pair touching keeps running until the hold completes."""
+    level = _resting_pair_level(hold_time=3.0)
+    config = SimulationConfig(max_steps=600, early_termination=True)
+    env = InterphyreEnv(level, config=config)
+    _, _, terminated, _, info = env.step([(3.0, 3.0, 0.3)])
+    assert terminated is True
+    assert info["success"] is True
+    assert info["termination_reason"] == "success"
+    env.close()
+
+
+@pytest.mark.fast
+def test_success_hold_shortcut_stops_before_hold_completes():
+    """A settled goal contact resolves success without simulating the full hold."""
+    level = _resting_pair_level(hold_time=3.0)
+    full = InterphyreEnv(level, config=SimulationConfig(max_steps=600))
+    _, _, _, _, full_info = full.step([(3.0, 3.0, 0.3)])
+    full.close()
+
+    config = SimulationConfig(max_steps=600, success_hold_shortcut=True)
+    env = InterphyreEnv(_resting_pair_level(hold_time=3.0), config=config)
+    _, reward, terminated, truncated, info = env.step([(3.0, 3.0, 0.3)])
+    assert terminated is True
+    assert truncated is False
+    assert info["success"] is full_info["success"] is True
+    assert reward == 1.0
+    assert info["termination_reason"] == "success_hold"
+    assert info["step_count"] < full_info["step_count"]
+    env.close()
+
+
+@pytest.mark.fast
+def test_success_hold_shortcut_respects_budget():
+    """A hold that would finish after max_steps is not reported as success."""
+    level = _resting_pair_level(hold_time=3.0)
+    config = SimulationConfig(
+        max_steps=150, early_termination=True, success_hold_shortcut=True
+    )
+    env = InterphyreEnv(level, config=config)
+    _, _, _, truncated, info = env.step([(3.0, 3.0, 0.3)])
+    assert truncated is True
+    assert info["success"] is False
+    env.close()
+
+
+@pytest.mark.fast
+def test_verify_early_termination_runs_full_rollout():
+    """Verification mode simulates the full hold and reports its real outcome."""
+    config = SimulationConfig(
+        max_steps=600, success_hold_shortcut=True, verify_early_termination=True
+    )
+    env = InterphyreEnv(_resting_pair_level(hold_time=3.0), config=config)
+    _, _, terminated, _, info = env.step([(3.0, 3.0, 0.3)])
+    assert terminated is True
+    assert info["termination_reason"] == "success"
+    env.close()
+
+
+@pytest.mark.fast
+def test_verify_early_termination_raises_on_disagreement(monkeypatch):
+    """A shortcut verdict contradicted by the full rollout is an error."""
+    config = SimulationConfig(
+        max_steps=200, success_hold_shortcut=True, verify_early_termination=True
+    )
+    env = InterphyreEnv(_resting_pair_level(hold_time=1000.0), config=config)
+    monkeypatch.setattr(env.engine, "settled_outcome", lambda remaining: True)
+    with pytest.raises(RuntimeError, match="Early termination predicted success"):
+        env.step([(3.0, 3.0, 0.3)])
+    env.close()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "level_name", ["two_body_problem", "cliffhanger", "basket_case", "catapult"]
+)
+def test_early_termination_preserves_outcomes(level_name):
+    """Success/failure is identical with and without the settled-world shortcuts."""
+    registry = _get_registry()
+    rng = np.random.default_rng(0)
+    for seed in range(2):
+        entry = registry.get_valid_entry(level_name, seed)
+        if not entry or entry["status"] != "valid":
+            continue
+        solution = entry["solution"]
+        actions = [solution] + [
+            [
+                (float(rng.uniform(-4, 4)), float(rng.uniform(-4, 4)), p[2])
+                for p in solution
+            ]
+            for _ in range(2)
+        ]
+        envs = [
+            InterphyreEnv(
+                level_name, seed=seed, config=SimulationConfig(early_termination=flag)
+            )
+            for flag in (False, True)
+        ]
+        envs.append(
+            InterphyreEnv(
+                level_name,
+                seed=seed,
+                config=SimulationConfig(
+                    early_termination=True, success_hold_shortcut=True
+                ),
+            )
+        )
+        for action in actions:
+            results = []
+            for env in envs:
+                env.reset()
+                _, _, _, _, info = env.step(action)
+                results.append(info)
+            assert results[0]["success"] == results[1]["success"]
+            assert results[0]["success"] == results[2]["success"]
+            assert results[1]["step_count"] <= results[0]["step_count"]
+            assert results[2]["step_count"] <= results[0]["step_count"]
+        for env in envs:
+            env.close()
+
+
+@pytest.mark.fast
+def test_is_settled_failure_requires_level():
+    engine = Box2DEngine()
+    with pytest.raises(ValueError, match="Level is not set"):
+        engine.is_settled_failure(10)
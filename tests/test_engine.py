@@ -4,8 +4,9 @@ Tests for core engine behaviors that need validation coverage.
 
 import pytest
 
-from interphyre.engine import Box2DEngine
-from interphyre.level import Level
+from interphyre.config import SimulationConfig
+from interphyre.engine import Box2DEngine, LeanContactListener
+from interphyre.level import ContactGoal, Level
 from interphyre.objects import Ball, Bar, Basket, InterphyreObject
 
 
@@ -258,3 +259,184 @@ def test_get_contact_duration_returns_value():
     engine.contact_listener.contact_start_time[pair] = 0.0
     engine.contact_listener.current_time = 2.0
     assert engine.get_contact_duration("ball_a", "ball_b") == pytest.approx(2.0)
+
+
+def _make_goal_level(hold=None):
+    return Level(
+        name="engine_goal_test",
+        objects={
+            "floor": Bar(x1=-4.0, y1=-4.0, x2=4.0, y2=-4.0, thickness=0.2),
+            "ball": Ball(x=0.0, y=-3.0, radius=0.5, dynamic=True),
+        },
+        action_objects=[],
+        success_condition=ContactGoal("ball", "floor", hold=hold),
+        metadata={},
+    )
+
+
+@pytest.mark.fast
+def test_contact_goal_is_a_success_condition():
+    """A ContactGoal evaluates like the equivalent is_in_contact_for_duration call."""
+    level = _make_goal_level()
+    assert level.goal == ContactGoal("ball", "floor")
+    assert _make_level({}).goal is None
+
+    engine = Box2DEngine(level=level)
+    pair = frozenset(("ball", "floor"))
+    engine.contact_listener.contacts.add(pair)
+    engine.contact_listener.contact_start_time[pair] = 0.0
+    engine.contact_listener.current_time = engine.config.default_success_time
+    assert level.success_condition(engine) is True
+    assert ContactGoal("ball", "floor", hold=5.0)(engine) is False
+
+
+@pytest.mark.fast
+def test_goal_ready_time_follows_goal_contact():
+    """The listener's ready time is inf until the goal pair touches, then start + hold."""
+    engine = Box2DEngine(level=_make_goal_level(hold=1.0))
+    listener = engine.contact_listener
+    assert listener.goal_pair == frozenset(("ball", "floor"))
+    assert listener.goal_ready_time == float("inf")
+
+    dt = engine.config.time_step
+    while frozenset(("ball", "floor")) not in listener.contacts:
+        engine.world.Step(
+            dt, engine.config.velocity_iters, engine.config.position_iters
+        )
+        engine.time_update(dt)
+    start = listener.contact_start_time[frozenset(("ball", "floor"))]
+    assert listener.goal_ready_time == pytest.approx(start + 1.0)
+
+    engine.reset(_make_level({}))
+    assert listener.goal_pair is None
+    assert listener.goal_ready_time == 0.0
+
+
+@pytest.mark.fast
+def test_check_success_matches_success_condition():
+    """check_success agrees with the raw predicate at every step of a rollout."""
+    level = _make_goal_level(hold=1.0)
+    engine = Box2DEngine(level=level)
+    dt = engine.config.time_step
+    seen_success = False
+    for _ in range(120):
+        engine.world.Step(
+            dt, engine.config.velocity_iters, engine.config.position_iters
+        )
+        engine.time_update(dt)
+        expected = level.success_condition(engine)
+        assert engine.check_success() is expected
+        seen_success |= expected
+    assert seen_success
+
+
+@pytest.mark.fast
+def test_all_levels_declare_contact_goals():
+    """Every shipped level's success condition is a declarative ContactGoal."""
+    from interphyre.levels import list_levels, load_level
+
+    for name in list_levels():
+        level = load_level(name, seed=0)
+        assert level.goal is not None, name
+        assert level.goal.a in level.objects and level.goal.b in level.objects
+
+
+def _bouncing_level():
+    objects = {
+        f"ball_{i}": Ball(
+            x=-3.0 + 1.5 * i, y=1.0, radius=0.4, restitution=0.9, dynamic=True
+        )
+        for i in range(5)
+    }
+    objects["floor"] = Bar(x1=-4.5, y1=-2.0, x2=4.5, y2=-2.0, thickness=0.2)
+    return Level(
+        name="engine_lean_test",
+        objects=objects,
+        action_objects=[],
+        success_condition=ContactGoal("ball_0", "floor", hold=0.5),
+        metadata={},
+    )
+
+
+def _run_engine(engine, steps):
+    dt = engine.config.time_step
+    for _ in range(steps):
+        engine.world.Step(
+            dt, engine.config.velocity_iters, engine.config.position_iters
+        )
+        engine.time_update(dt)
+
+
+@pytest.mark.fast
+def test_lean_listener_matches_full_listener():
+    """Lean contact tracking reports the same contacts, log and statistics."""
+    full = Box2DEngine(level=_bouncing_level())
+    lean = Box2DEngine(
+        level=_bouncing_level(), config=SimulationConfig(lean_contact_tracking=True)
+    )
+    assert isinstance(lean.contact_listener, LeanContactListener)
+
+    for _ in range(6):
+        _run_engine(full, 25)
+        _run_engine(lean, 25)
+        assert lean.contact_listener.contacts == full.contact_listener.contacts
+        assert (
+            lean.contact_listener.contact_start_time
+            == full.contact_listener.contact_start_time
+        )
+        assert lean.get_contact_log() == full.get_contact_log()
+        assert lean.get_contact_statistics() == full.get_contact_statistics()
+        assert lean.check_success() == full.check_success()
+        assert lean.get_contact_duration("ball_0", "floor") == pytest.approx(
+            full.get_contact_duration("ball_0", "floor")
+        )
+        assert lean.has_contact("ball_1", "floor") == full.has_contact(
+            "ball_1", "floor"
+        )
+
+
+@pytest.mark.fast
+def test_lean_listener_ring_buffer_is_bounded():
+    """The event log keeps only the newest events while statistics count them all."""
+    config = SimulationConfig(lean_contact_tracking=True, contact_event_capacity=4)
+    engine = Box2DEngine(level=_bouncing_level(), config=config)
+    full = Box2DEngine(level=_bouncing_level())
+    _run_engine(engine, 150)
+    _run_engine(full, 150)
+
+    full_log = full.get_contact_log()
+    assert len(full_log) > 4
+    assert engine.get_contact_log() == full_log[-4:]
+    assert engine.get_contact_statistics() == full.get_contact_statistics()
+
+
+@pytest.mark.fast
+def test_lean_listener_state_assignment_round_trip():
+    """Assigning the name-keyed views (as snapshot restore does) rebuilds the arrays."""
+    engine = Box2DEngine(
+        level=_bouncing_level(), config=SimulationConfig(lean_contact_tracking=True)
+    )
+    listener = engine.contact_listener
+    for _ in range(300):
+        _run_engine(engine, 1)
+        if listener.contacts:
+            break
+    contacts = listener.contacts
+    start_times = listener.contact_start_time
+    assert contacts
+
+    listener.ClearContacts()
+    assert listener.contacts == set()
+    assert listener.get_contact_statistics()["total_events"] == 0
+
+    listener.contacts = contacts
+    listener.contact_start_time = start_times
+    listener.SyncGoal()
+    assert listener.contacts == contacts
+    assert listener.contact_start_time == start_times
+
+
+@pytest.mark.fast
+def test_contact_event_capacity_must_be_positive():
+    with pytest.raises(ValueError, match="contact_event_capacity"):
+        SimulationConfig(contact_event_capacity=0)
@@ -401,3 +401,64 @@ def test_branch_restores_on_exception():
     # State must be fully restored after the exception.
     assert abs(env._level.objects["ball"].radius - original_radius) < 1e-6
     env.close()
+
+
+# ============================================================================
+# Action Masks and Valid-Only Sampling
+# ============================================================================
+
+
+@pytest.mark.fast
+def test_discrete_action_mask_matches_validation():
+    """Every mask cell agrees with what step() would accept."""
+    env = InterphyreEnv("the_funnel", seed=0, action_type="discrete")
+    _, info = env.reset()
+    mask = info["action_mask"]
+    assert mask.shape == tuple(env.action_space.nvec)
+    assert mask is env.action_mask()
+    assert not mask.flags.writeable
+    rng = np.random.default_rng(0)
+    for cell in rng.integers(0, mask.shape, size=(300, 3)):
+        invalid = env.validate_action(np.array(cell, dtype=np.int64))["invalid"]
+        assert mask[tuple(cell)] == (not invalid)
+    env.close()
+
+
+@pytest.mark.fast
+def test_action_mask_only_for_discrete_actions():
+    env = InterphyreEnv("the_funnel", seed=0)
+    _, info = env.reset()
+    assert "action_mask" not in info
+    assert env.action_mask() is None
+    env.close()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("action_type", ["continuous", "discrete"])
+def test_sample_valid_action_is_always_valid(action_type):
+    env = InterphyreEnv("the_funnel", seed=0, action_type=action_type)
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        action = env.sample_valid_action(rng)
+        assert env.action_space.contains(action)
+        assert not env.validate_action(action)["invalid"]
+    env.close()
+
+
+@pytest.mark.fast
+def test_sample_valid_action_raises_without_valid_cells():
+    level = Level(
+        name="blocked_level",
+        objects={
+            "red_ball": Ball(x=0.0, y=0.0, radius=0.5, color="red", dynamic=True),
+            "wall": Ball(x=0.0, y=0.0, radius=8.0, dynamic=False),
+        },
+        action_objects=["red_ball"],
+        success_condition=lambda engine: False,
+        metadata={},
+    )
+    env = InterphyreEnv(level, action_type="discrete", validate=False)
+    assert not env.action_mask().any()
+    with pytest.raises(RuntimeError, match="No valid placement"):
+        env.sample_valid_action(np.random.default_rng(0))
+    env.close()
@@ -1,13 +1,20 @@
 """
 Tests for action placement validity — shared logic used by both InterphyreEnv
-and the oracle registry via interphyre.validation.placement.is_valid_placement.
+and the oracle registry via interphyre.validation.placement.is_valid_placement,
+and its vectorized counterpart validate_placements.
 """
 
+import numpy as np
 import pytest
 
 from interphyre.level import Level
 from interphyre.objects import Ball, Bar, Basket
-from interphyre.validation.placement import is_valid_placement
+from interphyre.levels import list_levels, load_level
+from interphyre.validation.placement import (
+    is_valid_placement,
+    placement_geometry,
+    validate_placements,
+)
 
 
 def _make_validation_level():
@@ -92,3 +99,42 @@ def test_action_objects_are_skipped():
     # action_ball is at (-4.0, 4.0, r=0.5) — placing there should be valid
     # because action objects are ignored during collision checking.
     assert is_valid_placement(level, -4.0, 4.0, 0.5) is True
+
+
+@pytest.mark.fast
+def test_validate_placements_matches_scalar_check():
+    """The vectorized check agrees with is_valid_placement on every level."""
+    rng = np.random.default_rng(0)
+    levels = [_make_validation_level()] + [
+        load_level(name, seed=0) for name in list_levels()
+    ]
+    for level in levels:
+        xyr = np.column_stack(
+            [
+                rng.uniform(-5, 5, 500),
+                rng.uniform(-5, 5, 500),
+                rng.uniform(0.05, 1.5, 500),
+            ]
+        )
+        expected = [is_valid_placement(level, *map(float, row)) for row in xyr]
+        assert validate_placements(level, xyr).tolist() == expected, level.name
+
+
+@pytest.mark.fast
+def test_placement_geometry_tracks_moved_objects():
+    level = _make_validation_level()
+    before = placement_geometry(level)
+    assert before.balls.shape == (1, 3)
+    assert before.bars.shape == (1, 6)
+    assert before.slabs.shape == (4, 4)
+    assert placement_geometry(level) is before
+    assert validate_placements(level, [[0.0, -0.6, 0.2]]).tolist() == [False]
+    level.move_object("static_ball", 3.5, 3.5)
+    assert validate_placements(level, [[3.5, 3.5, 0.2]]).tolist() == [False]
+    assert validate_placements(level, [[0.0, -0.6, 0.2]]).tolist() == [True]
+
+
+@pytest.mark.fast
+def test_validate_placements_requires_n_by_3():
+    with pytest.raises(ValueError, match="Expected placements of shape"):
+        validate_placements(_make_validation_level(), np.zeros((4, 2)))
@@ -309,6 +309,135 @@ def test_branch_nested():
     env.close()
 
 
+def test_restore_rebuilds_only_changed_bodies():
+    env = _make_env()
+    env.step_physics(5)
+    snap = _snapshot(env)
+    blue, platform = env.engine.bodies["blue_ball"], env.engine.bodies["platform"]
+    red = env.engine.bodies["red_ball"]
+
+    # No structural change: every body is kept.
+    env.step_physics(10)
+    env.restore(snap)
+    assert env.engine.bodies["red_ball"] is red
+
+    # Bodies created before the edited one are kept; it and later ones are rebuilt.
+    env.set("red_ball", radius=0.3)
+    env.add("extra", Ball(x=-2.0, y=2.0, radius=0.2, color="gray", dynamic=True))
+    env.restore(snap)
+    assert env.engine.bodies["blue_ball"] is blue
+    assert env.engine.bodies["platform"] is platform
+    assert "extra" not in env.engine.bodies
+    body = env.engine.bodies["red_ball"]
+    assert abs(body.fixtures[0].shape.radius - 0.5) < 1e-6
+    assert body.position.y == pytest.approx(snap.objects["red_ball"]["position"][1])
+    env.close()
+
+
+def test_branch_results_independent_of_history():
+    def run(radii):
+        env = _make_env()
+        env.step_physics(5)
+        snap = _snapshot(env)
+        results = {}
+        for r in radii:
+            with env.branch(snap):
+                env.set("red_ball", radius=r)
+                env.step_physics(120)
+                body = env.engine.bodies["blue_ball"]
+                results[r] = (*body.position, body.angle, *body.linearVelocity)
+        env.close()
+        return results
+
+    radii = [0.5, 1.2, 1.7]
+    assert run(radii) == run(radii[::-1])
+
+
+def test_branch_many_matches_branch_loop():
+    env = _make_env()
+    env.step_physics(5)
+    snap = _snapshot(env)
+    expected = []
+    for r in (0.3, 0.7):
+        with env.branch(snap):
+            env.set("red_ball", radius=r)
+            env.step_physics(60)
+            expected.append(tuple(env.engine.bodies["red_ball"].position))
+
+    result = env.branch_many(
+        snap,
+        [("set", "red_ball", {"radius": 0.3}), lambda e: e.set("red_ball", radius=0.7)],
+        60,
+        return_states=True,
+    )
+    names = snap.layout.object_names
+    states = result["states"][:, names.index("red_ball"), :2]
+    assert states.tolist() == [list(p) for p in expected]
+    assert result["success"].tolist() == [False, False]
+    # The environment is left at the snapshot.
+    assert env.step_count == 5
+    assert abs(env._level.objects["red_ball"].radius - 0.5) < 1e-6
+    env.close()
+
+
+def test_restore_keeps_contact_hold_timers():
+    """Contacts touching at capture time do not begin again after a restore."""
+    env = _make_env()
+    env.step_physics(120)  # both balls asleep on the platform
+    snap = _snapshot(env)
+
+    def wake_and_step():
+        env.engine.bodies["red_ball"].awake = True
+        env.step_physics(1)
+        return dict(env.engine.contact_listener.contact_start_time)
+
+    expected = wake_and_step()
+    assert len(expected) == 2
+    env.restore(snap)
+    assert wake_and_step() == expected
+    env.close()
+
+
+def test_counterfactual_sweep_matches_branching():
+    from interphyre.interventions import CounterfactualSweep
+
+    env = _make_env(
+        success_condition=lambda engine: engine.bodies["red_ball"].position.x > 1.0
+    )
+    interventions = [None, ("impulse", "red_ball", (4.0, 0.0))]
+    sweep = CounterfactualSweep(env, interventions, checkpoint_every=8)
+    outcomes = sweep.run(steps=60)
+
+    assert outcomes.shape == (60, 2) and outcomes.dtype == bool
+    assert sorted(sweep.checkpoints) == list(range(0, 60, 8))
+    assert sweep.factual_outcome is False
+    assert not outcomes[:, 0].any()
+    assert outcomes[:, 1].any()
+    assert env.step_count == 0  # back at the start of the rollout
+
+    # Intervening at step 21 branches from the checkpoint at step 16.
+    with env.branch(sweep.checkpoints[16]):
+        env.step_physics(5)
+        env.impulse("red_ball", (4.0, 0.0))
+        env.step_physics(39)
+        assert outcomes[21, 1] == env.success
+
+    positions = CounterfactualSweep(
+        env,
+        interventions,
+        checkpoint_every=8,
+        outcome=lambda e: e.engine.bodies["red_ball"].position.x,
+    ).run(steps=60, times=[0, 21])
+    assert positions.shape == (2, 2) and positions.dtype == float
+    assert (positions[:, 1] > 1.0).tolist() == outcomes[[0, 21], 1].tolist()
+
+    with pytest.raises(ValueError):
+        CounterfactualSweep(env, interventions, checkpoint_every=0)
+    with pytest.raises(ValueError):
+        sweep.run(steps=60, times=[60])
+    env.close()
+
+
 # ── API surface ──
 
 
@@ -0,0 +1,103 @@
+"""
+Tests for evaluate-only environments and lazily built observations.
+"""
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv
+from interphyre.environment import LazyObservation
+
+
+@pytest.mark.fast
+def test_evaluate_only_skips_observations_and_statistics(bundled_solution):
+    action = bundled_solution("catapult")
+    reference = InterphyreEnv("catapult")
+    _, ref_reward, _, _, ref_info = reference.step(action)
+    reference.close()
+
+    env = InterphyreEnv("catapult", observation_type="image", evaluate_only=True)
+    assert env.observation_type is None
+    assert env.observation_space is None
+    obs, _ = env.reset()
+    assert obs is None
+    obs, reward, _, _, info = env.step(action)
+    assert obs is None
+    assert reward == ref_reward
+    assert info["success"] is ref_info["success"] is True
+    assert info["step_count"] == ref_info["step_count"]
+    assert "contact_statistics" not in info
+    env.close()
+
+
+@pytest.mark.fast
+def test_observation_type_none_keeps_full_info(bundled_solution):
+    env = InterphyreEnv("two_body_problem", observation_type=None)
+    obs, _ = env.reset()
+    assert obs is None
+    obs, _, _, _, info = env.step(bundled_solution("two_body_problem"))
+    assert obs is None
+    assert "contact_statistics" in info
+    env.close()
+
+
+@pytest.mark.fast
+def test_lazy_observations_are_not_built_when_dropped(monkeypatch, bundled_solution):
+    env = InterphyreEnv("two_body_problem", lazy_observations=True)
+    calls = []
+    original = env._get_observation
+    monkeypatch.setattr(env, "_get_observation", lambda: calls.append(1) or original())
+    action = bundled_solution("two_body_problem")
+    for _ in range(3):
+        env.reset()
+        env.step(action)
+    assert calls == []
+
+    obs, _ = env.reset()
+    assert isinstance(obs, LazyObservation)
+    assert not obs.computed
+    assert obs["step_count"] == 0
+    assert obs.computed
+    assert calls == [1]
+    env.close()
+
+
+@pytest.mark.fast
+def test_lazy_observation_reflects_state_it_was_returned_for(bundled_solution):
+    """A proxy held across later steps is built before the world changes."""
+    action = bundled_solution("catapult")
+    eager = InterphyreEnv("catapult")
+    eager.reset()
+    expected, *_ = eager.step(action)
+    eager.close()
+
+    env = InterphyreEnv("catapult", lazy_observations=True)
+    initial, _ = env.reset()
+    final, *_ = env.step(action)
+    assert initial.computed and not final.computed
+    assert initial.get()["step_count"] == 0
+    env.reset()
+    assert final.computed
+    result = final.get()
+    assert result["step_count"] == expected["step_count"]
+    for name, state in expected["objects"].items():
+        np.testing.assert_array_equal(
+            result["objects"][name]["position"], state["position"]
+        )
+    env.close()
+
+
+@pytest.mark.fast
+def test_lazy_image_observation_supports_array_access():
+    env = InterphyreEnv(
+        "two_body_problem",
+        observation_type="image",
+        image_size=(32, 32),
+        lazy_observations=True,
+    )
+    obs, _ = env.reset()
+    frame = np.asarray(obs)
+    assert frame.shape == (32, 32, 3)
+    assert frame.dtype == np.uint8
+    assert env.observation_space.contains(frame)
+    env.close()
@@ -0,0 +1,118 @@
+"""
+Tests for the flat "physics_array" observation and the listener-maintained
+contact matrix behind it.
+"""
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv, SimulationConfig
+from interphyre.interventions.state import StateSnapshot
+
+
+def _assert_matches_physics_state(env: InterphyreEnv, obs: dict) -> None:
+    reference = env._get_physics_state()
+    names = list(env.level.objects.keys())
+    assert obs["state"].shape == (len(names), 6)
+    for i, name in enumerate(names):
+        ref = reference["objects"][name]
+        expected = [
+            *ref["position"],
+            *ref["velocity"],
+            ref["angle"],
+            ref["angular_velocity"],
+        ]
+        np.testing.assert_allclose(obs["state"][i], expected, rtol=1e-6, atol=1e-6)
+    np.testing.assert_array_equal(obs["contacts"], reference["contacts"])
+    assert obs["step_count"] == reference["step_count"]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("lean", [False, True])
+@pytest.mark.parametrize("level_name", ["catapult", "basket_case"])
+def test_physics_array_matches_physics_state(level_name, lean, bundled_solution):
+    """State rows and contact matrix agree with physics_state throughout a rollout."""
+    config = SimulationConfig(lean_contact_tracking=lean)
+    env = InterphyreEnv(level_name, observation_type="physics_array", config=config)
+    obs, _ = env.reset()
+    assert env.observation_space.contains(obs)
+    _assert_matches_physics_state(env, obs)
+
+    env.place_action(bundled_solution(level_name))
+    env.action_placed = True
+    saw_contact = False
+    for _ in range(40):
+        env.step_physics(5)
+        obs = env._get_observation()
+        _assert_matches_physics_state(env, obs)
+        saw_contact = saw_contact or bool(obs["contacts"].any())
+    assert saw_contact
+    env.close()
+
+
+@pytest.mark.fast
+def test_physics_array_reuses_buffers_unless_copy_requested(bundled_solution):
+    env = InterphyreEnv("catapult", observation_type="physics_array")
+    first, _ = env.reset()
+    action = bundled_solution("catapult")
+    second, *_ = env.step(action)
+    assert second["state"] is first["state"]
+    assert second["contacts"] is first["contacts"]
+    assert second["contacts"] is env.engine.contact_listener.contact_matrix
+    env.close()
+
+    env = InterphyreEnv(
+        "catapult", observation_type="physics_array", copy_observations=True
+    )
+    first, _ = env.reset()
+    snapshot = first["state"].copy()
+    second, *_ = env.step(action)
+    assert second["state"] is not first["state"]
+    np.testing.assert_array_equal(first["state"], snapshot)
+    assert not np.array_equal(second["state"], snapshot)
+    env.close()
+
+
+@pytest.mark.fast
+def test_contact_matrix_cleared_on_reset(bundled_solution):
+    env = InterphyreEnv("catapult", observation_type="physics_array")
+    obs, *_ = env.step(bundled_solution("catapult"))
+    assert obs["contacts"].any()
+    obs, _ = env.reset()
+    assert not obs["contacts"].any()
+    env.close()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("lean", [False, True])
+def test_contact_matrix_follows_snapshot_restore(lean, bundled_solution):
+    config = SimulationConfig(lean_contact_tracking=lean)
+    env = InterphyreEnv("catapult", observation_type="physics_array", config=config)
+    env.reset()
+    env.place_action(bundled_solution("catapult"))
+    env.action_placed = True
+    env.step_physics(60)
+    expected = env._get_observation()["contacts"].copy()
+    snapshot = StateSnapshot.capture(env.engine)
+    env.step_physics(120)
+    env.restore(snapshot)
+    np.testing.assert_array_equal(env._get_observation()["contacts"], expected)
+    _assert_matches_physics_state(env, env._get_observation())
+    env.close()
+
+
+@pytest.mark.fast
+def test_physics_array_tracks_added_objects():
+    from interphyre.objects import Ball
+
+    env = InterphyreEnv(
+        "two_body_problem", observation_type="physics_array", enable_interventions=True
+    )
+    env.reset()
+    env.add("extra", Ball(x=4.0, y=4.0, radius=0.2, color="gray", dynamic=True))
+    obs = env._get_observation()
+    names = list(env.level.objects.keys())
+    assert obs["state"].shape == (len(names), 6)
+    assert obs["contacts"].shape == (len(names), len(names))
+    np.testing.assert_allclose(obs["state"][names.index("extra"), :2], [4.0, 4.0])
+    env.close()
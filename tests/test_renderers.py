@@ -572,6 +572,108 @@ def test_opencv_render_custom_dimensions():
     assert image.shape == (600, 800, 3), f"Expected (600,800,3), got {image.shape}"
 
 
+def _full_redraw(engine, width, height, ppm, discrete=False):
+    """Reference rendering: every body, bottom to top, on a cleared canvas."""
+    helper = OpenCVRenderer(width=width, height=height, ppm=ppm)
+    if discrete:
+        image = np.zeros((height, width), dtype=np.uint8)
+    else:
+        image = np.full((height, width, 3), 255, dtype=np.uint8)
+    for body in sorted(engine.bodies.values(), key=lambda b: b.position.y):
+        color = helper._get_object_color(body, engine)
+        if color is None:
+            continue
+        value = RGB_TO_DISCRETE.get(color, 0) if discrete else color
+        for fixture in body.fixtures:
+            if fixture.sensor:
+                continue
+            shape = fixture.shape
+            if isinstance(shape, b2CircleShape):
+                center = body.transform * shape.pos
+                radius = max(1, round(shape.radius * ppm))
+                cv2.circle(image, helper.world_to_screen(center), radius, value, -1)
+            else:
+                pts = np.array(
+                    [
+                        helper.world_to_screen(body.transform * v)
+                        for v in shape.vertices
+                    ],
+                    dtype=np.int32,
+                )
+                cv2.fillPoly(image, [pts], value)
+    return image
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("level_name", ["catapult", "marble_race"])
+def test_opencv_incremental_render_matches_full_redraw(level_name):
+    """Cached background + dirty-region compositing is pixel-identical."""
+    from interphyre import InterphyreEnv
+    from interphyre.validation import _get_registry
+
+    env = InterphyreEnv(level_name)
+    entry = _get_registry().get_valid_entry(level_name, 0)
+    env.place_action([tuple(p) for p in entry["solution"]])
+    renderer = OpenCVRenderer(width=224, height=224, ppm=22.4)
+    for step in range(150):
+        env.step_physics(2)
+        np.testing.assert_array_equal(
+            renderer.render(env.engine),
+            _full_redraw(env.engine, 224, 224, 22.4),
+            err_msg=f"RGB mismatch at step {step}",
+        )
+        np.testing.assert_array_equal(
+            renderer.render_discrete(env.engine),
+            _full_redraw(env.engine, 224, 224, 22.4, discrete=True),
+            err_msg=f"discrete mismatch at step {step}",
+        )
+    env.close()
+
+
+@pytest.mark.fast
+def test_opencv_render_tracks_interventions():
+    """Recreated, added, removed and moved static bodies invalidate the caches."""
+    from interphyre import InterphyreEnv
+    from interphyre.objects import Ball
+
+    env = InterphyreEnv("catapult", enable_interventions=True)
+    renderer = OpenCVRenderer(width=200, height=200, ppm=20)
+
+    def check():
+        np.testing.assert_array_equal(
+            renderer.render(env.engine), _full_redraw(env.engine, 200, 200, 20)
+        )
+
+    check()
+    env.set("green_ball", radius=0.6)
+    check()
+    env.add("extra", Ball(x=-3.0, y=3.0, radius=0.4, color="purple", dynamic=True))
+    check()
+    env.step_physics(20)
+    check()
+    env.remove("extra")
+    check()
+    env.set("ledge", x=2.5)
+    check()
+    env.close()
+
+
+@pytest.mark.fast
+def test_opencv_render_skips_drawing_when_nothing_moved(monkeypatch):
+    """A frame with no movement redraws nothing and returns the same image."""
+    env_engine = Box2DEngine(level=load_level("two_body_problem", seed=0))
+    renderer = OpenCVRenderer(width=120, height=120, ppm=12)
+    first = renderer.render(env_engine)
+    draw = MagicMock(side_effect=renderer._draw)
+    monkeypatch.setattr(renderer, "_draw", draw)
+    second = renderer.render(env_engine)
+    assert draw.call_count == 0
+    np.testing.assert_array_equal(first, second)
+    assert second is not first
+    second[:] = 0
+    np.testing.assert_array_equal(renderer.render(env_engine), first)
+
+
 # ============================================================================
 # Pygame Renderer Tests (10-12 tests) - WITH MOCKING
 # ============================================================================
@@ -1022,3 +1124,221 @@ def test_video_recorder_close_no_frames_no_output_path():
     # No frames — should close cleanly
     recorder.close()
     assert recorder._closed is True
+
+
+# ============================================================================
+# Streaming VideoRecorder
+# ============================================================================
+
+
+def _record_rollout(recorder, level_name="basket_case"):
+    from interphyre import InterphyreEnv
+    from interphyre.validation import _get_registry
+
+    entry = _get_registry().get_valid_entry(level_name, 0)
+    env = InterphyreEnv(level_name)
+    env.renderer = recorder
+    env.step([tuple(p) for p in entry["solution"]])
+    steps = env.step_count
+    env.renderer = None
+    env.close()
+    return steps
+
+
+@pytest.mark.fast
+def test_video_recorder_streams_several_formats_from_one_pass(tmp_path):
+    """Streaming writes MP4 and GIF as frames arrive without buffering them."""
+    from PIL import Image
+
+    from interphyre.render.video import VideoRecorder
+
+    reference = VideoRecorder(width=96, height=96, ppm=9.6)
+    _record_rollout(reference)
+    expected = reference.frames[::2]
+
+    paths = {"mp4": str(tmp_path / "mp4" / "out.mp4"), "gif": str(tmp_path / "out.gif")}
+    recorder = VideoRecorder(
+        width=96,
+        height=96,
+        ppm=9.6,
+        video_format=["mp4", "gif"],
+        fps=30,
+        output_path=paths,
+        streaming=True,
+        physics_fps=60,
+    )
+    steps = _record_rollout(recorder)
+    assert recorder.frames == []
+    assert recorder.get_frame_count() == (steps + 1) // 2 == len(expected)
+    recorder.close()
+
+    capture = cv2.VideoCapture(paths["mp4"])
+    assert int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) == len(expected)
+    capture.release()
+
+    with Image.open(paths["gif"]) as gif:
+        assert gif.n_frames == len(expected)
+        for index in (0, len(expected) - 1):
+            gif.seek(index)
+            np.testing.assert_array_equal(
+                np.asarray(gif.convert("RGB")), expected[index]
+            )
+
+
+@pytest.mark.fast
+def test_video_recorder_multiple_formats_share_stem(tmp_path):
+    """A single output path with several formats swaps the extension per format."""
+    from interphyre.render.video import VideoRecorder
+
+    recorder = VideoRecorder(
+        width=32,
+        height=32,
+        ppm=3.2,
+        video_format=("gif", "mp4"),
+        output_path=str(tmp_path / "clip.mp4"),
+    )
+    for _ in range(3):
+        recorder.add_frame(np.full((32, 32, 3), 255, dtype=np.uint8))
+    recorder.close()
+    assert (tmp_path / "clip.gif").exists()
+    assert (tmp_path / "clip.mp4").exists()
+
+
+@pytest.mark.fast
+def test_video_recorder_streaming_requires_output_path():
+    from interphyre.render.video import VideoRecorder
+
+    recorder = VideoRecorder(streaming=True)
+    with pytest.raises(ValueError, match="output_path"):
+        recorder.add_frame(np.zeros((600, 600, 3), dtype=np.uint8))
+    with pytest.raises(ValueError, match="Unsupported video format"):
+        VideoRecorder(video_format=["mp4", "avi"])
+    with pytest.raises(ValueError, match="physics_fps"):
+        VideoRecorder(physics_fps=0)
+
+
+@pytest.mark.fast
+def test_export_videos_for_level_writes_all_formats(tmp_path):
+    import json
+
+    from interphyre.render.video import export_videos_for_level
+    from interphyre.validation import _get_registry
+
+    entry = _get_registry().get_valid_entry("basket_case", 0)
+    level_dir = tmp_path / "data" / "basket_case"
+    level_dir.mkdir(parents=True)
+    flat = [v for p in entry["solution"] for v in p]
+    for name in ("successes", "failures"):
+        solutions = {"basket_case": {"solutions": {"0": [flat]}}}
+        (level_dir / f"{name}.json").write_text(json.dumps(solutions))
+
+    out = tmp_path / "out"
+    export_videos_for_level(
+        "basket_case", str(tmp_path / "data"), str(out), formats=["mp4", "gif"]
+    )
+    for label in ("success", "failure"):
+        assert (out / "mp4" / f"basket_case_0_{label}.mp4").stat().st_size > 0
+        assert (out / "gif" / f"basket_case_0_{label}.gif").stat().st_size > 0
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("workers", [1, 2])
+def test_export_videos_skips_up_to_date_outputs(tmp_path, workers):
+    from PIL import Image
+
+    from interphyre.render.video import VideoJob, VideoRecorder, export_videos
+    from interphyre.validation import _get_registry
+
+    action = tuple(
+        tuple(p) for p in _get_registry().get_valid_entry("basket_case", 0)["solution"]
+    )
+    jobs = [VideoJob("basket_case", 0, action, "success")]
+    out = str(tmp_path)
+    kwargs = {"formats": ["mp4", "gif"], "size": (64, 64), "workers": workers}
+
+    results = export_videos(jobs, out, **kwargs)
+    gif_path = str(tmp_path / "gif" / "basket_case_0_success.gif")
+    mp4_path = str(tmp_path / "mp4" / "basket_case_0_success.mp4")
+    assert results == {gif_path: "written", mp4_path: "written"}
+
+    # The exported GIF matches recording the rollout directly at 30 fps.
+    reference = VideoRecorder(width=64, height=64, ppm=6.4, physics_fps=60)
+    _record_rollout(reference)
+    with Image.open(gif_path) as gif:
+        assert gif.n_frames == len(reference.frames)
+        gif.seek(gif.n_frames - 1)
+        np.testing.assert_array_equal(
+            np.asarray(gif.convert("RGB")), reference.frames[-1]
+        )
+
+    assert set(export_videos(jobs, out, **kwargs).values()) == {"skipped"}
+    assert set(export_videos(jobs, out, force=True, **kwargs).values()) == {"written"}
+
+    # Changing a render setting or removing a file invalidates only that output.
+    (tmp_path / "mp4" / "basket_case_0_success.mp4").unlink()
+    results = export_videos(jobs, out, **kwargs)
+    assert results == {gif_path: "skipped", mp4_path: "written"}
+    results = export_videos(jobs, out, **{**kwargs, "size": (48, 48)})
+    assert set(results.values()) == {"written"}
+
+
+@pytest.mark.fast
+def test_export_videos_hashes_the_rendered_variant(tmp_path):
+    """The manifest digest covers the validated variant the video shows."""
+    import json
+
+    from interphyre.levels import load_level
+    from interphyre.render.video import (
+        _MANIFEST_NAME,
+        VideoJob,
+        export_videos,
+        video_digest,
+    )
+    from interphyre.validation import _get_registry, load_valid_level
+
+    validated = load_valid_level("catapult", 4)
+    assert validated.variant != 0
+    solution = _get_registry().get_solution("catapult", 4, validated.variant)
+    action = tuple(tuple(p) for p in solution)
+    jobs = [VideoJob("catapult", 4, action)]
+    kwargs = {"formats": ["gif"], "size": (32, 32), "workers": 1}
+
+    export_videos(jobs, str(tmp_path), **kwargs)
+    manifest = json.loads((tmp_path / _MANIFEST_NAME).read_text())
+    (digest,) = manifest.values()
+    assert digest == video_digest(validated.level, action, "gif", 30, (32, 32))
+    assert digest != video_digest(
+        load_level("catapult", 4), action, "gif", 30, (32, 32)
+    )
+    assert set(export_videos(jobs, str(tmp_path), **kwargs).values()) == {"skipped"}
+
+
+@pytest.mark.fast
+def test_export_videos_decimates_to_fps_not_dividing_physics_rate(tmp_path):
+    """At 25 fps the export keeps the same frames as a 25 fps VideoRecorder."""
+    from PIL import Image
+
+    from interphyre.render.video import VideoJob, VideoRecorder, export_videos
+    from interphyre.validation import _get_registry
+
+    action = tuple(
+        tuple(p) for p in _get_registry().get_valid_entry("basket_case", 0)["solution"]
+    )
+    export_videos(
+        [VideoJob("basket_case", 0, action)],
+        str(tmp_path),
+        formats=["gif"],
+        video_fps=25,
+        size=(32, 32),
+        workers=1,
+    )
+
+    reference = VideoRecorder(width=32, height=32, ppm=3.2, fps=25, physics_fps=60)
+    steps = _record_rollout(reference)
+    with Image.open(tmp_path / "gif" / "basket_case_0.gif") as gif:
+        assert gif.n_frames == len(reference.frames)
+        assert gif.n_frames == pytest.approx(steps * 25 / 60, abs=1)
+        gif.seek(gif.n_frames - 1)
+        np.testing.assert_array_equal(
+            np.asarray(gif.convert("RGB")), reference.frames[-1]
+        )
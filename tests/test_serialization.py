@@ -474,6 +474,63 @@ def test_snapshot_metadata_preserved(intervention_config):
     assert restored.metadata["number"] == 42
 
 
+@pytest.mark.fast
+@pytest.mark.intervention
+def test_snapshot_from_buffer_is_zero_copy(snapshot_at_step_50):
+    """from_buffer() views the arrays in the buffer instead of copying them."""
+    import numpy as np
+
+    data = bytearray(snapshot_at_step_50.to_bytes())
+    restored = StateSnapshot.from_buffer(data)
+
+    assert restored == snapshot_at_step_50
+    raw = np.frombuffer(data, dtype=np.uint8)
+    assert np.shares_memory(restored.transforms, raw)
+    assert np.shares_memory(restored.velocities, raw)
+    assert not restored.transforms.flags.writeable
+
+
+@pytest.mark.fast
+@pytest.mark.intervention
+def test_snapshots_share_layout(intervention_config):
+    """Snapshots of the same bodies share one layout; bytes can omit it."""
+    from interphyre.interventions.state import SnapshotLayout
+
+    level = load_level("two_body_problem", seed=42)
+    engine = Box2DEngine(level, config=intervention_config)
+    first = StateSnapshot.capture(engine)
+    engine.world.Step(
+        engine.config.time_step,
+        engine.config.velocity_iters,
+        engine.config.position_iters,
+    )
+    engine.time_update(engine.config.time_step)
+    second = StateSnapshot.capture(engine)
+
+    assert first.layout is second.layout
+    assert SnapshotLayout.lookup(first.layout.digest) is first.layout
+    assert first.transforms.shape == (len(first.layout.names), 3)
+
+    compact = second.to_bytes(include_layout=False)
+    assert len(compact) < len(second.to_bytes())
+    assert StateSnapshot.from_bytes(compact) == second
+    # Bytes that reference a layout this process has never seen cannot be decoded.
+    digest_offset = compact.index(second.layout.digest.encode())
+    unknown = compact[:digest_offset] + b"z" + compact[digest_offset + 1 :]
+    with pytest.raises(ValueError, match="layout"):
+        StateSnapshot.from_bytes(unknown)
+
+
+@pytest.mark.fast
+@pytest.mark.intervention
+def test_snapshot_pickles_through_binary_format(snapshot_at_step_50):
+    import pickle
+
+    restored = pickle.loads(pickle.dumps(snapshot_at_step_50))
+    assert restored == snapshot_at_step_50
+    assert restored.layout is snapshot_at_step_50.layout
+
+
 # ============================================================================
 # Round-Trip Tests (6-8 tests)
 # ============================================================================
@@ -0,0 +1,133 @@
+"""
+Tests for SnapshotStore and the env-owned store behind env.snapshots.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv, SimulationConfig
+from interphyre.interventions import SnapshotStore, at_step
+from interphyre.interventions.state import StateSnapshot
+
+
+def _snapshots(count: int) -> list[StateSnapshot]:
+    env = InterphyreEnv("two_body_problem", enable_interventions=True)
+    env.reset()
+    env.place_action([(0.0, 3.0, 0.5)])
+    env.action_placed = True
+    snapshots = []
+    for _ in range(count):
+        env.step_physics(5)
+        snapshots.append(StateSnapshot.capture(env.engine))
+    env.close()
+    return snapshots
+
+
+@pytest.mark.fast
+def test_lru_eviction_and_stats():
+    a, b, c = _snapshots(3)
+    store = SnapshotStore(max_snapshots=2)
+    store.put("a", a)
+    store.put("b", b)
+    assert store.get("a") is a  # "b" is now least recently used
+    store.put("c", c)
+    assert "b" not in store
+    assert store.keys() == ["a", "c"]
+    assert store.get("b") is None
+    with pytest.raises(KeyError):
+        store["b"]
+    stats = store.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 1
+    assert stats["in_memory"] == 2
+
+
+@pytest.mark.fast
+def test_full_store_without_auto_cleanup_raises():
+    a, b = _snapshots(2)
+    store = SnapshotStore(max_snapshots=1, auto_cleanup=False)
+    store.put("a", a)
+    store.put("a", b)  # replacing a key never needs room
+    with pytest.raises(RuntimeError):
+        store.put("b", a)
+    assert store.keys() == ["a"]
+
+
+@pytest.mark.fast
+def test_spill_to_disk_round_trips(tmp_path):
+    snapshots = _snapshots(4)
+    spill_dir = tmp_path / "spill"
+    store = SnapshotStore(max_snapshots=1, auto_cleanup=False, spill_path=spill_dir)
+    assert store.spill_file is None
+    for i, snapshot in enumerate(snapshots):
+        store.put(i, snapshot)
+    assert len(store) == 4
+    stats = store.get_stats()
+    assert stats["spills"] == 3 and stats["on_disk"] == 3
+    assert stats["evictions"] == 0
+    path = Path(store.spill_file)
+    assert path.parent == spill_dir
+    assert path.stat().st_size == stats["disk_bytes"] > 0
+
+    for i, snapshot in enumerate(snapshots):
+        restored = store[i]
+        assert restored == snapshot
+        assert restored.step_index == snapshot.step_index
+    assert store.get_stats()["disk_hits"] == 4
+
+    store.close()
+    assert not path.exists()
+
+
+@pytest.mark.fast
+def test_stores_sharing_a_spill_directory_keep_separate_files(tmp_path):
+    snapshots = _snapshots(4)
+    config = SimulationConfig(
+        enable_interventions=True,
+        intervention_max_snapshots=1,
+        intervention_spill_path=str(tmp_path),
+    )
+    a = SnapshotStore.from_config(config)
+    b = SnapshotStore.from_config(config)
+    for i in range(2):
+        a.put(f"k{i}", snapshots[i])
+        b.put(f"k{i}", snapshots[i + 2])
+    assert a.spill_file != b.spill_file
+
+    a.close()
+    assert b.get("k0") == snapshots[2]
+    assert b.get("k1") == snapshots[3]
+
+    # The file may already be gone, e.g. after the directory was cleaned up.
+    Path(b.spill_file).unlink()
+    b.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.fast
+def test_env_store_follows_config_and_resolves_keys():
+    config = SimulationConfig(enable_interventions=True, intervention_max_snapshots=3)
+    env = InterphyreEnv("two_body_problem", config=config)
+    assert env.snapshots.max_snapshots == 3
+
+    snapshot, _ = env.run_until(at_step(10), action=(0.0, 3.0, 0.5), key="contact")
+    assert env.snapshots["contact"] is snapshot
+    for _ in range(5):
+        env.step_physics(2)
+        env.checkpoint()
+    assert len(env.snapshots) == 3
+    assert "contact" not in env.snapshots
+
+    key = env.snapshots.keys()[-1]
+    expected = env.snapshots[key]
+    env.step_physics(20)
+    with env.branch(key):
+        assert env.step_count == key
+        current = StateSnapshot.capture(env.engine)
+        np.testing.assert_array_equal(current.transforms, expected.transforms)
+    with pytest.raises(KeyError):
+        env.restore("contact")
+    env.close()
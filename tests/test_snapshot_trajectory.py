@@ -0,0 +1,133 @@
+"""
+Tests for keyframe + delta snapshot trajectory files.
+"""
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv
+from interphyre.interventions import SnapshotTrajectory, SnapshotTrajectoryWriter
+from interphyre.interventions.state import StateSnapshot
+
+
+def _env() -> InterphyreEnv:
+    env = InterphyreEnv("two_body_problem", enable_interventions=True)
+    env.reset()
+    return env
+
+
+def _place(env: InterphyreEnv) -> None:
+    env.place_action([(0.0, 3.0, 0.5)])
+    env.action_placed = True
+
+
+@pytest.mark.fast
+def test_records_decode_to_the_captured_snapshots(tmp_path):
+    env = _env()
+    _place(env)
+    path = tmp_path / "rollout.traj"
+    snapshots = []
+    with SnapshotTrajectoryWriter(path, keyframe_every=7) as writer:
+        for step in range(40):
+            env.step_physics()
+            metadata = {"step": step} if step % 10 == 0 else None
+            snapshots.append(writer.capture(env.engine, metadata=metadata))
+    env.close()
+
+    with SnapshotTrajectory(path) as trajectory:
+        assert len(trajectory) == 40
+        assert trajectory.keyframes.tolist() == list(range(0, 40, 7))
+        assert trajectory.steps.tolist() == [s.step_index for s in snapshots]
+        # Random access, so the reader cannot rely on decoding in order.
+        for record in np.random.default_rng(0).permutation(40).tolist():
+            decoded = trajectory[record]
+            assert decoded == snapshots[record]
+            assert decoded.metadata == snapshots[record].metadata
+            np.testing.assert_array_equal(
+                decoded.structure_versions, snapshots[record].structure_versions
+            )
+        assert trajectory[-1] == snapshots[-1]
+        assert trajectory.at_step(snapshots[12].step_index) == snapshots[12]
+        with pytest.raises(KeyError):
+            trajectory.at_step(-5)
+        with pytest.raises(IndexError):
+            trajectory[40]
+    with pytest.raises(ValueError, match="closed"):
+        trajectory[0]
+
+    # Deltas only carry the dynamic bodies, so even with a keyframe every 7
+    # records the file is smaller than the snapshots serialized one by one.
+    full = sum(len(s.to_bytes(include_layout=False)) for s in snapshots)
+    assert path.stat().st_size < full
+
+
+@pytest.mark.fast
+def test_layout_change_starts_a_keyframe(tmp_path):
+    env = _env()
+    path = tmp_path / "rollout.traj"
+    snapshots = []
+    with SnapshotTrajectoryWriter(path, keyframe_every=100) as writer:
+        for _ in range(3):
+            env.step_physics()
+            snapshots.append(writer.capture(env.engine))
+        _place(env)  # adds the action ball to the layout
+        for _ in range(3):
+            env.step_physics()
+            snapshots.append(writer.capture(env.engine))
+    env.close()
+
+    with SnapshotTrajectory(path) as trajectory:
+        assert trajectory.keyframes.tolist() == [0, 3]
+        assert [trajectory[i] for i in range(6)] == snapshots
+
+
+@pytest.mark.fast
+def test_restore_from_decoded_record(tmp_path):
+    env = _env()
+    _place(env)
+    path = tmp_path / "rollout.traj"
+    with SnapshotTrajectoryWriter(path, keyframe_every=10) as writer:
+        for _ in range(60):
+            env.step_physics()
+            writer.capture(env.engine)
+
+    with SnapshotTrajectory(path) as trajectory:
+        snapshot = trajectory[25]
+        env.restore(snapshot)
+        restored = StateSnapshot.capture(env.engine)
+        np.testing.assert_array_equal(restored.transforms, snapshot.transforms)
+        np.testing.assert_array_equal(restored.velocities, snapshot.velocities)
+        assert restored.step_index == snapshot.step_index
+    env.close()
+
+
+@pytest.mark.fast
+def test_reader_sees_flushed_records_of_an_open_writer(tmp_path):
+    env = _env()
+    _place(env)
+    path = tmp_path / "rollout.traj"
+    writer = SnapshotTrajectoryWriter(path, keyframe_every=4)
+    for _ in range(6):
+        env.step_physics()
+        writer.capture(env.engine)
+    writer.flush()
+    with SnapshotTrajectory(path) as trajectory:
+        assert len(trajectory) == 6
+    writer.close()
+
+    # A record cut off mid-write is left out of the index.
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+    with SnapshotTrajectory(path) as trajectory:
+        assert len(trajectory) == 5
+    env.close()
+
+
+@pytest.mark.fast
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        SnapshotTrajectoryWriter(tmp_path / "a.traj", keyframe_every=0)
+    path = tmp_path / "not_a_trajectory"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        SnapshotTrajectory(path)
@@ -0,0 +1,116 @@
+"""
+Tests for deferred rendering: TrajectoryRecorder and render_trajectory.
+"""
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv
+from interphyre.render import (
+    OpenCVRenderer,
+    TrajectoryRecorder,
+    VideoRecorder,
+    render_trajectory,
+)
+from interphyre.validation import _get_registry
+
+
+def _solution(level_name: str, seed: int = 0):
+    entry = _get_registry().get_valid_entry(level_name, seed)
+    return [tuple(p) for p in entry["solution"]]
+
+
+def _record(level_name: str, renderer):
+    env = InterphyreEnv(level_name)
+    env.renderer = renderer
+    env.step(_solution(level_name))
+    level = env.level
+    env.renderer = None
+    env.close()
+    return level
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("level_name", ["catapult", "marble_race"])
+def test_render_trajectory_matches_inline_rendering(level_name):
+    video = VideoRecorder(width=120, height=120, ppm=12)
+    _record(level_name, video)
+    expected = np.stack(video.frames)
+    video.frames.clear()
+
+    recorder = TrajectoryRecorder(capacity=16)
+    level = _record(level_name, recorder)
+    trajectory = recorder.get_trajectory()
+    assert len(trajectory) == len(expected)
+    assert trajectory.poses.dtype == np.float32
+    assert trajectory.poses.shape == (len(expected), len(trajectory.names), 3)
+
+    frames = render_trajectory(level, trajectory, size=(120, 120))
+    np.testing.assert_array_equal(frames, expected)
+
+
+@pytest.mark.fast
+def test_render_trajectory_stride_workers_and_discrete():
+    recorder = TrajectoryRecorder()
+    level = _record("catapult", recorder)
+    trajectory = recorder.get_trajectory()
+    full = render_trajectory(level, trajectory, size=(64, 64))
+    threaded = render_trajectory(
+        level, trajectory, stride=5, size=(64, 64), workers=3, use_threads=True
+    )
+    np.testing.assert_array_equal(threaded, full[::5])
+
+    discrete = render_trajectory(
+        level, trajectory, stride=50, size=(64, 64), discrete=True
+    )
+    assert discrete.shape == (len(full[::50]), 64, 64)
+    renderer = OpenCVRenderer(width=64, height=64, ppm=6.4)
+    np.testing.assert_array_equal(
+        renderer.discrete_to_rgb(discrete[-1]), full[::50][-1]
+    )
+
+
+@pytest.mark.fast
+def test_render_trajectory_process_pool():
+    recorder = TrajectoryRecorder()
+    level = _record("basket_case", recorder)
+    trajectory = recorder.get_trajectory()
+    serial = render_trajectory(level, trajectory, stride=10, size=(48, 48))
+    parallel = render_trajectory(level, trajectory, stride=10, size=(48, 48), workers=2)
+    np.testing.assert_array_equal(parallel, serial)
+
+
+@pytest.mark.fast
+def test_trajectory_recorder_marks_removed_bodies():
+    env = InterphyreEnv("two_body_problem", enable_interventions=True)
+    recorder = TrajectoryRecorder()
+    env.reset()
+    env.place_action(_solution("two_body_problem"))
+    recorder.render(env.engine)
+    name = next(n for n in env.level.objects if n not in env.level.action_objects)
+    env.remove(name)
+    recorder.render(env.engine)
+    trajectory = recorder.get_trajectory()
+    column = trajectory.names.index(name)
+    assert not np.isnan(trajectory.poses[0, column]).any()
+    assert np.isnan(trajectory.poses[1, column]).all()
+
+    frames = render_trajectory(env.level, trajectory, size=(64, 64))
+    expected = OpenCVRenderer(width=64, height=64, ppm=6.4).render(env.engine)
+    np.testing.assert_array_equal(frames[1], expected)
+    env.close()
+
+
+@pytest.mark.fast
+def test_trajectory_recorder_errors_and_reset():
+    with pytest.raises(ValueError):
+        TrajectoryRecorder(capacity=0)
+    recorder = TrajectoryRecorder()
+    with pytest.raises(RuntimeError):
+        recorder.get_trajectory()
+    _record("two_body_problem", recorder)
+    assert recorder.get_frame_count() > 0
+    recorder.reset()
+    assert recorder.get_frame_count() == 0
+    with pytest.raises(ValueError):
+        render_trajectory(None, None, stride=0)
@@ -265,3 +265,111 @@ class TestTriggerResetOnRunUntil:
         any_trigger.reset()
         assert child1._fired is False
         assert child2._fired is False
+
+
+class TestEventDrivenRunUntil:
+    """run_until() only evaluates triggers at scheduled steps and on watched
+    contacts, and must fire at exactly the step per-step polling would."""
+
+    @staticmethod
+    def _env():
+        from interphyre.environment import InterphyreEnv
+
+        return InterphyreEnv("two_body_problem", seed=42, enable_interventions=True)
+
+    @staticmethod
+    def _poll(env, trigger, max_steps):
+        """Reference loop: evaluate the trigger after every step."""
+        trigger.reset()
+        env.reset()
+        env.place_action([(0.0, 3.0, 0.5)])
+        env.action_placed = True
+        for step in range(1, max_steps + 1):
+            env.step_physics()
+            if trigger.should_fire(step, env.engine):
+                return step
+        return None
+
+    @pytest.mark.parametrize(
+        "make_trigger",
+        [
+            lambda: at_step(40),
+            lambda: on_contact("green_ball", "bottom_wall"),
+            lambda: on_contact_with("red_ball"),
+            lambda: on_contact("green_ball", "red_ball"),
+            lambda: on_contact_duration("blue_ball", "bottom_wall", 0.1),
+            lambda: on_velocity_threshold("green_ball", 1.0),
+            lambda: on_sequence(
+                [on_contact_with("blue_ball"), on_contact_with("red_ball")]
+            ),
+            lambda: on_sequence(
+                [on_contact("red_ball", "bottom_wall"), at_step(100)],
+                reset_on_failure=False,
+            ),
+            lambda: on_any([on_contact("green_ball", "red_ball"), at_step(150)]),
+            lambda: on_success(),
+        ],
+    )
+    def test_fire_step_matches_polling(self, make_trigger):
+        env = self._env()
+        expected = self._poll(env, make_trigger(), 300)
+
+        env.reset()
+        snapshot, step = env.run_until(
+            make_trigger(), action=(0.0, 3.0, 0.5), max_steps=300
+        )
+        assert (snapshot is not None) == (expected is not None)
+        assert step == (expected if expected is not None else 300)
+        assert env.step_count == step
+
+    def test_event_triggers_are_not_polled_between_wakeups(self):
+        calls = []
+
+        class CountingTrigger(EventBasedTrigger):
+            def should_fire(self, step_index, engine):
+                calls.append(step_index)
+                return super().should_fire(step_index, engine)
+
+        env = self._env()
+        env.reset()
+        trigger = CountingTrigger(event_type="contact", object_names=("red_ball",))
+        snapshot, step = env.run_until(trigger, action=(0.0, 3.0, 0.5), max_steps=300)
+
+        assert snapshot is not None
+        assert calls == [step]
+        assert not env.engine.contact_listener._watching
+
+    def test_condition_checked_every_k_steps(self):
+        steps = []
+
+        def condition(engine):
+            steps.append(engine.contact_listener.current_time)
+            return len(steps) == 3
+
+        env = self._env()
+        env.reset()
+        snapshot, step = env.run_until(
+            when(condition, every=10), action=(0.0, 3.0, 0.5), max_steps=100
+        )
+        assert snapshot is not None
+        assert step == 30
+        assert len(steps) == 3
+
+    def test_check_every_must_be_positive(self):
+        with pytest.raises(ValueError):
+            when(lambda e: True, every=0)
+
+    def test_next_check_schedules(self):
+        engine = _make_mock_engine()
+        engine.contact_listener.HasContact.return_value = False
+        assert at_step(10).next_check(3, engine) == 10
+        assert at_step(10).next_check(10, engine) is None
+        assert on_contact("a", "b").next_check(3, engine) is None
+        assert when(lambda e: False, every=4).next_check(5, engine) == 8
+        assert on_any([at_step(10), at_step(7)]).next_check(0, engine) == 7
+        assert on_any(
+            [on_contact("a", "b"), on_contact_with("c")]
+        ).watched_contacts() == (
+            ("a", "b"),
+            ("c",),
+        )
@@ -420,6 +420,325 @@ def test_schema_hash_stale(tmp_path, monkeypatch, caplog):
     )
 
 
+# ---------------------------------------------------------------------------
+# Columnar bundles
+# ---------------------------------------------------------------------------
+
+
+def test_columnar_bundle_round_trip():
+    """Entries decode exactly, including value types the JSON bundle distinguishes."""
+    from interphyre.validation.compact_bundles import (
+        ColumnarBundle,
+        encode_columnar_bundle,
+    )
+
+    def scene(x, color, dynamic, extra=None):
+        objects = {"ball": {"x": x, "color": color, "dynamic": dynamic, "r": 0.5}}
+        if extra is not None:
+            objects["post"] = {"x": -0.0, "points": extra}
+        return objects
+
+    entries = [
+        {
+            "seed": 7,
+            "variant": 0,
+            "status": "impossible",
+            "scene": None,
+            "solution": None,
+        },
+        {
+            "seed": 3,
+            "variant": 2,
+            "status": "valid",
+            "scene": scene(-5, "red", True),
+            "solution": [[0.1, 2.0, 0.3]],
+        },
+        {
+            "seed": 3,
+            "variant": 0,
+            "status": "impossible",
+            "scene": None,
+            "solution": None,
+        },
+        {
+            "seed": 12,
+            "variant": 1,
+            "status": "valid",
+            "scene": scene(-0.0, "blue", False, [[1, 2], None]),
+            "solution": [[-1.5, 0.25, 0.4], [3.0, 1.0, 0.2]],
+        },
+        {
+            "seed": 40,
+            "variant": 0,
+            "status": "valid",
+            "scene": scene(1.25, "red", True),
+            "solution": None,
+        },
+    ]
+    data = {"schema_hash": "ab" * 32, "oracle_commit": "abc1234", "entries": entries}
+    bundle = ColumnarBundle(
+        encode_columnar_bundle(data, source={"size": 1, "mtime_ns": 2})
+    )
+
+    assert bundle.index["seed"].tolist() == [3, 7, 12, 40]
+    assert bundle.schema_hash == "ab" * 32
+    assert bundle.source == {"size": 1, "mtime_ns": 2}
+    for entry in (entries[0], entries[1], entries[3], entries[4]):
+        # JSON text equality also checks int vs float, -0.0 and key order.
+        assert json.dumps(bundle.get(entry["seed"])) == json.dumps(entry)
+    assert bundle.get(4) is None
+    assert bundle.find(100) is None
+
+    with pytest.raises(ValueError):
+        ColumnarBundle(b"not a columnar bundle")
+    with pytest.raises(ValueError):
+        encode_columnar_bundle({"entries": [dict(entries[0], status="unknown")]})
+
+
+def test_registry_reuses_columnar_bundle(tmp_path, monkeypatch):
+    """The first registry converts the bundle; later ones map it without decompressing."""
+    import interphyre.validation.registry as reg_mod
+    from interphyre.validation.compact_bundles import ColumnarBundle
+
+    with lzma.open(_BUNDLE_DIR / "basket_case.json.lzma", "rt", encoding="utf-8") as fh:
+        entries = {e["seed"]: e for e in json.load(fh)["entries"]}
+
+    reg = SeedRegistry(tmp_path / "test.db")
+    assert reg.lookup("basket_case", 2, entries[2]["variant"]) == "valid"
+    columnar_path = tmp_path / "bundles" / "basket_case.columnar"
+    assert columnar_path.exists()
+    reg.close()
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("bundle was decompressed again")
+
+    monkeypatch.setattr(reg_mod.lzma, "open", fail_open)
+    reg = SeedRegistry(tmp_path / "test.db")
+    for seed in (0, 2, 517, 9999):
+        entry = entries[seed]
+        assert reg.get_valid_entry("basket_case", seed) == entry
+        assert (
+            reg.get_scene_dict("basket_case", seed, entry["variant"]) == entry["scene"]
+        )
+        assert (
+            reg.get_solution("basket_case", seed, entry["variant"]) == entry["solution"]
+        )
+    assert isinstance(reg._bundled["basket_case"], ColumnarBundle)
+
+    n_valid = sum(e["status"] == "valid" for e in entries.values())
+    assert reg.count("basket_case", "valid") == n_valid
+    assert len(reg.valid_entries("basket_case")) == n_valid
+    assert reg.bundle_valid_rate("basket_case") == n_valid / len(entries)
+    reg.close()
+
+
+def test_registry_reconverts_changed_bundle(tmp_path, monkeypatch):
+    """A columnar copy converted from a different bundle file is not reused."""
+    import interphyre.validation.registry as reg_mod
+
+    SeedRegistry(tmp_path / "test.db").lookup("basket_case", 2, 0)
+    columnar_path = tmp_path / "bundles" / "basket_case.columnar"
+    before = columnar_path.stat().st_mtime_ns
+
+    monkeypatch.setattr(
+        reg_mod, "bundle_source", lambda path: {"size": 0, "mtime_ns": 0}
+    )
+    reg = SeedRegistry(tmp_path / "test.db")
+    assert reg.lookup("basket_case", 2, 0) == "valid"
+    assert columnar_path.stat().st_mtime_ns != before
+    assert reg._bundled["basket_case"].source == {"size": 0, "mtime_ns": 0}
+
+
+def test_registry_keeps_bundle_in_memory_when_unwritable(tmp_path, monkeypatch):
+    """A columnar copy that cannot be written is built in memory instead."""
+    import interphyre.validation.registry as reg_mod
+    from interphyre.validation.compact_bundles import ColumnarBundle
+
+    def fail_write(path, encoded):
+        raise OSError("read-only cache directory")
+
+    monkeypatch.setattr(reg_mod, "write_columnar_bundle", fail_write)
+    reg = SeedRegistry(tmp_path / "test.db")
+    status, variant = reg.bundled_status("basket_case", 2)
+    assert status == "valid"
+    assert reg.lookup("basket_case", 2, variant) == "valid"
+    assert isinstance(reg._bundled["basket_case"], ColumnarBundle)
+    assert not (tmp_path / "bundles" / "basket_case.columnar").exists()
+    assert reg.bundled_status("basket_case", 10_000_000) is None
+    assert reg.bundled_status("no_such_level", 2) is None
+    reg.close()
+
+
+def test_registry_merges_sqlite_rows_into_bundled_index(tmp_path):
+    """count() and valid_entries() add SQLite seeds the bundle does not cover."""
+    reg = SeedRegistry(tmp_path / "test.db")
+    bundled = reg.valid_entries("basket_case")
+    n_impossible = reg.count("basket_case", "impossible")
+
+    reg.record("basket_case", 20_000, 1, "valid")
+    reg.record("basket_case", 20_001, 0, "impossible")
+    # Already in the bundle, so not counted a second time.
+    reg.record("basket_case", bundled[0][0], 5, "valid")
+
+    entries = reg.valid_entries("basket_case")
+    assert entries == bundled + [(20_000, 1)]
+    assert reg.count("basket_case", "valid") == len(bundled) + 1
+    assert reg.count("basket_case", "impossible") == n_impossible + 1
+    assert reg.count("basket_case", "unknown") == 0
+    reg.close()
+
+
+def test_load_valid_level_decodes_bundled_scene_on_access(tmp_path):
+    """Bundled hits defer scene decoding until scene_dict is read."""
+    reg = SeedRegistry(tmp_path / "test.db")
+    status, variant = reg.bundled_status("basket_case", 2)
+    expected = reg.get_scene_dict("basket_case", 2, variant)
+    assert status == "valid"
+
+    validated = load_valid_level("basket_case", seed=2, registry=reg)
+    assert validated.variant == variant
+    assert "scene_dict" not in vars(validated)
+    assert validated.scene_dict == expected
+    assert vars(validated)["scene_dict"] == expected
+    with pytest.raises(AttributeError):
+        validated.not_an_attribute
+    reg.close()
+
+
+def test_bundled_validated_level_pickles(tmp_path):
+    """Lazy bundled levels pickle with their scene, decoded from the bundle."""
+    import pickle
+
+    reg = SeedRegistry(tmp_path / "test.db")
+    validated = load_valid_level("catapult", seed=4, registry=reg)
+    assert validated.variant != 0
+    expected = reg.get_scene_dict("catapult", 4, validated.variant)
+    # Later changes to the caller's level do not leak into the scene.
+    validated.level.objects["green_ball"].x += 1.0
+
+    restored = pickle.loads(pickle.dumps(validated))
+    assert vars(restored)["scene_dict"] == expected
+    assert validated.scene_dict == expected
+    assert (restored.level_name, restored.seed, restored.variant) == (
+        "catapult",
+        4,
+        validated.variant,
+    )
+    reg.close()
+
+
+# ---------------------------------------------------------------------------
+# Bulk registry APIs
+# ---------------------------------------------------------------------------
+
+
+def test_lookup_many_matches_lookup(tmp_path):
+    """lookup_many() agrees with lookup() across both tiers, stale rows and misses."""
+    reg = SeedRegistry(tmp_path / "test.db")
+    valid_seed, valid_variant = reg.valid_entries("basket_case")[0]
+    reg.record_many(
+        [
+            ("basket_case", 20_000, 0, "impossible"),
+            ("basket_case", 20_000, 1, "valid", {"ball": {"x": 1.0}}),
+            ("basket_case", 20_001, 0, "trivial"),
+        ]
+    )
+    reg.record("basket_case", 20_002, 0, "valid")
+    reg._get_conn().execute(
+        "UPDATE seed_validity SET schema_hash='stale' WHERE seed=20002"
+    )
+    reg._get_conn().commit()
+
+    pairs = [
+        (valid_seed, valid_variant),
+        (valid_seed, valid_variant + 1),
+        (20_000, 0),
+        (20_000, 1),
+        (20_000, 2),
+        (20_001, 0),
+        (20_002, 0),
+        (30_000, 0),
+    ]
+    seeds, variants = zip(*pairs)
+    expected = [reg.lookup("basket_case", s, v) for s, v in pairs]
+    assert expected[-2:] == [None, None]
+    assert reg.lookup_many("basket_case", seeds, variants) == expected
+    assert not reg._get_conn().in_transaction
+    assert reg.lookup_many("basket_case", [20_000, 20_001], 0) == [
+        "impossible",
+        "trivial",
+    ]
+    assert reg.lookup_many("basket_case", [], []) == []
+    with pytest.raises(ValueError):
+        reg.lookup_many("basket_case", [1, 2, 3], [0, 1])
+
+    # Inside batched() the caller's transaction is left open for its commit.
+    with reg.batched():
+        reg.record("basket_case", 20_003, 0, "impossible")
+        assert reg.lookup_many("basket_case", [20_003], 0) == ["impossible"]
+        assert reg._get_conn().in_transaction
+    assert reg.lookup("basket_case", 20_003, 0) == "impossible"
+    reg.close()
+
+
+def test_record_many_round_trip(tmp_path):
+    """record_many() stores the same columns as record()."""
+    reg = SeedRegistry(tmp_path / "test.db")
+    scene = {"ball": {"x": 1.0, "y": 2.0}}
+    solution = [[0.5, 1.5, 0.3]]
+    reg.record_many(
+        [
+            ("basket_case", 20_000, 2, "valid", scene, solution),
+            ("basket_case", 20_001, 0, "impossible"),
+        ]
+    )
+    reg.close()
+
+    reg = SeedRegistry(tmp_path / "test.db")
+    assert reg.lookup("basket_case", 20_000, 2) == "valid"
+    assert reg.get_scene_dict("basket_case", 20_000, 2) == scene
+    assert reg.get_solution("basket_case", 20_000, 2) == solution
+    assert reg.lookup("basket_case", 20_001, 0) == "impossible"
+    assert reg.get_scene_dict("basket_case", 20_001, 0) is None
+    reg.close()
+
+
+def test_prewarm_partitions_resolved_seeds_without_workers(tmp_path, monkeypatch):
+    """Seeds fully covered by the registry are counted without starting a pool."""
+    import interphyre.validation as validation_mod
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("prewarm started workers for resolved seeds")
+
+    monkeypatch.setattr(validation_mod, "ProcessPoolExecutor", no_pool)
+    reg = SeedRegistry(tmp_path / "test.db")
+    reg.record_many(
+        [
+            ("basket_case", 20_000, 0, "impossible"),
+            ("basket_case", 20_000, 1, "valid"),
+            *(("basket_case", 20_001, v, "trivial") for v in range(3)),
+            ("basket_case", 20_002, 0, "trivial"),
+            ("basket_case", 20_002, 1, "impossible"),
+            ("basket_case", 20_002, 2, "impossible"),
+        ]
+    )
+    counts = prewarm(
+        ["basket_case"],
+        [2, 20_000, 20_001, 20_002],
+        registry=reg,
+        max_variants=3,
+        progress=False,
+    )
+    assert counts["basket_case"] == {
+        "valid": 2,
+        "trivial": 1,
+        "impossible": 0,
+        "exhausted": 1,
+        "variant_hist": {0: 1, 1: 1},
+    }
+    reg.close()
+
+
 # ---------------------------------------------------------------------------
 # Helpers for new tests (validation_repair_spec.md)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,71 @@
+"""
+Tests for InterphyreVectorEnv: stacked image observations, sync and async.
+"""
+
+import numpy as np
+import pytest
+
+from interphyre import InterphyreEnv, InterphyreVectorEnv
+
+LEVELS = ["two_body_problem", "flagpole_sitta"]
+
+
+def _make(asynchronous):
+    return InterphyreVectorEnv(
+        LEVELS, seeds=[0, 1], asynchronous=asynchronous, image_size=(48, 32)
+    )
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_vector_env_matches_single_envs(asynchronous):
+    """Frames, rewards and auto-reset agree with one InterphyreEnv per level."""
+    envs = _make(asynchronous)
+    singles = [
+        InterphyreEnv(name, seed=seed, observation_type="image", image_size=(48, 32))
+        for name, seed in zip(LEVELS, [0, 1])
+    ]
+    obs, infos = envs.reset(seed=0)
+    assert obs.shape == (2, 32, 48, 3)
+    assert obs.dtype == np.uint8
+    assert infos["level_name"].tolist() == LEVELS
+
+    actions = np.array([[-3.0, 3.0, 0.5], [100.0, 100.0, 0.5]], dtype=np.float32)
+    obs, rewards, terminated, truncated, infos = envs.step(actions)
+    assert infos["invalid_action"].tolist() == [False, True]
+    assert infos["_final_obs"].tolist() == [True, False]
+    for i, env in enumerate(singles):
+        first, _ = env.reset(seed=i)
+        final, reward, term, trunc, info = env.step(actions[i])
+        assert rewards[i] == reward
+        assert terminated[i] == term
+        assert truncated[i] == trunc
+        assert infos["success"][i] == info["success"]
+        # Finished episodes are reset in the same call; invalid ones keep going.
+        assert np.array_equal(obs[i], first)
+        if not infos["invalid_action"][i]:
+            assert np.array_equal(infos["final_obs"][i], final)
+        env.close()
+    envs.close()
+
+
+@pytest.mark.fast
+def test_vector_env_stacks_action_bounds():
+    envs = _make(asynchronous=False)
+    assert envs.action_space.shape == (2, 3)
+    assert envs.single_action_space.shape == (3,)
+    assert envs.action_space.high[1, 1] == pytest.approx(3.5)
+    assert envs.single_action_space.high[1] == pytest.approx(5.0)
+    envs.close()
+
+
+@pytest.mark.fast
+def test_vector_env_rejects_bad_arguments():
+    with pytest.raises(ValueError, match="at least one level"):
+        InterphyreVectorEnv([])
+    with pytest.raises(ValueError, match="Expected 2 seeds"):
+        InterphyreVectorEnv(LEVELS, seeds=[0])
+    envs = _make(asynchronous=False)
+    with pytest.raises(ValueError, match="Expected actions for 2"):
+        envs.step(np.zeros((3, 3)))
+    envs.close()
@@ -14,7 +14,6 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from interphyre.environment import InterphyreEnv
 from interphyre.config import SimulationConfig
 from interphyre.levels import _level_registry, load_level
-from agents.random_agent import RandomAgent
 from agents.evaluation import EpisodeResult, Evaluator
 
 
@@ -62,11 +61,10 @@ def run_level_baseline(
     """Run baseline evaluation for a single level.
 
     Each episode consists of up to max_attempts valid attempts:
-    1. Agent provides action (object placement)
-    2. If invalid action: sample new action without resetting environment (until valid)
-    3. If valid action: count as attempt and run full simulation
-    4. If success: episode ends
-    5. If timeout: reset environment with same seed and try again (up to max_attempts)
+    1. Sample a random valid placement with env.sample_valid_action()
+    2. Count it as an attempt and run the full simulation
+    3. If success: episode ends
+    4. If timeout: reset environment with same seed and try again (up to max_attempts)
 
     All episodes and attempts contain only valid actions.
     Each episode uses a unique environment seed, retries use the same seed.
@@ -89,10 +87,6 @@ def run_level_baseline(
             discrete_colors=False,
         )
 
-        # Create agent
-        agent = RandomAgent(seed=seed)
-        agent.set_action_space(env.action_space)
-
         # Create evaluator
         evaluator = Evaluator()
 
@@ -128,35 +122,13 @@ def run_level_baseline(
                     # Reset environment for this attempt with the same episode seed
                     obs, info = env.reset(seed=episode_seed)
 
-                # Keep trying until we get a valid action (with safety limit)
-                max_invalid_retries = 1000  # Safety limit to prevent infinite loops
-                invalid_retries = 0
-
-                while invalid_retries < max_invalid_retries:
-                    # Get action from agent (with different seed for each attempt)
-                    attempt_seed = episode_seed + attempt + 1
-                    agent.set_seed(attempt_seed)
-                    action = agent.get_action(obs)
-
-                    # Execute action (runs full simulation to completion)
-                    obs, reward, terminated, truncated, info = env.step(action)
-
-                    # Check if action was valid
-                    if terminated and reward < 0:  # Invalid action
-                        invalid_retries += 1
-                        # Reset environment and try another action
-                        obs, info = env.reset(seed=episode_seed)
-                        continue
-                    else:
-                        # Valid action found - count as attempt and break out of retry loop
-                        attempts += 1
-                        break
-
-                if invalid_retries >= max_invalid_retries:
-                    print(
-                        f"  Warning: Hit safety limit for invalid actions in episode {total_episodes_run}"
-                    )
-                    break
+                # Sample only valid placements, so every step() is a real attempt.
+                attempt_seed = episode_seed + attempt + 1
+                action = env.sample_valid_action(np.random.default_rng(attempt_seed))
+
+                # Execute action (runs full simulation to completion)
+                obs, reward, terminated, truncated, info = env.step(action)
+                attempts += 1
 
                 # Check if successful
                 if terminated and reward > 0:  # Success
@@ -0,0 +1,113 @@
+"""Benchmark StateSnapshot capture, restore and serialization per body.
+
+Compares the array snapshot format against the legacy dict + pickle helpers
+(_save_world/_load_world) that StateSnapshot used to embed.
+
+    python tools/benchmark_snapshots.py --levels catapult marble_race --repeats 500
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interphyre.environment import InterphyreEnv
+from interphyre.interventions.state import StateSnapshot, _load_world, _save_world
+from interphyre.validation import _get_registry
+
+
+def _per_call_us(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def benchmark_level(level_name: str, repeats: int, steps: int) -> dict[str, float]:
+    """Time snapshot operations on a level after a few seconds of a solved rollout."""
+    entry = _get_registry().get_valid_entry(level_name, 0)
+    env = InterphyreEnv(level_name, enable_interventions=True, observation_type=None)
+    env.reset()
+    env.place_action([tuple(p) for p in entry["solution"]])
+    env.action_placed = True
+    env.step_physics(steps)
+    engine = env.engine
+
+    snapshot = StateSnapshot.capture(engine)
+    data = snapshot.to_bytes()
+    compact = snapshot.to_bytes(include_layout=False)
+    legacy = _save_world(engine.world, engine.bodies)
+    legacy_bytes = pickle.dumps(
+        (snapshot.objects, legacy, snapshot.obj_attrs),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+    results = {
+        "bodies": len(engine.bodies),
+        "capture": _per_call_us(lambda: StateSnapshot.capture(engine), repeats),
+        "legacy_capture": _per_call_us(
+            lambda: (
+                _save_world(engine.world, engine.bodies),
+                StateSnapshot._capture_obj_attrs(engine.level, engine.bodies),
+            ),
+            repeats,
+        ),
+        "restore": _per_call_us(lambda: snapshot.restore(engine), repeats),
+        "apply_state": _per_call_us(
+            lambda: snapshot._apply_body_state(engine), repeats
+        ),
+        "legacy_load_world": _per_call_us(
+            lambda: _load_world(engine.world, engine.bodies, legacy), repeats
+        ),
+        "to_bytes": _per_call_us(snapshot.to_bytes, repeats),
+        "from_buffer": _per_call_us(lambda: StateSnapshot.from_buffer(data), repeats),
+        "from_buffer_no_layout": _per_call_us(
+            lambda: StateSnapshot.from_buffer(compact), repeats
+        ),
+        "legacy_unpickle": _per_call_us(lambda: pickle.loads(legacy_bytes), repeats),
+        "bytes": len(data),
+        "bytes_no_layout": len(compact),
+        "legacy_bytes": len(legacy_bytes),
+    }
+    env.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--levels",
+        nargs="+",
+        default=["two_body_problem", "catapult", "marble_race", "pinball_machine"],
+    )
+    parser.add_argument("--repeats", type=int, default=300)
+    parser.add_argument("--steps", type=int, default=120)
+    args = parser.parse_args()
+
+    header = (
+        f"{'level':<18} {'bodies':>6} {'capture':>16} {'apply state':>16} "
+        f"{'restore':>8} {'to_bytes':>9} {'from_buf':>9} {'bytes':>14}"
+    )
+    print("times in us per body (legacy in parentheses); sizes in bytes")
+    print("restore is measured without structural changes, so no body is rebuilt")
+    print(header)
+    print("-" * len(header))
+    for level_name in args.levels:
+        r = benchmark_level(level_name, args.repeats, args.steps)
+        n = r["bodies"]
+        print(
+            f"{level_name:<18} {n:>6} "
+            f"{r['capture'] / n:>7.2f} ({r['legacy_capture'] / n:>6.2f}) "
+            f"{r['apply_state'] / n:>7.2f} ({r['legacy_load_world'] / n:>6.2f}) "
+            f"{r['restore'] / n:>8.2f} "
+            f"{r['to_bytes'] / n:>9.2f} "
+            f"{r['from_buffer_no_layout'] / n:>9.2f} "
+            f"{r['bytes_no_layout']:>6} ({r['legacy_bytes']:>5})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark snapshot trajectory files against per-step snapshot pickles.
+
+Records a solved rollout per level with SnapshotTrajectoryWriter and reports
+bytes per step next to pickling every StateSnapshot (the format used by
+SnapshotStore spill files) and StateSnapshot.to_bytes(include_layout=False).
+
+    python tools/benchmark_trajectories.py --levels catapult --steps 600
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from interphyre.environment import InterphyreEnv
+from interphyre.interventions import (
+    SnapshotTrajectory,
+    SnapshotTrajectoryWriter,
+    StateSnapshot,
+)
+from interphyre.validation import _get_registry
+
+
+def benchmark_level(level_name: str, steps: int, keyframe_every: int) -> dict:
+    """Record one rollout and measure storage size, write and decode time."""
+    entry = _get_registry().get_valid_entry(level_name, 0)
+    env = InterphyreEnv(level_name, enable_interventions=True, observation_type=None)
+    env.reset()
+    env.place_action([tuple(p) for p in entry["solution"]])
+    env.action_placed = True
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rollout.traj")
+        snapshots = []
+        write_time = 0.0
+        with SnapshotTrajectoryWriter(path, keyframe_every=keyframe_every) as writer:
+            for _ in range(steps):
+                env.step_physics()
+                snapshot = StateSnapshot.capture(env.engine)
+                start = time.perf_counter()
+                writer.append(snapshot)
+                write_time += time.perf_counter() - start
+                snapshots.append(snapshot)
+        size = os.path.getsize(path)
+
+        with SnapshotTrajectory(path) as trajectory:
+            order = np.random.default_rng(0).permutation(len(trajectory))
+            start = time.perf_counter()
+            for record in order.tolist():
+                trajectory[record]
+            decode_time = time.perf_counter() - start
+
+    pickled = sum(
+        len(pickle.dumps(s, protocol=pickle.HIGHEST_PROTOCOL)) for s in snapshots
+    )
+    compact = sum(len(s.to_bytes(include_layout=False)) for s in snapshots)
+    env.close()
+    return {
+        "bodies": len(snapshots[-1].layout.names),
+        "trajectory": size / steps,
+        "pickle": pickled / steps,
+        "no_layout": compact / steps,
+        "write_us": write_time / steps * 1e6,
+        "decode_us": decode_time / steps * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--levels",
+        nargs="+",
+        default=["two_body_problem", "catapult", "marble_race", "pinball_machine"],
+    )
+    parser.add_argument("--steps", type=int, default=600)
+    parser.add_argument("--keyframe-every", type=int, default=60)
+    args = parser.parse_args()
+
+    header = (
+        f"{'level':<18} {'bodies':>6} {'trajectory':>11} {'to_bytes':>9} "
+        f"{'pickle':>8} {'ratio':>6} {'write us':>9} {'decode us':>10}"
+    )
+    print(f"bytes per step, keyframe every {args.keyframe_every} steps")
+    print("decode is random access: keyframe plus delta per record")
+    print(header)
+    print("-" * len(header))
+    for level_name in args.levels:
+        r = benchmark_level(level_name, args.steps, args.keyframe_every)
+        print(
+            f"{level_name:<18} {r['bodies']:>6} {r['trajectory']:>11.1f} "
+            f"{r['no_layout']:>9.1f} {r['pickle']:>8.1f} "
+            f"{r['pickle'] / r['trajectory']:>5.1f}x "
+            f"{r['write_us']:>9.1f} {r['decode_us']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
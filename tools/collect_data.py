@@ -58,6 +58,7 @@ class CEMAgent:
         self.min_std = min_std
         self.action_space = None
         self._evaluator = None
+        self._batch_evaluator = None
 
     def set_action_space(self, action_space) -> None:
         self.action_space = action_space
@@ -66,12 +67,22 @@ class CEMAgent:
         """Set evaluator callback: evaluator(action_array) -> (reward, success)."""
         self._evaluator = evaluator
 
+    def set_batch_evaluator(self, batch_evaluator) -> None:
+        """Set batch evaluator: batch_evaluator(samples) -> (rewards, successes).
+
+        When set, each CEM iteration scores its whole population in one call
+        instead of calling the per-action evaluator.
+        """
+        self._batch_evaluator = batch_evaluator
+
     def set_seed(self, seed: int) -> None:
         self.rng = np.random.default_rng(seed)
         self.seed = seed
 
     def get_action(self, observation: Any) -> np.ndarray:
-        if self.action_space is None or self._evaluator is None:
+        if self.action_space is None or (
+            self._evaluator is None and self._batch_evaluator is None
+        ):
             raise ValueError("Action space or evaluator not set for CEMAgent.")
 
         low = np.asarray(self.action_space.low, dtype=np.float32)
@@ -90,13 +101,17 @@ class CEMAgent:
             samples = np.clip(samples, low, high)
             samples = np.round(samples, 4)
 
-            rewards = []
-            successes = []
-            for sample in samples:
-                reward, success = self._evaluator(sample)
-                rewards.append(reward)
-                successes.append(success)
-
+            if self._batch_evaluator is not None:
+                rewards, successes = self._batch_evaluator(samples)
+            else:
+                rewards = []
+                successes = []
+                for sample in samples:
+                    reward, success = self._evaluator(sample)
+                    rewards.append(reward)
+                    successes.append(success)
+
+            for sample, reward, success in zip(samples, rewards, successes):
                 if success and reward > best_reward:
                     best_reward = reward
                     best_success = sample.copy()
@@ -339,6 +354,7 @@ class DataCollector:
         agent: Any,
         verify_mode: bool = False,
         fix_ball_size: Optional[float] = None,
+        batch_workers: Optional[int] = None,
     ):
         """Initialize data collector.
 
@@ -348,12 +364,15 @@ class DataCollector:
             agent: Agent to use for action generation
             verify_mode: If True, double-check each solution (slower but safer)
             fix_ball_size: If provided, fix ball radius to this value
+            batch_workers: Worker processes for env.step_batch() when scoring a
+                CEM population (None = score in this process)
         """
         self.level_name = level_name
         self.config = config
         self.agent = agent
         self.verify_mode = verify_mode
         self.fix_ball_size = fix_ball_size
+        self.batch_workers = batch_workers
         self.env: Optional[InterphyreEnv] = None
         self.current_seed: Optional[int] = None
 
@@ -375,6 +394,9 @@ class DataCollector:
             image_size=(224, 224),
             image_ppm=60.0,
             discrete_colors=False,
+            # Frames are only rendered if the agent actually reads them; the
+            # scoring resets/steps in _evaluate_action() never do.
+            lazy_observations=True,
         )
         return env
 
@@ -409,6 +431,10 @@ class DataCollector:
         agent.set_action_space(self.env.action_space)
         if hasattr(agent, "set_evaluator"):
             agent.set_evaluator(lambda action: self._evaluate_action(seed, action))
+        if hasattr(agent, "set_batch_evaluator"):
+            agent.set_batch_evaluator(
+                lambda samples: self._evaluate_actions(seed, samples)
+            )
 
         # Try to find a solution
         for attempt in range(max_attempts):
@@ -466,6 +492,24 @@ class DataCollector:
         _, reward, _, _, info = self.env.step(action_tuples)
         return reward, bool(info.get("success", False))
 
+    def _evaluate_actions(
+        self, seed: int, samples: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score a population of actions with one env.step_batch() call.
+
+        Returns (rewards, successes); invalid actions get reward -1.0.
+        """
+        if self.env is None:
+            return np.full(len(samples), -1.0), np.zeros(len(samples), dtype=bool)
+
+        actions = np.asarray(
+            [_normalize_action(s, fix_ball_size=self.fix_ball_size) for s in samples],
+            dtype=np.float64,
+        )
+        self.env.reset(seed=seed)
+        result = self.env.step_batch(actions, workers=self.batch_workers)
+        return result["reward"], result["success"]
+
     def _verify_action(self, seed: int, action: List[float]) -> bool:
         """Verify an action by running it again in a fresh environment.
 
@@ -483,9 +527,8 @@ class DataCollector:
             verify_env = InterphyreEnv(
                 level,
                 config=self.config,
-                observation_type="physics_state",
                 action_type="continuous",
-                discrete_colors=False,
+                evaluate_only=True,
             )
             verify_env.reset(seed=seed)
             action_tuples = _action_to_tuples(action)
@@ -524,6 +567,7 @@ class CollectConfig:
     cem_population: int = 128
     cem_elite_frac: float = 0.1
     cem_iterations: int = 5
+    cem_workers: int = 1
 
 
 def _collect_seed_worker(
@@ -837,6 +881,7 @@ def collect_for_level(config: CollectConfig) -> Dict[str, Any]:
             success_agent,
             verify_mode=config.verify_mode,
             fix_ball_size=config.fix_ball_size,
+            batch_workers=config.cem_workers if config.cem_workers > 1 else None,
         )
 
         pbar = tqdm(
@@ -1005,6 +1050,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=5,
         help="CEM iterations per attempt (default: 5)",
     )
+    parser.add_argument(
+        "--cem-workers",
+        type=int,
+        default=1,
+        help=(
+            "Processes that score each CEM population via env.step_batch() "
+            "(default: 1; only with --workers 1)"
+        ),
+    )
     return parser
 
 
@@ -1039,6 +1093,15 @@ def main() -> None:
         max_seed = args.max_seed
         explicit_seeds = None
 
+    if args.cem_workers < 1:
+        _log("Error: --cem-workers must be at least 1")
+        return
+    if args.cem_workers > 1 and args.workers > 1:
+        # Seed workers are daemonic pool processes, which cannot start their
+        # own step_batch() pools.
+        _log("Error: --cem-workers > 1 requires --workers 1")
+        return
+
     verify_mode = not args.no_verify
     if args.verify_mode:
         verify_mode = True
@@ -1068,6 +1131,7 @@ def main() -> None:
             cem_population=args.cem_population,
             cem_elite_frac=args.cem_elite_frac,
             cem_iterations=args.cem_iterations,
+            cem_workers=args.cem_workers,
         )
         result = collect_for_level(config)
 